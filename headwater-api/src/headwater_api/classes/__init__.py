@@ -17,6 +17,7 @@ from headwater_api.classes.curator_classes.requests import (
 from headwater_api.classes.conduit_classes.responses import (
     GenerationResponse,
     BatchResponse,
+    BatchStreamItem,
     TokenizationResponse,
 )
 from headwater_api.classes.embeddings_classes.responses import (
@@ -57,6 +58,14 @@ from headwater_api.classes.siphon_classes.batch_extract import BatchExtractReque
 from headwater_api.classes.siphon_classes.batch_extract import ExtractResult
 from headwater_api.classes.siphon_classes.batch_extract import BatchExtractResponse
 
+# Jobs
+from headwater_api.classes.jobs_classes.jobs import (
+    JobKind,
+    JobState,
+    JobStatusResponse,
+    JobResultsResponse,
+)
+
 # Reranker
 from headwater_api.classes.reranker_classes.requests import RerankDocument, RerankRequest
 from headwater_api.classes.reranker_classes.responses import (
@@ -70,6 +79,7 @@ from headwater_api.classes.conduit_classes.openai_compat import (
     OpenAIChatMessage,
     JsonSchemaFormat,
     ResponseFormat,
+    StreamOptions,
     OpenAIChatRequest,
     ResponsesInputMessage,
     ResponsesTextFormat,
@@ -96,6 +106,7 @@ __all__ = [
     # Responses
     "GenerationResponse",
     "BatchResponse",
+    "BatchStreamItem",
     "TokenizationResponse",
     "CuratorResponse",
     "CuratorResult",
@@ -124,6 +135,11 @@ __all__ = [
     "BatchExtractRequest",
     "ExtractResult",
     "BatchExtractResponse",
+    # Jobs
+    "JobKind",
+    "JobState",
+    "JobStatusResponse",
+    "JobResultsResponse",
     # Reranker
     "RerankDocument",
     "RerankRequest",
@@ -134,6 +150,7 @@ __all__ = [
     "OpenAIChatMessage",
     "JsonSchemaFormat",
     "ResponseFormat",
+    "StreamOptions",
     "OpenAIChatRequest",
     "ResponsesInputMessage",
     "ResponsesTextFormat",
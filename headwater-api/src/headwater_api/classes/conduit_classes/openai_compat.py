@@ -7,6 +7,7 @@ __all__ = [
     "OpenAIChatMessage",
     "JsonSchemaFormat",
     "ResponseFormat",
+    "StreamOptions",
     "OpenAIChatRequest",
     "ResponsesInputMessage",
     "ResponsesTextFormat",
@@ -36,6 +37,10 @@ class ResponseFormat(BaseModel):
     json_schema: JsonSchemaFormat
 
 
+class StreamOptions(BaseModel):
+    include_usage: bool = False
+
+
 class OpenAIChatRequest(BaseModel):
     model: str
     messages: list[OpenAIChatMessage] = Field(min_length=1)
@@ -44,6 +49,7 @@ class OpenAIChatRequest(BaseModel):
     max_tokens: int | None = Field(default=None, ge=1)
     stop: list[str] | str | None = None
     stream: bool = False
+    stream_options: StreamOptions | None = None
     response_format: ResponseFormat | None = None
     use_cache: bool = True
 
@@ -55,8 +61,8 @@ class OpenAIChatRequest(BaseModel):
 
     @model_validator(mode="after")
     def _validate_request(self) -> OpenAIChatRequest:
-        if self.stream:
-            raise ValueError("Streaming is not supported on this endpoint.")
+        if self.stream and self.response_format is not None:
+            raise ValueError("Streaming is not supported together with response_format.")
         for msg in self.messages:
             if msg.role == "tool" and msg.tool_call_id is None:
                 raise ValueError("tool_call_id is required for messages with role='tool'.")
@@ -105,4 +111,12 @@ class OpenAIResponsesRequest(BaseModel):
     text: ResponsesText | None = None
     max_output_tokens: int | None = Field(default=None, ge=1)
     temperature: float | None = Field(default=None, ge=0.0, le=2.0)
+    stream: bool = False
     use_cache: bool = True
+
+    @model_validator(mode="after")
+    def _validate_stream(self) -> OpenAIResponsesRequest:
+        fmt = self.text.format if self.text and self.text.format else None
+        if self.stream and fmt is not None and fmt.type != "text":
+            raise ValueError("Streaming is not supported together with a json_schema or json_object text format.")
+        return self
@@ -28,6 +28,18 @@ class BatchRequest(BaseModel):
         default=8,
         description="Max concurrent Ollama requests. Prevents queue flooding and ReadTimeout on large batches.",
     )
+    adaptive_concurrency: bool = Field(
+        default=False,
+        description=(
+            "Let the server choose the concurrency: start at min_concurrent and adjust it AIMD-style "
+            "from observed latency, tokens/s and error rate, never above max_concurrent."
+        ),
+    )
+    min_concurrent: int = Field(
+        default=1,
+        ge=1,
+        description="Lower bound and starting point for adaptive_concurrency.",
+    )
 
     # Standard request fields
     params: GenerationParams
@@ -48,6 +60,8 @@ class BatchRequest(BaseModel):
             raise ValueError(
                 "If 'input_variables_list' is provided, 'prompt_str' must also be provided."
             )
+        if self.adaptive_concurrency and self.max_concurrent is not None and self.max_concurrent < self.min_concurrent:
+            raise ValueError("'max_concurrent' must be at least 'min_concurrent' with adaptive_concurrency.")
         return self
 
 
@@ -12,6 +12,16 @@ class BatchResponse(BaseModel):
     )
 
 
+class BatchStreamItem(BaseModel):
+    """One line of a /conduit/batch/stream response, sent as soon as that item finishes"""
+
+    index: int = Field(..., description="Position of the item in the request's prompt or input-variables list")
+    result: Conversation | None = Field(default=None, description="The item's result; None if it failed")
+    error: str | None = Field(default=None, description="Why the item failed, if it did")
+    error_type: str | None = Field(default=None, description="Exception type of the failure")
+    duration_ms: float = Field(..., description="Time from the item starting to finishing, in milliseconds")
+
+
 class TokenizationResponse(BaseModel):
     """Response model for tokenization requests"""
 
@@ -22,6 +32,7 @@ class TokenizationResponse(BaseModel):
 
 __all__ = [
     "BatchResponse",
+    "BatchStreamItem",
     "GenerationResponse",
     "TokenizationResponse",
 ]
@@ -0,0 +1,11 @@
+from headwater_api.classes.jobs_classes.jobs import JobKind
+from headwater_api.classes.jobs_classes.jobs import JobState
+from headwater_api.classes.jobs_classes.jobs import JobStatusResponse
+from headwater_api.classes.jobs_classes.jobs import JobResultsResponse
+
+__all__ = [
+    "JobKind",
+    "JobState",
+    "JobStatusResponse",
+    "JobResultsResponse",
+]
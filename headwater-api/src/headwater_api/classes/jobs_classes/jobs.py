@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class JobKind(str, Enum):
+    CONDUIT_BATCH = "conduit_batch"
+    SIPHON_EXTRACT_BATCH = "siphon_extract_batch"
+    SIPHON_EMBED_BATCH = "siphon_embed_batch"
+
+
+class JobState(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def finished(self) -> bool:
+        return self in (JobState.SUCCEEDED, JobState.FAILED, JobState.CANCELLED)
+
+
+class JobStatusResponse(BaseModel):
+    """State and progress of a background batch job (GET /jobs/{job_id})."""
+
+    job_id: str
+    kind: JobKind
+    state: JobState
+    total: int = Field(..., description="Input items in the job (prompts, sources or URIs)")
+    completed: int = Field(..., description="Input items processed so far")
+    results_available: int = Field(..., description="Result rows that can be paged now")
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+    summary: dict[str, Any] | None = Field(
+        default=None, description="Totals for jobs whose results are per-chunk counts (siphon_embed_batch)"
+    )
+
+
+class JobResultsResponse(BaseModel):
+    """One page of a job's results (GET /jobs/{job_id}/results)."""
+
+    job_id: str
+    state: JobState
+    offset: int
+    results: list[Any] = Field(
+        ...,
+        description=(
+            "conduit_batch: serialized Conversation (or null for a failed item) per prompt; "
+            "siphon_extract_batch: ExtractResult per source; "
+            "siphon_embed_batch: EmbedBatchResponse per chunk of URIs"
+        ),
+    )
+    next_offset: int | None = Field(
+        default=None, description="Offset of the next page, or None if no more results are available yet"
+    )
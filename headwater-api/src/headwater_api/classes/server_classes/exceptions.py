@@ -43,6 +43,10 @@ class ErrorType(str, Enum):
     ROUTING_ERROR = "routing_error"
     BACKEND_UNAVAILABLE = "backend_unavailable"
     BACKEND_TIMEOUT = "backend_timeout"
+    OVERLOADED = "overloaded"
+    JOB_NOT_FOUND = "job_not_found"
+    DEADLINE_EXCEEDED = "deadline_exceeded"
+    CLIENT_DISCONNECTED = "client_disconnected"
 
 
 class HeadwaterServerError(BaseModel):
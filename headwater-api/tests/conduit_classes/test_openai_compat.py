@@ -4,13 +4,25 @@ import pytest
 from pydantic import ValidationError
 
 
-def test_stream_true_raises_validation_error():
+def test_stream_true_is_accepted():
+    from headwater_api.classes.conduit_classes.openai_compat import OpenAIChatRequest
+    req = OpenAIChatRequest(
+        model="headwater/claude-sonnet-4-6",
+        messages=[{"role": "user", "content": "Hello"}],
+        stream=True,
+    )
+    assert req.stream is True
+    assert req.stream_options is None
+
+
+def test_stream_with_response_format_raises_validation_error():
     from headwater_api.classes.conduit_classes.openai_compat import OpenAIChatRequest
     with pytest.raises(ValidationError) as exc_info:
         OpenAIChatRequest(
             model="headwater/claude-sonnet-4-6",
             messages=[{"role": "user", "content": "Hello"}],
             stream=True,
+            response_format={"type": "json_schema", "json_schema": {"name": "x", "schema": {"type": "object"}}},
         )
     errors = exc_info.value.errors()
     assert any("Streaming is not supported" in str(e["msg"]) for e in errors)
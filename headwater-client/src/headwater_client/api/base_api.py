@@ -3,6 +3,8 @@ Base class for all API classes.
 Handles the transport dependency injection.
 """
 
+from collections.abc import Iterator
+
 from headwater_client.transport.headwater_transport import HeadwaterTransport
 
 
@@ -21,3 +23,9 @@ class BaseAPI:
             return self._transport._request(method, endpoint)
         elif method.upper() in ["POST", "PUT", "DELETE", "PATCH"]:
             return self._transport._request(method, endpoint, json_payload=json_payload)
+
+    def _stream_lines(
+        self, method: str, endpoint: str, json_payload: str | None = None
+    ) -> Iterator[str]:
+        """Yield the response body line by line as it arrives (NDJSON endpoints)."""
+        return self._transport._stream_lines(method, endpoint, json_payload=json_payload)
@@ -3,6 +3,8 @@ Base class for all async API classes.
 Handles the async transport dependency injection.
 """
 
+from collections.abc import AsyncIterator
+
 from headwater_client.transport.headwater_async_transport import HeadwaterAsyncTransport
 
 
@@ -20,4 +22,10 @@ class BaseAsyncAPI:
         if method.upper() == "GET":
             return await self._transport._request(method, endpoint)
         elif method.upper() in ["POST", "PUT", "DELETE", "PATCH"]:
-            return await self._transport._request(method, endpoint, json_payload=json_payload)
\ No newline at end of file
+            return await self._transport._request(method, endpoint, json_payload=json_payload)
+
+    def _stream_lines(
+        self, method: str, endpoint: str, json_payload: str | None = None
+    ) -> AsyncIterator[str]:
+        """Yield the response body line by line as it arrives (NDJSON endpoints)."""
+        return self._transport._stream_lines(method, endpoint, json_payload=json_payload)
@@ -2,12 +2,15 @@
 Client for interacting with the Conduit service.
 """
 
+from collections.abc import Iterator
+
 from headwater_client.api.base_api import BaseAPI
 from headwater_api.classes import (
     GenerationRequest,
     GenerationResponse,
     BatchRequest,
     BatchResponse,
+    BatchStreamItem,
     TokenizationRequest,
     TokenizationResponse,
 )
@@ -30,6 +33,12 @@ class ConduitAPI(BaseAPI):
         response = self._request(method, endpoint, json_payload=json_payload)
         return BatchResponse.model_validate_json(response)
 
+    def stream_batch(self, batch: BatchRequest) -> Iterator[BatchStreamItem]:
+        """Run a batch and yield each item as soon as it finishes, in completion order (see item.index)"""
+        json_payload = batch.model_dump_json()
+        for line in self._stream_lines("POST", "/conduit/batch/stream", json_payload=json_payload):
+            yield BatchStreamItem.model_validate_json(line)
+
     def list_models(self, provider: str | None = None) -> dict:
         """List all models available in the conduit registry, optionally filtered by provider."""
         endpoint = "/conduit/models"
@@ -2,12 +2,15 @@
 Async client for interacting with the Conduit service.
 """
 
+from collections.abc import AsyncIterator
+
 from headwater_client.api.base_async_api import BaseAsyncAPI
 from headwater_api.classes import (
     GenerationRequest,
     GenerationResponse,
     BatchRequest,
     BatchResponse,
+    BatchStreamItem,
     TokenizationRequest,
     TokenizationResponse,
 )
@@ -30,6 +33,12 @@ class ConduitAsyncAPI(BaseAsyncAPI):
         response = await self._request(method, endpoint, json_payload=json_payload)
         return BatchResponse.model_validate_json(response)
 
+    async def stream_batch(self, batch: BatchRequest) -> AsyncIterator[BatchStreamItem]:
+        """Run a batch and yield each item as soon as it finishes, in completion order (see item.index)"""
+        json_payload = batch.model_dump_json()
+        async for line in self._stream_lines("POST", "/conduit/batch/stream", json_payload=json_payload):
+            yield BatchStreamItem.model_validate_json(line)
+
     async def list_models(self, provider: str | None = None) -> dict:
         """List all models available in the conduit registry, optionally filtered by provider."""
         endpoint = "/conduit/models"
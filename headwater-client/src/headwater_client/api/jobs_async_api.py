@@ -0,0 +1,85 @@
+"""
+Async client for background batch jobs.
+
+Large batches can outlive an HTTP request; submitting them as jobs returns a
+job id at once, and the work keeps running on the server if the client goes away.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from headwater_api.classes import (
+    BatchExtractRequest,
+    BatchRequest,
+    EmbedBatchRequest,
+    JobResultsResponse,
+    JobStatusResponse,
+    SIPHON_EMBED_MODEL,
+)
+from headwater_client.api.base_async_api import BaseAsyncAPI
+
+
+class JobsAsyncAPI(BaseAsyncAPI):
+    async def submit_batch(self, batch: BatchRequest) -> JobStatusResponse:
+        """Queue a conduit batch as a job (POST /conduit/batch/jobs)."""
+        response = await self._request("POST", "/conduit/batch/jobs", json_payload=batch.model_dump_json())
+        return JobStatusResponse.model_validate_json(response)
+
+    async def submit_extract_batch(self, request: BatchExtractRequest) -> JobStatusResponse:
+        """Queue a siphon batch extraction as a job (POST /siphon/extract/batch/jobs)."""
+        response = await self._request(
+            "POST", "/siphon/extract/batch/jobs", json_payload=request.model_dump_json()
+        )
+        return JobStatusResponse.model_validate_json(response)
+
+    async def submit_embed_batch(
+        self,
+        uris: list[str],
+        model: str = SIPHON_EMBED_MODEL,
+        force: bool = False,
+    ) -> JobStatusResponse:
+        """Queue a siphon embed-batch as a job (POST /siphon/embed-batch/jobs)."""
+        request = EmbedBatchRequest(uris=uris, model=model, force=force)
+        response = await self._request(
+            "POST", "/siphon/embed-batch/jobs", json_payload=request.model_dump_json()
+        )
+        return JobStatusResponse.model_validate_json(response)
+
+    async def status(self, job_id: str) -> JobStatusResponse:
+        """Fetch a job's state and progress."""
+        response = await self._request("GET", f"/jobs/{job_id}")
+        return JobStatusResponse.model_validate_json(response)
+
+    async def results(self, job_id: str, offset: int = 0, limit: int = 100) -> JobResultsResponse:
+        """Fetch one page of a job's results."""
+        response = await self._request("GET", f"/jobs/{job_id}/results?offset={offset}&limit={limit}")
+        return JobResultsResponse.model_validate_json(response)
+
+    async def iter_results(self, job_id: str, page_size: int = 100) -> AsyncIterator[Any]:
+        """Yield every result available now, page by page. Call after wait() for the complete set."""
+        offset: int | None = 0
+        while offset is not None:
+            page = await self.results(job_id, offset=offset, limit=page_size)
+            for result in page.results:
+                yield result
+            offset = page.next_offset
+
+    async def cancel(self, job_id: str) -> JobStatusResponse:
+        """Cancel a queued or running job; results already produced are kept."""
+        response = await self._request("DELETE", f"/jobs/{job_id}")
+        return JobStatusResponse.model_validate_json(response)
+
+    async def wait(
+        self, job_id: str, poll_interval: float = 2.0, timeout: float | None = None
+    ) -> JobStatusResponse:
+        """Poll until the job succeeds, fails or is cancelled. Raises TimeoutError after timeout seconds."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = await self.status(job_id)
+            if status.state.finished:
+                return status
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Job {job_id} still {status.state.value} after {timeout}s")
+            await asyncio.sleep(poll_interval)
@@ -18,6 +18,7 @@ from headwater_api.classes import GpuResponse, LogsLastResponse, RouterGpuRespon
 from headwater_client.api.conduit_api import ConduitAPI
 from headwater_client.api.curator_api import CuratorAPI
 from headwater_client.api.embeddings_api import EmbeddingsAPI
+from headwater_client.api.jobs_api import JobsAPI
 from headwater_client.api.reranker_api import RerankerAPI
 from headwater_client.api.siphon_sync_api import SiphonAPI
 from headwater_client.transport.headwater_transport import HeadwaterTransport
@@ -25,12 +26,15 @@ from headwater_client.transport.headwater_transport import HeadwaterTransport
 
 class HeadwaterClient:
     def __init__(
-        self, host_alias: Literal["headwater", "bywater", "backwater", "deepwater", "stillwater"] = "headwater"
+        self,
+        host_alias: Literal["headwater", "bywater", "backwater", "deepwater", "stillwater"] = "headwater",
+        timeout: float | None = None,
     ):
-        self._transport = HeadwaterTransport(host_alias=host_alias)
+        self._transport = HeadwaterTransport(host_alias=host_alias, timeout=timeout)
         self.conduit = ConduitAPI(self._transport)
         self.curator = CuratorAPI(self._transport)
         self.embeddings = EmbeddingsAPI(self._transport)
+        self.jobs = JobsAPI(self._transport)
         self.reranker = RerankerAPI(self._transport)
         self.siphon = SiphonAPI(self._transport)
 
@@ -62,6 +66,10 @@ class HeadwaterClient:
         """Fetch Prometheus metrics in text exposition format (GET /metrics)."""
         return self._transport.get_metrics()
 
+    def get_federated_metrics(self) -> str:
+        """Fetch the router's merged fleet metrics, one `backend` label per source (GET /metrics/federate)."""
+        return self._transport.get_federated_metrics()
+
     def get_sysinfo(self) -> dict:
         """Fetch CPU and RAM stats from a subserver (GET /sysinfo)."""
         return self._transport.get_sysinfo()
@@ -26,6 +26,7 @@ from typing import Literal
 from headwater_client.api.conduit_async_api import ConduitAsyncAPI
 from headwater_client.api.curator_async_api import CuratorAsyncAPI
 from headwater_client.api.embeddings_async_api import EmbeddingsAsyncAPI
+from headwater_client.api.jobs_async_api import JobsAsyncAPI
 from headwater_client.api.openai_async_api import OpenAICompatAsyncAPI
 from headwater_client.api.reranker_async_api import RerankerAsyncAPI
 from headwater_client.api.siphon_async_api import SiphonAsyncAPI
@@ -38,13 +39,15 @@ class HeadwaterAsyncClient:
         self,
         base_url: str = "",
         host_alias: Literal["headwater", "bywater", "backwater", "deepwater", "stillwater"] = "headwater",
+        timeout: float | None = None,
     ):
         self._transport = HeadwaterAsyncTransport(
-            base_url=base_url, host_alias=host_alias
+            base_url=base_url, host_alias=host_alias, timeout=timeout
         )
         self.conduit = ConduitAsyncAPI(self._transport)
         self.curator = CuratorAsyncAPI(self._transport)
         self.embeddings = EmbeddingsAsyncAPI(self._transport)
+        self.jobs = JobsAsyncAPI(self._transport)
         self.openai = OpenAICompatAsyncAPI(self._transport)
         self.reranker = RerankerAsyncAPI(self._transport)
         self.siphon = SiphonAsyncAPI(self._transport)
@@ -90,6 +93,10 @@ class HeadwaterAsyncClient:
         """Fetch Prometheus metrics in text exposition format (GET /metrics)."""
         return await self._transport.get_metrics()
 
+    async def get_federated_metrics(self) -> str:
+        """Fetch the router's merged fleet metrics, one `backend` label per source (GET /metrics/federate)."""
+        return await self._transport.get_federated_metrics()
+
     async def get_sysinfo(self) -> dict:
         """Fetch CPU and RAM stats from a subserver (GET /sysinfo)."""
         return await self._transport.get_sysinfo()
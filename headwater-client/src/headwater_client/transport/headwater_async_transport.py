@@ -8,6 +8,7 @@ from headwater_api.classes import (
     StatusResponse,
 )
 from dbclients.discovery.host import get_network_context
+from collections.abc import AsyncIterator
 from urllib.parse import urljoin
 from typing import TYPE_CHECKING, Literal
 import httpx
@@ -19,6 +20,7 @@ logger = logging.getLogger(__name__)
 # Constants
 HEADWATER_SERVER_DEFAULT_PORT = 8080
 HEADWATER_ROUTER_PORT = 8081
+DEADLINE_HEADER = "X-Headwater-Deadline"
 
 
 class HeadwaterAsyncTransport:
@@ -30,8 +32,17 @@ class HeadwaterAsyncTransport:
         self,
         base_url: str = "",
         host_alias: Literal["headwater", "bywater", "backwater", "deepwater", "stillwater"] = "headwater",
+        timeout: float | None = None,
     ):
+        """
+        timeout: seconds to wait for each request. It is also sent as X-Headwater-Deadline,
+        so the router and subserver stop working on a request once the caller has given up.
+        Streaming calls use it only as the wait for each chunk and send no deadline: a
+        stream may run far longer than one read while results keep arriving.
+        None waits indefinitely.
+        """
         self._host_alias = host_alias
+        self._timeout = timeout
         if base_url == "":
             self.base_url: str = self._get_url()
         else:
@@ -137,6 +148,10 @@ class HeadwaterAsyncTransport:
         safe_endpoint = endpoint.lstrip("/")
         full_url = urljoin(self.base_url, safe_endpoint)
         headers = {}
+        timeout = httpx.USE_CLIENT_DEFAULT
+        if self._timeout is not None:
+            headers[DEADLINE_HEADER] = f"{self._timeout:g}"
+            timeout = httpx.Timeout(self._timeout, connect=10.0)
 
         # Set Content-Type header if sending data
         if json_payload is not None:
@@ -152,6 +167,7 @@ class HeadwaterAsyncTransport:
                 url=full_url,
                 headers=headers,
                 content=data_bytes,  # Use 'content' for pre-encoded bytes/strings
+                timeout=timeout,
             )
 
             # Check for HTTP errors (should raise)
@@ -179,6 +195,53 @@ class HeadwaterAsyncTransport:
             # Re-raise exceptions already handled (like from _handle_error_response)
             raise
 
+    async def _stream_lines(
+        self,
+        method: str,
+        endpoint: str,
+        json_payload: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Like _request, but yields the response body line by line as it arrives
+        (for NDJSON endpoints). Blank lines are skipped. No X-Headwater-Deadline is
+        sent; the timeout bounds each read, not the whole stream.
+        """
+        await self._ensure_client()
+
+        safe_endpoint = endpoint.lstrip("/")
+        full_url = urljoin(self.base_url, safe_endpoint)
+        headers = {}
+        timeout = httpx.USE_CLIENT_DEFAULT
+        if self._timeout is not None:
+            timeout = httpx.Timeout(self._timeout, connect=10.0)
+        if json_payload is not None:
+            headers["Content-Type"] = "application/json"
+            data_bytes = json_payload.encode("utf-8")
+        else:
+            data_bytes = None
+
+        try:
+            async with self._client.stream(
+                method=method,
+                url=full_url,
+                headers=headers,
+                content=data_bytes,
+                timeout=timeout,
+            ) as response:
+                if not response.is_success:
+                    await response.aread()
+                    self._handle_error_response(response)
+                async for line in response.aiter_lines():
+                    if line:
+                        yield line
+        except httpx.RequestError as e:
+            logger.error(f"Network error requesting {full_url}: {e}")
+            raise HeadwaterServerException(
+                HeadwaterServerError(
+                    error_type="network_error", message=str(e), status_code=503
+                )
+            )
+
     # General server methods
     async def ping(self) -> bool:
         """
@@ -293,6 +356,10 @@ class HeadwaterAsyncTransport:
         """Fetch Prometheus metrics in text exposition format (GET /metrics)."""
         return await self._request("GET", "/metrics")
 
+    async def get_federated_metrics(self) -> str:
+        """Router and all backend metrics in one exposition, labelled by backend (GET /metrics/federate)."""
+        return await self._request("GET", "/metrics/federate")
+
     async def get_sysinfo(self) -> dict:
         """Fetch CPU and RAM stats from a subserver (GET /sysinfo)."""
         import json
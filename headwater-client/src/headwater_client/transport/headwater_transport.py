@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Literal
 
 from headwater_api.classes import (
@@ -21,6 +22,7 @@ logger = logging.getLogger(__name__)
 # Constants
 HEADWATER_SERVER_DEFAULT_PORT = 8080
 HEADWATER_ROUTER_PORT = 8081
+DEADLINE_HEADER = "X-Headwater-Deadline"
 
 
 class HeadwaterTransport:
@@ -32,8 +34,17 @@ class HeadwaterTransport:
         self,
         base_url: str = "",
         host_alias: Literal["headwater", "bywater", "backwater", "deepwater", "stillwater"] = "headwater",
+        timeout: float | None = None,
     ):
+        """
+        timeout: seconds to wait for each request. It is also sent as X-Headwater-Deadline,
+        so the router and subserver stop working on a request once the caller has given up.
+        Streaming calls use it only as the wait for each chunk and send no deadline: a
+        stream may run far longer than one read while results keep arriving.
+        None waits indefinitely.
+        """
         self._host_alias = host_alias
+        self._timeout = timeout
         if base_url == "":
             self.base_url: str = self._get_url()
         else:
@@ -118,6 +129,8 @@ class HeadwaterTransport:
         safe_endpoint = endpoint.lstrip("/")
         full_url = urljoin(self.base_url, safe_endpoint)
         headers = {}
+        if self._timeout is not None:
+            headers[DEADLINE_HEADER] = f"{self._timeout:g}"
 
         # Set Content-Type header if sending data
         if json_payload is not None:
@@ -133,6 +146,7 @@ class HeadwaterTransport:
                 url=full_url,
                 headers=headers,
                 data=data_bytes,  # Use 'data' for pre-encoded bytes/strings
+                timeout=self._timeout,
             )
 
             # Check for HTTP errors (should raise)
@@ -162,6 +176,50 @@ class HeadwaterTransport:
             # Re-raise exceptions already handled (like from _handle_error_response)
             raise
 
+    def _stream_lines(
+        self,
+        method: str,
+        endpoint: str,
+        json_payload: str | None = None,
+    ) -> Iterator[str]:
+        """
+        Like _request, but yields the response body line by line as it arrives
+        (for NDJSON endpoints). Blank lines are skipped. No X-Headwater-Deadline is
+        sent; the timeout bounds each read, not the whole stream.
+        """
+        safe_endpoint = endpoint.lstrip("/")
+        full_url = urljoin(self.base_url, safe_endpoint)
+        headers = {}
+        if json_payload is not None:
+            headers["Content-Type"] = "application/json"
+            data_bytes = json_payload.encode("utf-8")
+        else:
+            data_bytes = None
+
+        try:
+            with self._session.request(
+                method=method,
+                url=full_url,
+                headers=headers,
+                data=data_bytes,
+                timeout=self._timeout,
+                stream=True,
+            ) as response:
+                if not response.ok:
+                    self._handle_error_response(response)
+                for line in response.iter_lines():
+                    if line:
+                        yield line.decode("utf-8")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Network error requesting {full_url}: {e}")
+            raise HeadwaterServerException(
+                HeadwaterServerError(
+                    error_type="network_error",
+                    message=str(e),
+                    status_code=503,
+                )
+            ) from e
+
     # General server methods
     def ping(self) -> bool:
         """
@@ -273,6 +331,10 @@ class HeadwaterTransport:
         """Fetch Prometheus metrics in text exposition format (GET /metrics)."""
         return self._request("GET", "/metrics")
 
+    def get_federated_metrics(self) -> str:
+        """Router and all backend metrics in one exposition, labelled by backend (GET /metrics/federate)."""
+        return self._request("GET", "/metrics/federate")
+
     def get_sysinfo(self) -> dict:
         """Fetch CPU and RAM stats from a subserver (GET /sysinfo)."""
         import json
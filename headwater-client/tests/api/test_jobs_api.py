@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from headwater_api.classes import BatchExtractRequest, JobResultsResponse, JobState, JobStatusResponse
+
+
+def _status(state: JobState, completed: int = 0) -> str:
+    return JobStatusResponse(
+        job_id="abc",
+        kind="siphon_extract_batch",
+        state=state,
+        total=3,
+        completed=completed,
+        results_available=completed,
+        created_at=0.0,
+    ).model_dump_json()
+
+
+def _page(offset: int, results: list, next_offset: int | None) -> str:
+    return JobResultsResponse(
+        job_id="abc", state=JobState.SUCCEEDED, offset=offset, results=results, next_offset=next_offset
+    ).model_dump_json()
+
+
+def test_submit_extract_batch_posts_to_jobs_endpoint():
+    """submit_extract_batch() queues the request on /siphon/extract/batch/jobs."""
+    from headwater_client.api.jobs_api import JobsAPI
+
+    transport = MagicMock()
+    transport._request.return_value = _status(JobState.QUEUED)
+    api = JobsAPI(transport)
+    request = BatchExtractRequest(sources=["a.pdf", "b.pdf", "c.pdf"])
+    job = api.submit_extract_batch(request)
+    transport._request.assert_called_once_with(
+        "POST", "/siphon/extract/batch/jobs", json_payload=request.model_dump_json()
+    )
+    assert job.job_id == "abc"
+    assert job.state == JobState.QUEUED
+
+
+def test_wait_polls_until_finished_and_iter_results_pages():
+    """wait() returns the first finished status; iter_results() follows next_offset to the end."""
+    from headwater_client.api.jobs_api import JobsAPI
+
+    transport = MagicMock()
+    transport._request.side_effect = [
+        _status(JobState.RUNNING, 1),
+        _status(JobState.SUCCEEDED, 3),
+        _page(0, [1, 2], 2),
+        _page(2, [3], None),
+    ]
+    api = JobsAPI(transport)
+    assert api.wait("abc", poll_interval=0).state == JobState.SUCCEEDED
+    assert list(api.iter_results("abc", page_size=2)) == [1, 2, 3]
+    assert transport._request.call_args_list[-1].args == ("GET", "/jobs/abc/results?offset=2&limit=2")
+
+
+@pytest.mark.asyncio
+async def test_async_cancel_sends_delete():
+    """cancel() issues DELETE /jobs/{id} and returns the job's new status."""
+    from headwater_client.api.jobs_async_api import JobsAsyncAPI
+
+    transport = MagicMock()
+    transport._request = AsyncMock(return_value=_status(JobState.CANCELLED, 1))
+    api = JobsAsyncAPI(transport)
+    status = await api.cancel("abc")
+    transport._request.assert_called_once_with("DELETE", "/jobs/abc", json_payload=None)
+    assert status.state == JobState.CANCELLED
@@ -81,3 +81,67 @@ def test_async_transport_get_url_emits_debug_log(monkeypatch, caplog):
     with caplog.at_level(logging.DEBUG, logger="headwater_client.transport.headwater_async_transport"):
         HeadwaterAsyncTransport(host_alias="bywater")
     assert any("bywater" in r.message and "2.2.2.2" in r.message for r in caplog.records)
+
+
+def test_async_transport_timeout_sends_deadline_header():
+    """A transport timeout is sent as X-Headwater-Deadline so the servers can abandon the work."""
+    import asyncio
+    import httpx
+
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, text="{}")
+
+    async def run() -> None:
+        for timeout in (30.0, None):
+            t = HeadwaterAsyncTransport(base_url="http://192.168.99.99:8080", timeout=timeout)
+            t._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            await t._request("POST", "/conduit/embeddings", json_payload="{}")
+            await t._client.aclose()
+
+    asyncio.run(run())
+    assert seen[0].headers["X-Headwater-Deadline"] == "30"
+    assert seen[0].extensions["timeout"]["read"] == 30.0
+    assert "X-Headwater-Deadline" not in seen[1].headers
+
+
+def test_async_transport_stream_lines_yields_each_ndjson_line():
+    """_stream_lines() yields non-empty lines of a streamed body, for NDJSON endpoints."""
+    import asyncio
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b'{"index": 1}\n\n{"index": 0}\n')
+
+    async def run() -> list[str]:
+        t = HeadwaterAsyncTransport(base_url="http://192.168.99.99:8080")
+        t._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        lines = [line async for line in t._stream_lines("POST", "/conduit/batch/stream", json_payload="{}")]
+        await t._client.aclose()
+        return lines
+
+    assert asyncio.run(run()) == ['{"index": 1}', '{"index": 0}']
+
+
+def test_async_transport_stream_lines_sends_no_deadline():
+    """A streamed call uses timeout per read only; X-Headwater-Deadline would cut a long stream off."""
+    import asyncio
+    import httpx
+
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, content=b'{"index": 0}\n')
+
+    async def run() -> None:
+        t = HeadwaterAsyncTransport(base_url="http://192.168.99.99:8080", timeout=30)
+        t._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        _ = [line async for line in t._stream_lines("POST", "/conduit/batch/stream", json_payload="{}")]
+        await t._client.aclose()
+
+    asyncio.run(run())
+    assert "X-Headwater-Deadline" not in seen[0].headers
+    assert seen[0].extensions["timeout"]["read"] == 30.0
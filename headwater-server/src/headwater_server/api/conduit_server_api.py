@@ -50,6 +50,14 @@ class ConduitServerAPI:
 
             return await conduit_batch_service(batch)
 
+        @self.app.post("/conduit/batch/stream")
+        async def conduit_batch_stream(batch: BatchRequest):
+            from headwater_server.services.conduit_service.conduit_batch_service import (
+                conduit_batch_stream_service,
+            )
+
+            return await conduit_batch_stream_service(batch)
+
         @self.app.post("/conduit/tokenize", response_model=TokenizationResponse)
         async def conduit_tokenize(
             request: TokenizationRequest,
@@ -76,6 +84,11 @@ class ConduitServerAPI:
 
         @self.app.post("/v1/chat/completions", dependencies=[Depends(_require_auth)])
         async def conduit_openai_chat(request: OpenAIChatRequest) -> dict:
+            if request.stream:
+                from headwater_server.services.conduit_service.conduit_openai_stream_service import (
+                    conduit_openai_stream_service,
+                )
+                return await conduit_openai_stream_service(request)
             from headwater_server.services.conduit_service.conduit_openai_service import (
                 conduit_openai_service,
             )
@@ -83,6 +96,11 @@ class ConduitServerAPI:
 
         @self.app.post("/v1/responses", dependencies=[Depends(_require_auth)])
         async def conduit_openai_responses(request: OpenAIResponsesRequest) -> dict:
+            if request.stream:
+                from headwater_server.services.conduit_service.conduit_responses_stream_service import (
+                    conduit_responses_stream_service,
+                )
+                return await conduit_responses_stream_service(request)
             from headwater_server.services.conduit_service.conduit_responses_service import (
                 conduit_responses_service,
             )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import JSONResponse
+from headwater_api.classes import BatchExtractRequest
+from headwater_api.classes import BatchRequest
+from headwater_api.classes import EmbedBatchRequest
+from headwater_api.classes import JobKind
+from headwater_api.classes import JobResultsResponse
+from headwater_api.classes import JobStatusResponse
+from headwater_server.server.jobs import JobRunner
+
+
+def _job_not_found(request: Request, job_id: str) -> JSONResponse:
+    from headwater_api.classes import ErrorType, HeadwaterServerError
+
+    error = HeadwaterServerError(
+        error_type=ErrorType.JOB_NOT_FOUND,
+        message=f"No job with id '{job_id}' on this server",
+        status_code=404,
+        path=request.url.path,
+        method=request.method,
+        request_id=getattr(request.state, "request_id", None),
+        context={"job_id": job_id},
+    )
+    return JSONResponse(status_code=404, content=error.model_dump(mode="json"))
+
+
+class JobsServerAPI:
+    def __init__(self, app: FastAPI, runner: JobRunner):
+        self.app: FastAPI = app
+        self._runner = runner
+
+    def register_routes(self):
+        """
+        Register background-job variants of the batch endpoints, plus status/results/cancel.
+        """
+        runner = self._runner
+
+        @self.app.post("/conduit/batch/jobs", response_model=JobStatusResponse, status_code=202)
+        async def submit_conduit_batch(batch: BatchRequest) -> JobStatusResponse:
+            """Queue a /conduit/batch request as a background job; returns immediately."""
+            return await runner.submit(JobKind.CONDUIT_BATCH, batch)
+
+        @self.app.post("/siphon/extract/batch/jobs", response_model=JobStatusResponse, status_code=202)
+        async def submit_siphon_extract_batch(request: BatchExtractRequest) -> JobStatusResponse:
+            """Queue a /siphon/extract/batch request as a background job; returns immediately."""
+            return await runner.submit(JobKind.SIPHON_EXTRACT_BATCH, request)
+
+        @self.app.post("/siphon/embed-batch/jobs", response_model=JobStatusResponse, status_code=202)
+        async def submit_siphon_embed_batch(request: EmbedBatchRequest) -> JobStatusResponse:
+            """Queue a /siphon/embed-batch request as a background job; returns immediately."""
+            return await runner.submit(JobKind.SIPHON_EMBED_BATCH, request)
+
+        @self.app.get("/jobs/{job_id}", response_model=JobStatusResponse)
+        async def job_status(request: Request, job_id: str):
+            status = await runner.status(job_id)
+            return status if status is not None else _job_not_found(request, job_id)
+
+        @self.app.get("/jobs/{job_id}/results", response_model=JobResultsResponse)
+        async def job_results(
+            request: Request,
+            job_id: str,
+            offset: int = Query(default=0, ge=0),
+            limit: int = Query(default=100, ge=1, le=1000),
+        ):
+            """
+            Page through a job's results. Rows are available as soon as their chunk
+            commits, so a running job can be read incrementally.
+            """
+            page = await runner.results(job_id, offset, limit)
+            return page if page is not None else _job_not_found(request, job_id)
+
+        @self.app.delete("/jobs/{job_id}", response_model=JobStatusResponse)
+        async def cancel_job(request: Request, job_id: str):
+            """Cancel a queued or running job; results already committed are kept."""
+            status = await runner.cancel(job_id)
+            return status if status is not None else _job_not_found(request, job_id)
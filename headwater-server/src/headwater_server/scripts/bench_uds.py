@@ -0,0 +1,130 @@
+"""
+Per-request overhead of loopback TCP vs a Unix domain socket, router -> subserver.
+
+Against a running subserver that listens on both (see HEADWATER_UDS in server/main.py):
+
+    python -m headwater_server.scripts.bench_uds \\
+        --tcp http://localhost:8080 --uds /run/headwater/bywater.sock
+
+times small /conduit/tokenize and /conduit/embeddings calls over each transport
+with the same pooled client setup the router uses. With no --tcp/--uds it starts a
+stub app on a loopback port and a temporary socket and times POST /conduit/tokenize
+against it, which isolates the transport cost from any model work.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httpx
+
+from headwater_api.classes import SIPHON_EMBED_MODEL
+from headwater_server.server.upstream import open_client
+
+TOKENIZE_MODEL = "gpt-oss:latest"
+
+
+def _payloads(embed_model: str, tokenize_model: str) -> dict[str, dict]:
+    return {
+        "/conduit/tokenize": {"model": tokenize_model, "text": "The quick brown fox."},
+        "/conduit/embeddings": {
+            "model": embed_model,
+            "batch": {"ids": ["1"], "documents": ["The quick brown fox."]},
+        },
+    }
+
+
+async def _time_calls(client: httpx.AsyncClient, path: str, payload: dict, n: int, warmup: int) -> list[float]:
+    samples: list[float] = []
+    for i in range(warmup + n):
+        start = time.perf_counter()
+        response = await client.post(path, json=payload)
+        elapsed = (time.perf_counter() - start) * 1000
+        response.raise_for_status()
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def _summary(samples: list[float]) -> tuple[float, float, float]:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return statistics.fmean(ordered), statistics.median(ordered), p99
+
+
+async def _run(targets: dict[str, str], payloads: dict[str, dict], n: int, warmup: int) -> None:
+    limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+    timeout = httpx.Timeout(60.0, connect=5.0)
+    clients = {label: open_client(url, limits, timeout) for label, url in targets.items()}
+    try:
+        print(f"{'path':<22}{'transport':<11}{'mean ms':>9}{'p50 ms':>9}{'p99 ms':>9}")
+        for path, payload in payloads.items():
+            means: dict[str, float] = {}
+            for label, client in clients.items():
+                mean, p50, p99 = _summary(await _time_calls(client, path, payload, n, warmup))
+                means[label] = mean
+                print(f"{path:<22}{label:<11}{mean:>9.3f}{p50:>9.3f}{p99:>9.3f}")
+            saved = means["tcp"] - means["uds"]
+            print(f"{path:<22}{'saved':<11}{saved:>9.3f}  ({saved / means['tcp']:.1%} of TCP mean)\n")
+    finally:
+        for client in clients.values():
+            await client.aclose()
+
+
+def _start_stub(port: int, uds: str) -> None:
+    """Serve a stub /conduit/tokenize on TCP and UDS from a daemon thread."""
+    import socket
+
+    import uvicorn
+    from fastapi import FastAPI
+
+    app = FastAPI()
+
+    @app.post("/conduit/tokenize")
+    async def tokenize(body: dict) -> dict:
+        return {"model": body["model"], "input_text": body["text"], "token_count": len(body["text"].split())}
+
+    tcp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    tcp.bind(("127.0.0.1", port))
+    unix = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    unix.bind(uds)
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", access_log=False))
+    threading.Thread(target=server.run, kwargs={"sockets": [tcp, unix]}, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tcp", help="subserver base URL over TCP, e.g. http://localhost:8080")
+    parser.add_argument("--uds", help="path of the same subserver's Unix socket")
+    parser.add_argument("-n", type=int, default=2000, help="timed requests per path and transport")
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--embed-model", default=SIPHON_EMBED_MODEL)
+    parser.add_argument("--tokenize-model", default=TOKENIZE_MODEL)
+    parser.add_argument("--port", type=int, default=18080, help="loopback port for the stub server")
+    args = parser.parse_args()
+
+    payloads = _payloads(args.embed_model, args.tokenize_model)
+    if args.tcp or args.uds:
+        if not (args.tcp and args.uds):
+            parser.error("--tcp and --uds must be given together")
+        asyncio.run(_run({"tcp": args.tcp, "uds": f"unix://{args.uds}"}, payloads, args.n, args.warmup))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        uds = str(Path(tmp) / "bench.sock")
+        _start_stub(args.port, uds)
+        targets = {"tcp": f"http://127.0.0.1:{args.port}", "uds": f"unix://{uds}"}
+        stub_payloads = {"/conduit/tokenize": payloads["/conduit/tokenize"]}
+        asyncio.run(_run(targets, stub_payloads, args.n, args.warmup))
+
+
+if __name__ == "__main__":
+    main()
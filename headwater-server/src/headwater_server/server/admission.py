@@ -0,0 +1,193 @@
+"""
+Per-route and per-backend admission control with interactive/bulk priority queues.
+
+Without limits the router forwards everything immediately, so a burst of
+/conduit/batch jobs for a heavy model stalls interactive chat on the same node.
+The `admission` block of routes.yaml caps concurrent proxied requests per
+route key and per backend. A request over a cap waits in a bounded queue in
+front of that route/backend; when a slot frees, interactive waiters are served
+before bulk ones (FIFO within a class). A full queue, or a wait longer than
+`admission.queue_timeout`, is answered 429 with Retry-After.
+
+Priority comes from the X-Headwater-Priority header (interactive | bulk), else
+from the `admission.bulk` path prefixes, else interactive. Time spent queued
+does not count against the upstream read timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from headwater_server.server.routing_config import AdmissionSettings, RouterConfig
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITIES = (INTERACTIVE, BULK)  # service order
+PRIORITY_HEADER = "x-headwater-priority"
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be queued (queue_full) or waited too long (queue_timeout)."""
+
+    def __init__(self, scope: str, reason: str, retry_after: float):
+        super().__init__(f"{scope}: {reason.replace('_', ' ')}")
+        self.scope = scope
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _Gate:
+    """Concurrency limit with a bounded queue; interactive waiters go first, FIFO within a class."""
+
+    def __init__(self, scope: str, limit: int, queue_size: int):
+        self.scope = scope
+        self.limit = limit
+        self.queue_size = queue_size
+        self.in_flight = 0
+        self.waiters: dict[str, deque[asyncio.Future]] = {p: deque() for p in PRIORITIES}
+
+    def queued(self, priority: str | None = None) -> int:
+        if priority is not None:
+            return sum(not f.done() for f in self.waiters[priority])
+        return sum(self.queued(p) for p in PRIORITIES)
+
+    async def acquire(self, priority: str, timeout: float, retry_after: float) -> None:
+        if self.in_flight < self.limit and not self.queued():
+            self.in_flight += 1
+            return
+        if self.queued() >= self.queue_size:
+            raise AdmissionRejected(self.scope, "queue_full", retry_after)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters[priority].append(waiter)
+        try:
+            await asyncio.wait({waiter}, timeout=timeout)
+        except BaseException:
+            if waiter.done():
+                self.release()  # a slot was handed over to a request that went away
+            else:
+                waiter.cancel()
+            raise
+        if not waiter.done():
+            waiter.cancel()
+            raise AdmissionRejected(self.scope, "queue_timeout", retry_after)
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self.admit()
+
+    def admit(self) -> None:
+        """Hand free slots to waiters; also called after a reload raised the limit."""
+        while self.in_flight < self.limit:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    def _next_waiter(self) -> asyncio.Future | None:
+        for priority in PRIORITIES:
+            queue = self.waiters[priority]
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.done():
+                    return waiter
+        return None
+
+
+class Ticket:
+    """Slots held by one admitted request; release() is idempotent."""
+
+    def __init__(self, gates: list[_Gate], waited_ms: float):
+        self._gates = gates
+        self.scopes = [gate.scope for gate in gates]  # empty when neither route nor backend is capped
+        self.waited_ms = waited_ms
+
+    def release(self) -> None:
+        gates, self._gates = self._gates, []
+        for gate in reversed(gates):
+            gate.release()
+
+
+class AdmissionController:
+    def __init__(self, config: RouterConfig):
+        self._routes: dict[str, _Gate] = {}
+        self._backends: dict[str, _Gate] = {}   # keyed by backend URL
+        self.rejected: dict[tuple[str, str], int] = {}  # (scope, reason) -> count
+        self.reconfigure(config)
+
+    def reconfigure(self, config: RouterConfig) -> None:
+        """Adopt new limits; in-flight counts and queued requests carry over."""
+        settings = config.admission
+        self._settings = settings
+        self._bulk = sorted(settings.bulk, key=len, reverse=True)
+        self._routes = self._resize(
+            self._routes, {key: (f"route:{key}", limit) for key, limit in settings.routes.items()}, settings
+        )
+        self._backends = self._resize(
+            self._backends,
+            {config.backends[name]: (f"backend:{name}", limit) for name, limit in settings.backends.items()},
+            settings,
+        )
+
+    @staticmethod
+    def _resize(
+        gates: dict[str, _Gate], limits: Mapping[str, tuple[str, int]], settings: AdmissionSettings
+    ) -> dict[str, _Gate]:
+        resized: dict[str, _Gate] = {}
+        for key, (scope, limit) in limits.items():
+            gate = gates.get(key) or _Gate(scope, limit, settings.queue_size)
+            gate.scope = scope
+            gate.limit = limit
+            gate.queue_size = settings.queue_size
+            gate.admit()
+            resized[key] = gate
+        return resized
+
+    def priority(self, path: str, headers: Mapping[str, str]) -> str:
+        requested = headers.get(PRIORITY_HEADER, "").strip().lower()
+        if requested in PRIORITIES:
+            return requested
+        for prefix in self._bulk:
+            if path == prefix or path.startswith(prefix + "/"):
+                return BULK
+        return INTERACTIVE
+
+    async def acquire(self, route_key: str | None, backend_url: str | None, priority: str) -> Ticket:
+        """Wait for a slot on route_key and backend_url (whichever are given and limited).
+
+        The router takes the route slot once per request and a backend slot per
+        attempt, so failover and hedges count against the backend they go to.
+        """
+        gates = [g for g in (self._routes.get(route_key), self._backends.get(backend_url)) if g is not None]
+        start = time.monotonic()
+        held: list[_Gate] = []
+        try:
+            for gate in gates:
+                await gate.acquire(priority, self._settings.queue_timeout, self._settings.retry_after)
+                held.append(gate)
+        except AdmissionRejected as exc:
+            key = (exc.scope, exc.reason)
+            self.rejected[key] = self.rejected.get(key, 0) + 1
+            Ticket(held, 0.0).release()
+            raise
+        except BaseException:
+            Ticket(held, 0.0).release()
+            raise
+        return Ticket(held, (time.monotonic() - start) * 1000)
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per scope: limit, in_flight and queue depth by priority, for metrics."""
+        return {
+            gate.scope: {
+                "limit": gate.limit,
+                "in_flight": gate.in_flight,
+                **{f"queued_{p}": gate.queued(p) for p in PRIORITIES},
+            }
+            for gate in [*self._routes.values(), *self._backends.values()]
+        }
@@ -0,0 +1,141 @@
+"""
+Prefix-affinity routing for multi-turn conversations.
+
+Ollama and similar runtimes keep the KV cache of a prompt prefix around, so a
+follow-up turn that reaches the same process skips re-reading the whole
+conversation. Least-outstanding routing spreads turns across the pool and throws
+that away. For route keys listed under `affinity.routes` in routes.yaml, the
+router hashes the model, the system prompt and the first `affinity.messages`
+non-system messages of chat-style bodies, and places that hash on a
+consistent-hash ring of the route's pool. Every turn of one conversation
+therefore maps to the same backend, and adding or removing a backend only moves
+the conversations that hashed to it.
+
+The owner is skipped when its circuit is not closed, or when it already carries more
+than `affinity.load_factor` times its weighted share of the pool's in-flight
+requests (consistent hashing with bounded loads). The request then spills to the
+next backend clockwise on the ring, so a hot conversation cannot pin one node
+while the others idle.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import math
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from headwater_server.server.balancer import LeastOutstandingBalancer
+    from headwater_server.server.health import HealthMonitor
+    from headwater_server.server.routing_config import AffinitySettings
+
+# Request paths (no leading /) whose bodies carry a conversation.
+AFFINITY_PATHS = frozenset({"v1/chat/completions", "v1/messages", "conduit/generate"})
+
+RINGS_MAX = 256  # cached rings; one per distinct pool/weights/vnodes combination
+
+
+def _hash(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+
+def prefix_key(body: bytes, messages: int) -> bytes | None:
+    """
+    Conversation identity of an OpenAI, Anthropic or GenerationRequest body.
+
+    Returns None for bodies that are not JSON objects or carry no messages.
+    """
+    try:
+        parsed = json.loads(body)
+    except ValueError:
+        return None
+    if not isinstance(parsed, dict) or not isinstance(parsed.get("messages"), list):
+        return None
+    params = parsed.get("params")
+    model = parsed.get("model") or (params.get("model") if isinstance(params, dict) else None)
+    system = [m for m in parsed["messages"] if isinstance(m, dict) and m.get("role") == "system"]
+    turns = [m for m in parsed["messages"] if not (isinstance(m, dict) and m.get("role") == "system")]
+    if not turns:
+        return None
+    prefix = [model, parsed.get("system"), system, turns[:messages]]
+    return hashlib.blake2b(json.dumps(prefix, sort_keys=True).encode(), digest_size=16).digest()
+
+
+class HashRing:
+    """Consistent-hash ring with `vnodes` points per unit of weight."""
+
+    def __init__(self, urls: Sequence[str], weights: Mapping[str, float], vnodes: int):
+        points: list[tuple[int, str]] = []
+        for url in urls:
+            for i in range(max(1, round(vnodes * weights.get(url, 1.0)))):
+                points.append((_hash(f"{url}#{i}".encode()), url))
+        points.sort()
+        self._points = [p for p, _ in points]
+        self._urls = [u for _, u in points]
+        self._distinct = len(set(urls))
+
+    def candidates(self, key: bytes) -> list[str]:
+        """Distinct backends in ring order, starting with the owner of key."""
+        start = bisect.bisect(self._points, _hash(key))
+        seen: list[str] = []
+        for i in range(len(self._urls)):
+            url = self._urls[(start + i) % len(self._urls)]
+            if url not in seen:
+                seen.append(url)
+                if len(seen) == self._distinct:
+                    break
+        return seen
+
+
+class PrefixAffinity:
+    def __init__(self, settings: AffinitySettings):
+        self._rings: dict[tuple, HashRing] = {}
+        self.reconfigure(settings)
+
+    def reconfigure(self, settings: AffinitySettings) -> None:
+        self._settings = settings
+        self._routes = frozenset(settings.routes)
+
+    def enabled(self, route_key: str, path: str) -> bool:
+        return route_key in self._routes and path in AFFINITY_PATHS
+
+    def key(self, body: bytes) -> bytes | None:
+        return prefix_key(body, self._settings.messages)
+
+    def _ring(self, pool: Sequence[str], weights: Mapping[str, float]) -> HashRing:
+        ring_key = (tuple(pool), tuple(sorted(weights.items())), self._settings.vnodes)
+        ring = self._rings.get(ring_key)
+        if ring is None:
+            if len(self._rings) >= RINGS_MAX:
+                self._rings.clear()
+            ring = self._rings[ring_key] = HashRing(pool, weights, self._settings.vnodes)
+        return ring
+
+    def choose(
+        self,
+        key: bytes,
+        pool: Sequence[str],
+        weights: Mapping[str, float],
+        balancer: LeastOutstandingBalancer,
+        health: HealthMonitor,
+    ) -> tuple[str, str] | None:
+        """
+        Return (backend_url, reason) for a conversation key, or None if no pool member can take it.
+
+        reason is "affinity" when the ring owner was used and "affinity_spill"
+        when its circuit was not closed or it was over its load bound.
+        """
+        total_weight = sum(weights.get(url, 1.0) for url in pool)
+        total_in_flight = sum(balancer.in_flight(url) for url in pool)
+        for i, url in enumerate(self._ring(pool, weights).candidates(key)):
+            if not health.is_closed(url):
+                continue
+            share = weights.get(url, 1.0) / total_weight
+            bound = math.ceil(self._settings.load_factor * (total_in_flight + 1) * share)
+            if balancer.in_flight(url) + 1 > bound:
+                continue
+            return url, "affinity" if i == 0 else "affinity_spill"
+        return None
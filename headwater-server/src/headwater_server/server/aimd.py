@@ -0,0 +1,132 @@
+"""
+AIMD (additive-increase, multiplicative-decrease) in-flight limit for adaptive conduit batches.
+
+A fixed max_concurrent is either too low (Ollama idles between requests) or too
+high (requests queue inside the runtime until they hit ReadTimeout), and the
+right value moves with model size and whatever else the node is serving. With
+`adaptive_concurrency` the batch instead starts at `min_concurrent` and lets
+each finished item move the limit, TCP-style:
+
+- Cost signal: seconds per generated token (the inverse of the item's tokens/s),
+  or plain seconds when the result reports no token counts. The baseline is the
+  cheapest cost seen, allowed to drift up by BASELINE_DRIFT per item so a batch
+  whose prompts get longer is not throttled forever by one early short item.
+- Increase: an item that finishes at most `tolerance` x baseline raises the
+  limit by 1 during slow start (doubling per round), and by 1/limit afterwards
+  (about +1 per round of `limit` items).
+- Decrease: an item slower than that, or an error rate above ERROR_RATE over the
+  last ERROR_WINDOW items, multiplies the limit by `backoff` and ends slow
+  start. Items that started before the last decrease cannot trigger another,
+  so one burst of congestion costs one backoff rather than one per in-flight
+  item.
+
+The limit always stays within [minimum, maximum].
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+BACKOFF = 0.7
+TOLERANCE = 2.0  # cost above this multiple of the baseline counts as congestion
+BASELINE_DRIFT = 0.01
+ERROR_WINDOW = 20
+ERROR_RATE = 0.2
+MIN_ERROR_SAMPLES = 5  # the first failures are measured against this many items, not fewer
+
+
+class AIMDLimiter:
+    """In-flight limit for one batch; acquire() before an item, release() with its outcome after."""
+
+    def __init__(
+        self,
+        minimum: int,
+        maximum: int,
+        model: str = "",
+        backoff: float = BACKOFF,
+        tolerance: float = TOLERANCE,
+    ):
+        if not 1 <= minimum <= maximum:
+            raise ValueError(f"need 1 <= minimum <= maximum, got {minimum}, {maximum}")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.model = model
+        self._backoff = backoff
+        self._tolerance = tolerance
+        self._limit = float(minimum)
+        self._slow_start = True
+        self._baseline: float | None = None
+        self._last_decrease = 0.0
+        self._outcomes: deque[bool] = deque(maxlen=ERROR_WINDOW)
+        self._in_flight = 0
+        self._changed = asyncio.Condition()
+        self.peak = minimum
+        self.tokens = 0
+        self.started_at = time.monotonic()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    async def acquire(self) -> float:
+        """Wait for an in-flight slot; returns the start time to pass back to release()."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return time.monotonic()
+
+    async def release(self, started: float, ok: bool, tokens: int = 0) -> None:
+        """Free the slot and adjust the limit from the item's outcome and cost."""
+        seconds = time.monotonic() - started
+        self.tokens += tokens
+        self._outcomes.append(ok)
+        previous = self.limit
+        direction, reason = self._adjust(started, ok, seconds / tokens if tokens else seconds)
+        async with self._changed:
+            self._in_flight -= 1
+            self._changed.notify_all()
+        if self.limit != previous:
+            from headwater_server.server.metrics import conduit_metrics
+
+            metrics = conduit_metrics()
+            metrics.record_batch_adjustment(self.model, direction, reason)
+            metrics.record_batch_concurrency(self.limit, self.model)
+            logger.debug(
+                "batch_concurrency_changed",
+                extra={"model": self.model, "limit": self.limit, "previous": previous, "reason": reason},
+            )
+
+    def _adjust(self, started: float, ok: bool, cost: float) -> tuple[str, str]:
+        if ok:
+            self._baseline = cost if self._baseline is None else min(cost, self._baseline * (1 + BASELINE_DRIFT))
+        error_rate = self._outcomes.count(False) / max(len(self._outcomes), MIN_ERROR_SAMPLES)
+        if error_rate > ERROR_RATE:
+            reason = "errors"
+        elif ok and cost > self._tolerance * self._baseline:
+            reason = "latency"
+        elif ok:
+            step = 1.0 if self._slow_start else 1.0 / self._limit
+            self._limit = min(float(self.maximum), self._limit + step)
+            self.peak = max(self.peak, self.limit)
+            return "increase", "ok"
+        else:
+            return "none", "errors"  # an isolated failure: neither a congestion signal nor a success
+        if started >= self._last_decrease:
+            self._limit = max(float(self.minimum), self._limit * self._backoff)
+            self._slow_start = False
+            self._last_decrease = time.monotonic()
+        return "decrease", reason
+
+    def summary(self) -> dict[str, float]:
+        """Log extras for batch_completed."""
+        elapsed = time.monotonic() - self.started_at
+        return {
+            "final_concurrency": self.limit,
+            "peak_concurrency": self.peak,
+            "tokens_per_s": round(self.tokens / elapsed, 1) if elapsed > 0 else 0.0,
+        }
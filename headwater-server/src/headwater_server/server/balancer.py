@@ -0,0 +1,52 @@
+"""
+Least-outstanding-requests load balancing across a route's backend pool.
+
+A route in routes.yaml may list several backends (e.g. bywater and backwater
+both serving embeddings). The router counts requests it currently has open to
+each backend URL and sends new work to the one with the lowest in-flight count
+per unit of weight. Counts cover the whole upstream exchange, including a
+streamed response body, so a long generation keeps its backend marked busy.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping, Sequence
+
+
+class LeastOutstandingBalancer:
+    def __init__(self):
+        self._lock = threading.Lock()  # read from the metrics scrape thread
+        self._in_flight: dict[str, int] = {}
+
+    def pick(self, candidates: Sequence[str], weights: Mapping[str, float] | None = None) -> str:
+        """
+        Return the candidate URL with the lowest (in_flight + 1) / weight.
+
+        Ties go to the earlier candidate, so an idle pool keeps using its primary.
+        """
+        if not candidates:
+            raise ValueError("pick() requires at least one candidate")
+        weights = weights or {}
+        with self._lock:
+            return min(
+                candidates,
+                key=lambda url: (self._in_flight.get(url, 0) + 1) / weights.get(url, 1.0),
+            )
+
+    def acquire(self, backend_url: str) -> None:
+        with self._lock:
+            self._in_flight[backend_url] = self._in_flight.get(backend_url, 0) + 1
+
+    def release(self, backend_url: str) -> None:
+        with self._lock:
+            remaining = self._in_flight.get(backend_url, 0) - 1
+            self._in_flight[backend_url] = max(remaining, 0)
+
+    def in_flight(self, backend_url: str) -> int:
+        with self._lock:
+            return self._in_flight.get(backend_url, 0)
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._in_flight)
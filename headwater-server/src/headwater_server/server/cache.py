@@ -0,0 +1,249 @@
+"""
+Router response cache for deterministic endpoints.
+
+Embeddings, tokenization, reranking and model lists return the same bytes for
+the same request, so repeats need not reach a GPU node. Paths listed under
+`cache.routes` in routes.yaml are cached by request key (method, target, body,
+Authorization) for that prefix's TTL:
+
+- memory tier: an LRU bounded by `cache.max_mb`. A single response larger than
+  an eighth of the budget is not cached, so one big batch cannot flush the rest.
+- disk tier (optional, `cache.disk_path`): a SQLite file bounded by
+  `cache.disk_max_mb`, so warm entries survive a router restart. Disk hits are
+  promoted to memory. SQLite calls run in a worker thread.
+
+Only 200 responses are stored. A request opts out with `Cache-Control: no-cache`
+/ `no-store` or `X-Headwater-Cache: bypass`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from headwater_server.server.coalesce import SharedResponse
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from headwater_server.server.routing_config import CacheSettings
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+CACHEABLE_METHODS = frozenset({"GET", "POST"})
+MAX_ENTRY_FRACTION = 8  # largest cacheable entry = budget / MAX_ENTRY_FRACTION
+
+
+def bypasses_cache(headers: Mapping[str, str]) -> bool:
+    cache_control = headers.get("cache-control", "").lower()
+    return (
+        "no-cache" in cache_control
+        or "no-store" in cache_control
+        or headers.get("x-headwater-cache", "").lower() == "bypass"
+    )
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    response: SharedResponse
+    route: str              # the cache.routes prefix that matched
+    expires_at: float       # time.time()
+
+    @property
+    def size(self) -> int:
+        headers = sum(len(k) + len(v) for k, v in self.response.headers.items())
+        return len(self.response.body) + headers + 64
+
+
+class _DiskTier:
+    """SQLite-backed second tier. All methods block; call them via asyncio.to_thread."""
+
+    def __init__(self, path: Path, max_bytes: int):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key BLOB PRIMARY KEY, route TEXT, expires_at REAL, last_access REAL,"
+            " status INTEGER, headers TEXT, body BLOB, size INTEGER)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+        self.evictions = 0
+
+    def get(self, key: bytes) -> CacheEntry | None:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT route, expires_at, status, headers, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            route, expires_at, status, headers, body = row
+            if expires_at <= now:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        return CacheEntry(SharedResponse(status, json.loads(headers), body), route, expires_at)
+
+    def put(self, key: bytes, entry: CacheEntry) -> None:
+        response = entry.response
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.route, entry.expires_at, time.time(), response.status_code,
+                 json.dumps(response.headers), response.body, entry.size),
+            )
+            self._trim()
+
+    def _trim(self) -> None:
+        self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        while total > self._max_bytes:
+            row = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (row[0],))
+            total -= row[1]
+            self.evictions += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class ResponseCache:
+    def __init__(self, settings: CacheSettings):
+        self._entries: OrderedDict[bytes, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._disk: _DiskTier | None = None
+        self._pending: set[asyncio.Task] = set()        # disk writes in flight
+        self._hits: dict[tuple[str, str], int] = {}    # (route, tier) -> count
+        self._misses: dict[str, int] = {}               # route -> count
+        self._evictions = 0
+        self.reconfigure(settings)
+
+    def reconfigure(self, settings: CacheSettings) -> None:
+        """Adopt new rules and budgets. The disk tier is opened once; a new disk_path needs a restart."""
+        self._settings = settings
+        self._max_bytes = int(settings.max_mb * MB)
+        # Longest prefix first, so `conduit/embeddings` beats `conduit`.
+        self._rules = sorted(settings.routes.items(), key=lambda item: len(item[0]), reverse=True)
+        if settings.disk_path is not None and self._disk is None:
+            try:
+                self._disk = _DiskTier(settings.disk_path, int(settings.disk_max_mb * MB))
+            except (OSError, sqlite3.Error) as exc:
+                logger.error("cache_disk_unavailable", extra={"path": str(settings.disk_path), "error": str(exc)})
+        self._trim()
+
+    def rule(self, path: str) -> tuple[str, float] | None:
+        """Return (prefix, ttl) of the cache rule covering path, or None if the path is not cached."""
+        for prefix, ttl in self._rules:
+            if path == prefix or path.startswith(prefix + "/"):
+                return prefix, ttl
+        return None
+
+    # ── Lookup / store ───────────────────────────────────────────────────────
+
+    async def get(self, key: bytes, route: str) -> tuple[SharedResponse, str] | None:
+        """Return (response, tier) on a hit, where tier is "memory" or "disk"."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.time():
+                self._entries.move_to_end(key)
+                self._count_hit(route, "memory")
+                return entry.response, "memory"
+            self._remove(key)
+
+        if self._disk is not None:
+            try:
+                entry = await asyncio.to_thread(self._disk.get, key)
+            except sqlite3.Error as exc:
+                logger.warning("cache_disk_read_failed", extra={"error": str(exc)})
+                entry = None
+            if entry is not None:
+                self._store_memory(key, entry)
+                self._count_hit(route, "disk")
+                return entry.response, "disk"
+
+        self._misses[route] = self._misses.get(route, 0) + 1
+        return None
+
+    def put(self, key: bytes, route: str, ttl: float, response: SharedResponse) -> None:
+        """Store a 200 response; the disk write, if any, runs in the background."""
+        if response.status_code != 200:
+            return
+        entry = CacheEntry(response, route, time.time() + ttl)
+        if entry.size > self._max_bytes // MAX_ENTRY_FRACTION:
+            return
+        self._store_memory(key, entry)
+        if self._disk is not None:
+            task = asyncio.ensure_future(self._write_disk(key, entry))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _write_disk(self, key: bytes, entry: CacheEntry) -> None:
+        disk = self._disk
+        if disk is None:
+            return
+        try:
+            await asyncio.to_thread(disk.put, key, entry)
+        except sqlite3.Error as exc:
+            logger.warning("cache_disk_write_failed", extra={"error": str(exc)})
+
+    async def flush(self) -> None:
+        """Wait for background disk writes."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def _store_memory(self, key: bytes, entry: CacheEntry) -> None:
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        self._trim()
+
+    def _remove(self, key: bytes) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+    def _trim(self) -> None:
+        while self._bytes > self._max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._evictions += 1
+
+    def _count_hit(self, route: str, tier: str) -> None:
+        self._hits[(route, tier)] = self._hits.get((route, tier), 0) + 1
+
+    # ── Read side ────────────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        """Counters for the metrics scrape."""
+        return {
+            "hits": dict(self._hits),
+            "misses": dict(self._misses),
+            "evictions": {
+                "memory": self._evictions,
+                "disk": self._disk.evictions if self._disk is not None else 0,
+            },
+            "memory_bytes": self._bytes,
+            "memory_entries": len(self._entries),
+        }
+
+    async def aclose(self) -> None:
+        await self.flush()
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
@@ -0,0 +1,73 @@
+"""
+Single-flight coalescing of identical in-flight requests in the router.
+
+RAG pipelines often send the same /conduit/embeddings/quick, /reranker/rerank
+or /conduit/tokenize payload from many workers at once. For routes listed
+under `coalesce:` in routes.yaml, the router hashes method, target, body and
+Authorization header; the first request with a given key (the leader) goes
+upstream and every identical request that arrives while it is in flight (a
+follower) waits for the leader's buffered response instead of sending a
+duplicate to the GPU node.
+
+The upstream call runs in its own task, so a leader whose client disconnects
+does not cancel the response its followers are waiting on. Failures are shared
+too: followers get the leader's error response.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+COALESCIBLE_METHODS = frozenset({"GET", "POST"})
+
+
+def request_key(method: str, target: str, body: bytes, *vary: str) -> bytes:
+    """Hash of method, target (path + query), body and any varying header values."""
+    digest = hashlib.sha256()
+    for part in (method.encode(), target.encode(), body, *(v.encode() for v in vary)):
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.digest()
+
+
+@dataclass(frozen=True)
+class SharedResponse:
+    """A fully buffered upstream response that can be replayed to every waiter."""
+
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls: dict[bytes, asyncio.Task[SharedResponse]] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(
+        self, key: bytes, fn: Callable[[], Awaitable[SharedResponse]]
+    ) -> tuple[SharedResponse, bool]:
+        """Return (response, shared); shared is True when another request's call was joined."""
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task), True
+
+        self.leaders += 1
+        task = asyncio.ensure_future(fn())
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), False
+
+    def _forget(self, key: bytes, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved; every waiter may already be gone
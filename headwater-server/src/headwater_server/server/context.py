@@ -1,5 +1,12 @@
 from __future__ import annotations
 
 from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from headwater_server.server.deadline import Deadline
+    from headwater_server.server.timing import ServerTiming
 
 request_id_var: ContextVar[str] = ContextVar("request_id", default="system")
+server_timing_var: ContextVar[ServerTiming | None] = ContextVar("server_timing", default=None)
+deadline_var: ContextVar[Deadline | None] = ContextVar("deadline", default=None)
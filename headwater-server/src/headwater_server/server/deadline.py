@@ -0,0 +1,205 @@
+"""
+Request deadlines: propagation from client to router to subserver, and early abandonment.
+
+A caller that will only wait N seconds sends `X-Headwater-Deadline: N`, the
+budget in seconds (decimal) from when the request is sent. The value is relative
+rather than a wall-clock time so hosts need not agree on the clock: each hop
+turns it into a local monotonic deadline on arrival and forwards what is left,
+so time spent queueing or retrying in the router comes off the subserver's
+budget.
+
+DeadlineMiddleware (plain ASGI, installed on the router and every subserver):
+- answers 504 at once if the budget is already spent on arrival;
+- cancels the handler when the deadline passes (504 if nothing was sent yet);
+- cancels the handler when the client disconnects. It watches for that once the
+  handler has read the request body; the reply then goes nowhere, so it is a 499.
+
+Cancelling the handler closes its upstream and Ollama connections, which stops
+remote generation. Work in executor threads cannot be interrupted from outside,
+so services check the Deadline from current() before expensive work and between
+batch chunks. Threads do not inherit context variables, so the Deadline object
+is passed into them. Cancellation also marks it expired, so a thread's next
+check() stops it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import time
+from collections.abc import Mapping
+
+from headwater_server.server.context import deadline_var
+
+logger = logging.getLogger(__name__)
+
+DEADLINE_HEADER = "x-headwater-deadline"
+
+# nginx's "client closed request"; never seen by the client, only in logs and metrics.
+CLIENT_CLOSED_STATUS = 499
+
+
+class DeadlineExceeded(Exception):
+    """The request's deadline passed or its client went away; reason says which."""
+
+    def __init__(self, reason: str = "deadline"):
+        super().__init__("client disconnected" if reason == "client_disconnected" else "request deadline exceeded")
+        self.reason = reason
+
+    @property
+    def status_code(self) -> int:
+        return CLIENT_CLOSED_STATUS if self.reason == "client_disconnected" else 504
+
+
+class Deadline:
+    """A monotonic deadline (or none) plus a cancellation flag, shared with worker threads."""
+
+    def __init__(self, budget: float | None = None):
+        self.at = None if budget is None else time.monotonic() + budget
+        self.cancelled: str | None = None
+
+    def remaining(self) -> float | None:
+        """Seconds left, never negative; None without a deadline."""
+        return None if self.at is None else max(0.0, self.at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.cancelled is not None or (self.at is not None and time.monotonic() >= self.at)
+
+    def cancel(self, reason: str) -> None:
+        if self.cancelled is None:
+            self.cancelled = reason
+
+    def check(self) -> None:
+        """Raise DeadlineExceeded if the work should stop; call before and between expensive steps."""
+        if self.expired():
+            raise DeadlineExceeded(self.cancelled or "deadline")
+
+
+def parse_budget(value: str | None) -> float | None:
+    """Seconds from an X-Headwater-Deadline value; None if absent or malformed."""
+    if value is None:
+        return None
+    try:
+        budget = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(budget):
+        return None
+    return max(0.0, budget)
+
+
+def current() -> Deadline:
+    """The current request's Deadline; an unbounded one outside a request."""
+    return deadline_var.get() or Deadline()
+
+
+def check_deadline() -> None:
+    current().check()
+
+
+def with_deadline(headers: Mapping[str, str]) -> dict[str, str]:
+    """headers with X-Headwater-Deadline set to the current request's remaining budget."""
+    remaining = current().remaining()
+    out = {k: v for k, v in headers.items() if k.lower() != DEADLINE_HEADER}
+    if remaining is not None:
+        out[DEADLINE_HEADER] = f"{remaining:.3f}"
+    return out
+
+
+async def _send_error(send, status_code: int, reason: str, path: str, method: str) -> None:
+    from headwater_api.classes import HeadwaterServerError, ErrorType
+
+    error = HeadwaterServerError(
+        error_type=ErrorType.CLIENT_DISCONNECTED if reason == "client_disconnected" else ErrorType.DEADLINE_EXCEEDED,
+        message=str(DeadlineExceeded(reason)),
+        status_code=status_code,
+        path=path,
+        method=method,
+    )
+    body = json.dumps(error.model_dump(mode="json")).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class DeadlineMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        value = next((v.decode("latin-1") for k, v in scope["headers"] if k == DEADLINE_HEADER.encode()), None)
+        deadline = Deadline(parse_budget(value))
+        token = deadline_var.set(deadline)
+        try:
+            if deadline.expired():
+                logger.info("request_abandoned", extra={"path": scope["path"], "reason": "deadline", "stage": "arrival"})
+                await _send_error(send, 504, "deadline", scope["path"], scope["method"])
+                return
+            await self._run(scope, receive, send, deadline)
+        finally:
+            deadline_var.reset(token)
+
+    async def _run(self, scope, receive, send, deadline: Deadline) -> None:
+        body_read = asyncio.Event()
+        disconnected = asyncio.Event()
+        started = False
+
+        async def app_receive():
+            if body_read.is_set():
+                # The watcher owns the real receive from here on.
+                await disconnected.wait()
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                disconnected.set()
+            elif not message.get("more_body", False):
+                body_read.set()
+            return message
+
+        async def app_send(message) -> None:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        async def watch_disconnect() -> None:
+            await body_read.wait()
+            while (await receive())["type"] != "http.disconnect":
+                pass
+            disconnected.set()
+
+        app_task = asyncio.ensure_future(self.app(scope, app_receive, app_send))
+        watcher = asyncio.ensure_future(watch_disconnect())
+        gone = asyncio.ensure_future(disconnected.wait())
+        try:
+            done, _ = await asyncio.wait({app_task, gone}, timeout=deadline.remaining(), return_when=asyncio.FIRST_COMPLETED)
+            if app_task in done:
+                app_task.result()
+                return
+            reason = "client_disconnected" if gone in done else "deadline"
+            deadline.cancel(reason)
+            app_task.cancel()
+            try:
+                await app_task
+            except asyncio.CancelledError:
+                pass
+            except DeadlineExceeded:
+                pass
+            logger.info(
+                "request_abandoned",
+                extra={"path": scope["path"], "reason": reason, "stage": "streaming" if started else "handler"},
+            )
+            if not started:
+                status = CLIENT_CLOSED_STATUS if reason == "client_disconnected" else 504
+                await _send_error(send, status, reason, scope["path"], scope["method"])
+        finally:
+            for task in (watcher, gone, app_task):
+                task.cancel()
@@ -3,6 +3,7 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 from headwater_api.classes import HeadwaterServerError, ErrorType
+from headwater_server.server.deadline import DeadlineExceeded
 import json
 import logging
 
@@ -117,6 +118,21 @@ class ErrorHandlers:
 
             return JSONResponse(status_code=422, content=error.model_dump())
 
+        @self.app.exception_handler(DeadlineExceeded)
+        async def deadline_exceeded_handler(request: Request, exc: DeadlineExceeded) -> JSONResponse:
+            """A service gave up on work whose deadline passed or whose client left."""
+
+            logger.info("request_abandoned", extra={"path": request.url.path, "reason": exc.reason, "stage": "service"})
+            error = HeadwaterServerError(
+                error_type=ErrorType.CLIENT_DISCONNECTED if exc.reason == "client_disconnected" else ErrorType.DEADLINE_EXCEEDED,
+                message=str(exc),
+                status_code=exc.status_code,
+                path=str(request.url.path),
+                method=request.method,
+                request_id=getattr(request.state, "request_id", None),
+            )
+            return JSONResponse(status_code=exc.status_code, content=error.model_dump())
+
         @self.app.exception_handler(Exception)
         async def general_exception_handler(request: Request, exc: Exception):
             """Catch-all exception handler"""
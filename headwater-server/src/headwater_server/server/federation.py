@@ -0,0 +1,141 @@
+"""
+Federated /metrics: one Prometheus scrape target for the router and every backend.
+
+GET /metrics/federate on the router fetches each backend's /metrics in parallel
+on the pooled upstream clients. It adds a `backend` label to every sample; a
+sample that already has one keeps it as `exported_backend`, as Prometheus
+federation does. Same-named families are merged into one exposition, together
+with the router's own metrics (backend="router").
+
+Each backend gets `federation.timeout` seconds. A backend that is slower, down
+or answers with something unparsable is left out and reported as
+headwater_federate_up{backend}=0, so one slow node cannot stretch the scrape
+past that bound. The merged text is cached for `federation.cache_ttl` seconds
+and concurrent scrapes share one fetch, so several dashboards polling at once
+cost the fleet a single round.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING
+
+from prometheus_client import REGISTRY, CollectorRegistry, generate_latest
+from prometheus_client.core import GaugeMetricFamily, Metric
+from prometheus_client.parser import text_string_to_metric_families
+
+if TYPE_CHECKING:
+    from headwater_server.server.routing_config import FederationSettings
+    from headwater_server.server.upstream import UpstreamPool
+
+logger = logging.getLogger(__name__)
+
+ROUTER_BACKEND = "router"  # backend label of the router's own series
+
+
+def _with_backend(labels: Mapping[str, str], backend: str) -> dict[str, str]:
+    labels = dict(labels)
+    if "backend" in labels:
+        labels["exported_backend"] = labels.pop("backend")
+    labels["backend"] = backend
+    return labels
+
+
+def relabel(text: str, backend: str) -> list[Metric]:
+    """Parse one exposition and add backend=<name> to every sample."""
+    families = list(text_string_to_metric_families(text))
+    for family in families:
+        family.samples = [s._replace(labels=_with_backend(s.labels, backend)) for s in family.samples]
+    return families
+
+
+def merge(scrapes: Iterable[list[Metric]]) -> list[Metric]:
+    """One family per metric name; a name seen with a different type keeps the first type's series only."""
+    merged: dict[str, Metric] = {}
+    for families in scrapes:
+        for family in families:
+            existing = merged.get(family.name)
+            if existing is None:
+                merged[family.name] = family
+            elif existing.type == family.type:
+                existing.samples.extend(family.samples)
+            else:
+                logger.debug(
+                    "federate_type_conflict",
+                    extra={"metric": family.name, "type": family.type, "kept_type": existing.type},
+                )
+    return list(merged.values())
+
+
+class _Families:
+    """Collector that yields pre-built families, so generate_latest can render them."""
+
+    def __init__(self, families: list[Metric]):
+        self._families = families
+
+    def collect(self) -> list[Metric]:
+        return self._families
+
+
+def render(families: list[Metric]) -> bytes:
+    registry = CollectorRegistry(auto_describe=False)
+    registry.register(_Families(families))
+    return generate_latest(registry)
+
+
+class MetricsFederator:
+    def __init__(self, upstream: UpstreamPool, settings: FederationSettings):
+        self._upstream = upstream
+        self._settings = settings
+        self._cached: tuple[float, bytes] | None = None
+        self._inflight: asyncio.Task | None = None
+
+    def reconfigure(self, settings: FederationSettings) -> None:
+        self._settings = settings
+        self._cached = None
+
+    async def _scrape(self, name: str, url: str) -> tuple[str, list[Metric] | None, float]:
+        start = time.monotonic()
+        try:
+            resp = await self._upstream.client(url).get("/metrics", timeout=self._settings.timeout)
+            resp.raise_for_status()
+            families = relabel(resp.text, name)
+        except Exception as exc:  # any failure just drops this backend from the round
+            logger.warning("federate_scrape_failed", extra={"backend": name, "error": str(exc) or type(exc).__name__})
+            families = None
+        return name, families, time.monotonic() - start
+
+    async def _collect(self, backends: Mapping[str, str]) -> bytes:
+        results = await asyncio.gather(*(self._scrape(name, url) for name, url in backends.items()))
+        up = GaugeMetricFamily(
+            "headwater_federate_up", "1 if the backend's /metrics was scraped in this federated round", labels=["backend"]
+        )
+        duration = GaugeMetricFamily(
+            "headwater_federate_scrape_duration_seconds",
+            "Time taken to scrape the backend's /metrics in this federated round",
+            labels=["backend"],
+        )
+        scrapes = [relabel(generate_latest(REGISTRY).decode(), ROUTER_BACKEND)]
+        for name, families, elapsed in results:
+            up.add_metric([name], 0.0 if families is None else 1.0)
+            duration.add_metric([name], round(elapsed, 4))
+            if families is not None:
+                scrapes.append(families)
+        return render(merge(scrapes) + [up, duration])
+
+    async def exposition(self, backends: Mapping[str, str]) -> bytes:
+        """The merged exposition, from cache if it is younger than cache_ttl."""
+        if self._cached is not None and time.monotonic() - self._cached[0] < self._settings.cache_ttl:
+            return self._cached[1]
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._collect(backends))
+            self._inflight.add_done_callback(self._finished)
+        return await asyncio.shield(self._inflight)
+
+    def _finished(self, task: asyncio.Task) -> None:
+        self._inflight = None
+        if not task.cancelled() and task.exception() is None:
+            self._cached = (time.monotonic(), task.result())
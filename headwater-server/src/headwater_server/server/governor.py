@@ -0,0 +1,187 @@
+"""
+Process-wide per-model concurrency limits for the subserver's conduit services.
+
+Each /conduit/batch call used to bound only its own items, and /conduit/generate,
+/v1/chat/completions, /v1/messages and /v1/responses had no bound at all, so
+three clients running max_concurrent=8 against one Ollama model put 24+
+requests on a runtime that serves a few in parallel. The rest wait inside
+Ollama, invisible to us, until they hit a read timeout.
+
+Every conduit model call now holds a slot from one ModelGovernor, keyed by the
+resolved model name, for as long as the model is generating. Limits come from
+the optional ~/.config/headwater/concurrency.yaml:
+
+    ollama: 4              # models served by the local Ollama that are not listed below
+    models:                # resolved model name -> max concurrent calls
+      qwen3:30b: 2
+      gpt-4o: 32
+
+A model with no entry that is not served by Ollama is not limited. Waiters
+are served strictly FIFO across all callers. A batch queues one waiter per
+item it is ready to run, so a later interactive request waits behind at most
+the batch's current in-flight items, not the whole batch. Time spent queued
+is recorded in the headwater.conduit.queue.wait histogram. A queued request
+whose client goes away or whose deadline passes is cancelled by
+DeadlineMiddleware and leaves the queue.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+CONCURRENCY_YAML_PATH = Path.home() / ".config" / "headwater" / "concurrency.yaml"
+
+DEFAULT_OLLAMA_LIMIT = 4  # Ollama's own default OLLAMA_NUM_PARALLEL
+
+
+class GovernorConfigError(Exception):
+    """Raised at startup when concurrency.yaml is present but invalid."""
+
+
+@dataclass(frozen=True)
+class GovernorConfig:
+    ollama: int | None = DEFAULT_OLLAMA_LIMIT        # limit for unlisted Ollama models (None: unlimited)
+    models: dict[str, int] = field(default_factory=dict)  # resolved model name -> limit
+
+
+def _limit(value, where: str) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise GovernorConfigError(f"concurrency.yaml: {where} must be a positive integer or null, got {value!r}")
+    return value
+
+
+def load_governor_config(path: Path = CONCURRENCY_YAML_PATH) -> GovernorConfig:
+    """Load concurrency.yaml; defaults when the file does not exist."""
+    if not path.exists():
+        return GovernorConfig()
+    with open(path) as f:
+        try:
+            raw = yaml.safe_load(f) or {}
+        except yaml.YAMLError as exc:
+            raise GovernorConfigError(f"concurrency.yaml is not valid YAML: {exc}") from exc
+    if not isinstance(raw, dict):
+        raise GovernorConfigError(f"concurrency.yaml must be a mapping, got {type(raw).__name__}")
+    unknown = set(raw) - {"ollama", "models"}
+    if unknown:
+        raise GovernorConfigError(f"concurrency.yaml has unknown keys: {sorted(unknown)}")
+    models = raw.get("models") or {}
+    if not isinstance(models, dict):
+        raise GovernorConfigError("concurrency.yaml: models must be a mapping of model name to limit")
+    return GovernorConfig(
+        ollama=_limit(raw.get("ollama", DEFAULT_OLLAMA_LIMIT), "ollama"),
+        models={str(name): _limit(limit, f"models.{name}") for name, limit in models.items()},
+    )
+
+
+class _ModelGate:
+    """Concurrency limit for one model with a FIFO queue; limit None means unlimited."""
+
+    def __init__(self, limit: int | None):
+        self.limit = limit
+        self.in_flight = 0
+        self.waiters: deque[asyncio.Future] = deque()
+
+    def queued(self) -> int:
+        return sum(not f.done() for f in self.waiters)
+
+    async def acquire(self) -> None:
+        if self.limit is None or (self.in_flight < self.limit and not self.queued()):
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self.release()  # a slot was handed over to a caller that went away
+            else:
+                waiter.cancel()
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        while self.waiters and (self.limit is None or self.in_flight < self.limit):
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class ModelGovernor:
+    def __init__(self, config: GovernorConfig, is_ollama: Callable[[str], bool] = lambda model: False):
+        self._config = config
+        self._is_ollama = is_ollama
+        self._gates: dict[str, _ModelGate] = {}
+
+    def limit(self, model: str) -> int | None:
+        if model in self._config.models:
+            return self._config.models[model]
+        return self._config.ollama if self._is_ollama(model) else None
+
+    def _gate(self, model: str) -> _ModelGate:
+        gate = self._gates.get(model)
+        if gate is None:
+            gate = self._gates[model] = _ModelGate(self.limit(model))
+        return gate
+
+    @asynccontextmanager
+    async def slot(self, model: str, endpoint: str) -> AsyncIterator[float]:
+        """Hold one of model's slots for the body; yields the milliseconds spent queued."""
+        gate = self._gate(model)
+        start = time.monotonic()
+        await gate.acquire()
+        waited_ms = (time.monotonic() - start) * 1000
+        try:
+            if gate.limit is not None:
+                from headwater_server.server.metrics import conduit_metrics
+
+                conduit_metrics().record_queue_wait(waited_ms, model, endpoint)
+                if waited_ms >= 1:
+                    logger.debug(
+                        "model_slot_waited",
+                        extra={"model": model, "endpoint": endpoint, "waited_ms": round(waited_ms, 1)},
+                    )
+            yield waited_ms
+        finally:
+            gate.release()
+
+    def snapshot(self) -> dict[str, dict]:
+        """Per limited model: limit, in_flight and queued, for metrics."""
+        return {
+            model: {"limit": gate.limit, "in_flight": gate.in_flight, "queued": gate.queued()}
+            for model, gate in self._gates.items()
+            if gate.limit is not None
+        }
+
+
+_governor: ModelGovernor | None = None
+
+
+def model_governor() -> ModelGovernor:
+    """The subserver's ModelGovernor, built from concurrency.yaml on first use."""
+    global _governor
+    if _governor is None:
+        from headwater_server.services.conduit_service.token_stream import is_ollama_model
+
+        def is_ollama(model: str) -> bool:
+            try:
+                return is_ollama_model(model)
+            except FileNotFoundError:  # no model store: nothing is known to be Ollama
+                return False
+
+        _governor = ModelGovernor(load_governor_config(), is_ollama)
+    return _governor
@@ -16,7 +16,13 @@ from headwater_server.api.embeddings_server_api import EmbeddingsServerAPI
 from headwater_server.api.curator_server_api import CuratorServerAPI
 from headwater_server.api.siphon_server_api import SiphonServerAPI
 from headwater_server.api.headwater_api import HeadwaterServerAPI
+from headwater_server.api.jobs_server_api import JobsServerAPI
 from headwater_server.api.reranker_server_api import RerankerServerAPI
+from headwater_server.server.deadline import DeadlineMiddleware
+from headwater_server.server.governor import model_governor
+from headwater_server.server.jobs import JobRunner
+from headwater_server.server.timing import HEADER, ServerTiming, TimedJSONResponse
+from headwater_server.services.jobs_service.job_specs import JOB_SPECS
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +30,7 @@ logger = logging.getLogger(__name__)
 class HeadwaterServer:
     def __init__(self, name: str = "Headwater API Server"):
         self._name = name
+        self._jobs = JobRunner(JOB_SPECS)
         self.app: FastAPI = self._create_app()
         self._register_routes()
         self._register_middleware()
@@ -31,6 +38,7 @@ class HeadwaterServer:
 
     def _create_app(self) -> FastAPI:
         name = self._name  # capture for closure
+        jobs = self._jobs
 
         @asynccontextmanager
         async def lifespan(app: FastAPI):
@@ -48,15 +56,20 @@ class HeadwaterServer:
                         "models_in_db": len(EmbeddingModelStore.get_all_specs()),
                     },
                 )
+            # Load concurrency.yaml now, so a bad file fails startup rather than the first LLM call.
+            model_governor()
+            await jobs.start()
             yield
             # Shutdown
             logger.info(f"{name} shutting down...")
+            await jobs.stop()
 
         return FastAPI(
             title=self._name,
             description="Universal content ingestion and LLM processing API",
             version="1.0.0",
             lifespan=lifespan,
+            default_response_class=TimedJSONResponse,
         )
 
     def _register_routes(self):
@@ -70,6 +83,7 @@ class HeadwaterServer:
         SiphonServerAPI(self.app).register_routes()
         HeadwaterServerAPI(self.app, server_name=self._name).register_routes()
         RerankerServerAPI(self.app).register_routes()
+        JobsServerAPI(self.app, self._jobs).register_routes()
 
     def _register_middleware(self):
         """
@@ -77,7 +91,10 @@ class HeadwaterServer:
         and runs before CORSMiddleware (which is added last via add_middleware).
         """
         from fastapi.middleware.cors import CORSMiddleware
-        from headwater_server.server.context import request_id_var
+        from headwater_server.server.context import request_id_var, server_timing_var
+
+        # Added first so it sits inside the correlation middleware: its 504/499s get X-Request-ID and are logged.
+        self.app.add_middleware(DeadlineMiddleware)
 
         @self.app.middleware("http")
         async def correlation_middleware(
@@ -93,6 +110,8 @@ class HeadwaterServer:
 
             request.state.request_id = request_id
             token = request_id_var.set(request_id)
+            timing = ServerTiming()
+            timing_token = server_timing_var.set(timing)
             start = time.monotonic()
             status_code = 500
 
@@ -133,6 +152,7 @@ class HeadwaterServer:
                 status_code = 500
             finally:
                 duration_ms = round((time.monotonic() - start) * 1000, 1)
+                timing.add("app", duration_ms)
                 extra: dict = {
                     "path": request.url.path,
                     "method": request.method,
@@ -142,11 +162,14 @@ class HeadwaterServer:
                 model = getattr(request.state, "model", None)
                 if model is not None:
                     extra["model"] = model
+                extra.update(timing.log_extra())
                 logger.debug("request_finished", extra=extra)
+                server_timing_var.reset(timing_token)
                 request_id_var.reset(token)
 
             if response is not None:
                 response.headers["X-Request-ID"] = request_id
+                response.headers[HEADER] = timing.header()
             return response
 
         self.app.add_middleware(
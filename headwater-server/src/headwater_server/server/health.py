@@ -0,0 +1,187 @@
+"""
+Active backend health checking and per-backend circuit breakers for the router.
+
+A single background task pings every backend's /ping on the pooled upstream
+clients every `health.interval` seconds and caches the result (up/down and
+probe latency). The proxy consults the circuit before each attempt, so requests
+skip a known-dead backend immediately instead of paying its connect timeout.
+
+Circuit states:
+- closed:    traffic flows. `failure_threshold` consecutive failures (probe or
+             proxied request) open it.
+- open:      traffic skips the backend. After `cooldown` seconds one trial
+             request is let through (half-open). A successful probe closes it.
+- half_open: one trial in flight; its success closes the circuit, its failure
+             re-opens it for another cooldown.
+
+The metrics scrape reads snapshot() instead of pinging synchronously.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from headwater_server.server.routing_config import RouterConfig
+    from headwater_server.server.upstream import UpstreamPool
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class BackendHealth:
+    up: bool = False                      # last active probe succeeded
+    latency_ms: float | None = None       # last successful probe round-trip
+    last_probe: float | None = None       # time.monotonic() of the last probe
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    trial_in_flight: bool = False
+
+
+class HealthMonitor:
+    def __init__(self, config: RouterConfig, upstream: UpstreamPool):
+        self._config = config
+        self._settings = config.health
+        self._upstream = upstream
+        self._url_to_name: dict[str, str] = {url: name for name, url in config.backends.items()}
+        self._health: dict[str, BackendHealth] = {url: BackendHealth() for url in config.backends.values()}
+        self._task: asyncio.Task | None = None
+
+    def reconfigure(self, config: RouterConfig) -> None:
+        """Adopt a reloaded config; state is kept for backends that are still configured."""
+        self._config = config
+        self._settings = config.health
+        self._url_to_name = {url: name for name, url in config.backends.items()}
+        self._health = {url: self._health.get(url) or BackendHealth() for url in config.backends.values()}
+
+    def _get(self, backend_url: str) -> BackendHealth:
+        health = self._health.get(backend_url)
+        if health is None:
+            health = self._health[backend_url] = BackendHealth()
+        return health
+
+    # ── Circuit breaker ──────────────────────────────────────────────────────
+
+    def allow(self, backend_url: str) -> bool:
+        """Return True if a request may be sent to backend_url now."""
+        health = self._get(backend_url)
+        if health.state is CircuitState.CLOSED:
+            return True
+        if health.state is CircuitState.OPEN:
+            if time.monotonic() - health.opened_at < self._settings.cooldown:
+                return False
+            self._transition(backend_url, health, CircuitState.HALF_OPEN)
+        if health.trial_in_flight:
+            return False
+        health.trial_in_flight = True
+        return True
+
+    def record_success(self, backend_url: str) -> None:
+        health = self._get(backend_url)
+        health.consecutive_failures = 0
+        health.trial_in_flight = False
+        if health.state is not CircuitState.CLOSED:
+            self._transition(backend_url, health, CircuitState.CLOSED)
+
+    def record_failure(self, backend_url: str) -> None:
+        health = self._get(backend_url)
+        health.consecutive_failures += 1
+        health.trial_in_flight = False
+        if health.state is CircuitState.HALF_OPEN or (
+            health.state is CircuitState.CLOSED
+            and health.consecutive_failures >= self._settings.failure_threshold
+        ):
+            health.opened_at = time.monotonic()
+            self._transition(backend_url, health, CircuitState.OPEN)
+        elif health.state is CircuitState.OPEN:
+            health.opened_at = time.monotonic()
+
+    def release_trial(self, backend_url: str) -> None:
+        """Give back a half-open trial whose request never got an answer that says anything about the backend."""
+        health = self._get(backend_url)
+        if health.state is CircuitState.HALF_OPEN:
+            health.trial_in_flight = False
+
+    def _transition(self, backend_url: str, health: BackendHealth, state: CircuitState) -> None:
+        log = logger.warning if state is CircuitState.OPEN else logger.info
+        log(
+            "backend_circuit_state",
+            extra={
+                "backend": self._url_to_name.get(backend_url, backend_url),
+                "backend_url": backend_url,
+                "from_state": health.state.value,
+                "to_state": state.value,
+                "consecutive_failures": health.consecutive_failures,
+            },
+        )
+        health.state = state
+
+    # ── Active probing ───────────────────────────────────────────────────────
+
+    async def probe(self, backend_url: str) -> None:
+        health = self._get(backend_url)
+        start = time.monotonic()
+        try:
+            resp = await self._upstream.client(backend_url).get("/ping", timeout=self._settings.timeout)
+            ok = resp.status_code == 200
+        except Exception:
+            ok = False
+        health.last_probe = time.monotonic()
+        health.up = ok
+        if ok:
+            health.latency_ms = round((health.last_probe - start) * 1000, 1)
+            self.record_success(backend_url)
+        else:
+            self.record_failure(backend_url)
+
+    async def probe_all(self) -> None:
+        await asyncio.gather(*(self.probe(url) for url in self._config.backends.values()))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.probe_all()
+            except Exception as exc:  # never let the prober die
+                logger.error("health_probe_failed", extra={"error": str(exc)})
+            await asyncio.sleep(self._settings.interval)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="headwater-health-probe")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    # ── Read side ────────────────────────────────────────────────────────────
+
+    def is_up(self, backend_url: str) -> bool:
+        return self._get(backend_url).up
+
+    def is_closed(self, backend_url: str) -> bool:
+        """True if the circuit is closed. Unlike allow(), never claims a half-open trial."""
+        return self._get(backend_url).state is CircuitState.CLOSED
+
+    def snapshot(self) -> dict[str, BackendHealth]:
+        """Copy of the cached state keyed by backend URL, for metrics and /routes/health."""
+        return {
+            url: BackendHealth(**vars(health))
+            for url, health in list(self._health.items())
+        }
@@ -0,0 +1,131 @@
+"""
+Hedged requests for short idempotent routes.
+
+One slow node (mid model swap, under GC) drags the p99 of quick embeddings
+and small reranks. For route keys listed under `hedge.routes` in routes.yaml,
+the router tracks recent time-to-response-headers per route; if the chosen
+backend has not answered within the `hedge.percentile` of that window, a
+duplicate is sent to another member of the route's pool. Whichever answers
+first is used and the other is cancelled.
+
+Hedges are paid for from a token budget: every request on a hedged route
+deposits `hedge.budget` tokens and every hedge spends one, so at most that
+fraction of requests is ever duplicated and a slow fleet cannot double its own
+load. No hedging happens until a route has `hedge.min_samples` observations.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from headwater_server.server.routing_config import HedgeSettings
+
+logger = logging.getLogger(__name__)
+
+BUDGET_CAP = 10.0  # most hedges that can be saved up for a burst
+
+T = TypeVar("T")
+
+
+class Hedger:
+    def __init__(self, settings: HedgeSettings):
+        self._latencies: dict[str, deque[float]] = {}
+        self._tokens = 0.0
+        self.reconfigure(settings)
+
+    def reconfigure(self, settings: HedgeSettings) -> None:
+        self._settings = settings
+        self._routes = frozenset(settings.routes)
+        for route_key, window in list(self._latencies.items()):
+            self._latencies[route_key] = deque(window, maxlen=settings.window)
+
+    def enabled(self, route_key: str) -> bool:
+        return route_key in self._routes
+
+    def observe(self, route_key: str, latency_ms: float) -> None:
+        window = self._latencies.get(route_key)
+        if window is None:
+            window = self._latencies[route_key] = deque(maxlen=self._settings.window)
+        window.append(latency_ms)
+
+    def delay(self, route_key: str) -> float | None:
+        """Seconds to wait before hedging route_key, or None while there is too little history."""
+        window = self._latencies.get(route_key)
+        if window is None or len(window) < self._settings.min_samples:
+            return None
+        ordered = sorted(window)
+        index = min(len(ordered) - 1, int(len(ordered) * self._settings.percentile / 100))
+        return ordered[index] / 1000
+
+    def deposit(self) -> None:
+        self._tokens = min(BUDGET_CAP, self._tokens + self._settings.budget)
+
+    def try_spend(self) -> bool:
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+
+async def _reap(task: asyncio.Task[T], discard: Callable[[T], Awaitable[None]]) -> None:
+    """Wait out a losing attempt and release whatever it produced."""
+    try:
+        result = await task
+    except BaseException:
+        return
+    await discard(result)
+
+
+async def race(
+    primary: Awaitable[T],
+    start_hedge: Callable[[], Awaitable[T] | None],
+    delay: float,
+    discard: Callable[[T], Awaitable[None]],
+) -> tuple[T, bool]:
+    """
+    Run primary; if it has not finished after delay seconds, also run start_hedge().
+
+    Returns (result, hedge_won). The first attempt to succeed wins and the other
+    is cancelled in the background; a result that arrives anyway is passed to
+    discard. If both fail, the primary's exception is raised. start_hedge may
+    return None to decline (no budget, no eligible backend).
+    """
+    first = asyncio.ensure_future(primary)
+    try:
+        done, _ = await asyncio.wait({first}, timeout=delay)
+    except BaseException:
+        first.cancel()
+        asyncio.ensure_future(_reap(first, discard))
+        raise
+    if done:
+        return first.result(), False
+
+    hedge = start_hedge()
+    if hedge is None:
+        return await first, False
+    second = asyncio.ensure_future(hedge)
+
+    pending = {first, second}
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            winner = next((t for t in (first, second) if t in done and t.exception() is None), None)
+            if winner is not None:
+                for loser in (first, second):
+                    if loser is not winner:
+                        loser.cancel()
+                        asyncio.ensure_future(_reap(loser, discard))
+                return winner.result(), winner is second
+    except BaseException:
+        for task in (first, second):
+            task.cancel()
+            asyncio.ensure_future(_reap(task, discard))
+        raise
+
+    second.exception()  # retrieved; the primary's failure is the one reported
+    raise first.exception()
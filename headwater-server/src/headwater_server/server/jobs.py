@@ -0,0 +1,345 @@
+"""
+Durable background jobs for long-running batch endpoints.
+
+/conduit/batch, /siphon/extract/batch and /siphon/embed-batch only answer once
+the whole batch is done, so a large batch outlives the router's read timeout
+and the finished work is lost with the connection. Their job variants
+(POST .../jobs) return a job id at once. JOB_WORKERS worker tasks then run
+queued jobs chunk by chunk, committing each chunk's results to a local SQLite
+file before starting the next.
+
+A client or router disconnect never touches a running job. After a restart,
+jobs that were running resume from their last committed chunk. Finished jobs
+are kept for JOB_RETENTION seconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from headwater_api.classes import JobKind, JobResultsResponse, JobState, JobStatusResponse
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = 2                    # jobs run concurrently per subserver
+JOB_RETENTION = 7 * 24 * 3600      # seconds a finished job and its results are kept
+POLL_INTERVAL = 1.0                # seconds an idle worker waits before checking the queue again
+
+
+def default_jobs_path() -> Path:
+    from xdg_base_dirs import xdg_state_home
+
+    return xdg_state_home() / "headwater_server" / "jobs.sqlite"
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """How one kind of batch request is split into chunks and run."""
+
+    request_model: type[BaseModel]
+    items_fields: tuple[str, ...]                          # list fields; the first non-empty one is split
+    chunk_size: Callable[[Any], int]
+    run: Callable[[Any], Awaitable[list[Any]]]             # chunk request -> JSON-able result rows
+    summarize: Callable[[list[Any]], dict[str, Any]] | None = None
+
+    def items_field(self, request: BaseModel) -> str:
+        return next((f for f in self.items_fields if getattr(request, f)), self.items_fields[0])
+
+    def total(self, request: BaseModel) -> int:
+        return len(getattr(request, self.items_field(request)))
+
+    def chunk(self, request: BaseModel, start: int, size: int) -> BaseModel:
+        field = self.items_field(request)
+        return request.model_copy(update={field: getattr(request, field)[start:start + size]})
+
+
+class JobStore:
+    """SQLite job table plus one row per result. All methods block; call them via asyncio.to_thread."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY, kind TEXT, state TEXT, request TEXT,"
+            " total INTEGER, completed INTEGER DEFAULT 0, n_results INTEGER DEFAULT 0,"
+            " error TEXT, summary TEXT, created_at REAL, started_at REAL, finished_at REAL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, created_at)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS job_results ("
+            " job_id TEXT, idx INTEGER, result TEXT, PRIMARY KEY (job_id, idx))"
+        )
+
+    def create(self, kind: JobKind, request_json: str, total: int) -> str:
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO jobs (id, kind, state, request, total, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind.value, JobState.QUEUED.value, request_json, total, time.time()),
+            )
+        return job_id
+
+    def get(self, job_id: str) -> sqlite3.Row | None:
+        with self._lock:
+            return self._db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+    def claim(self) -> sqlite3.Row | None:
+        """Mark the oldest queued job running and return it."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT * FROM jobs WHERE state = ? ORDER BY created_at LIMIT 1", (JobState.QUEUED.value,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE jobs SET state = ?, started_at = COALESCE(started_at, ?) WHERE id = ?",
+                (JobState.RUNNING.value, time.time(), row["id"]),
+            )
+            return row
+
+    def append(self, job_id: str, completed: int, rows: list[Any]) -> bool:
+        """Commit one chunk's results and progress; False if the job is no longer running."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                job = self._db.execute(
+                    "SELECT state, n_results FROM jobs WHERE id = ?", (job_id,)
+                ).fetchone()
+                if job is None or job["state"] != JobState.RUNNING.value:
+                    self._db.execute("ROLLBACK")
+                    return False
+                start = job["n_results"]
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO job_results VALUES (?, ?, ?)",
+                    [(job_id, start + i, json.dumps(row)) for i, row in enumerate(rows)],
+                )
+                self._db.execute(
+                    "UPDATE jobs SET completed = ?, n_results = ? WHERE id = ?",
+                    (completed, start + len(rows), job_id),
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return True
+
+    def finish(self, job_id: str, state: JobState, error: str | None = None, summary: dict | None = None) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET state = ?, error = ?, summary = ?, finished_at = ? WHERE id = ? AND state = ?",
+                (state.value, error, json.dumps(summary) if summary is not None else None,
+                 time.time(), job_id, JobState.RUNNING.value),
+            )
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job; False if it had already finished (or does not exist)."""
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE jobs SET state = ?, finished_at = ? WHERE id = ? AND state IN (?, ?)",
+                (JobState.CANCELLED.value, time.time(), job_id, JobState.QUEUED.value, JobState.RUNNING.value),
+            )
+            return cursor.rowcount > 0
+
+    def results(self, job_id: str, offset: int, limit: int) -> list[Any]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT result FROM job_results WHERE job_id = ? AND idx >= ? ORDER BY idx LIMIT ?",
+                (job_id, offset, limit),
+            ).fetchall()
+        return [json.loads(row["result"]) for row in rows]
+
+    def requeue_running(self) -> int:
+        """Return jobs interrupted by a shutdown to the queue; they resume from their last chunk."""
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE jobs SET state = ? WHERE state = ?", (JobState.QUEUED.value, JobState.RUNNING.value)
+            )
+            return cursor.rowcount
+
+    def prune(self, older_than: float) -> None:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            self._db.execute(
+                "DELETE FROM job_results WHERE job_id IN"
+                " (SELECT id FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?)",
+                (older_than,),
+            )
+            self._db.execute("DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?", (older_than,))
+            self._db.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def _status(row: sqlite3.Row) -> JobStatusResponse:
+    return JobStatusResponse(
+        job_id=row["id"],
+        kind=row["kind"],
+        state=row["state"],
+        total=row["total"],
+        completed=row["completed"],
+        results_available=row["n_results"],
+        created_at=row["created_at"],
+        started_at=row["started_at"],
+        finished_at=row["finished_at"],
+        error=row["error"],
+        summary=json.loads(row["summary"]) if row["summary"] else None,
+    )
+
+
+class JobRunner:
+    def __init__(
+        self,
+        specs: Mapping[JobKind, JobSpec],
+        path: Path | None = None,
+        workers: int = JOB_WORKERS,
+    ):
+        self._specs = specs
+        self._path = path
+        self._n_workers = workers
+        self._store: JobStore | None = None
+        self._workers: list[asyncio.Task] = []
+        self._running: dict[str, asyncio.Task] = {}   # job_id -> task running its chunks
+        self._wakeup: asyncio.Event | None = None
+        self._stopping = False
+
+    @property
+    def store(self) -> JobStore:
+        if self._store is None:
+            raise RuntimeError("JobRunner has not been started")
+        return self._store
+
+    async def start(self) -> None:
+        """Open the store, requeue interrupted jobs, drop expired ones and start the workers."""
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._store = await asyncio.to_thread(JobStore, self._path or default_jobs_path())
+        requeued = await asyncio.to_thread(self.store.requeue_running)
+        await asyncio.to_thread(self.store.prune, time.time() - JOB_RETENTION)
+        if requeued:
+            logger.info("jobs_resumed", extra={"count": requeued})
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"headwater-job-worker-{i}")
+            for i in range(self._n_workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers; jobs still running are left to resume on the next start."""
+        self._stopping = True
+        workers, self._workers = self._workers, []
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    # ── API ──────────────────────────────────────────────────────────────────
+
+    async def submit(self, kind: JobKind, request: BaseModel) -> JobStatusResponse:
+        total = self._specs[kind].total(request)
+        job_id = await asyncio.to_thread(self.store.create, kind, request.model_dump_json(), total)
+        logger.info("job_submitted", extra={"job_id": job_id, "kind": kind.value, "total": total})
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return await self.status(job_id)
+
+    async def status(self, job_id: str) -> JobStatusResponse | None:
+        row = await asyncio.to_thread(self.store.get, job_id)
+        return _status(row) if row is not None else None
+
+    async def results(self, job_id: str, offset: int, limit: int) -> JobResultsResponse | None:
+        row = await asyncio.to_thread(self.store.get, job_id)
+        if row is None:
+            return None
+        results = await asyncio.to_thread(self.store.results, job_id, offset, limit)
+        end = offset + len(results)
+        return JobResultsResponse(
+            job_id=job_id,
+            state=row["state"],
+            offset=offset,
+            results=results,
+            next_offset=end if end < row["n_results"] else None,
+        )
+
+    async def cancel(self, job_id: str) -> JobStatusResponse | None:
+        if await asyncio.to_thread(self.store.cancel, job_id):
+            task = self._running.get(job_id)
+            if task is not None:
+                task.cancel()
+            logger.info("job_cancelled", extra={"job_id": job_id})
+        return await self.status(job_id)
+
+    # ── Workers ──────────────────────────────────────────────────────────────
+
+    async def _work(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            try:
+                row = await asyncio.to_thread(self.store.claim)
+            except sqlite3.Error as exc:  # never let a worker die
+                logger.error("job_claim_failed", extra={"error": str(exc)})
+                row = None
+            if row is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            task = asyncio.create_task(self._run(row), name=f"headwater-job-{row['id']}")
+            self._running[row["id"]] = task
+            try:
+                await task
+            except asyncio.CancelledError:
+                if self._stopping:
+                    raise
+            finally:
+                self._running.pop(row["id"], None)
+
+    async def _run(self, row: sqlite3.Row) -> None:
+        job_id = row["id"]
+        spec = self._specs[JobKind(row["kind"])]
+        start = time.monotonic()
+        try:
+            request = spec.request_model.model_validate_json(row["request"])
+            total = spec.total(request)
+            size = max(1, spec.chunk_size(request))
+            for offset in range(row["completed"], total, size):
+                rows = await spec.run(spec.chunk(request, offset, size))
+                completed = min(offset + size, total)
+                if not await asyncio.to_thread(self.store.append, job_id, completed, rows):
+                    return  # cancelled between chunks
+                logger.debug("job_progress", extra={"job_id": job_id, "completed": completed, "total": total})
+
+            summary = None
+            if spec.summarize is not None:
+                n_results = (await asyncio.to_thread(self.store.get, job_id))["n_results"]
+                summary = spec.summarize(await asyncio.to_thread(self.store.results, job_id, 0, n_results))
+            await asyncio.to_thread(self.store.finish, job_id, JobState.SUCCEEDED, None, summary)
+            logger.info(
+                "job_succeeded",
+                extra={"job_id": job_id, "total": total, "duration_ms": round((time.monotonic() - start) * 1000, 1)},
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.error("job_failed", extra={"job_id": job_id, "error": str(exc)}, exc_info=exc)
+            await asyncio.to_thread(self.store.finish, job_id, JobState.FAILED, f"{type(exc).__name__}: {exc}")
@@ -3,8 +3,18 @@ Main entry point for the headwater server. Detects the host machine and starts t
 - Headwater (alphablue)
 - Bywater (caruana)
 - Backwater (botvinnik)
+
+Set HEADWATER_UDS=/run/headwater/<server>.sock to also listen on a Unix domain
+socket, so a router on the same host can reach this server without loopback TCP
+(routes.yaml backend URL `unix:///run/headwater/<server>.sock`).
+
+Set HEADWATER_HTTP2=1 to serve cleartext HTTP/2 (h2c) as well as HTTP/1.1, for a
+router configured with `http2: true` for this backend. uvicorn only speaks
+HTTP/1.1, so this mode runs the app under Hypercorn (`pip install hypercorn`).
 """
 
+import os
+
 import headwater_server.server.logging_config
 from dbclients.discovery.host import get_network_context
 from typing import Literal
@@ -20,6 +30,65 @@ hosts = {
 }
 servers = Literal["deepwater", "bywater", "backwater"]
 
+UDS_ENV = "HEADWATER_UDS"
+HTTP2_ENV = "HEADWATER_HTTP2"
+H2_MAX_CONCURRENT_STREAMS = 256  # per connection; a router fan-out shares a few connections
+
+
+def serve_h2c(app: str, port: int, uds: str | None = None) -> None:
+    """
+    Serve app with Hypercorn on 0.0.0.0:port (and uds, if given).
+
+    Each listener accepts HTTP/1.1 and prior-knowledge h2c on the same socket.
+    Runs without auto-reload.
+    """
+    import asyncio
+    import importlib
+
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    module_name, _, attr = app.partition(":")
+    asgi_app = getattr(importlib.import_module(module_name), attr)
+
+    config = Config()
+    config.bind = [f"0.0.0.0:{port}"]
+    if uds:
+        if os.path.exists(uds):
+            os.unlink(uds)  # stale socket from a previous run
+        config.bind.append(f"unix:{uds}")
+        config.umask = 0o117  # socket mode 0660
+    config.h2_max_concurrent_streams = H2_MAX_CONCURRENT_STREAMS
+    asyncio.run(serve(asgi_app, config))
+
+
+def serve_tcp_and_uds(app: str, port: int, uds: str) -> None:
+    """
+    Serve app on 0.0.0.0:port and on the Unix socket at uds from one process.
+
+    uvicorn's reloader supervises a single listening socket, so this mode runs
+    without auto-reload.
+    """
+    import socket
+    import uvicorn
+
+    tcp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    tcp.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    tcp.bind(("0.0.0.0", port))
+
+    if os.path.exists(uds):
+        os.unlink(uds)  # stale socket from a previous run
+    unix = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    unix.bind(uds)
+    os.chmod(uds, 0o660)
+
+    config = uvicorn.Config(app, log_config=None, log_level="info")
+    try:
+        uvicorn.Server(config).run(sockets=[tcp, unix])
+    finally:
+        if os.path.exists(uds):
+            os.unlink(uds)
+
 
 def run_server(server: servers):
     from headwater_server.server.logo import print_logo
@@ -47,15 +116,21 @@ def run_server(server: servers):
     _ = sys.stdout.flush()
 
     try:
-        uvicorn.run(
-            "headwater_server.server.headwater:app",
-            host="0.0.0.0",
-            port=8080,
-            reload=True,
-            reload_dirs=[str(Path(__file__).parent.parent.parent)],
-            log_config=None,
-            log_level="info",
-        )
+        uds = os.getenv(UDS_ENV)
+        if os.getenv(HTTP2_ENV, "").lower() in ("1", "true", "yes"):
+            serve_h2c("headwater_server.server.headwater:app", 8080, uds)
+        elif uds:
+            serve_tcp_and_uds("headwater_server.server.headwater:app", 8080, uds)
+        else:
+            uvicorn.run(
+                "headwater_server.server.headwater:app",
+                host="0.0.0.0",
+                port=8080,
+                reload=True,
+                reload_dirs=[str(Path(__file__).parent.parent.parent)],
+                log_config=None,
+                log_level="info",
+            )
     finally:
         # Reset scrolling region to default when exiting
         _ = sys.stdout.write("\033[r")
@@ -6,7 +6,140 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from fastapi import FastAPI
+    from headwater_server.server.admission import AdmissionController
+    from headwater_server.server.balancer import LeastOutstandingBalancer
+    from headwater_server.server.cache import ResponseCache
+    from headwater_server.server.health import HealthMonitor
     from headwater_server.server.routing_config import RouterConfig
+    from headwater_server.server.upstream import UpstreamPool
+
+
+class RouterMetrics:
+    """Synchronous instruments recorded from the router's proxy path.
+
+    Exposed to request handlers as app.state.router_metrics; absent when
+    register_router_metrics has not run (e.g. in unit tests).
+    """
+
+    def __init__(self, meter):
+        self._upstream_ttfb = meter.create_histogram(
+            "headwater.router.upstream.ttfb",
+            unit="ms",
+            description="Time from request arrival at the router to the first upstream response byte",
+        )
+
+        self._coalesced = meter.create_counter(
+            "headwater.router.coalesced",
+            description="Requests served from an identical in-flight request instead of going upstream",
+        )
+        self._hedges = meter.create_counter(
+            "headwater.router.hedges",
+            description="Hedged duplicate requests sent to a second backend, and how many of them won",
+        )
+        self._queue_wait = meter.create_histogram(
+            "headwater.router.admission.wait",
+            unit="ms",
+            description="Time a request waited in the admission queue for a route/backend slot",
+        )
+        self._admission_rejected = meter.create_counter(
+            "headwater.router.admission.rejected",
+            description="Requests answered 429 because an admission queue was full or the wait timed out",
+        )
+        self._affinity = meter.create_counter(
+            "headwater.router.affinity",
+            description="Sticky-routed conversation requests: hit (prefix owner), spill (next on ring), fallback (balancer)",
+        )
+        self._scatter_shards = meter.create_counter(
+            "headwater.router.scatter.shards",
+            description="Shard attempts of scattered batch requests, by backend and outcome (ok, failed)",
+        )
+
+    def record_ttfb(self, ttfb_ms: float, backend: str, route: str) -> None:
+        self._upstream_ttfb.record(ttfb_ms, {"backend_name": backend, "route": route})
+
+    def record_coalesced(self, route: str) -> None:
+        self._coalesced.add(1, {"route": route})
+
+    def record_hedge(self, route: str, outcome: str) -> None:
+        """outcome is "sent" when a duplicate goes out, "won" when it answered first."""
+        self._hedges.add(1, {"route": route, "outcome": outcome})
+
+    def record_queue_wait(self, wait_ms: float, route: str, priority: str) -> None:
+        self._queue_wait.record(wait_ms, {"route": route, "priority": priority})
+
+    def record_admission_rejected(self, scope: str, reason: str, priority: str) -> None:
+        self._admission_rejected.add(1, {"scope": scope, "reason": reason, "priority": priority})
+
+    def record_affinity(self, route: str, outcome: str) -> None:
+        self._affinity.add(1, {"route": route, "outcome": outcome})
+
+    def record_scatter_shard(self, route: str, backend: str, outcome: str) -> None:
+        self._scatter_shards.add(1, {"route": route, "backend_name": backend, "outcome": outcome})
+
+
+_router_metrics: RouterMetrics | None = None
+_router_config: RouterConfig | None = None  # swapped by set_router_config() on routes.yaml reload
+
+
+def set_router_config(router_config: RouterConfig) -> None:
+    """Point the router's backend gauges at a reloaded config."""
+    global _router_config
+    _router_config = router_config
+
+
+def _backends() -> dict[str, str]:
+    return _router_config.backends if _router_config is not None else {}
+
+
+class ConduitMetrics:
+    """Synchronous instruments recorded by the subserver's conduit services."""
+
+    def __init__(self, meter):
+        self._ttft = meter.create_histogram(
+            "headwater.llm.ttft",
+            unit="ms",
+            description="Time from a streaming completion request to its first generated token",
+        )
+        self._batch_concurrency = meter.create_gauge(
+            "headwater.conduit.batch.concurrency",
+            description="In-flight item limit currently chosen by an adaptive conduit batch",
+        )
+        self._batch_adjustments = meter.create_counter(
+            "headwater.conduit.batch.concurrency.adjustments",
+            description="Adaptive batch concurrency changes, by direction and the signal that caused them",
+        )
+        self._queue_wait = meter.create_histogram(
+            "headwater.conduit.queue.wait",
+            unit="ms",
+            description="Time a conduit model call waited for a slot on its model's concurrency limit",
+        )
+
+    def record_ttft(self, ttft_ms: float, model: str, endpoint: str) -> None:
+        self._ttft.record(ttft_ms, {"model": model, "endpoint": endpoint})
+
+    def record_batch_concurrency(self, limit: int, model: str) -> None:
+        self._batch_concurrency.set(limit, {"model": model})
+
+    def record_batch_adjustment(self, model: str, direction: str, reason: str) -> None:
+        """direction is "increase" or "decrease"; reason is "ok", "latency" or "errors"."""
+        self._batch_adjustments.add(1, {"model": model, "direction": direction, "reason": reason})
+
+    def record_queue_wait(self, wait_ms: float, model: str, endpoint: str) -> None:
+        self._queue_wait.record(wait_ms, {"model": model, "endpoint": endpoint})
+
+
+_conduit_metrics: ConduitMetrics | None = None
+
+
+def conduit_metrics() -> ConduitMetrics:
+    """The subserver's conduit instruments, created on first use so they bind to whichever
+    meter provider register_metrics has set by then (a no-op one in unit tests)."""
+    global _conduit_metrics
+    if _conduit_metrics is None:
+        from opentelemetry import metrics as otel_metrics
+
+        _conduit_metrics = ConduitMetrics(otel_metrics.get_meter("headwater"))
+    return _conduit_metrics
 
 
 def register_metrics(app: FastAPI, server_name: str) -> None:
@@ -44,17 +177,25 @@ def register_metrics(app: FastAPI, server_name: str) -> None:
         meter = otel_metrics.get_meter("headwater")
         _register_gpu_metrics(meter)
         _register_ollama_metrics(meter)
+        _register_governor_metrics(meter)
 
 
 def register_router_metrics(
     app: FastAPI,
     server_name: str,
     router_config: RouterConfig,
+    balancer: LeastOutstandingBalancer | None = None,
+    health: HealthMonitor | None = None,
+    cache: ResponseCache | None = None,
+    admission: AdmissionController | None = None,
+    upstream: UpstreamPool | None = None,
 ) -> None:
     """Register OTel metrics for the router.
 
     Adds /metrics route and activates HTTP auto-instrumentation (per-app).
-    Registers backend health gauges only once (global OTel setup).
+    Registers backend health and in-flight gauges only once (global OTel setup).
+    With a HealthMonitor, backend gauges read its cached probe state instead of
+    pinging every backend inside the scrape.
     """
     from opentelemetry import metrics as otel_metrics
     from opentelemetry.sdk.metrics import MeterProvider as SdkMeterProvider
@@ -80,9 +221,23 @@ def register_router_metrics(
     _add_metrics_route(app)
     FastAPIInstrumentor().instrument_app(app)
 
+    global _router_metrics
+    set_router_config(router_config)
     if not already_configured:
         meter = otel_metrics.get_meter("headwater")
-        _register_backend_metrics(meter, router_config)
+        _register_backend_metrics(meter, health)
+        if balancer is not None:
+            _register_balancer_metrics(meter, balancer)
+        if cache is not None:
+            _register_cache_metrics(meter, cache)
+        if admission is not None:
+            _register_admission_metrics(meter, admission)
+        if upstream is not None:
+            _register_upstream_metrics(meter, upstream)
+        _register_process_metrics(meter)
+        _router_metrics = RouterMetrics(meter)
+
+    app.state.router_metrics = _router_metrics
 
 
 def _add_metrics_route(app: FastAPI) -> None:
@@ -257,14 +412,142 @@ def _register_ollama_metrics(meter) -> None:
                                   description="Fraction of model layers on CPU (0.0=all GPU, 1.0=all CPU)")
 
 
-def _register_backend_metrics(meter, router_config) -> None:
+def _register_governor_metrics(meter) -> None:
+    from opentelemetry.metrics import Observation
+    from headwater_server.server.governor import model_governor
+
+    def _observe_queued(options):
+        for model, state in model_governor().snapshot().items():
+            yield Observation(state["queued"], {"model": model})
+
+    def _observe_in_flight(options):
+        for model, state in model_governor().snapshot().items():
+            yield Observation(state["in_flight"], {"model": model})
+
+    def _observe_limit(options):
+        for model, state in model_governor().snapshot().items():
+            yield Observation(state["limit"], {"model": model})
+
+    meter.create_observable_gauge("headwater.conduit.queued", callbacks=[_observe_queued],
+                                  description="Conduit model calls waiting for a slot, per limited model")
+    meter.create_observable_gauge("headwater.conduit.in_flight", callbacks=[_observe_in_flight],
+                                  description="Conduit model calls holding a slot, per limited model")
+    meter.create_observable_gauge("headwater.conduit.limit", callbacks=[_observe_limit],
+                                  description="Configured concurrent-call limit per model")
+
+
+def _register_balancer_metrics(meter, balancer) -> None:
+    from opentelemetry.metrics import Observation
+
+    def _observe_in_flight(options):
+        in_flight = balancer.snapshot()
+        for name, url in _backends().items():
+            yield Observation(in_flight.get(url, 0), {"backend_name": name, "backend_url": url})
+
+    meter.create_observable_gauge("headwater.router.backend.in_flight", callbacks=[_observe_in_flight],
+                                  description="Requests the router currently has open to each backend")
+
+
+def _register_cache_metrics(meter, cache) -> None:
+    from opentelemetry.metrics import Observation
+
+    def _observe_hits(options):
+        for (route, tier), count in cache.stats()["hits"].items():
+            yield Observation(count, {"route": route, "tier": tier})
+
+    def _observe_misses(options):
+        for route, count in cache.stats()["misses"].items():
+            yield Observation(count, {"route": route})
+
+    def _observe_evictions(options):
+        for tier, count in cache.stats()["evictions"].items():
+            yield Observation(count, {"tier": tier})
+
+    def _observe_memory_bytes(options):
+        yield Observation(cache.stats()["memory_bytes"], {})
+
+    meter.create_observable_counter("headwater.router.cache.hits", callbacks=[_observe_hits],
+                                    description="Responses served from the router cache")
+    meter.create_observable_counter("headwater.router.cache.misses", callbacks=[_observe_misses],
+                                    description="Cacheable requests that had to go upstream")
+    meter.create_observable_counter("headwater.router.cache.evictions", callbacks=[_observe_evictions],
+                                    description="Entries evicted to stay within the cache budget")
+    meter.create_observable_gauge("headwater.router.cache.memory_bytes", callbacks=[_observe_memory_bytes],
+                                  unit="By", description="Bytes held by the in-memory cache tier")
+
+
+def _register_admission_metrics(meter, admission) -> None:
+    from opentelemetry.metrics import Observation
+
+    def _observe_queued(options):
+        for scope, state in admission.snapshot().items():
+            for priority in ("interactive", "bulk"):
+                yield Observation(state[f"queued_{priority}"], {"scope": scope, "priority": priority})
+
+    def _observe_in_flight(options):
+        for scope, state in admission.snapshot().items():
+            yield Observation(state["in_flight"], {"scope": scope})
+
+    meter.create_observable_gauge("headwater.router.admission.queued", callbacks=[_observe_queued],
+                                  description="Requests waiting for a slot on each capped route/backend")
+    meter.create_observable_gauge("headwater.router.admission.in_flight", callbacks=[_observe_in_flight],
+                                  description="Admitted requests holding a slot on each capped route/backend")
+
+
+def _register_upstream_metrics(meter, upstream) -> None:
+    from opentelemetry.metrics import Observation
+
+    def _grouped():
+        names = {url: name for name, url in _backends().items()}
+        for url, connections in upstream.connections().items():
+            groups: dict[tuple[str, str], list] = {}
+            for conn in connections:
+                groups.setdefault((conn.protocol, "idle" if conn.idle else "active"), []).append(conn)
+            yield names.get(url, url), groups
+
+    def _observe_connections(options):
+        for name, groups in _grouped():
+            for (protocol, state), conns in groups.items():
+                yield Observation(len(conns), {"backend_name": name, "protocol": protocol, "state": state})
+
+    def _observe_streams(options):
+        for name, groups in _grouped():
+            streams: dict[str, int] = {}
+            for (protocol, _), conns in groups.items():
+                streams[protocol] = streams.get(protocol, 0) + sum(c.streams for c in conns)
+            for protocol, count in streams.items():
+                yield Observation(count, {"backend_name": name, "protocol": protocol})
+
+    meter.create_observable_gauge("headwater.router.upstream.connections", callbacks=[_observe_connections],
+                                  description="Open router -> backend connections by protocol and active/idle state")
+    meter.create_observable_gauge("headwater.router.upstream.streams", callbacks=[_observe_streams],
+                                  description="Requests in flight on router -> backend connections (HTTP/2: open streams)")
+
+
+def _register_process_metrics(meter) -> None:
+    from opentelemetry.metrics import Observation
+
+    def _observe_peak_rss(options):
+        import resource
+        import sys
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is KiB on Linux, bytes on macOS.
+        yield Observation(peak if sys.platform == "darwin" else peak * 1024, {})
+
+    meter.create_observable_gauge("headwater.process.peak_rss", callbacks=[_observe_peak_rss],
+                                  unit="By", description="Peak resident set size of this process")
+
+
+def _register_backend_metrics(meter, health=None) -> None:
     from opentelemetry.metrics import Observation
     import httpx
 
-    config = router_config  # live reference; reads .backends at observation time
+    if health is not None:
+        _register_health_metrics(meter, health)
+        return
 
     def _observe_backend_up(options):
-        for name, url in config.backends.items():
+        for name, url in _backends().items():
             try:
                 resp = httpx.get(f"{url}/ping", timeout=2.0)
                 up = 1 if resp.status_code == 200 else 0
@@ -274,3 +557,37 @@ def _register_backend_metrics(meter, router_config) -> None:
 
     meter.create_observable_gauge("headwater.backend.up", callbacks=[_observe_backend_up],
                                   description="1 if backend responds to /ping within 2s, 0 otherwise")
+
+
+def _register_health_metrics(meter, health) -> None:
+    from opentelemetry.metrics import Observation
+    from headwater_server.server.health import CircuitState
+
+    circuit_values = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+    def _observe_backend_up(options):
+        snapshot = health.snapshot()
+        for name, url in _backends().items():
+            state = snapshot.get(url)
+            yield Observation(1 if state and state.up else 0, {"backend_name": name, "backend_url": url})
+
+    def _observe_probe_latency(options):
+        snapshot = health.snapshot()
+        for name, url in _backends().items():
+            state = snapshot.get(url)
+            if state and state.up and state.latency_ms is not None:
+                yield Observation(state.latency_ms, {"backend_name": name, "backend_url": url})
+
+    def _observe_circuit_state(options):
+        snapshot = health.snapshot()
+        for name, url in _backends().items():
+            state = snapshot.get(url)
+            value = circuit_values[state.state] if state else 0
+            yield Observation(value, {"backend_name": name, "backend_url": url})
+
+    meter.create_observable_gauge("headwater.backend.up", callbacks=[_observe_backend_up],
+                                  description="1 if the last background /ping probe succeeded, 0 otherwise")
+    meter.create_observable_gauge("headwater.backend.probe_latency", callbacks=[_observe_probe_latency],
+                                  unit="ms", description="Round-trip time of the last successful /ping probe")
+    meter.create_observable_gauge("headwater.router.backend.circuit_state", callbacks=[_observe_circuit_state],
+                                  description="Circuit breaker state per backend: 0=closed, 1=half_open, 2=open")
@@ -0,0 +1,161 @@
+"""
+Which Ollama models are resident on which backend, for model-aware pool routing.
+
+Loading a model into Ollama costs seconds to minutes, and loading a cold model
+onto a node that is already full evicts whatever was hot there. Every subserver
+reports its loaded models and free VRAM on GET /gpu; ResidencyMap polls that
+endpoint on the backends that belong to a multi-backend pool every
+`residency.interval` seconds, and choose_backend() uses it to prefer a backend
+where the requested model is already loaded.
+
+A backend whose last refresh failed, or whose Ollama query errored, or whose
+data is older than STALE_AFTER sweeps, is reported as unknown rather than idle.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from headwater_server.server.routing_config import RouterConfig
+    from headwater_server.server.upstream import UpstreamPool
+
+logger = logging.getLogger(__name__)
+
+STALE_AFTER = 3  # refresh intervals
+
+
+def normalize_model(name: str) -> str:
+    """Ollama treats an untagged name as `:latest`."""
+    return name if ":" in name else f"{name}:latest"
+
+
+@dataclass(frozen=True)
+class BackendResidency:
+    models: dict[str, int] = field(default_factory=dict)  # normalized model name -> loaded size in MB
+    vram_free_mb: int | None = None                        # summed over GPUs; None if no GPU stats
+    refreshed_at: float = 0.0                              # time.monotonic()
+
+
+class ResidencyMap:
+    def __init__(self, config: RouterConfig, upstream: UpstreamPool):
+        self._upstream = upstream
+        self._state: dict[str, BackendResidency] = {}
+        self._task: asyncio.Task | None = None
+        self._started = False
+        self._apply(config)
+
+    def _apply(self, config: RouterConfig) -> None:
+        self._settings = config.residency
+        pooled = {name for names in config.pools.values() for name in names}
+        self._urls: list[str] = [url for name, url in config.backends.items() if name in pooled]
+
+    def reconfigure(self, config: RouterConfig) -> None:
+        """Adopt a reloaded config; starts polling if the first multi-backend pool appeared."""
+        self._apply(config)
+        self._state = {url: state for url, state in self._state.items() if url in self._urls}
+        if self._started:
+            self.start()
+
+    # ── Routing queries ──────────────────────────────────────────────────────
+
+    def _current(self, backend_url: str) -> BackendResidency | None:
+        state = self._state.get(backend_url)
+        if state is None:
+            return None
+        if time.monotonic() - state.refreshed_at > STALE_AFTER * self._settings.interval:
+            return None
+        return state
+
+    def known(self, backend_url: str) -> bool:
+        return self._current(backend_url) is not None
+
+    def is_resident(self, backend_url: str, model: str) -> bool:
+        state = self._current(backend_url)
+        return state is not None and normalize_model(model) in state.models
+
+    def would_evict(self, backend_url: str, model: str) -> bool:
+        """
+        True if loading model on backend_url would likely push out a resident model.
+
+        A backend with nothing loaded never evicts. Otherwise the load fits only
+        if the model's size is known (it is resident on some other backend) and
+        the backend has at least that much free VRAM.
+        """
+        state = self._current(backend_url)
+        if state is None or not state.models:
+            return False
+        size_mb = self._known_size(normalize_model(model))
+        if size_mb is None or state.vram_free_mb is None:
+            return True
+        return state.vram_free_mb < size_mb
+
+    def _known_size(self, model: str) -> int | None:
+        for state in list(self._state.values()):
+            if model in state.models:
+                return state.models[model]
+        return None
+
+    # ── Refresh ──────────────────────────────────────────────────────────────
+
+    async def refresh(self, backend_url: str) -> None:
+        from headwater_api.classes import GpuResponse
+
+        try:
+            resp = await self._upstream.client(backend_url).get("/gpu", timeout=self._settings.timeout)
+            resp.raise_for_status()
+            gpu = GpuResponse.model_validate(resp.json())
+        except Exception as exc:
+            self._state.pop(backend_url, None)
+            logger.debug("residency_refresh_failed", extra={"backend_url": backend_url, "error": str(exc)})
+            return
+
+        if gpu.error and "ollama" in gpu.error:
+            # Ollama did not answer /api/ps; an empty list would read as "idle".
+            self._state.pop(backend_url, None)
+            return
+
+        self._state[backend_url] = BackendResidency(
+            models={normalize_model(m.name): m.size_mb for m in gpu.ollama_loaded_models},
+            vram_free_mb=sum(g.vram_free_mb for g in gpu.gpus) if gpu.gpus else None,
+            refreshed_at=time.monotonic(),
+        )
+
+    async def refresh_all(self) -> None:
+        await asyncio.gather(*(self.refresh(url) for url in self._urls))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh_all()
+            except Exception as exc:  # never let the refresher die
+                logger.error("residency_refresh_failed", extra={"error": str(exc)})
+            await asyncio.sleep(self._settings.interval)
+
+    def start(self) -> None:
+        """Start polling; deferred until some route has more than one backend."""
+        self._started = True
+        if self._task is None and self._urls:
+            self._task = asyncio.create_task(self._run(), name="headwater-residency-refresh")
+
+    async def stop(self) -> None:
+        self._started = False
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def snapshot(self) -> dict[str, list[str]]:
+        """Resident models per backend URL (current data only), for /routes/."""
+        return {
+            url: sorted(state.models)
+            for url in self._urls
+            if (state := self._current(url)) is not None
+        }
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import math
+import signal
 import time
 import uuid
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from dataclasses import asdict
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -14,28 +19,97 @@ import httpx
 import headwater_server.server.logging_config  # noqa: F401
 
 from fastapi import FastAPI, Query, Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from headwater_api.classes import StatusResponse, LogsLastResponse, GpuResponse, RouterGpuResponse
 from headwater_server.server.routing_config import (
     RouterConfig,
+    RoutingConfigError,
     RoutingError,
+    choose_backend,
     get_fallback_urls,
+    get_pool_urls,
+    get_pool_weights,
+    is_model_routed,
     load_router_config,
+    resolve_route_key,
     ROUTES_YAML_PATH,
 )
+from headwater_server.server.affinity import PrefixAffinity
+from headwater_server.server.admission import AdmissionController, AdmissionRejected, Ticket
+from headwater_server.server.balancer import LeastOutstandingBalancer
+from headwater_server.server.federation import MetricsFederator
+from headwater_server.server.cache import CACHEABLE_METHODS, ResponseCache, bypasses_cache
+from headwater_server.server.coalesce import COALESCIBLE_METHODS, SharedResponse, SingleFlight, request_key
+from headwater_server.server.health import HealthMonitor
+from headwater_server.server.hedge import Hedger, race
+from headwater_server.server.residency import ResidencyMap
+from headwater_server.server.routing_key import extract_model
+from headwater_server.server.scatter import ADAPTERS, Shard, ShardFailed, ThroughputTracker, gather_shards, plan_shards
+from headwater_server.server.context import server_timing_var
+from headwater_server.server.deadline import DeadlineMiddleware, with_deadline
+from headwater_server.server.timing import HEADER as TIMING_HEADER, ServerTiming, phase
+from headwater_server.server.timing import merge as merge_timing, record as record_timing
+from headwater_server.server.upstream import UpstreamPool
 
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+CONFIG_WATCH_INTERVAL = 2.0  # seconds between routes.yaml mtime checks
+JOB_LOOKUP_TIMEOUT = 10.0    # seconds per backend when locating a background job
+JOB_OWNERS_MAX = 10_000      # job_id -> backend URLs remembered
+
 HOP_BY_HOP = frozenset({
     "connection", "transfer-encoding", "te", "trailer",
     "upgrade", "keep-alive", "proxy-authorization", "proxy-authenticate",
 })
 
 
+class _StreamedBody:
+    """Async-iterable request body that records whether streaming has begun."""
+
+    def __init__(self, request: Request):
+        self._request = request
+        self.started = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        self.started = True
+        async for chunk in self._request.stream():
+            yield chunk
+
+
+def _has_body(request: Request) -> bool:
+    return "content-length" in request.headers or "transfer-encoding" in request.headers
+
+
+async def _relay(
+    upstream: httpx.Response,
+    on_first_byte: Callable[[], None],
+    on_close: Callable[[], None],
+) -> AsyncIterator[bytes]:
+    """Yield upstream bytes as they arrive; always release the upstream connection."""
+    first = True
+    try:
+        async for chunk in upstream.aiter_raw():
+            if first:
+                first = False
+                on_first_byte()
+            yield chunk
+        if first:
+            on_first_byte()
+    except httpx.HTTPError as exc:
+        # Headers are already on the wire, so the status cannot change; cut the body short.
+        logger.error(
+            "proxy_stream_aborted",
+            extra={"backend": str(upstream.request.url), "error": str(exc)},
+        )
+    finally:
+        await upstream.aclose()
+        on_close()
+
+
 class HeadwaterRouter:
     def __init__(
         self,
@@ -46,18 +120,154 @@ class HeadwaterRouter:
         self._config: RouterConfig = load_router_config(config_path or ROUTES_YAML_PATH)
         self._config_path: Path = config_path or ROUTES_YAML_PATH
         self._startup_time: float = time.time()
-        self.app: FastAPI = FastAPI(
+        self._upstream: UpstreamPool = UpstreamPool(self._config)
+        self._balancer: LeastOutstandingBalancer = LeastOutstandingBalancer()
+        self._health: HealthMonitor = HealthMonitor(self._config, self._upstream)
+        self._residency: ResidencyMap = ResidencyMap(self._config, self._upstream)
+        self._coalescer: SingleFlight = SingleFlight()
+        self._cache: ResponseCache = ResponseCache(self._config.cache)
+        self._hedger: Hedger = Hedger(self._config.hedge)
+        self._admission: AdmissionController = AdmissionController(self._config)
+        self._throughput: ThroughputTracker = ThroughputTracker()
+        self._affinity: PrefixAffinity = PrefixAffinity(self._config.affinity)
+        self._federator: MetricsFederator = MetricsFederator(self._upstream, self._config.federation)
+        self._job_owners: OrderedDict[str, str] = OrderedDict()  # job_id -> backend URL
+        self._config_mtime: float | None = self._stat_config()
+        self._reload_lock = asyncio.Lock()
+        self.app: FastAPI = self._create_app()
+        self._register_routes()
+        self._register_middleware()
+
+    def _stat_config(self) -> float | None:
+        try:
+            return self._config_path.stat().st_mtime
+        except OSError:
+            return None
+
+    async def reload_config(self) -> RouterConfig:
+        """
+        Re-read routes.yaml and atomically swap it in.
+
+        Requests already in flight finish on the config they started with; new
+        requests see the new one. If the file fails validation the current config
+        stays in place and the RoutingConfigError (or FileNotFoundError) is re-raised.
+        """
+        async with self._reload_lock:
+            self._config_mtime = self._stat_config()
+            try:
+                config = load_router_config(self._config_path)
+            except (RoutingConfigError, FileNotFoundError) as exc:
+                logger.error(
+                    "routes_reload_failed",
+                    extra={"config_path": str(self._config_path), "error": str(exc)},
+                )
+                raise
+
+            old = self._config
+            self._upstream.reconfigure(config)
+            self._health.reconfigure(config)
+            self._residency.reconfigure(config)
+            self._cache.reconfigure(config.cache)
+            self._hedger.reconfigure(config.hedge)
+            self._admission.reconfigure(config)
+            self._affinity.reconfigure(config.affinity)
+            self._federator.reconfigure(config.federation)
+            self._config = config
+            from headwater_server.server.metrics import set_router_config
+            set_router_config(config)
+
+            logger.info(
+                "routes_reloaded",
+                extra={
+                    "config_path": str(self._config_path),
+                    "backends_added": sorted(config.backends.keys() - old.backends.keys()),
+                    "backends_removed": sorted(old.backends.keys() - config.backends.keys()),
+                    "routes_changed": sorted(
+                        key for key in config.routes.keys() | old.routes.keys()
+                        if config.routes.get(key) != old.routes.get(key)
+                        or config.pools.get(key) != old.pools.get(key)
+                    ),
+                    "heavy_models": config.heavy_models,
+                },
+            )
+            return config
+
+    async def _try_reload(self, trigger: str) -> None:
+        logger.info("routes_reload_requested", extra={"trigger": trigger})
+        try:
+            await self.reload_config()
+        except (RoutingConfigError, FileNotFoundError):
+            pass  # already logged; the previous config stays active
+        except Exception as exc:
+            # The file watcher and SIGHUP tasks are never restarted or awaited, so
+            # nothing may escape them; the previous config stays active.
+            logger.exception(
+                "routes_reload_failed",
+                extra={"config_path": str(self._config_path), "error": str(exc)},
+            )
+
+    async def _watch_config(self) -> None:
+        """Reload when routes.yaml's mtime changes (polling; no inotify dependency)."""
+        while True:
+            await asyncio.sleep(CONFIG_WATCH_INTERVAL)
+            mtime = self._stat_config()
+            if mtime is not None and mtime != self._config_mtime:
+                await self._try_reload("file_watch")
+
+    def _create_app(self) -> FastAPI:
+        name = self._name  # capture for closure
+        router = self
+        upstream = self._upstream
+        health = self._health
+        residency = self._residency
+        cache = self._cache
+
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            logger.info(f"{name} starting up...")
+            await upstream.start()
+            health.start()
+            residency.start()
+            watcher = asyncio.create_task(router._watch_config(), name="headwater-routes-watch")
+            loop = asyncio.get_running_loop()
+            try:
+                loop.add_signal_handler(
+                    signal.SIGHUP, lambda: asyncio.ensure_future(router._try_reload("sighup"))
+                )
+                sighup = True
+            except (NotImplementedError, RuntimeError, ValueError, AttributeError):
+                sighup = False  # not the main thread (e.g. TestClient) or no SIGHUP on this platform
+            yield
+            logger.info(f"{name} shutting down...")
+            if sighup:
+                loop.remove_signal_handler(signal.SIGHUP)
+            watcher.cancel()
+            await residency.stop()
+            await health.stop()
+            await upstream.aclose()
+            await cache.aclose()
+
+        return FastAPI(
             title=self._name,
             description="Headwater routing gateway",
             version="1.0.0",
+            lifespan=lifespan,
         )
-        self._register_routes()
-        self._register_middleware()
 
     def _register_routes(self) -> None:
         from headwater_api.classes import HeadwaterServerError, ErrorType
 
-        config = self._config
+        router = self
+        upstream_pool = self._upstream
+        balancer = self._balancer
+        health = self._health
+        residency = self._residency
+        coalescer = self._coalescer
+        cache = self._cache
+        hedger = self._hedger
+        admission = self._admission
+        throughput = self._throughput
+        affinity = self._affinity
 
         @self.app.get("/ping")
         async def ping() -> dict:
@@ -96,23 +306,46 @@ class HeadwaterRouter:
 
         @self.app.get("/routes/")
         def routes_config() -> dict:
+            config = router._config
             return {
                 "backends": config.backends,
                 "routes": config.routes,
+                "pools": config.pools,
+                "weights": config.weights,
+                "resident_models": residency.snapshot(),
                 "heavy_models": config.heavy_models,
                 "config_path": str(config_path),
             }
 
+        @self.app.post("/routes/reload")
+        async def routes_reload(request: Request) -> Response:
+            try:
+                config = await router.reload_config()
+            except (RoutingConfigError, FileNotFoundError) as exc:
+                error = HeadwaterServerError(
+                    error_type=ErrorType.ROUTING_ERROR,
+                    message=f"routes.yaml rejected, keeping the previous config: {exc}",
+                    status_code=400,
+                    path=request.url.path,
+                    method=request.method,
+                    request_id=request.state.request_id,
+                    context={"config_path": str(config_path)},
+                )
+                return JSONResponse(status_code=400, content=error.model_dump(mode="json"))
+            return JSONResponse({
+                "reloaded": True,
+                "config_path": str(config_path),
+                "backends": config.backends,
+                "routes": config.routes,
+            })
+
         @self.app.get("/gpu", response_model=RouterGpuResponse)
         async def gpu() -> RouterGpuResponse:
-            import asyncio
-
             async def fetch_backend_gpu(name: str, base_url: str) -> tuple[str, GpuResponse]:
                 try:
-                    async with httpx.AsyncClient(timeout=10.0) as client:
-                        resp = await client.get(f"{base_url}/gpu")
-                        resp.raise_for_status()
-                        return name, GpuResponse.model_validate(resp.json())
+                    resp = await upstream_pool.client(base_url).get("/gpu", timeout=10.0)
+                    resp.raise_for_status()
+                    return name, GpuResponse.model_validate(resp.json())
                 except Exception as exc:
                     return name, GpuResponse(
                         server_name=name,
@@ -122,27 +355,109 @@ class HeadwaterRouter:
                     )
 
             results = await asyncio.gather(
-                *[fetch_backend_gpu(name, url) for name, url in config.backends.items()]
+                *[fetch_backend_gpu(name, url) for name, url in router._config.backends.items()]
             )
             return RouterGpuResponse(backends=dict(results))
 
+        federator = self._federator
+
+        @self.app.get("/metrics/federate", include_in_schema=False)
+        async def metrics_federate() -> Response:
+            """Router and backend /metrics merged into one exposition, each series labelled by backend."""
+            from prometheus_client.exposition import CONTENT_TYPE_PLAIN_0_0_4
+
+            by_url = {url: name for name, url in reversed(router._config.backends.items())}
+            body = await federator.exposition({name: url for url, name in by_url.items()})
+            return Response(content=body, media_type=CONTENT_TYPE_PLAIN_0_0_4)
+
+        @self.app.api_route("/jobs/{job_path:path}", methods=["GET", "DELETE"])
+        async def jobs(request: Request, job_path: str) -> Response:
+            """
+            Relay job status/results/cancel to the subserver that owns the job.
+
+            Jobs are submitted through the normal routes (e.g. POST /conduit/batch/jobs)
+            and live on whichever backend accepted them; the id does not say which,
+            so an unknown id is looked up on every backend and the owner remembered.
+            """
+            config = router._config
+            job_id = job_path.split("/")[0]
+            target = f"/jobs/{job_path}"
+            if request.url.query:
+                target = f"{target}?{request.url.query}"
+            owner = router._job_owners.get(job_id)
+            candidates = [owner] if owner in config.backends.values() else list(dict.fromkeys(config.backends.values()))
+
+            async def ask(url: str) -> tuple[str, httpx.Response | Exception]:
+                # health.allow() may have granted this lookup a half-open trial: always settle it.
+                try:
+                    resp = await upstream_pool.client(url).request(
+                        request.method,
+                        target,
+                        headers={"x-request-id": request.state.request_id},
+                        timeout=JOB_LOOKUP_TIMEOUT,
+                    )
+                except httpx.HTTPError as exc:
+                    health.record_failure(url)
+                    return url, exc
+                health.record_success(url)
+                return url, resp
+
+            answers = await asyncio.gather(*(ask(url) for url in candidates if health.allow(url)))
+            unreachable = [url for url, resp in answers if isinstance(resp, Exception)]
+            for url, resp in answers:
+                if isinstance(resp, httpx.Response) and resp.status_code != 404:
+                    router._job_owners[job_id] = url
+                    router._job_owners.move_to_end(job_id)
+                    while len(router._job_owners) > JOB_OWNERS_MAX:
+                        router._job_owners.popitem(last=False)
+                    headers = {k: v for k, v in resp.headers.items() if k.lower() not in HOP_BY_HOP}
+                    return Response(content=resp.content, status_code=resp.status_code, headers=headers)
+
+            if unreachable or len(answers) < len(candidates):
+                error = HeadwaterServerError(
+                    error_type=ErrorType.BACKEND_UNAVAILABLE,
+                    message=f"Job '{job_id}' not found on reachable backends; some backends are unavailable",
+                    status_code=503,
+                    path=request.url.path,
+                    method=request.method,
+                    request_id=request.state.request_id,
+                    context={"unreachable": unreachable, "circuit_open": len(candidates) - len(answers)},
+                )
+                return JSONResponse(status_code=503, content=error.model_dump(mode="json"))
+            error = HeadwaterServerError(
+                error_type=ErrorType.JOB_NOT_FOUND,
+                message=f"No backend has a job with id '{job_id}'",
+                status_code=404,
+                path=request.url.path,
+                method=request.method,
+                request_id=request.state.request_id,
+                context={"job_id": job_id, "backends_asked": candidates},
+            )
+            return JSONResponse(status_code=404, content=error.model_dump(mode="json"))
+
         @self.app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE"])
         async def proxy(request: Request, path: str) -> Response:
+            config = router._config  # held for the whole request, across reloads
             service = path.split("/")[0]
+            start = time.monotonic()
 
-            body = await request.body()
+            # Only model-routed services need the body before a backend is chosen;
+            # everything else streams straight through to the upstream.
             model: str | None = None
-            if body:
-                try:
-                    parsed = json.loads(body)
+            content: bytes | _StreamedBody
+            if is_model_routed(service, path):
+                with phase("body"):
+                    content = await request.body()
+                if content:
                     # Top-level "model" (OpenAI-style) or nested under "params" (GenerationRequest/BatchRequest)
-                    model = parsed.get("model") or (parsed.get("params") or {}).get("model")
-                except Exception:
-                    pass
+                    model = extract_model(content)
+            elif _has_body(request):
+                content = _StreamedBody(request)
+            else:
+                content = b""
 
             try:
-                from headwater_server.server.routing_config import resolve_backend
-                backend_url, route_key = resolve_backend(service, model, config, path)
+                route_key = resolve_route_key(service, model, config, path)
             except RoutingError as exc:
                 error = HeadwaterServerError(
                     error_type=ErrorType.ROUTING_ERROR,
@@ -154,6 +469,57 @@ class HeadwaterRouter:
                 )
                 return JSONResponse(status_code=400, content=error.model_dump(mode="json"))
 
+            coalesce = route_key in config.coalesce and request.method in COALESCIBLE_METHODS
+            cache_rule = cache.rule(path) if request.method in CACHEABLE_METHODS else None
+            cache_bypass = cache_rule is not None and bypasses_cache(request.headers)
+            scatter_adapter = (
+                ADAPTERS.get(path) if route_key in config.scatter.routes and request.method == "POST" else None
+            )
+            buffered = coalesce or cache_rule is not None or scatter_adapter is not None
+            hedged_route = hedger.enabled(route_key)
+            sticky = request.method == "POST" and affinity.enabled(route_key, path)
+            if (buffered or hedged_route or sticky) and isinstance(content, _StreamedBody):
+                # The body is part of the coalescing / cache key; a hedge must be able to resend it,
+                # a scatter to split it and affinity to hash its conversation prefix.
+                with phase("body"):
+                    content = await request.body()
+
+            target = f"/{path}"
+            if request.url.query:
+                target = f"{target}?{request.url.query}"
+            if buffered:
+                key = request_key(request.method, target, content, request.headers.get("authorization", ""))
+
+            if cache_rule is not None and not cache_bypass:
+                with phase("cache"):
+                    hit = await cache.get(key, cache_rule[0])
+                if hit is not None:
+                    cached, tier = hit
+                    logger.debug(
+                        "proxy_cache_hit",
+                        extra={"path": path, "route": route_key, "tier": tier, "req_id": request.state.request_id},
+                    )
+                    headers = {
+                        k: v for k, v in cached.headers.items()
+                        if not k.lower().startswith("x-headwater-")
+                    }
+                    headers["X-Headwater-Cache"] = "hit"
+                    headers["X-Headwater-Route-Reason"] = "cache"
+                    return Response(content=cached.body, status_code=cached.status_code, headers=headers)
+
+            router_metrics = getattr(request.app.state, "router_metrics", None)
+            choice: tuple[str, str] | None = None
+            with phase("route"):
+                if sticky and (conversation := affinity.key(content)) is not None:
+                    choice = affinity.choose(
+                        conversation, get_pool_urls(route_key, config), get_pool_weights(route_key, config),
+                        balancer, health,
+                    )
+                    if router_metrics is not None:
+                        outcome = "fallback" if choice is None else "hit" if choice[1] == "affinity" else "spill"
+                        router_metrics.record_affinity(route_key, outcome)
+                backend_url, route_reason = choice or choose_backend(route_key, model, config, balancer, residency)
+
             forward_headers = {
                 k: v for k, v in request.headers.items()
                 if k.lower() not in HOP_BY_HOP
@@ -168,63 +534,230 @@ class HeadwaterRouter:
                     "model": model,
                     "path": path,
                     "route": route_key,
+                    "route_reason": route_reason,
                 },
             )
 
-            backends_to_try = [backend_url] + get_fallback_urls(route_key, config)
-            upstream = None
-            for attempt_url in backends_to_try:
-                attempt_target = f"{attempt_url}/{path}"
-                if request.url.query:
-                    attempt_target = f"{attempt_target}?{request.url.query}"
-                try:
-                    async with httpx.AsyncClient() as client:
-                        upstream = await client.request(
-                            method=request.method,
-                            url=attempt_target,
-                            headers=forward_headers,
-                            content=body,
-                            timeout=httpx.Timeout(300.0, connect=5.0),
-                        )
-                    backend_url = attempt_url
-                    break
-                except httpx.ConnectError as exc:
-                    logger.warning(
-                        "backend_unavailable",
-                        extra={
-                            "backend": attempt_url,
-                            "path": path,
-                            "error": str(exc),
-                            "req_id": request.state.request_id,
-                            "will_retry": attempt_url != backends_to_try[-1],
-                        },
-                    )
-                except httpx.TimeoutException as exc:
-                    logger.error(
-                        "backend_timeout",
+            # Chosen backend first, then the rest of its pool, then configured fallbacks.
+            backends_to_try = list(dict.fromkeys(
+                [backend_url] + get_pool_urls(route_key, config) + get_fallback_urls(route_key, config)
+            ))
+            timeout = upstream_pool.timeout(route_key)
+            url_to_name = {v: k for k, v in config.backends.items()}
+
+            if hedged_route:
+                hedger.deposit()
+            hedge_won = False
+            priority = admission.priority(path, request.headers)
+
+            def rejected(exc: AdmissionRejected) -> JSONResponse:
+                logger.warning(
+                        "admission_rejected",
                         extra={
-                            "backend": attempt_url,
+                            "scope": exc.scope,
+                            "reason": exc.reason,
+                            "priority": priority,
                             "path": path,
-                            "error": str(exc),
                             "req_id": request.state.request_id,
                         },
                     )
-                    error = HeadwaterServerError(
-                        error_type=ErrorType.BACKEND_TIMEOUT,
-                        message=f"Backend timed out after 300s: {attempt_url}",
-                        status_code=503,
-                        path=request.url.path,
+                if router_metrics is not None:
+                    router_metrics.record_admission_rejected(exc.scope, exc.reason, priority)
+                error = HeadwaterServerError(
+                    error_type=ErrorType.OVERLOADED,
+                    message=f"Too many requests queued for {exc}",
+                    status_code=429,
+                    path=request.url.path,
+                    method=request.method,
+                    request_id=request.state.request_id,
+                    context={"scope": exc.scope, "reason": exc.reason, "priority": priority},
+                )
+                return JSONResponse(
+                    status_code=429,
+                    content=error.model_dump(mode="json"),
+                    headers={"Retry-After": str(math.ceil(exc.retry_after))},
+                )
+
+            async def admit() -> Ticket | JSONResponse:
+                """Wait for a slot on the route, or build the 429; backend slots are taken per attempt."""
+                try:
+                    ticket = await admission.acquire(route_key, None, priority)
+                except AdmissionRejected as exc:
+                    return rejected(exc)
+                if ticket.scopes:
+                    record_timing("queue", ticket.waited_ms)
+                    if router_metrics is not None:
+                        router_metrics.record_queue_wait(ticket.waited_ms, route=route_key, priority=priority)
+                return ticket
+
+            backend_tickets: dict[str, list[Ticket]] = {}  # admission slots held per backend URL (shards may share one)
+
+            async def acquire_backend(url: str) -> None:
+                """Take url's admission slot (may raise AdmissionRejected) and its balancer slot."""
+                ticket = await admission.acquire(None, url, priority)
+                if ticket.scopes:
+                    record_timing("queue", ticket.waited_ms, url_to_name.get(url, url))
+                    if router_metrics is not None:
+                        router_metrics.record_queue_wait(ticket.waited_ms, route=route_key, priority=priority)
+                backend_tickets.setdefault(url, []).append(ticket)
+                balancer.acquire(url)
+
+            def release_backend(url: str) -> None:
+                balancer.release(url)
+                held = backend_tickets.get(url)
+                if held:
+                    held.pop().release()
+
+            async def send_to(url: str) -> tuple[httpx.Response, str]:
+                """
+                One upstream exchange; url's admission and balancer slots are held until the response is closed.
+
+                The caller's health.allow(url) may have claimed the half-open trial: every exit settles it.
+                """
+                client = upstream_pool.client(url)
+                try:
+                    await acquire_backend(url)
+                except BaseException:
+                    health.release_trial(url)  # rejected or cancelled while queued: never reached the backend
+                    raise
+                sent_at = time.monotonic()
+                connect: list[float] = []
+
+                async def trace(event: str, info: dict) -> None:
+                    # Only fires when the pool has to open a new connection (TCP/unix connect, TLS, h2 preface).
+                    if event.startswith("connection.") and event.endswith((".started", ".complete")):
+                        connect.append(time.monotonic())
+
+                try:
+                    upstream_request = client.build_request(
                         method=request.method,
-                        request_id=request.state.request_id,
-                        context={"backend": attempt_url},
+                        url=target,
+                        headers=with_deadline(forward_headers),
+                        content=content,
+                        timeout=timeout,
+                        extensions={"trace": trace},
                     )
-                    return JSONResponse(status_code=503, content=error.model_dump(mode="json"))
+                    upstream = await client.send(upstream_request, stream=True)
+                except BaseException as exc:
+                    release_backend(url)
+                    if isinstance(exc, (httpx.ConnectError, httpx.TimeoutException)):
+                        health.record_failure(url)
+                    else:
+                        health.release_trial(url)
+                    raise
+                health.record_success(url)
+                headers_ms = (time.monotonic() - sent_at) * 1000
+                backend_name = url_to_name.get(url, url)
+                if connect:
+                    record_timing("connect", (connect[-1] - connect[0]) * 1000, backend_name)
+                record_timing("upstream", headers_ms, backend_name)
+                if hedged_route:
+                    hedger.observe(route_key, headers_ms)
+                return upstream, url
+
+            async def discard(result: tuple[httpx.Response, str]) -> None:
+                upstream, url = result
+                await upstream.aclose()
+                release_backend(url)
+
+            def start_hedge(primary_url: str) -> Awaitable[tuple[httpx.Response, str]] | None:
+                candidates = [url for url in get_pool_urls(route_key, config) if url != primary_url]
+                if not candidates or not hedger.try_spend():
+                    return None
+                hedge_url = balancer.pick(candidates, get_pool_weights(route_key, config))
+                if not health.allow(hedge_url):
+                    return None
+                logger.debug(
+                    "proxy_hedge_sent",
+                    extra={
+                        "backend": hedge_url,
+                        "primary": primary_url,
+                        "path": path,
+                        "req_id": request.state.request_id,
+                    },
+                )
+                if router_metrics is not None:
+                    router_metrics.record_hedge(route_key, "sent")
+                return send_to(hedge_url)
+
+            async def forward() -> httpx.Response | JSONResponse:
+                """Send to the first backend that accepts the connection; sets backend_url.
+
+                On success the backend's admission and balancer slots stay acquired
+                until the caller calls release_backend(backend_url).
+                """
+                nonlocal backend_url, hedge_won
+                skipped: list[str] = []
+                for attempt_url in backends_to_try:
+                    if not health.allow(attempt_url):
+                        skipped.append(attempt_url)
+                        logger.debug(
+                            "backend_circuit_open",
+                            extra={
+                                "backend": attempt_url,
+                                "path": path,
+                                "req_id": request.state.request_id,
+                            },
+                        )
+                        continue
+                    try:
+                        delay = hedger.delay(route_key) if hedged_route else None
+                        if delay is None:
+                            upstream, backend_url = await send_to(attempt_url)
+                        else:
+                            (upstream, backend_url), hedge_won = await race(
+                                send_to(attempt_url),
+                                lambda: start_hedge(attempt_url),
+                                delay,
+                                discard,
+                            )
+                            if hedge_won and router_metrics is not None:
+                                router_metrics.record_hedge(route_key, "won")
+                        return upstream
+                    except AdmissionRejected as exc:
+                        return rejected(exc)
+                    except httpx.ConnectError as exc:
+                        # A streamed body can only be sent once; if any of it went out
+                        # we cannot replay it against a fallback.
+                        replayable = not (isinstance(content, _StreamedBody) and content.started)
+                        logger.warning(
+                            "backend_unavailable",
+                            extra={
+                                "backend": attempt_url,
+                                "path": path,
+                                "error": str(exc),
+                                "req_id": request.state.request_id,
+                                "will_retry": replayable and attempt_url != backends_to_try[-1],
+                            },
+                        )
+                        if not replayable:
+                            break
+                    except httpx.TimeoutException as exc:
+                        logger.error(
+                            "backend_timeout",
+                            extra={
+                                "backend": attempt_url,
+                                "path": path,
+                                "error": str(exc),
+                                "req_id": request.state.request_id,
+                            },
+                        )
+                        error = HeadwaterServerError(
+                            error_type=ErrorType.BACKEND_TIMEOUT,
+                            message=f"Backend timed out after {timeout.read:g}s: {attempt_url}",
+                            status_code=503,
+                            path=request.url.path,
+                            method=request.method,
+                            request_id=request.state.request_id,
+                            context={"backend": attempt_url},
+                        )
+                        return JSONResponse(status_code=503, content=error.model_dump(mode="json"))
 
-            if upstream is None:
                 logger.error(
                     "all_backends_unavailable",
                     extra={
                         "backends_tried": backends_to_try,
+                        "circuit_open": skipped,
                         "path": path,
                         "req_id": request.state.request_id,
                     },
@@ -236,36 +769,244 @@ class HeadwaterRouter:
                     path=request.url.path,
                     method=request.method,
                     request_id=request.state.request_id,
-                    context={"backends_tried": backends_to_try},
+                    context={"backends_tried": backends_to_try, "circuit_open": skipped},
                 )
                 return JSONResponse(status_code=503, content=error.model_dump(mode="json"))
 
-            logger.debug(
-                "proxy_response",
-                extra={
-                    "service": service,
-                    "backend": backend_url,
-                    "path": path,
-                    "upstream_status": upstream.status_code,
-                    "req_id": request.state.request_id,
-                },
-            )
+            def response_headers_for(upstream: httpx.Response) -> dict[str, str]:
+                nonlocal route_reason
+                logger.debug(
+                    "proxy_response",
+                    extra={
+                        "service": service,
+                        "backend": backend_url,
+                        "path": path,
+                        "upstream_status": upstream.status_code,
+                        "req_id": request.state.request_id,
+                    },
+                )
+                headers = {
+                    k: v for k, v in upstream.headers.items()
+                    if k.lower() not in HOP_BY_HOP and k.lower() != "server-timing"
+                }
+                upstream_timing = next((v for k, v in upstream.headers.items() if k.lower() == "server-timing"), None)
+                if upstream_timing:
+                    # Re-emitted under the router's own header, after the router's phases.
+                    merge_timing(upstream_timing, f"{url_to_name.get(backend_url, backend_url)}.")
+                if hedge_won:
+                    route_reason = "hedge"
+                elif backend_url != backends_to_try[0]:
+                    headers["X-Headwater-Routed-Via"] = url_to_name.get(backend_url, backend_url)
+                    headers["X-Headwater-Primary-Backend"] = url_to_name.get(backends_to_try[0], backends_to_try[0])
+                    route_reason = "failover"
+                headers["X-Headwater-Route-Reason"] = route_reason
+                return headers
 
-            response_headers = {
-                k: v for k, v in upstream.headers.items()
-                if k.lower() not in HOP_BY_HOP
-            }
-            if backend_url != backends_to_try[0]:
-                url_to_name = {v: k for k, v in config.backends.items()}
-                response_headers["X-Headwater-Routed-Via"] = url_to_name.get(backend_url, backend_url)
-                response_headers["X-Headwater-Primary-Backend"] = url_to_name.get(backends_to_try[0], backends_to_try[0])
-            return Response(
-                content=upstream.content,
-                status_code=upstream.status_code,
-                headers=response_headers,
+            def on_first_byte() -> None:
+                ttfb_ms = round((time.monotonic() - start) * 1000, 1)
+                if router_metrics is not None:
+                    router_metrics.record_ttfb(
+                        ttfb_ms, backend=url_to_name.get(backend_url, backend_url), route=route_key
+                    )
+                logger.debug(
+                    "proxy_first_byte",
+                    extra={
+                        "backend": backend_url,
+                        "path": path,
+                        "ttfb_ms": ttfb_ms,
+                        "req_id": request.state.request_id,
+                    },
+                )
+
+            async def scatter() -> SharedResponse | None:
+                """Split a large batch across the healthy pool; None means send it whole instead."""
+                try:
+                    payload = json.loads(content)
+                    n = scatter_adapter.count(payload)
+                except (ValueError, TypeError, KeyError):
+                    return None
+                if n < config.scatter.min_items:
+                    return None
+                # is_closed(), not allow(): a member left without a shard would keep a claimed half-open trial.
+                eligible = [url for url in get_pool_urls(route_key, config) if health.is_closed(url)]
+                if model and any(residency.known(url) for url in eligible):
+                    # Only nodes already serving the model; a shard must not force cold loads.
+                    eligible = [url for url in eligible if residency.is_resident(url, model)]
+                rate_key = route_key if model is None else f"{route_key}/{model}"
+                shards = plan_shards(n, throughput.weights(rate_key, eligible), config.scatter.min_shard)
+                if len(shards) < 2:
+                    return None
+
+                shard_headers = {k: v for k, v in forward_headers.items() if k.lower() != "content-length"}
+                pool_weights = get_pool_weights(route_key, config)
+
+                async def send_shard(url: str, shard: Shard) -> dict:
+                    body = scatter_adapter.slice(payload, shard.start, shard.stop)
+                    client = upstream_pool.client(url)
+                    try:
+                        await acquire_backend(url)
+                    except AdmissionRejected:
+                        raise ShardFailed(url, None) from None  # that backend's queue is full: try another
+                    sent_at = time.monotonic()
+                    try:
+                        upstream = await client.send(client.build_request(
+                            method=request.method,
+                            url=target,
+                            headers=with_deadline(shard_headers),
+                            content=json.dumps(body).encode(),
+                            timeout=timeout,
+                        ))
+                    except (httpx.ConnectError, httpx.TimeoutException):
+                        health.record_failure(url)
+                        failure = ShardFailed(url, None)
+                    else:
+                        health.record_success(url)
+                        failure = None
+                        if upstream.status_code >= 400:
+                            failure = ShardFailed(url, upstream.status_code, upstream.content, upstream.headers)
+                    finally:
+                        release_backend(url)
+                    if router_metrics is not None:
+                        router_metrics.record_scatter_shard(
+                            route_key, url_to_name.get(url, url), "failed" if failure else "ok"
+                        )
+                    if failure is not None:
+                        logger.warning(
+                            "scatter_shard_failed",
+                            extra={
+                                "backend": url,
+                                "path": path,
+                                "items": shard.size,
+                                "upstream_status": failure.status_code,
+                                "req_id": request.state.request_id,
+                            },
+                        )
+                        raise failure
+                    result = upstream.json()
+                    throughput.observe(
+                        rate_key, url, scatter_adapter.work(body, result), time.monotonic() - sent_at
+                    )
+                    return result
+
+                try:
+                    with phase("scatter", f"{len(shards)} shards"):
+                        parts, retries = await gather_shards(
+                            shards, eligible, send_shard, lambda urls: balancer.pick(urls, pool_weights)
+                        )
+                except ShardFailed as exc:
+                    if exc.status_code is not None:
+                        headers = {
+                            k: v for k, v in exc.headers.items()
+                            if k.lower() not in HOP_BY_HOP and k.lower() != "content-length"
+                        }
+                        headers["X-Headwater-Route-Reason"] = "scatter"
+                        return SharedResponse(exc.status_code, headers, exc.body)
+                    error = HeadwaterServerError(
+                        error_type=ErrorType.BACKEND_UNAVAILABLE,
+                        message=f"Scattered batch failed: no backend left for a shard of route '{route_key}'",
+                        status_code=503,
+                        path=request.url.path,
+                        method=request.method,
+                        request_id=request.state.request_id,
+                        context={"backends_tried": eligible},
+                    )
+                    return SharedResponse(
+                        503, {"content-type": "application/json"}, json.dumps(error.model_dump(mode="json")).encode()
+                    )
+
+                shard_summary = ",".join(f"{url_to_name.get(s.url, s.url)}={s.size}" for s in shards)
+                logger.debug(
+                    "proxy_scattered",
+                    extra={
+                        "path": path,
+                        "route": route_key,
+                        "items": n,
+                        "shards": shard_summary,
+                        "retries": retries,
+                        "req_id": request.state.request_id,
+                    },
+                )
+                on_first_byte()
+                return SharedResponse(
+                    200,
+                    {
+                        "content-type": "application/json",
+                        "X-Headwater-Route-Reason": "scatter",
+                        "X-Headwater-Shards": shard_summary,
+                    },
+                    json.dumps(scatter_adapter.merge(parts)).encode(),
+                )
+
+            if buffered:
+                async def fetch_buffered() -> SharedResponse:
+                    ticket = await admit()
+                    if isinstance(ticket, JSONResponse):
+                        return SharedResponse(ticket.status_code, dict(ticket.headers), bytes(ticket.body))
+                    try:
+                        if scatter_adapter is not None:
+                            scattered = await scatter()
+                            if scattered is not None:
+                                return scattered
+                        result = await forward()
+                        if isinstance(result, JSONResponse):
+                            return SharedResponse(result.status_code, dict(result.headers), bytes(result.body))
+                        held_url = backend_url
+                        try:
+                            body = b"".join([chunk async for chunk in result.aiter_raw()])
+                        finally:
+                            await result.aclose()
+                            release_backend(held_url)
+                    finally:
+                        ticket.release()
+                    on_first_byte()
+                    return SharedResponse(result.status_code, response_headers_for(result), body)
+
+                if coalesce:
+                    shared, joined = await coalescer.do(key, fetch_buffered)
+                else:
+                    shared, joined = await fetch_buffered(), False
+                headers = dict(shared.headers)
+                if cache_rule is not None:
+                    headers["X-Headwater-Cache"] = "bypass" if cache_bypass else "miss"
+                    if not cache_bypass and not joined:
+                        cache.put(key, cache_rule[0], cache_rule[1], shared)
+                if joined:
+                    headers["X-Headwater-Coalesced"] = "true"
+                    if router_metrics is not None:
+                        router_metrics.record_coalesced(route_key)
+                    logger.debug(
+                        "proxy_coalesced",
+                        extra={"path": path, "route": route_key, "req_id": request.state.request_id},
+                    )
+                return Response(content=shared.body, status_code=shared.status_code, headers=headers)
+
+            ticket = await admit()
+            if isinstance(ticket, JSONResponse):
+                return ticket
+            try:
+                result = await forward()
+            except BaseException:
+                ticket.release()
+                raise
+            if isinstance(result, JSONResponse):
+                ticket.release()
+                return result
+            held_url = backend_url
+
+            def on_close() -> None:
+                release_backend(held_url)
+                ticket.release()
+
+            return StreamingResponse(
+                _relay(result, on_first_byte, on_close=on_close),
+                status_code=result.status_code,
+                headers=response_headers_for(result),
             )
 
     def _register_middleware(self) -> None:
+        # Inside the correlation middleware, so its 504/499s get X-Request-ID and are logged.
+        self.app.add_middleware(DeadlineMiddleware)
+
         @self.app.middleware("http")
         async def correlation_middleware(request: Request, call_next: Callable) -> Response:
             header_value = request.headers.get("X-Request-ID", "")
@@ -277,11 +1018,17 @@ class HeadwaterRouter:
                 request_id = str(uuid.uuid4())
 
             request.state.request_id = request_id
+            timing = ServerTiming()
+            timing_token = server_timing_var.set(timing)
             start = time.monotonic()
 
-            response = await call_next(request)
+            try:
+                response = await call_next(request)
+            finally:
+                server_timing_var.reset(timing_token)
 
             duration_ms = round((time.monotonic() - start) * 1000, 1)
+            timing.add("total", duration_ms)
             logger.debug(
                 "request_finished",
                 extra={
@@ -289,9 +1036,11 @@ class HeadwaterRouter:
                     "method": request.method,
                     "status_code": response.status_code,
                     "duration_ms": duration_ms,
+                    **timing.log_extra(),
                 },
             )
             response.headers["X-Request-ID"] = request_id
+            response.headers[TIMING_HEADER] = timing.header()
             return response
 
 
@@ -310,4 +1059,8 @@ except FileNotFoundError:
 
 if _router is not None:
     from headwater_server.server.metrics import register_router_metrics
-    register_router_metrics(_router.app, _router._name, _router._config)
+    register_router_metrics(
+        _router.app, _router._name, _router._config,
+        balancer=_router._balancer, health=_router._health, cache=_router._cache,
+        admission=_router._admission, upstream=_router._upstream,
+    )
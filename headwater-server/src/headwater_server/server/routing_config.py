@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 import yaml
 
 if TYPE_CHECKING:
-    pass
+    from headwater_server.server.balancer import LeastOutstandingBalancer
+    from headwater_server.server.residency import ResidencyMap
 
 ROUTES_YAML_PATH = Path.home() / ".config" / "headwater" / "routes.yaml"
 
@@ -15,19 +16,137 @@ REQUIRED_TOP_LEVEL_KEYS = {"backends", "routes", "heavy_models"}
 
 
 class RoutingConfigError(Exception):
-    """Raised at startup when routes.yaml is present but structurally invalid."""
+    """Raised when routes.yaml is present but structurally invalid, at startup or on reload."""
 
 
 class RoutingError(ValueError):
     """Raised by resolve_backend when a service has no route entry."""
 
 
+@dataclass(frozen=True)
+class UpstreamSettings:
+    """Connection-pool limits and timeouts for router -> backend traffic."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0        # seconds an idle keep-alive connection is kept
+    connect_timeout: float = 5.0
+    read_timeout: float = 300.0
+    http2: bool = False               # h2c with prior knowledge: many streams share few connections
+
+
+@dataclass(frozen=True)
+class HealthSettings:
+    """Active backend probing and circuit-breaker thresholds."""
+
+    interval: float = 5.0            # seconds between /ping sweeps
+    timeout: float = 2.0             # per-probe timeout
+    failure_threshold: int = 3       # consecutive failures that open the circuit
+    cooldown: float = 10.0           # seconds an open circuit waits before a half-open trial
+
+
+@dataclass(frozen=True)
+class ResidencySettings:
+    """How often the router refreshes which Ollama models are loaded on each pooled backend."""
+
+    interval: float = 10.0           # seconds between /gpu sweeps
+    timeout: float = 5.0             # per-backend /gpu timeout
+
+
+@dataclass(frozen=True)
+class FederationSettings:
+    """GET /metrics/federate: per-backend scrape timeout and how long a merged scrape is reused."""
+
+    timeout: float = 2.0             # per-backend /metrics timeout; bounds the federated scrape
+    cache_ttl: float = 5.0           # seconds a merged exposition is served from cache
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    """Router response cache: memory budget, optional disk tier, and TTL per cached path prefix."""
+
+    max_mb: float = 256.0
+    disk_path: Path | None = None    # enables the on-disk tier (SQLite file)
+    disk_max_mb: float = 2048.0
+    routes: dict[str, float] = field(default_factory=dict)  # path prefix (no leading /) -> TTL seconds
+
+
+@dataclass(frozen=True)
+class HedgeSettings:
+    """Tail-latency hedging for idempotent routes."""
+
+    percentile: float = 95.0         # hedge once the primary is slower than this percentile
+    budget: float = 0.1              # hedges allowed per request on a hedged route
+    min_samples: int = 20            # observations needed before a route is hedged
+    window: int = 200                # recent latencies kept per route
+    routes: list[str] = field(default_factory=list)  # route_keys declared idempotent
+
+
+@dataclass(frozen=True)
+class AdmissionSettings:
+    """Concurrency caps per route/backend and the priority queue in front of them."""
+
+    queue_size: int = 64             # waiters allowed per capped route/backend before 429
+    queue_timeout: float = 30.0      # seconds a request may wait for a slot before 429
+    retry_after: float = 5.0         # Retry-After sent with a 429
+    routes: dict[str, int] = field(default_factory=dict)    # route_key -> max concurrent requests
+    backends: dict[str, int] = field(default_factory=dict)  # backend_name -> max concurrent requests
+    bulk: list[str] = field(default_factory=list)           # path prefixes (no leading /) queued as bulk
+
+
+@dataclass(frozen=True)
+class ScatterSettings:
+    """Splitting of large list-shaped requests across a route's pool."""
+
+    min_items: int = 256             # smaller requests go to a single backend
+    min_shard: int = 32              # backends whose share would be smaller sit the request out
+    routes: list[str] = field(default_factory=list)  # pooled route_keys whose batches are scattered
+
+
+@dataclass(frozen=True)
+class AffinitySettings:
+    """Sticky routing of conversation turns by a hash of their prefix."""
+
+    messages: int = 1                # non-system messages hashed with the system prompt and model
+    load_factor: float = 1.25        # owner is skipped above this multiple of its share of in-flight requests
+    vnodes: int = 100                # ring points per unit of backend weight
+    routes: list[str] = field(default_factory=list)  # pooled route_keys routed by conversation prefix
+
+
+_Settings = TypeVar(
+    "_Settings",
+    UpstreamSettings,
+    HealthSettings,
+    ResidencySettings,
+    FederationSettings,
+    CacheSettings,
+    HedgeSettings,
+    AdmissionSettings,
+    ScatterSettings,
+    AffinitySettings,
+)
+
+
 @dataclass(frozen=True)
 class RouterConfig:
     backends: dict[str, str]              # backend name -> base_url
-    routes: dict[str, str]                # service name -> backend name
+    routes: dict[str, str]                # service name -> primary backend name
     heavy_models: list[str]               # model names that trigger heavy routing
     fallbacks: dict[str, list[str]] = field(default_factory=dict)  # route_key -> [backend_name, ...]
+    pools: dict[str, list[str]] = field(default_factory=dict)      # route_key -> [backend_name, ...], primary first
+    weights: dict[str, dict[str, float]] = field(default_factory=dict)  # route_key -> {backend_name: weight}
+    upstream: UpstreamSettings = field(default_factory=UpstreamSettings)  # fleet-wide defaults
+    upstream_backends: dict[str, UpstreamSettings] = field(default_factory=dict)  # backend_name -> pool limits
+    upstream_routes: dict[str, UpstreamSettings] = field(default_factory=dict)    # route_key -> timeouts
+    health: HealthSettings = field(default_factory=HealthSettings)
+    residency: ResidencySettings = field(default_factory=ResidencySettings)
+    federation: FederationSettings = field(default_factory=FederationSettings)
+    coalesce: list[str] = field(default_factory=list)  # route_keys whose identical in-flight requests share one upstream call
+    cache: CacheSettings = field(default_factory=CacheSettings)
+    hedge: HedgeSettings = field(default_factory=HedgeSettings)
+    admission: AdmissionSettings = field(default_factory=AdmissionSettings)
+    scatter: ScatterSettings = field(default_factory=ScatterSettings)
+    affinity: AffinitySettings = field(default_factory=AffinitySettings)
 
 
 def load_router_config(path: Path = ROUTES_YAML_PATH) -> RouterConfig:
@@ -36,14 +155,21 @@ def load_router_config(path: Path = ROUTES_YAML_PATH) -> RouterConfig:
 
     Raises:
         FileNotFoundError: if path does not exist (includes path in message).
-        RoutingConfigError: if required keys are missing or a route references
-                            an undefined backend.
+        RoutingConfigError: if the file is not a YAML mapping, required keys are
+                            missing, a block has the wrong shape or a route
+                            references an undefined backend.
     """
     if not path.exists():
         raise FileNotFoundError(f"routes.yaml not found at: {path}")
 
     with path.open() as f:
-        raw = yaml.safe_load(f)
+        try:
+            raw = yaml.safe_load(f)
+        except yaml.YAMLError as exc:
+            raise RoutingConfigError(f"routes.yaml is not valid YAML: {exc}") from exc
+
+    if not isinstance(raw, dict):
+        raise RoutingConfigError(f"routes.yaml must be a mapping, got {type(raw).__name__}")
 
     missing_keys = REQUIRED_TOP_LEVEL_KEYS - set(raw.keys())
     if missing_keys:
@@ -51,18 +177,28 @@ def load_router_config(path: Path = ROUTES_YAML_PATH) -> RouterConfig:
             f"routes.yaml missing required keys: {sorted(missing_keys)}"
         )
 
-    backends: dict[str, str] = raw["backends"]
-    routes: dict[str, str] = raw["routes"]
-    heavy_models: list[str] = raw["heavy_models"] or []
-
-    for service, backend_name in routes.items():
-        if backend_name not in backends:
+    backends: dict[str, str] = _mapping(raw["backends"], "backends")
+    for name, url in backends.items():
+        if str(url).startswith("unix://") and not str(url).startswith("unix:///"):
             raise RoutingConfigError(
-                f"Route '{service}' references undefined backend '{backend_name}'. "
-                f"Defined backends: {sorted(backends.keys())}"
+                f"Backend '{name}' socket URL must hold an absolute path (unix:///path.sock), got {url!r}"
             )
+    heavy_models: list[str] = _names(raw["heavy_models"], "heavy_models")
+
+    routes: dict[str, str] = {}
+    pools: dict[str, list[str]] = {}
+    weights: dict[str, dict[str, float]] = {}
+    for service, entry in _mapping(raw["routes"], "routes").items():
+        members = _parse_route_pool(service, entry, backends)
+        routes[service] = members[0][0]
+        if len(members) > 1:
+            pools[service] = [name for name, _ in members]
+            weights[service] = dict(members)
 
-    raw_fallbacks: dict[str, list[str]] = raw.get("fallbacks") or {}
+    raw_fallbacks: dict[str, list[str]] = {
+        route_key: _names(fallback_names, f"fallbacks.{route_key}")
+        for route_key, fallback_names in _mapping(raw.get("fallbacks"), "fallbacks").items()
+    }
     for route_key, fallback_names in raw_fallbacks.items():
         for fb_name in fallback_names:
             if fb_name not in backends:
@@ -71,24 +207,294 @@ def load_router_config(path: Path = ROUTES_YAML_PATH) -> RouterConfig:
                     f"Defined backends: {sorted(backends.keys())}"
                 )
 
+    coalesce: list[str] = _names(raw.get("coalesce"), "coalesce")
+    for route_key in coalesce:
+        if route_key not in routes:
+            raise RoutingConfigError(
+                f"coalesce references unknown route '{route_key}'. "
+                f"Defined routes: {sorted(routes.keys())}"
+            )
+
+    upstream, upstream_backends, upstream_routes = _parse_upstream(
+        raw.get("upstream"), backends, routes
+    )
+
     return RouterConfig(
         backends=backends,
         routes=routes,
         heavy_models=heavy_models,
         fallbacks=raw_fallbacks,
+        pools=pools,
+        weights=weights,
+        upstream=upstream,
+        upstream_backends=upstream_backends,
+        upstream_routes=upstream_routes,
+        health=_parse_settings(raw.get("health"), HealthSettings(), "health"),
+        residency=_parse_settings(raw.get("residency"), ResidencySettings(), "residency"),
+        federation=_parse_settings(raw.get("federation"), FederationSettings(), "federation"),
+        coalesce=coalesce,
+        cache=_parse_cache(raw.get("cache")),
+        hedge=_parse_hedge(raw.get("hedge"), routes),
+        admission=_parse_admission(raw.get("admission"), backends, routes),
+        scatter=_parse_scatter(raw.get("scatter"), pools),
+        affinity=_parse_affinity(raw.get("affinity"), pools),
     )
 
 
-def resolve_backend(service: str, model: str | None, config: RouterConfig, path: str = "") -> tuple[str, str]:
+def _parse_route_pool(
+    service: str, entry: str | list, backends: dict[str, str]
+) -> list[tuple[str, float]]:
     """
-    Return (backend_base_url, route_key) for the given service and model.
+    Parse one `routes` entry into [(backend_name, weight), ...], primary first.
+
+    Accepts a backend name, or a list whose items are backend names or
+    {backend: <name>, weight: <number>} mappings.
+    """
+    items = entry if isinstance(entry, list) else [entry]
+    if not items:
+        raise RoutingConfigError(f"Route '{service}' has an empty backend pool.")
+
+    members: list[tuple[str, float]] = []
+    for item in items:
+        if isinstance(item, dict):
+            backend_name = item.get("backend")
+            weight = item.get("weight", 1.0)
+        else:
+            backend_name, weight = item, 1.0
+        if not isinstance(backend_name, str) or backend_name not in backends:
+            raise RoutingConfigError(
+                f"Route '{service}' references undefined backend '{backend_name}'. "
+                f"Defined backends: {sorted(backends.keys())}"
+            )
+        if not isinstance(weight, (int, float)) or isinstance(weight, bool) or weight <= 0:
+            raise RoutingConfigError(
+                f"Route '{service}' backend '{backend_name}' weight must be a positive number, got {weight!r}"
+            )
+        if any(name == backend_name for name, _ in members):
+            raise RoutingConfigError(f"Route '{service}' lists backend '{backend_name}' more than once.")
+        members.append((backend_name, float(weight)))
+    return members
+
+
+def _mapping(raw, where: str) -> dict:
+    """An optional routes.yaml mapping block; absent or null is empty."""
+    if raw is None:
+        return {}
+    if not isinstance(raw, dict):
+        raise RoutingConfigError(f"{where} must be a mapping, got {type(raw).__name__}")
+    return raw
+
+
+def _names(raw, where: str) -> list[str]:
+    """An optional routes.yaml list of names (routes, backends, models); absent or null is empty."""
+    if raw is None:
+        return []
+    if not isinstance(raw, list) or not all(isinstance(name, str) for name in raw):
+        raise RoutingConfigError(f"{where} must be a list of names, got {raw!r}")
+    return raw
+
+
+def _parse_settings(raw: dict | None, base: _Settings, where: str) -> _Settings:
+    """Overlay a routes.yaml block of positive numbers onto a settings dataclass."""
+    raw = _mapping(raw, where)
+    allowed = {f.name for f in fields(base)}
+    unknown = set(raw) - allowed
+    if unknown:
+        raise RoutingConfigError(
+            f"{where} has unknown keys: {sorted(unknown)}. "
+            f"Allowed: {sorted(allowed)}"
+        )
+    for key, value in raw.items():
+        if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+            raise RoutingConfigError(f"{where}.{key} must be a positive number, got {value!r}")
+    return replace(base, **raw)
+
+
+def _parse_cache(raw: dict | None) -> CacheSettings:
+    """
+    Parse the optional `cache` block of routes.yaml.
+
+    `routes` maps a path prefix (e.g. `conduit/embeddings`, `reranker`) to the
+    TTL in seconds for responses under it; paths not listed are never cached.
+    """
+    raw = dict(_mapping(raw, "cache"))
+    raw_routes = raw.pop("routes", None) or {}
+    disk_path = raw.pop("disk_path", None)
+    settings = _parse_settings(raw, CacheSettings(), "cache")
+
+    if not isinstance(raw_routes, dict):
+        raise RoutingConfigError("cache.routes must map path prefixes to TTL seconds")
+    routes: dict[str, float] = {}
+    for prefix, ttl in raw_routes.items():
+        if not isinstance(ttl, (int, float)) or isinstance(ttl, bool) or ttl <= 0:
+            raise RoutingConfigError(f"cache.routes.{prefix} must be a positive number of seconds, got {ttl!r}")
+        routes[str(prefix).strip("/")] = float(ttl)
+
+    return replace(
+        settings,
+        disk_path=Path(disk_path).expanduser() if disk_path else None,
+        routes=routes,
+    )
+
+
+def _parse_hedge(raw: dict | None, routes: dict[str, str]) -> HedgeSettings:
+    """Parse the optional `hedge` block; `routes` lists the idempotent route keys to hedge."""
+    raw = dict(_mapping(raw, "hedge"))
+    hedge_routes = _names(raw.pop("routes", None), "hedge.routes")
+    settings = _parse_settings(raw, HedgeSettings(), "hedge")
+    if settings.percentile > 100:
+        raise RoutingConfigError(f"hedge.percentile must be at most 100, got {settings.percentile!r}")
+    if settings.budget > 1:
+        raise RoutingConfigError(f"hedge.budget must be at most 1, got {settings.budget!r}")
+    for route_key in hedge_routes:
+        if route_key not in routes:
+            raise RoutingConfigError(
+                f"hedge references unknown route '{route_key}'. "
+                f"Defined routes: {sorted(routes.keys())}"
+            )
+    return replace(settings, window=int(settings.window), routes=list(hedge_routes))
+
+
+def _parse_admission(raw: dict | None, backends: dict[str, str], routes: dict[str, str]) -> AdmissionSettings:
+    """
+    Parse the optional `admission` block of routes.yaml.
+
+    `routes.<route_key>` and `backends.<name>` cap concurrent proxied requests;
+    `bulk` lists path prefixes (e.g. `conduit/batch`) whose requests queue
+    behind interactive ones unless X-Headwater-Priority says otherwise.
+    """
+    raw = dict(_mapping(raw, "admission"))
+    raw_routes: dict = raw.pop("routes", None) or {}
+    raw_backends: dict = raw.pop("backends", None) or {}
+    bulk = raw.pop("bulk", None) or []
+    settings = _parse_settings(raw, AdmissionSettings(), "admission")
+
+    limits: dict[str, dict[str, int]] = {}
+    for where, raw_limits, defined in (("routes", raw_routes, routes), ("backends", raw_backends, backends)):
+        if not isinstance(raw_limits, dict):
+            raise RoutingConfigError(f"admission.{where} must map names to concurrency limits")
+        limits[where] = {}
+        for name, limit in raw_limits.items():
+            if name not in defined:
+                raise RoutingConfigError(
+                    f"admission.{where} references undefined {where[:-1]} '{name}'. "
+                    f"Defined {where}: {sorted(defined.keys())}"
+                )
+            if not isinstance(limit, int) or isinstance(limit, bool) or limit <= 0:
+                raise RoutingConfigError(f"admission.{where}.{name} must be a positive integer, got {limit!r}")
+            limits[where][name] = limit
+
+    if not isinstance(bulk, list):
+        raise RoutingConfigError("admission.bulk must be a list of path prefixes")
+    return replace(
+        settings,
+        queue_size=int(settings.queue_size),
+        routes=limits["routes"],
+        backends=limits["backends"],
+        bulk=[str(prefix).strip("/") for prefix in bulk],
+    )
+
+
+def _parse_scatter(raw: dict | None, pools: dict[str, list[str]]) -> ScatterSettings:
+    """Parse the optional `scatter` block; `routes` lists pooled route keys whose batches are split."""
+    raw = dict(_mapping(raw, "scatter"))
+    scatter_routes = _names(raw.pop("routes", None), "scatter.routes")
+    settings = _parse_settings(raw, ScatterSettings(), "scatter")
+    for route_key in scatter_routes:
+        if route_key not in pools:
+            raise RoutingConfigError(
+                f"scatter references route '{route_key}', which has no backend pool. "
+                f"Pooled routes: {sorted(pools.keys())}"
+            )
+    return replace(
+        settings,
+        min_items=int(settings.min_items),
+        min_shard=int(settings.min_shard),
+        routes=list(scatter_routes),
+    )
+
+
+def _parse_affinity(raw: dict | None, pools: dict[str, list[str]]) -> AffinitySettings:
+    """Parse the optional `affinity` block; `routes` lists pooled route keys with sticky conversations."""
+    raw = dict(_mapping(raw, "affinity"))
+    affinity_routes = _names(raw.pop("routes", None), "affinity.routes")
+    settings = _parse_settings(raw, AffinitySettings(), "affinity")
+    if settings.load_factor < 1:
+        raise RoutingConfigError(f"affinity.load_factor must be at least 1, got {settings.load_factor!r}")
+    for route_key in affinity_routes:
+        if route_key not in pools:
+            raise RoutingConfigError(
+                f"affinity references route '{route_key}', which has no backend pool. "
+                f"Pooled routes: {sorted(pools.keys())}"
+            )
+    return replace(
+        settings,
+        messages=int(settings.messages),
+        vnodes=int(settings.vnodes),
+        routes=list(affinity_routes),
+    )
+
+
+def _parse_upstream(
+    raw: dict | None, backends: dict[str, str], routes: dict[str, str]
+) -> tuple[UpstreamSettings, dict[str, UpstreamSettings], dict[str, UpstreamSettings]]:
+    """
+    Parse the optional `upstream` block of routes.yaml.
+
+    Top-level keys are fleet-wide defaults. `backends.<name>` overrides them for
+    that backend's connection pool (including `http2`); `routes.<route_key>`
+    overrides them for the timeouts of requests resolved to that route.
+    """
+    raw = dict(_mapping(raw, "upstream"))
+    raw_backends = _mapping(raw.pop("backends", None), "upstream.backends")
+    raw_routes = _mapping(raw.pop("routes", None), "upstream.routes")
+    defaults = _parse_upstream_settings(raw, UpstreamSettings(), "upstream")
+
+    upstream_backends: dict[str, UpstreamSettings] = {}
+    for name, overrides in raw_backends.items():
+        if name not in backends:
+            raise RoutingConfigError(
+                f"upstream.backends references undefined backend '{name}'. "
+                f"Defined backends: {sorted(backends.keys())}"
+            )
+        upstream_backends[name] = _parse_upstream_settings(overrides, defaults, f"upstream.backends.{name}")
+
+    upstream_routes: dict[str, UpstreamSettings] = {}
+    for route_key, overrides in raw_routes.items():
+        if route_key not in routes:
+            raise RoutingConfigError(
+                f"upstream.routes references undefined route '{route_key}'. "
+                f"Defined routes: {sorted(routes.keys())}"
+            )
+        overrides = _mapping(overrides, f"upstream.routes.{route_key}")
+        if "http2" in overrides:
+            raise RoutingConfigError(
+                f"upstream.routes.{route_key}.http2: the protocol is chosen per backend, under upstream.backends"
+            )
+        upstream_routes[route_key] = _parse_settings(overrides, defaults, f"upstream.routes.{route_key}")
+
+    return defaults, upstream_backends, upstream_routes
+
+
+def _parse_upstream_settings(raw: dict | None, base: UpstreamSettings, where: str) -> UpstreamSettings:
+    """_parse_settings for an upstream block, plus its boolean `http2` flag."""
+    raw = dict(_mapping(raw, where))
+    http2 = raw.pop("http2", base.http2)
+    if not isinstance(http2, bool):
+        raise RoutingConfigError(f"{where}.http2 must be true or false, got {http2!r}")
+    return replace(_parse_settings(raw, base, where), http2=http2)
+
+
+def resolve_route_key(service: str, model: str | None, config: RouterConfig, path: str = "") -> str:
+    """
+    Return the route_key for the given service and model.
 
     Resolution order:
-    1. conduit/embeddings sub-path → embeddings backend
-    2. conduit + heavy model → heavy_inference backend
-    3. reranker + heavy model → reranker_heavy backend
-    4. reranker + light/unknown model → reranker_light backend
-    5. all other services → config.routes[service]
+    1. conduit/embeddings sub-path → embeddings
+    2. conduit + heavy model → heavy_inference
+    3. reranker + heavy model → reranker_heavy
+    4. reranker + light/unknown model → reranker_light
+    5. all other services → service
 
     Raises:
         RoutingError: if service has no entry in config.routes.
@@ -96,28 +502,109 @@ def resolve_backend(service: str, model: str | None, config: RouterConfig, path:
     is_heavy = model is not None and model in config.heavy_models
 
     if service == "conduit" and path.startswith("conduit/embeddings"):
-        route_key = "embeddings"
-        backend_name = config.routes[route_key]
-        return config.backends[backend_name], route_key
-
+        return "embeddings"
     if service == "conduit" and is_heavy:
-        route_key = "heavy_inference"
-        backend_name = config.routes[route_key]
-        return config.backends[backend_name], route_key
-
+        return "heavy_inference"
     if service == "reranker":
-        route_key = "reranker_heavy" if is_heavy else "reranker_light"
-        backend_name = config.routes[route_key]
-        return config.backends[backend_name], route_key
-
+        return "reranker_heavy" if is_heavy else "reranker_light"
     if service not in config.routes:
         raise RoutingError(
             f"Unknown service '{service}'. Known services: {sorted(config.routes.keys())}"
         )
+    return service
+
+
+def choose_backend(
+    route_key: str,
+    model: str | None,
+    config: RouterConfig,
+    balancer: LeastOutstandingBalancer | None = None,
+    residency: ResidencyMap | None = None,
+) -> tuple[str, str]:
+    """
+    Return (backend_base_url, reason) for route_key.
+
+    Reasons:
+        primary            single-backend route, or no balancer
+        model_resident     model is already loaded on the chosen backend
+        cold_no_evict      model is loaded nowhere in the pool; the chosen backend
+                           can load it without evicting another model
+        cold               model is loaded nowhere and every backend would evict
+        least_outstanding  no residency data; fewest in-flight requests per weight
+
+    Ties within each group are broken by the balancer.
+    """
+    pool = get_pool_urls(route_key, config)
+    if balancer is None or len(pool) == 1:
+        return pool[0], "primary"
+    weights = get_pool_weights(route_key, config)
+
+    if model and residency is not None:
+        resident = [url for url in pool if residency.is_resident(url, model)]
+        if resident:
+            return balancer.pick(resident, weights), "model_resident"
+        known = [url for url in pool if residency.known(url)]
+        if known:
+            no_evict = [url for url in known if not residency.would_evict(url, model)]
+            if no_evict:
+                return balancer.pick(no_evict, weights), "cold_no_evict"
+            return balancer.pick(pool, weights), "cold"
+
+    return balancer.pick(pool, weights), "least_outstanding"
+
+
+def resolve_backend(
+    service: str,
+    model: str | None,
+    config: RouterConfig,
+    path: str = "",
+    balancer: LeastOutstandingBalancer | None = None,
+    residency: ResidencyMap | None = None,
+) -> tuple[str, str]:
+    """
+    Return (backend_base_url, route_key) for the given service and model.
+
+    See resolve_route_key() for how the route is chosen and choose_backend()
+    for how a backend is picked from the route's pool. Without a balancer the
+    route's primary backend is returned.
+
+    Raises:
+        RoutingError: if service has no entry in config.routes.
+    """
+    route_key = resolve_route_key(service, model, config, path)
+    backend_url, _ = choose_backend(route_key, model, config, balancer, residency)
+    return backend_url, route_key
+
+
+def get_pool_urls(route_key: str, config: RouterConfig) -> list[str]:
+    """Return the base URLs of every backend serving route_key, primary first."""
+    names = config.pools.get(route_key) or [config.routes[route_key]]
+    return [config.backends[name] for name in names]
+
+
+def get_pool_weights(route_key: str, config: RouterConfig) -> dict[str, float]:
+    """Return {base_url: weight} for route_key's pool (weight defaults to 1.0)."""
+    return {
+        config.backends[name]: weight
+        for name, weight in config.weights.get(route_key, {}).items()
+    }
 
-    route_key = service
-    backend_name = config.routes[service]
-    return config.backends[backend_name], route_key
+
+# OpenAI/Anthropic-compatible generation endpoints: the route does not depend on the
+# model, but choose_backend's residency preference does.
+MODEL_ROUTED_V1_PATHS = frozenset({"v1/chat/completions", "v1/messages", "v1/responses"})
+
+
+def is_model_routed(service: str, path: str = "") -> bool:
+    """
+    Return True if resolve_backend's choice for this service/path depends on the
+    request's model, i.e. the proxy must read the body before picking a backend.
+    """
+    if service == "conduit":
+        return not path.startswith("conduit/embeddings")
+    if service == "v1":
+        return path in MODEL_ROUTED_V1_PATHS
+    return service == "reranker"
 
 
 def get_fallback_urls(route_key: str, config: RouterConfig) -> list[str]:
@@ -127,3 +614,13 @@ def get_fallback_urls(route_key: str, config: RouterConfig) -> list[str]:
         for name in config.fallbacks.get(route_key, [])
         if name in config.backends
     ]
+
+
+def get_backend_upstream(backend_name: str, config: RouterConfig) -> UpstreamSettings:
+    """Return the connection-pool settings for a backend, falling back to the fleet defaults."""
+    return config.upstream_backends.get(backend_name, config.upstream)
+
+
+def get_route_upstream(route_key: str, config: RouterConfig) -> UpstreamSettings:
+    """Return the upstream timeout settings for a route, falling back to the fleet defaults."""
+    return config.upstream_routes.get(route_key, config.upstream)
@@ -0,0 +1,177 @@
+"""
+Extract the routing model from a raw JSON request body without building the object tree.
+
+The router only needs `model` (OpenAI/Anthropic style) or `params.model`
+(GenerationRequest/BatchRequest) to pick a backend. Running json.loads on a
+100k-document /conduit/embeddings or /conduit/batch payload just to read that
+one field costs tens of milliseconds and hundreds of MB of throwaway objects.
+
+extract_model() looks in two bounded windows instead:
+
+1. A structural walk over the first PREFIX_BYTES. Clients put `model` near the
+   top of OpenAI/Anthropic/embeddings bodies, so most requests stop here.
+2. If the body is larger, a walk from the first `"model":` / `"params":` key in
+   the last SUFFIX_BYTES to the end of the body. Pydantic serialises
+   BatchRequest/GenerationRequest with `params` after the prompt lists, and the
+   OpenAI SDK puts `model` after `messages`, so the key is almost always there.
+   Counting the brackets that close after the key tells us its nesting depth.
+
+Only if neither window settles it does it fall back to a full parse.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+
+PREFIX_BYTES = 64 * 1024
+SUFFIX_BYTES = 64 * 1024
+
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'  # unrolled loop: long strings stay in the regex engine
+
+# One match per structural event. The last alternative swallows a whole run of
+# non-key content (value strings, numbers, literals, commas, whitespace), so a
+# long array of strings costs one match rather than one per element.
+_TOKEN = re.compile(
+    rb"(?P<key>" + _STRING + rb")\s*:\s*(?P<value>" + _STRING + rb")?"
+    rb"|(?P<open>[{\[])"
+    rb"|(?P<close>[}\]])"
+    rb"|(?:" + _STRING + rb"(?!\s*:)|[^\"{}\[\]])+"
+)
+_KEY_CANDIDATE = re.compile(rb'"(?:model|params)"\s*:')
+
+_MODEL_KEY = b'"model"'
+_PARAMS_KEY = b'"params"'
+
+# (depth of the enclosing object relative to the walk start,
+#  key the enclosing object was opened under, raw value token)
+_ModelEvent = tuple[int, bytes | None, bytes]
+
+
+def _walk(body: bytes, pos: int, endpos: int) -> tuple[list[_ModelEvent], int, int] | None:
+    """
+    Walk JSON tokens in body[pos:endpos], which must start on a token boundary.
+
+    Returns (model_events, final_depth, stop) where stop is the offset the walk
+    reached: endpos, or earlier if a string is cut off by endpos. Returns None
+    on mismatched brackets.
+    """
+    parents: list[bytes | None] = []
+    is_object: list[bool] = []
+    depth = 0
+    pending_key: bytes | None = None
+    events: list[_ModelEvent] = []
+    stop = pos
+
+    for match in _TOKEN.finditer(body, pos, endpos):
+        if match.start() != stop:
+            break  # unterminated string at endpos; anything after is noise
+        stop = match.end()
+
+        key = match.group("key")
+        if key is not None:
+            value = match.group("value")
+            if value is None:
+                pending_key = key  # value is a container, number or literal
+            else:
+                pending_key = None
+                if key == _MODEL_KEY:
+                    events.append((depth, parents[-1] if parents else None, value))
+            continue
+
+        opener = match.group("open")
+        if opener is not None:
+            # A walk that starts mid-body starts inside an object (at a key).
+            in_object = is_object[-1] if is_object else pos > 0
+            parents.append(pending_key if in_object else None)
+            is_object.append(opener == b"{")
+            depth += 1
+        elif match.group("close") is not None:
+            if is_object:
+                if is_object[-1] != (match.group("close") == b"}"):
+                    return None
+                parents.pop()
+                is_object.pop()
+            depth -= 1
+        pending_key = None
+
+    return events, depth, stop
+
+
+def _decode(token: bytes) -> str | None:
+    try:
+        value = json.loads(token)
+    except ValueError:
+        return None
+    return value if isinstance(value, str) and value else None
+
+
+def _pick(events: list[_ModelEvent], offset: int) -> tuple[str | None, str | None]:
+    """Return (top-level model, params.model) from walk events; offset maps relative to absolute depth."""
+    top: str | None = None
+    nested: str | None = None
+    for depth, parent, value in events:
+        depth += offset
+        if depth == 1 and top is None:
+            top = _decode(value)
+        elif depth == 2 and parent == _PARAMS_KEY and nested is None:
+            nested = _decode(value)
+    return top, nested
+
+
+def _tail_candidate(body: bytes, start: int) -> int | None:
+    """Offset of the first unescaped `"model":` / `"params":` key at or after start."""
+    for match in _KEY_CANDIDATE.finditer(body, start):
+        i = match.start()
+        backslashes = 0
+        while i - backslashes > 0 and body[i - backslashes - 1] == 0x5C:
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return match.start()
+    return None
+
+
+def _full_parse(body: bytes) -> str | None:
+    try:
+        parsed = json.loads(body)
+        return parsed.get("model") or (parsed.get("params") or {}).get("model")
+    except Exception:
+        return None
+
+
+def extract_model(body: bytes) -> str | None:
+    """
+    Return body["model"] if truthy, else body["params"]["model"], else None.
+
+    Matches the full-parse lookup the proxy used to do for any JSON object body.
+    On bodies larger than PREFIX_BYTES, a top-level `model` that sits in neither
+    window is only found by the full-parse fallback, and a `params.model` found
+    in a window wins over it.
+    """
+    if body.lstrip()[:1] != b"{":
+        return None
+
+    walked = _walk(body, 0, min(len(body), PREFIX_BYTES))
+    if walked is None:
+        return _full_parse(body)
+    events, depth, stop = walked
+    top, nested = _pick(events, offset=0)
+    if top:
+        return top
+    if stop == len(body):
+        return nested if depth == 0 else _full_parse(body)
+
+    candidate = _tail_candidate(body, max(stop, len(body) - SUFFIX_BYTES))
+    if candidate is not None:
+        walked = _walk(body, candidate, len(body))
+        if walked is not None and walked[2] == len(body):
+            tail_events, tail_depth, _ = walked
+            # The walk started inside an object that closes -tail_depth levels
+            # later, so that object sits at absolute depth -tail_depth.
+            tail_top, tail_nested = _pick(tail_events, offset=-tail_depth)
+            if tail_top:
+                return tail_top
+            if tail_nested or nested:
+                return tail_nested or nested
+
+    return _full_parse(body)
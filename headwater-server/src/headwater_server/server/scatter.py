@@ -0,0 +1,229 @@
+"""
+Scatter-gather of large list-shaped requests across a route's backend pool.
+
+A big /conduit/embeddings or /conduit/batch request is otherwise pinned to one
+backend while the other pool members that can serve the same model sit idle.
+For route keys listed
+under `scatter.routes` in routes.yaml, the router splits a request with at
+least `scatter.min_items` items into one contiguous shard per healthy pool
+member (for a named model, only members that already have it loaded) and sends
+the shards in parallel. The responses are then concatenated
+back in the original order.
+
+Shard sizes follow each backend's measured throughput for that route and model
+(an EWMA of work units per second over recent shards: items for embeddings,
+generated tokens for batches), so a faster node gets a larger
+slice. A backend whose share would fall below `scatter.min_shard` items is left
+out. A shard that fails with a connection error, a timeout or a 5xx is retried
+on another pool member. A 4xx would fail identically anywhere, so it is
+returned as-is.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+THROUGHPUT_ALPHA = 0.3  # EWMA weight of the newest shard's throughput
+
+
+@dataclass(frozen=True)
+class ScatterAdapter:
+    """How to count, slice and merge one endpoint's JSON payload."""
+
+    count: Callable[[dict], int]                  # items in a request
+    slice: Callable[[dict, int, int], dict]       # request restricted to items [start, stop)
+    merge: Callable[[list[dict]], dict]           # shard responses, in order -> one response
+    work: Callable[[dict, dict], float]           # (shard request, shard response) -> work units done
+
+
+def _slice_chroma_batch(payload: dict, start: int, stop: int) -> dict:
+    batch = {k: v[start:stop] if isinstance(v, list) else v for k, v in payload["batch"].items()}
+    return {**payload, "batch": batch}
+
+
+EMBEDDINGS = ScatterAdapter(
+    count=lambda payload: len(payload["batch"]["ids"]),
+    slice=_slice_chroma_batch,
+    merge=lambda parts: {"embeddings": [e for part in parts for e in part["embeddings"]]},
+    work=lambda request, response: len(response["embeddings"]),
+)
+
+def _batch_items_field(payload: dict) -> str:
+    return "prompt_strings_list" if payload.get("prompt_strings_list") else "input_variables_list"
+
+
+def count_output_tokens(value: Any) -> int:
+    """Sum every `output_tokens` count found in a serialized result."""
+    if isinstance(value, dict):
+        return sum(
+            v if k == "output_tokens" and isinstance(v, int) else count_output_tokens(v)
+            for k, v in value.items()
+        )
+    if isinstance(value, list):
+        return sum(count_output_tokens(v) for v in value)
+    return 0
+
+
+def _batch_work(request: dict, response: dict) -> float:
+    # Generated tokens when the results report them; otherwise completed items.
+    results = response["results"]
+    return count_output_tokens(results) or sum(r is not None for r in results)
+
+
+BATCH = ScatterAdapter(
+    count=lambda payload: len(payload[_batch_items_field(payload)]),
+    slice=lambda payload, start, stop: {
+        **payload,
+        _batch_items_field(payload): payload[_batch_items_field(payload)][start:stop],
+    },
+    # Failed items are already None in each shard's results, so order and gaps carry over.
+    merge=lambda parts: {"results": [r for part in parts for r in part["results"]]},
+    work=_batch_work,
+)
+
+# Request path (no leading /) -> adapter. Only POSTs to these exact paths are scattered.
+ADAPTERS: dict[str, ScatterAdapter] = {
+    "conduit/embeddings": EMBEDDINGS,
+    "conduit/batch": BATCH,
+}
+
+
+@dataclass(frozen=True)
+class Shard:
+    url: str
+    start: int
+    stop: int
+
+    @property
+    def size(self) -> int:
+        return self.stop - self.start
+
+
+class ShardFailed(Exception):
+    """A shard attempt failed; `status_code` is None for connection errors and timeouts."""
+
+    def __init__(self, url: str, status_code: int | None, body: bytes = b"", headers: Mapping[str, str] | None = None):
+        super().__init__(f"{url}: {status_code if status_code is not None else 'unreachable'}")
+        self.url = url
+        self.status_code = status_code
+        self.body = body
+        self.headers = dict(headers or {})
+
+    @property
+    def retryable(self) -> bool:
+        return self.status_code is None or self.status_code >= 500
+
+
+class ThroughputTracker:
+    """Work units per second, per (route_key or route_key/model, backend URL)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()  # read from the metrics scrape thread
+        self._rates: dict[tuple[str, str], float] = {}
+
+    def observe(self, route_key: str, backend_url: str, work: float, seconds: float) -> None:
+        if work <= 0 or seconds <= 0:
+            return
+        rate = work / seconds
+        with self._lock:
+            previous = self._rates.get((route_key, backend_url))
+            self._rates[(route_key, backend_url)] = (
+                rate if previous is None else THROUGHPUT_ALPHA * rate + (1 - THROUGHPUT_ALPHA) * previous
+            )
+
+    def rate(self, route_key: str, backend_url: str) -> float | None:
+        with self._lock:
+            return self._rates.get((route_key, backend_url))
+
+    def weights(self, route_key: str, urls: Sequence[str]) -> dict[str, float]:
+        """Measured rate per URL; backends not yet measured get the mean of those that are."""
+        rates = {url: self.rate(route_key, url) for url in urls}
+        known = [r for r in rates.values() if r is not None]
+        default = sum(known) / len(known) if known else 1.0
+        return {url: rate if rate is not None else default for url, rate in rates.items()}
+
+    def snapshot(self) -> dict[tuple[str, str], float]:
+        with self._lock:
+            return dict(self._rates)
+
+
+def plan_shards(n: int, weights: Mapping[str, float], min_shard: int) -> list[Shard]:
+    """
+    Split n items into contiguous shards sized in proportion to weights.
+
+    Backends whose share would be under min_shard are dropped, slowest first.
+    The result always has at least one shard when n > 0.
+    """
+    urls = sorted(weights, key=lambda url: weights[url], reverse=True)
+    while len(urls) > 1:
+        total = sum(weights[url] for url in urls)
+        slowest = urls[-1]
+        if n * weights[slowest] / total >= min_shard:
+            break
+        urls.pop()
+    if not urls or n <= 0:
+        return []
+
+    total = sum(weights[url] for url in urls)
+    exact = [n * weights[url] / total for url in urls]
+    sizes = [int(x) for x in exact]
+    # Largest remainders take the items lost to rounding down.
+    for i in sorted(range(len(urls)), key=lambda i: exact[i] - sizes[i], reverse=True)[: n - sum(sizes)]:
+        sizes[i] += 1
+
+    shards: list[Shard] = []
+    start = 0
+    for url, size in zip(urls, sizes):
+        if size:
+            shards.append(Shard(url, start, start + size))
+            start += size
+    return shards
+
+
+async def gather_shards(
+    shards: Sequence[Shard],
+    candidates: Sequence[str],
+    send: Callable[[str, Shard], Awaitable[dict]],
+    pick: Callable[[list[str]], str],
+) -> tuple[list[dict], int]:
+    """
+    Send every shard concurrently and return (responses in shard order, retries).
+
+    A retryable failure moves the shard to pick(untried candidates). When a
+    shard runs out of candidates, or fails with a 4xx, its ShardFailed is raised
+    and the other shards are cancelled.
+    """
+    retries = 0
+
+    async def run(shard: Shard) -> dict:
+        nonlocal retries
+        tried: list[str] = []
+        url = shard.url
+        while True:
+            try:
+                return await send(url, shard)
+            except ShardFailed as exc:
+                tried.append(url)
+                remaining = [u for u in candidates if u not in tried]
+                if not exc.retryable or not remaining:
+                    raise
+                url = pick(remaining)
+                retries += 1
+
+    tasks = [asyncio.ensure_future(run(shard)) for shard in shards]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return list(results), retries
+
+
+def shard_payloads(adapter: ScatterAdapter, payload: dict[str, Any], shards: Sequence[Shard]) -> list[dict]:
+    return [adapter.slice(payload, shard.start, shard.stop) for shard in shards]
@@ -0,0 +1,117 @@
+"""
+Server-Timing phase breakdown for router and subserver responses.
+
+Each hop's correlation middleware puts a ServerTiming collector in
+server_timing_var for the life of the request. Code on the request path adds
+phases to it (record() / phase()), and the middleware writes them out as a
+`Server-Timing` response header and as flat `timing_<phase>_ms` extras on the
+request_finished log record (the ring buffer keeps scalar extras only), so
+/logs/last shows the same breakdown.
+
+The router parses the backend's Server-Timing header and re-emits its entries
+prefixed with the backend name (`bywater.embed;dur=41.2`) after its own, so one
+header shows router parsing, queueing, connection setup and upstream
+time-to-first-byte next to the subserver's model load, executor wait, inference
+and encode time.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from fastapi.responses import JSONResponse
+
+from headwater_server.server.context import server_timing_var
+
+HEADER = "Server-Timing"
+
+_ENTRY = re.compile(r'\s*([^;,\s]+)((?:\s*;\s*[^;,=\s]+(?:\s*=\s*(?:"[^"]*"|[^;,\s]*))?)*)\s*(?:,|$)')
+_PARAM = re.compile(r'\s*;\s*([^;,=\s]+)(?:\s*=\s*("[^"]*"|[^;,\s]*))?')
+
+
+@dataclass(frozen=True)
+class Phase:
+    name: str
+    dur_ms: float
+    desc: str | None = None
+
+    def render(self) -> str:
+        value = f"{self.name};dur={self.dur_ms:g}"
+        if self.desc:
+            value += f';desc="{self.desc}"'
+        return value
+
+
+class ServerTiming:
+    """Phases recorded during one request, in the order they were added."""
+
+    def __init__(self):
+        self.phases: list[Phase] = []
+
+    def add(self, name: str, dur_ms: float, desc: str | None = None) -> None:
+        self.phases.append(Phase(name, round(dur_ms, 2), desc))
+
+    def extend(self, phases: Iterable[Phase], prefix: str = "") -> None:
+        self.phases.extend(Phase(f"{prefix}{p.name}", p.dur_ms, p.desc) for p in phases)
+
+    def header(self) -> str:
+        return ", ".join(p.render() for p in self.phases)
+
+    def log_extra(self) -> dict[str, float]:
+        """`timing_<phase>_ms` log extras; repeated phases are summed."""
+        totals: dict[str, float] = {}
+        for p in self.phases:
+            key = f"timing_{p.name}_ms"
+            totals[key] = round(totals.get(key, 0.0) + p.dur_ms, 2)
+        return totals
+
+
+def record(name: str, dur_ms: float, desc: str | None = None) -> None:
+    """Add a phase to the current request's timing; a no-op outside a request."""
+    timing = server_timing_var.get()
+    if timing is not None:
+        timing.add(name, dur_ms, desc)
+
+
+def merge(header: str, prefix: str) -> None:
+    """Add an upstream hop's Server-Timing entries to the current request, names prefixed."""
+    timing = server_timing_var.get()
+    if timing is not None:
+        timing.extend(parse(header), prefix)
+
+
+@contextmanager
+def phase(name: str, desc: str | None = None) -> Iterator[None]:
+    """Time the enclosed block as one phase of the current request."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, (time.perf_counter() - start) * 1000, desc)
+
+
+def parse(header: str) -> list[Phase]:
+    """Entries of a Server-Timing header value; entries without `dur` count as 0 ms."""
+    phases: list[Phase] = []
+    for match in _ENTRY.finditer(header):
+        if not match.group(0).strip(" ,"):
+            continue
+        params = {k.lower(): (v or "").strip('"') for k, v in _PARAM.findall(match.group(2))}
+        try:
+            dur = float(params.get("dur") or 0)
+        except ValueError:
+            dur = 0.0
+        phases.append(Phase(match.group(1), dur, params.get("desc") or None))
+    return phases
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSONResponse that records its body rendering as the `encode` phase."""
+
+    def render(self, content) -> bytes:
+        with phase("encode"):
+            return super().render(content)
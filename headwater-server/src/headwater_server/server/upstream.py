@@ -0,0 +1,180 @@
+"""
+Long-lived HTTP clients for router -> backend traffic.
+
+HeadwaterRouter used to open a fresh httpx.AsyncClient per proxied request, which
+meant a new TCP connection (and no keep-alive) on every hop. UpstreamPool holds one
+client per backend for the lifetime of the router, sized from the `upstream` block
+of routes.yaml. Clients are opened in the router lifespan and closed on shutdown;
+client() also opens lazily so apps driven without a lifespan (e.g. TestClient used
+outside a `with` block) still work.
+
+A backend URL of the form `unix:///run/headwater/bywater.sock` is reached over
+that Unix domain socket instead of TCP, for subservers on the router's own host.
+
+A backend with `http2: true` under `upstream.backends` is spoken to in cleartext
+HTTP/2 with prior knowledge (h2c): concurrent requests become streams on a few
+shared connections instead of one HTTP/1.1 connection each. The subserver must
+serve h2c (HEADWATER_HTTP2=1, see server/main.py) and the router needs the `h2`
+package; without it the backend falls back to HTTP/1.1 with an error logged.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import httpx
+
+from headwater_server.server.routing_config import (
+    get_backend_upstream,
+    get_route_upstream,
+)
+
+if TYPE_CHECKING:
+    from headwater_server.server.routing_config import RouterConfig
+
+logger = logging.getLogger(__name__)
+
+UDS_SCHEME = "unix://"
+UDS_BASE_URL = "http://localhost"  # Host header and URL base for requests sent over a socket
+
+
+def uds_path(backend_url: str) -> str | None:
+    """Socket path of a `unix:///path.sock` backend URL, or None for an HTTP URL."""
+    if backend_url.startswith(UDS_SCHEME):
+        return backend_url[len(UDS_SCHEME):]
+    return None
+
+
+def open_client(
+    backend_url: str, limits: httpx.Limits, timeout: httpx.Timeout, http2: bool = False
+) -> httpx.AsyncClient:
+    """
+    AsyncClient for backend_url; `unix://` URLs get a transport bound to the socket.
+
+    http2=True speaks h2c with prior knowledge and raises ImportError without `h2`.
+    """
+    path = uds_path(backend_url)
+    transport = httpx.AsyncHTTPTransport(uds=path, limits=limits, http1=not http2, http2=http2)
+    return httpx.AsyncClient(
+        base_url=UDS_BASE_URL if path is not None else backend_url,
+        transport=transport,
+        timeout=timeout,
+    )
+
+
+@dataclass(frozen=True)
+class ConnectionStats:
+    """One pooled connection to a backend."""
+
+    protocol: str        # "HTTP/1.1", "HTTP/2", or "CONNECTING" before the handshake completes
+    idle: bool
+    streams: int         # requests in flight on the connection
+
+
+def _connection_stats(connection) -> ConnectionStats:
+    # httpcore's info() reads "'<origin>', HTTP/2, ACTIVE, Request Count: 3"; for
+    # HTTP/2 the count is the open streams, for HTTP/1.1 it is cumulative. That
+    # string is not a stable API: anything we can't read counts as no streams.
+    info = getattr(connection, "info", None)
+    parts = (info() if callable(info) else "").split(", ")
+    idle = connection.is_idle()
+    if len(parts) < 4:
+        return ConnectionStats(protocol=parts[-1], idle=idle, streams=0)
+    protocol = parts[-3]
+    if protocol == "HTTP/2":
+        try:
+            streams = int(parts[-1].rpartition(" ")[2])
+        except ValueError:
+            streams = 0
+    else:
+        streams = 0 if idle else 1
+    return ConnectionStats(protocol=protocol, idle=idle, streams=streams)
+
+
+class UpstreamPool:
+    def __init__(self, config: RouterConfig):
+        self._config = config
+        self._url_to_name: dict[str, str] = {url: name for name, url in config.backends.items()}
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def _open(self, backend_url: str) -> httpx.AsyncClient:
+        name = self._url_to_name.get(backend_url, backend_url)
+        settings = get_backend_upstream(name, self._config)
+        limits = httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        )
+        timeout = httpx.Timeout(settings.read_timeout, connect=settings.connect_timeout)
+        http2 = settings.http2
+        try:
+            client = open_client(backend_url, limits, timeout, http2=http2)
+        except ImportError as exc:
+            logger.error(
+                "upstream_http2_unavailable",
+                extra={"backend": name, "backend_url": backend_url, "error": str(exc)},
+            )
+            http2 = False
+            client = open_client(backend_url, limits, timeout)
+        logger.debug(
+            "upstream_client_opened",
+            extra={
+                "backend": name,
+                "backend_url": backend_url,
+                "max_connections": settings.max_connections,
+                "max_keepalive_connections": settings.max_keepalive_connections,
+                "keepalive_expiry": settings.keepalive_expiry,
+                "http2": http2,
+            },
+        )
+        return client
+
+    def reconfigure(self, config: RouterConfig) -> None:
+        """
+        Adopt a reloaded config. Route timeouts apply to the next request and new
+        backends get a client on first use; clients already open keep their pool
+        limits (and removed backends keep theirs) until the router restarts, so
+        in-flight streams are never cut.
+        """
+        self._config = config
+        self._url_to_name = {url: name for name, url in config.backends.items()}
+
+    async def start(self) -> None:
+        """Open a client for every configured backend."""
+        for url in self._config.backends.values():
+            if url not in self._clients:
+                self._clients[url] = self._open(url)
+
+    def client(self, backend_url: str) -> httpx.AsyncClient:
+        """Return the pooled client for backend_url, opening it on first use."""
+        client = self._clients.get(backend_url)
+        if client is None:
+            client = self._clients[backend_url] = self._open(backend_url)
+        return client
+
+    def timeout(self, route_key: str) -> httpx.Timeout:
+        """Per-request timeout for route_key (overrides the backend client's default)."""
+        settings = get_route_upstream(route_key, self._config)
+        return httpx.Timeout(settings.read_timeout, connect=settings.connect_timeout)
+
+    def connections(self) -> dict[str, list[ConnectionStats]]:
+        """Open connections per backend URL, for the metrics scrape."""
+        stats: dict[str, list[ConnectionStats]] = {}
+        for url, client in list(self._clients.items()):
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            stats[url] = [_connection_stats(c) for c in list(getattr(pool, "connections", []))]
+        return stats
+
+    async def aclose(self) -> None:
+        """Close every open client. Safe to call more than once."""
+        clients, self._clients = self._clients, {}
+        for url, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as exc:
+                logger.warning(
+                    "upstream_client_close_failed",
+                    extra={"backend_url": url, "error": str(exc)},
+                )
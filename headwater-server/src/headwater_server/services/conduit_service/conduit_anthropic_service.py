@@ -11,6 +11,7 @@ logger = logging.getLogger(__name__)
 
 async def conduit_anthropic_service(request: AnthropicRequest) -> dict:
     from conduit.core.model.model_async import ModelAsync
+    from headwater_server.server.governor import model_governor
     from conduit.core.model.models.modelstore import ModelStore
     from conduit.domain.config.conduit_options import ConduitOptions
     from conduit.domain.message.message import AssistantMessage
@@ -77,7 +78,8 @@ async def conduit_anthropic_service(request: AnthropicRequest) -> dict:
         include_history=False,
     )
     model = ModelAsync(model_name)
-    result = await model.query(gen_request)
+    async with model_governor().slot(model_name, "anthropic_messages"):
+        result = await model.query(gen_request)
 
     # 5. Build response
     from conduit.domain.result.response_metadata import StopReason
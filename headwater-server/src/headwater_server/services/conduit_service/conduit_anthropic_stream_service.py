@@ -15,125 +15,100 @@ def _sse(event_type: str, data: dict) -> str:
     return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
 
 
-async def _sse_generator(request: AnthropicRequest) -> AsyncGenerator[str, None]:
-    logger.info(
-        "Anthropic-compat stream request: model=%s",
-        request.model,
-    )
-    from conduit.core.model.model_async import ModelAsync
-    from conduit.core.model.models.modelstore import ModelStore
-    from conduit.domain.config.conduit_options import ConduitOptions
-    from conduit.domain.message.message import AssistantMessage
-    from conduit.domain.message.message import SystemMessage
-    from conduit.domain.message.message import UserMessage
-    from conduit.domain.request.generation_params import GenerationParams
-    from conduit.domain.request.request import GenerationRequest
-    from conduit.utils.progress.verbosity import Verbosity
-    from fastapi import HTTPException
+_STOP_REASONS = {
+    "stop": "end_turn",
+    "length": "max_tokens",
+    "tool_calls": "tool_use",
+    "content_filter": "end_turn",
+    "error": "end_turn",
+}
 
-    try:
-        model_name = ModelStore.validate_model(request.model)
-    except FileNotFoundError as exc:
-        logger.error("Model store unavailable: %s", exc)
-        raise HTTPException(status_code=502, detail="Model store unavailable.") from exc
-    except ValueError as exc:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unrecognized model: '{request.model}'.",
-        ) from exc
 
+def _messages(request: AnthropicRequest) -> list[dict]:
     messages = []
     if request.system:
-        messages.append(SystemMessage(content=request.system))
+        messages.append({"role": "system", "content": request.system})
     for msg in request.messages:
         content = msg.content if isinstance(msg.content, str) else " ".join(
             b.text for b in msg.content if b.type == "text"
         )
-        if msg.role == "user":
-            messages.append(UserMessage(content=content))
-        else:
-            messages.append(AssistantMessage(content=content))
-
-    params_kwargs: dict = {"model": model_name}
-    if request.temperature is not None:
-        params_kwargs["temperature"] = request.temperature
-    if request.top_p is not None:
-        params_kwargs["top_p"] = request.top_p
-    if request.max_tokens is not None:
-        params_kwargs["max_tokens"] = request.max_tokens
-    if request.stop_sequences:
-        params_kwargs["stop"] = request.stop_sequences
-
-    params = GenerationParams(**params_kwargs)
-    options = ConduitOptions(
-        project_name="headwater",
-        verbosity=Verbosity.SILENT,
-        include_history=False,
-    )
-    gen_request = GenerationRequest(
-        messages=messages,
-        params=params,
-        options=options,
-        include_history=False,
+        messages.append({"role": "user" if msg.role == "user" else "assistant", "content": content})
+    return messages
+
+
+async def _sse_generator(request: AnthropicRequest, model_name: str) -> AsyncGenerator[str, None]:
+    from headwater_server.services.conduit_service.token_stream import (
+        ChatParams,
+        Delta,
+        TokenStream,
+        chat_source,
+        count_tokens,
     )
-    model = ModelAsync(model_name)
-    result = await model.query(gen_request)
-
-    from conduit.domain.result.response_metadata import StopReason
-
-    content_text = str(result.message)
-    if not content_text and result.metadata.stop_reason != StopReason.LENGTH:
-        logger.error("Model returned empty response: model=%s", model_name)
-        raise HTTPException(status_code=500, detail="Model returned an empty response.")
-    _stop_map = {
-        StopReason.STOP: "end_turn",
-        StopReason.LENGTH: "max_tokens",
-        StopReason.TOOL_CALLS: "tool_use",
-        StopReason.CONTENT_FILTER: "end_turn",
-        StopReason.ERROR: "end_turn",
-    }
-    stop_reason = _stop_map.get(result.metadata.stop_reason)
-    if stop_reason is None:
-        logger.warning(
-            "Unknown StopReason '%s', defaulting to 'end_turn'",
-            result.metadata.stop_reason,
-        )
-        stop_reason = "end_turn"
 
+    messages = _messages(request)
+    params = ChatParams(
+        temperature=request.temperature,
+        top_p=request.top_p,
+        max_tokens=request.max_tokens,
+        stop=request.stop_sequences or None,
+    )
+    # Start generating before counting prompt tokens, so the count costs no latency.
+    stream = TokenStream(chat_source(model_name, messages, params), model_name, "anthropic_messages")
     msg_id = f"msg_{uuid.uuid4().hex[:24]}"
-
+    try:
+        input_tokens = await count_tokens(model_name, "\n".join(m["content"] for m in messages))
+        yield _sse("message_start", {
+            "type": "message_start",
+            "message": {
+                "id": msg_id,
+                "type": "message",
+                "role": "assistant",
+                "content": [],
+                "model": request.model,
+                "stop_reason": None,
+                "stop_sequence": None,
+                "usage": {
+                    "input_tokens": input_tokens,
+                    "output_tokens": 0,
+                },
+            },
+        })
+        yield _sse("content_block_start", {
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {"type": "text", "text": ""},
+        })
+        yield _sse("ping", {"type": "ping"})
+
+        async for item in stream:
+            if item is None:
+                yield _sse("ping", {"type": "ping"})
+            elif isinstance(item, Delta):
+                yield _sse("content_block_delta", {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "text_delta", "text": item.text},
+                })
+            else:
+                done = item
+                break
+        else:
+            raise RuntimeError("Token stream ended without a final usage record.")
+    except Exception as exc:
+        # Headers are already sent, so failures go out as an Anthropic error event.
+        logger.error("Anthropic-compat stream failed: model=%s error=%s", model_name, exc)
+        yield _sse("error", {"type": "error", "error": {"type": "api_error", "message": str(exc)}})
+        return
+    finally:
+        await stream.aclose()
+
+    stop_reason = _STOP_REASONS.get(done.stop_reason, "end_turn")
     logger.info(
-        "Anthropic-compat stream: model=%s stop_reason=%s input=%d output=%d",
+        "Anthropic-compat stream: model=%s stop_reason=%s input=%d output=%d ttft_ms=%s",
         model_name, stop_reason,
-        result.metadata.input_tokens, result.metadata.output_tokens,
+        done.input_tokens or input_tokens, done.output_tokens,
+        None if stream.ttft_ms is None else round(stream.ttft_ms, 1),
     )
-
-    yield _sse("message_start", {
-        "type": "message_start",
-        "message": {
-            "id": msg_id,
-            "type": "message",
-            "role": "assistant",
-            "content": [],
-            "model": request.model,
-            "stop_reason": None,
-            "stop_sequence": None,
-            "usage": {
-                "input_tokens": result.metadata.input_tokens,
-                "output_tokens": 0,
-            },
-        },
-    })
-    yield _sse("content_block_start", {
-        "type": "content_block_start",
-        "index": 0,
-        "content_block": {"type": "text", "text": ""},
-    })
-    yield _sse("content_block_delta", {
-        "type": "content_block_delta",
-        "index": 0,
-        "delta": {"type": "text_delta", "text": content_text},
-    })
     yield _sse("content_block_stop", {
         "type": "content_block_stop",
         "index": 0,
@@ -141,15 +116,37 @@ async def _sse_generator(request: AnthropicRequest) -> AsyncGenerator[str, None]
     yield _sse("message_delta", {
         "type": "message_delta",
         "delta": {"stop_reason": stop_reason, "stop_sequence": None},
-        "usage": {"output_tokens": result.metadata.output_tokens},
+        "usage": {
+            "input_tokens": done.input_tokens or input_tokens,
+            "output_tokens": done.output_tokens,
+        },
     })
     yield _sse("message_stop", {"type": "message_stop"})
 
 
 async def conduit_anthropic_stream_service(request: AnthropicRequest):
+    logger.info(
+        "Anthropic-compat stream request: model=%s",
+        request.model,
+    )
+    from conduit.core.model.models.modelstore import ModelStore
+    from fastapi import HTTPException
     from fastapi.responses import StreamingResponse
+
+    # Validate before the response starts, so a bad model is a plain 400/502 rather than a broken stream.
+    try:
+        model_name = ModelStore.validate_model(request.model)
+    except FileNotFoundError as exc:
+        logger.error("Model store unavailable: %s", exc)
+        raise HTTPException(status_code=502, detail="Model store unavailable.") from exc
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unrecognized model: '{request.model}'.",
+        ) from exc
+
     return StreamingResponse(
-        _sse_generator(request),
+        _sse_generator(request, model_name),
         media_type="text/event-stream",
         headers={"X-Accel-Buffering": "no", "Cache-Control": "no-cache"},
     )
@@ -1,23 +1,119 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from headwater_api.classes import BatchRequest
 from headwater_api.classes import BatchResponse
+from headwater_api.classes import BatchStreamItem
+from headwater_server.server.aimd import AIMDLimiter
+from headwater_server.server.deadline import DeadlineExceeded, check_deadline
+from headwater_server.server.governor import model_governor
+from headwater_server.server.scatter import count_output_tokens
 
 if TYPE_CHECKING:
     from conduit.domain.conversation.conversation import Conversation
+    from fastapi.responses import StreamingResponse
 
 logger = logging.getLogger(__name__)
 
 
-async def conduit_batch_service(batch: BatchRequest) -> BatchResponse:
+@dataclass
+class _Outcome:
+    index: int
+    result: Conversation | None
+    error: Exception | None
+    duration_ms: float
+
+
+def _limiter(batch: BatchRequest, n: int) -> AIMDLimiter:
+    """AIMD limit between min_concurrent and max_concurrent; a fixed one without adaptive_concurrency."""
+    maximum = max(1, min(n, batch.max_concurrent or n))
+    if batch.adaptive_concurrency:
+        return AIMDLimiter(min(batch.min_concurrent, maximum), maximum, model=batch.params.model)
+    return AIMDLimiter(maximum, maximum, model=batch.params.model)
+
+
+async def _run_items(batch: BatchRequest, limiter: AIMDLimiter) -> AsyncGenerator[_Outcome, None]:
+    """Run every item as its own conduit call, at most limiter.limit at a time; yield each as it finishes."""
     from conduit.core.conduit.batch.conduit_batch_async import ConduitBatchAsync
-    from conduit.batch import Verbosity
     from conduit.core.prompt.prompt import Prompt
 
+    model = batch.params.model
+    items = batch.input_variables_list or batch.prompt_strings_list or []
+    by_variables = bool(batch.input_variables_list)
+    n = len(items)
+    conduit = ConduitBatchAsync(
+        prompt=Prompt(batch.prompt_str) if batch.prompt_str else None,
+    )
+    finished: asyncio.Queue[_Outcome | DeadlineExceeded] = asyncio.Queue()
+    pending = iter(range(n))
+
+    async def run_item(i: int) -> _Outcome:
+        started = await limiter.acquire()
+        try:
+            check_deadline()
+            # One item per run() call: the limiter and the model's governor slots set the concurrency.
+            async with model_governor().slot(model, "conduit_batch"):
+                results = await conduit.run(
+                    input_variables_list=[items[i]] if by_variables else None,
+                    prompt_strings_list=None if by_variables else [items[i]],
+                    params=batch.params,
+                    options=batch.options,
+                    max_concurrent=1,
+                )
+            if isinstance(results[0], Exception):
+                raise results[0]
+            result = results[0]
+            tokens = count_output_tokens(result.model_dump(mode="json")) if hasattr(result, "model_dump") else 0
+        except DeadlineExceeded:
+            # The whole request is over, not this item: abort the batch and let the 504/499 handling answer.
+            await limiter.release(started, ok=False)
+            raise
+        except Exception as exc:
+            logger.error(
+                "batch_item_failed",
+                extra={
+                    "model": model,
+                    "index": i,
+                    "error_type": type(exc).__name__,
+                },
+                exc_info=exc,
+            )
+            await limiter.release(started, ok=False)
+            return _Outcome(i, None, exc, round((time.monotonic() - started) * 1000, 1))
+        await limiter.release(started, ok=True, tokens=tokens)
+        return _Outcome(i, result, None, round((time.monotonic() - started) * 1000, 1))
+
+    async def worker() -> None:
+        # Workers share one index iterator; the limiter decides how many of them run an item at once.
+        try:
+            for i in pending:
+                await finished.put(await run_item(i))
+        except DeadlineExceeded as exc:
+            await finished.put(exc)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(limiter.maximum if n else 0)]
+    try:
+        for _ in range(n):
+            outcome = await finished.get()
+            if isinstance(outcome, DeadlineExceeded):
+                raise outcome
+            yield outcome
+    finally:
+        # Also reached when a streaming client disconnects: stop items that are still generating.
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def conduit_batch_service(batch: BatchRequest) -> BatchResponse:
+    from conduit.batch import Verbosity
+
     model = batch.params.model
     n = len(batch.prompt_strings_list or batch.input_variables_list or [])
 
@@ -27,56 +123,26 @@ async def conduit_batch_service(batch: BatchRequest) -> BatchResponse:
             "model": model,
             "n": n,
             "max_concurrent": batch.max_concurrent,
+            "adaptive": batch.adaptive_concurrency,
         },
     )
 
+    check_deadline()
+
     # Set Verbosity to silent
     batch.options.verbosity = Verbosity.SILENT
 
-    conduit = ConduitBatchAsync(
-        prompt=Prompt(batch.prompt_str) if batch.prompt_str else None,
-    )
-
     start = time.monotonic()
-
-    if batch.input_variables_list:
-        raw_results = await conduit.run(
-            input_variables_list=batch.input_variables_list,
-            prompt_strings_list=None,
-            params=batch.params,
-            options=batch.options,
-            max_concurrent=batch.max_concurrent,
-        )
-    else:
-        raw_results = await conduit.run(
-            prompt_strings_list=batch.prompt_strings_list,
-            input_variables_list=None,
-            params=batch.params,
-            options=batch.options,
-            max_concurrent=batch.max_concurrent,
-        )
-
-    duration_ms = round((time.monotonic() - start) * 1000, 1)
+    limiter = _limiter(batch, n)
+    clean_results: list = [None] * n
     succeeded = 0
     failed = 0
-    clean_results: list = []
-
-    for i, result in enumerate(raw_results):
-        if isinstance(result, Exception):
-            failed += 1
-            logger.error(
-                "batch_item_failed",
-                extra={
-                    "model": model,
-                    "index": i,
-                    "error_type": type(result).__name__,
-                },
-                exc_info=result,
-            )
-            clean_results.append(None)
-        else:
+    async for item in _run_items(batch, limiter):
+        if item.error is None:
             succeeded += 1
-            clean_results.append(result)
+            clean_results[item.index] = item.result
+        else:
+            failed += 1
 
     logger.info(
         "batch_completed",
@@ -85,8 +151,92 @@ async def conduit_batch_service(batch: BatchRequest) -> BatchResponse:
             "n": n,
             "succeeded": succeeded,
             "failed": failed,
-            "duration_ms": duration_ms,
+            "duration_ms": round((time.monotonic() - start) * 1000, 1),
+            **(limiter.summary() if batch.adaptive_concurrency else {}),
         },
     )
 
     return BatchResponse(results=clean_results)
+
+
+def _stream_item(outcome: _Outcome, model: str) -> BatchStreamItem:
+    error = outcome.error
+    if error is None:
+        try:
+            return BatchStreamItem(index=outcome.index, result=outcome.result, duration_ms=outcome.duration_ms)
+        except Exception as exc:
+            # A result that does not serialize is reported as that item's failure rather than ending the stream.
+            logger.error(
+                "batch_item_failed",
+                extra={"model": model, "index": outcome.index, "error_type": type(exc).__name__},
+                exc_info=exc,
+            )
+            error = exc
+    return BatchStreamItem(
+        index=outcome.index,
+        error=str(error),
+        error_type=type(error).__name__,
+        duration_ms=outcome.duration_ms,
+    )
+
+
+async def _stream_items(batch: BatchRequest) -> AsyncGenerator[str, None]:
+    model = batch.params.model
+    n = len(batch.input_variables_list or batch.prompt_strings_list)
+    limiter = _limiter(batch, n)
+    start = time.monotonic()
+    succeeded = 0
+    failed = 0
+    try:
+        async for outcome in _run_items(batch, limiter):
+            item = _stream_item(outcome, model)
+            if item.error is None:
+                succeeded += 1
+            else:
+                failed += 1
+            yield item.model_dump_json() + "\n"
+    finally:
+        logger.info(
+            "batch_completed",
+            extra={
+                "model": model,
+                "n": n,
+                "succeeded": succeeded,
+                "failed": failed,
+                "abandoned": n - succeeded - failed,
+                "duration_ms": round((time.monotonic() - start) * 1000, 1),
+                "streamed": True,
+                **(limiter.summary() if batch.adaptive_concurrency else {}),
+            },
+        )
+
+
+async def conduit_batch_stream_service(batch: BatchRequest) -> StreamingResponse:
+    """Run a batch and send each item as one NDJSON line (a BatchStreamItem) as soon as it finishes.
+
+    Lines arrive in completion order; `index` says which input each one belongs to.
+    """
+    from conduit.batch import Verbosity
+    from fastapi.responses import StreamingResponse
+
+    logger.info(
+        "batch_started",
+        extra={
+            "model": batch.params.model,
+            "n": len(batch.prompt_strings_list or batch.input_variables_list or []),
+            "max_concurrent": batch.max_concurrent,
+            "adaptive": batch.adaptive_concurrency,
+            "streamed": True,
+        },
+    )
+
+    check_deadline()
+
+    # Set Verbosity to silent
+    batch.options.verbosity = Verbosity.SILENT
+
+    return StreamingResponse(
+        _stream_items(batch),
+        media_type="application/x-ndjson",
+        headers={"X-Accel-Buffering": "no", "Cache-Control": "no-cache"},
+    )
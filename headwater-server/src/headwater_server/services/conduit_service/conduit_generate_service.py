@@ -5,6 +5,8 @@ import time
 
 from headwater_api.classes import GenerationRequest
 from headwater_api.classes import GenerationResponse
+from headwater_server.server.deadline import check_deadline
+from headwater_server.server.governor import model_governor
 
 logger = logging.getLogger(__name__)
 
@@ -58,20 +60,22 @@ async def conduit_generate_service(request: GenerationRequest) -> GenerationResp
         },
     )
 
-    start = time.monotonic()
-    try:
-        response = await ModelAsync(model).query(request)
-    except Exception as exc:
-        logger.error(
-            "llm_call_failed",
-            extra={
-                "model": model,
-                "duration_ms": round((time.monotonic() - start) * 1000, 1),
-                "error_type": type(exc).__name__,
-            },
-            exc_info=True,
-        )
-        raise
+    check_deadline()
+    async with model_governor().slot(model, "conduit_generate"):
+        start = time.monotonic()
+        try:
+            response = await ModelAsync(model).query(request)
+        except Exception as exc:
+            logger.error(
+                "llm_call_failed",
+                extra={
+                    "model": model,
+                    "duration_ms": round((time.monotonic() - start) * 1000, 1),
+                    "error_type": type(exc).__name__,
+                },
+                exc_info=True,
+            )
+            raise
 
     if response.metadata is None:
         logger.error(
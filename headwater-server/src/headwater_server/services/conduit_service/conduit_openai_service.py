@@ -13,6 +13,7 @@ logger = logging.getLogger(__name__)
 
 async def conduit_openai_service(request: OpenAIChatRequest) -> dict:
     from conduit.core.model.model_async import ModelAsync
+    from headwater_server.server.governor import model_governor
     from conduit.core.model.models.modelstore import ModelStore
     from conduit.domain.config.conduit_options import ConduitOptions
     from conduit.domain.message.message import AssistantMessage, SystemMessage, ToolMessage, UserMessage
@@ -103,7 +104,8 @@ async def conduit_openai_service(request: OpenAIChatRequest) -> dict:
     )
 
     model = ModelAsync(model_name)
-    result = await model.query(gen_request)
+    async with model_governor().slot(model_name, "openai_chat_completions"):
+        result = await model.query(gen_request)
 
     # 7. Content coercion
     if request.response_format is not None:
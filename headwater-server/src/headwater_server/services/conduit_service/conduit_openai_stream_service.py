@@ -0,0 +1,150 @@
+from __future__ import annotations
+import json
+import logging
+import time
+import uuid
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from headwater_api.classes.conduit_classes.openai_compat import OpenAIChatRequest
+
+logger = logging.getLogger(__name__)
+
+# SSE comment line: ignored by OpenAI SDK clients, keeps proxies from timing out an idle stream.
+_KEEPALIVE = ": keep-alive\n\n"
+
+
+def _sse(data: dict | str) -> str:
+    return f"data: {data if isinstance(data, str) else json.dumps(data)}\n\n"
+
+
+def _messages(request: OpenAIChatRequest) -> list[dict]:
+    messages = []
+    for msg in request.messages:
+        if msg.role == "user":
+            messages.append({"role": "user", "content": msg.content, "name": msg.name})
+        elif msg.role == "tool":
+            messages.append({
+                "role": "tool",
+                "content": str(msg.content),
+                "tool_call_id": msg.tool_call_id,
+                "name": msg.name,
+            })
+        else:
+            messages.append({"role": msg.role, "content": msg.content})
+    return messages
+
+
+async def _sse_generator(request: OpenAIChatRequest, model_name: str) -> AsyncGenerator[str, None]:
+    from headwater_server.services.conduit_service.token_stream import (
+        ChatParams,
+        Delta,
+        TokenStream,
+        chat_source,
+    )
+
+    params = ChatParams(
+        temperature=request.temperature,
+        top_p=request.top_p,
+        max_tokens=request.max_tokens,
+        stop=request.normalized_stop,
+    )
+    stream = TokenStream(
+        chat_source(model_name, _messages(request), params, use_cache=request.use_cache),
+        model_name,
+        "openai_chat_completions",
+    )
+    # As OpenAI: the trailing `choices: []` usage chunk only on request, since SDK loops index choices[0].
+    include_usage = request.stream_options is not None and request.stream_options.include_usage
+    chunk_id = f"chatcmpl-{uuid.uuid4().hex[:16]}"
+    created = int(time.time())
+
+    def chunk(delta: dict, finish_reason: str | None = None) -> str:
+        return _sse({
+            "id": chunk_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": request.model,
+            "choices": [{"index": 0, "delta": delta, "logprobs": None, "finish_reason": finish_reason}],
+        })
+
+    try:
+        yield chunk({"role": "assistant", "content": ""})
+        async for item in stream:
+            if item is None:
+                yield _KEEPALIVE
+            elif isinstance(item, Delta):
+                yield chunk({"content": item.text})
+            else:
+                done = item
+                break
+        else:
+            raise RuntimeError("Token stream ended without a final usage record.")
+    except Exception as exc:
+        # Headers are already sent, so failures go out in the stream, as OpenAI does.
+        logger.error("OpenAI-compat stream failed: model=%s error=%s", model_name, exc)
+        yield _sse({"error": {"message": str(exc), "type": "server_error", "param": None, "code": None}})
+        yield _sse("[DONE]")
+        return
+    finally:
+        await stream.aclose()
+
+    logger.info(
+        "OpenAI-compat stream: model=%s finish_reason=%s input_tokens=%d output_tokens=%d ttft_ms=%s",
+        model_name,
+        done.stop_reason,
+        done.input_tokens,
+        done.output_tokens,
+        None if stream.ttft_ms is None else round(stream.ttft_ms, 1),
+    )
+    yield chunk({}, done.stop_reason)
+    if include_usage:
+        yield _sse({
+            "id": chunk_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": request.model,
+            "choices": [],
+            "usage": {
+                "prompt_tokens": done.input_tokens,
+                "completion_tokens": done.output_tokens,
+                "total_tokens": done.input_tokens + done.output_tokens,
+            },
+        })
+    yield _sse("[DONE]")
+
+
+async def conduit_openai_stream_service(request: OpenAIChatRequest):
+    from conduit.core.model.models.modelstore import ModelStore
+    from fastapi import HTTPException
+    from fastapi.responses import StreamingResponse
+
+    logger.info("OpenAI-compat stream request: model=%s", request.model)
+
+    # Validate before the response starts, so a bad request is a plain 400/502 rather than a broken stream.
+    try:
+        model_name = ModelStore.validate_model(request.model)
+    except FileNotFoundError as exc:
+        logger.error("Model store unavailable: %s", exc)
+        raise HTTPException(
+            status_code=502,
+            detail="Model store unavailable. Server configuration error.",
+        ) from exc
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unrecognized model: '{request.model}'. Check ModelStore for supported models.",
+        ) from exc
+
+    if not [m for m in request.messages if m.role != "system"]:
+        raise HTTPException(
+            status_code=400,
+            detail="messages must contain at least one non-system message.",
+        )
+
+    return StreamingResponse(
+        _sse_generator(request, model_name),
+        media_type="text/event-stream",
+        headers={"X-Accel-Buffering": "no", "Cache-Control": "no-cache"},
+    )
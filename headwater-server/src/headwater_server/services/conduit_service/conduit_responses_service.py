@@ -10,9 +10,67 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Always cap tokens: callers that don't set max_output_tokens (e.g. Firecrawl) would
+# otherwise let a thinking model consume unlimited CoT budget before producing output.
+DEFAULT_MAX_OUTPUT_TOKENS = 2048
+
+
+def message_item(msg_id: str, status: str, text: str | None) -> dict:
+    """An assistant output message; text None gives an empty content list (item just added)."""
+    return {
+        "type": "message",
+        "id": msg_id,
+        "status": status,
+        "role": "assistant",
+        "content": [] if text is None else [{"type": "output_text", "text": text, "annotations": []}],
+    }
+
+
+def usage_object(input_tokens: int, output_tokens: int) -> dict:
+    return {
+        "input_tokens": input_tokens,
+        "input_tokens_details": {"cached_tokens": 0},
+        "output_tokens": output_tokens,
+        "output_tokens_details": {"reasoning_tokens": 0},
+        "total_tokens": input_tokens + output_tokens,
+    }
+
+
+def response_object(
+    request: OpenAIResponsesRequest,
+    response_id: str,
+    created_at: int,
+    status: str,
+    output: list[dict],
+    usage: dict | None,
+    completed_at: int | None = None,
+    error: dict | None = None,
+) -> dict:
+    """A Responses API `response` object; shared by the JSON and streaming endpoints."""
+    return {
+        "id": response_id,
+        "object": "response",
+        "created_at": created_at,
+        "completed_at": completed_at,
+        "status": status,
+        "error": error,
+        "incomplete_details": None,
+        "instructions": None,
+        "model": request.model,
+        "output": output,
+        "parallel_tool_calls": True,
+        "tools": [],
+        "tool_choice": "auto",
+        "temperature": request.temperature if request.temperature is not None else 1.0,
+        "top_p": 1.0,
+        "metadata": {},
+        "usage": usage,
+    }
+
 
 async def conduit_responses_service(request: OpenAIResponsesRequest) -> dict:
     from conduit.core.model.model_async import ModelAsync
+    from headwater_server.server.governor import model_governor
     from conduit.core.model.models.modelstore import ModelStore
     from conduit.domain.config.conduit_options import ConduitOptions
     from conduit.domain.message.message import AssistantMessage, SystemMessage, UserMessage
@@ -75,9 +133,7 @@ async def conduit_responses_service(request: OpenAIResponsesRequest) -> dict:
     params_kwargs: dict = {"model": model_name}
     if request.temperature is not None:
         params_kwargs["temperature"] = request.temperature
-    # Always cap tokens: callers that don't set max_output_tokens (e.g. Firecrawl) would
-    # otherwise let a thinking model consume unlimited CoT budget before producing output.
-    params_kwargs["max_tokens"] = request.max_output_tokens if request.max_output_tokens is not None else 2048
+    params_kwargs["max_tokens"] = request.max_output_tokens if request.max_output_tokens is not None else DEFAULT_MAX_OUTPUT_TOKENS
     if json_schema_format is not None:
         params_kwargs["response_model_schema"] = json_schema_format.schema_
         params_kwargs["output_type"] = "structured_response"
@@ -105,7 +161,8 @@ async def conduit_responses_service(request: OpenAIResponsesRequest) -> dict:
     )
 
     model = ModelAsync(model_name)
-    result = await model.query(gen_request)
+    async with model_governor().slot(model_name, "openai_responses"):
+        result = await model.query(gen_request)
 
     # 6. Content coercion
     if json_schema_format is not None or json_object_mode:
@@ -145,39 +202,12 @@ async def conduit_responses_service(request: OpenAIResponsesRequest) -> dict:
     )
 
     now = int(time.time())
-    msg_id = f"msg_{uuid.uuid4().hex[:16]}"
-    return {
-        "id": f"resp_{uuid.uuid4().hex[:16]}",
-        "object": "response",
-        "created_at": now,
-        "completed_at": now,
-        "status": "completed",
-        "error": None,
-        "incomplete_details": None,
-        "instructions": None,
-        "model": request.model,
-        "output": [
-            {
-                "type": "message",
-                "id": msg_id,
-                "status": "completed",
-                "role": "assistant",
-                "content": [
-                    {"type": "output_text", "text": content, "annotations": []}
-                ],
-            }
-        ],
-        "parallel_tool_calls": True,
-        "tools": [],
-        "tool_choice": "auto",
-        "temperature": request.temperature if request.temperature is not None else 1.0,
-        "top_p": 1.0,
-        "metadata": {},
-        "usage": {
-            "input_tokens": result.metadata.input_tokens,
-            "input_tokens_details": {"cached_tokens": 0},
-            "output_tokens": result.metadata.output_tokens,
-            "output_tokens_details": {"reasoning_tokens": 0},
-            "total_tokens": result.metadata.input_tokens + result.metadata.output_tokens,
-        },
-    }
+    return response_object(
+        request,
+        response_id=f"resp_{uuid.uuid4().hex[:16]}",
+        created_at=now,
+        status="completed",
+        output=[message_item(f"msg_{uuid.uuid4().hex[:16]}", "completed", content)],
+        usage=usage_object(result.metadata.input_tokens, result.metadata.output_tokens),
+        completed_at=now,
+    )
@@ -0,0 +1,162 @@
+from __future__ import annotations
+import json
+import logging
+import time
+import uuid
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from headwater_api.classes.conduit_classes.openai_compat import OpenAIResponsesRequest
+
+logger = logging.getLogger(__name__)
+
+# SSE comment line: ignored by OpenAI SDK clients, keeps proxies from timing out an idle stream.
+_KEEPALIVE = ": keep-alive\n\n"
+
+
+def _messages(request: OpenAIResponsesRequest) -> list[dict]:
+    if isinstance(request.input, str):
+        return [{"role": "user", "content": request.input}]
+    messages = []
+    for msg in request.input:
+        role = msg.role if msg.role in ("system", "assistant") else "user"
+        messages.append({"role": role, "content": msg.text()})
+    return messages
+
+
+async def _sse_generator(request: OpenAIResponsesRequest, model_name: str) -> AsyncGenerator[str, None]:
+    from headwater_server.services.conduit_service.conduit_responses_service import (
+        DEFAULT_MAX_OUTPUT_TOKENS,
+        message_item,
+        response_object,
+        usage_object,
+    )
+    from headwater_server.services.conduit_service.token_stream import (
+        ChatParams,
+        Delta,
+        TokenStream,
+        chat_source,
+    )
+
+    params = ChatParams(
+        temperature=request.temperature,
+        max_tokens=request.max_output_tokens if request.max_output_tokens is not None else DEFAULT_MAX_OUTPUT_TOKENS,
+    )
+    stream = TokenStream(
+        chat_source(model_name, _messages(request), params, use_cache=request.use_cache),
+        model_name,
+        "openai_responses",
+    )
+    response_id = f"resp_{uuid.uuid4().hex[:16]}"
+    msg_id = f"msg_{uuid.uuid4().hex[:16]}"
+    created_at = int(time.time())
+    sequence = 0
+
+    def event(event_type: str, **data) -> str:
+        nonlocal sequence
+        payload = {"type": event_type, "sequence_number": sequence, **data}
+        sequence += 1
+        return f"event: {event_type}\ndata: {json.dumps(payload)}\n\n"
+
+    def response(status: str, output: list[dict], usage: dict | None = None, error: dict | None = None) -> dict:
+        completed_at = int(time.time()) if status == "completed" else None
+        return response_object(request, response_id, created_at, status, output, usage, completed_at, error)
+
+    text_parts: list[str] = []
+    try:
+        yield event("response.created", response=response("in_progress", []))
+        yield event("response.in_progress", response=response("in_progress", []))
+        yield event("response.output_item.added", output_index=0, item=message_item(msg_id, "in_progress", None))
+        yield event(
+            "response.content_part.added",
+            item_id=msg_id,
+            output_index=0,
+            content_index=0,
+            part={"type": "output_text", "text": "", "annotations": []},
+        )
+        async for item in stream:
+            if item is None:
+                yield _KEEPALIVE
+            elif isinstance(item, Delta):
+                text_parts.append(item.text)
+                yield event(
+                    "response.output_text.delta",
+                    item_id=msg_id,
+                    output_index=0,
+                    content_index=0,
+                    delta=item.text,
+                )
+            else:
+                done = item
+                break
+        else:
+            raise RuntimeError("Token stream ended without a final usage record.")
+    except Exception as exc:
+        # Headers are already sent, so failures go out as a response.failed event.
+        logger.error("Responses API stream failed: model=%s error=%s", model_name, exc)
+        error = {"code": "server_error", "message": str(exc)}
+        yield event("response.failed", response=response("failed", [], error=error))
+        return
+    finally:
+        await stream.aclose()
+
+    text = "".join(text_parts)
+    logger.info(
+        "Responses API stream: model=%s input_tokens=%d output_tokens=%d ttft_ms=%s",
+        model_name,
+        done.input_tokens,
+        done.output_tokens,
+        None if stream.ttft_ms is None else round(stream.ttft_ms, 1),
+    )
+    yield event("response.output_text.done", item_id=msg_id, output_index=0, content_index=0, text=text)
+    yield event(
+        "response.content_part.done",
+        item_id=msg_id,
+        output_index=0,
+        content_index=0,
+        part={"type": "output_text", "text": text, "annotations": []},
+    )
+    item = message_item(msg_id, "completed", text)
+    yield event("response.output_item.done", output_index=0, item=item)
+    yield event(
+        "response.completed",
+        response=response("completed", [item], usage_object(done.input_tokens, done.output_tokens)),
+    )
+
+
+async def conduit_responses_stream_service(request: OpenAIResponsesRequest):
+    from conduit.core.model.models.modelstore import ModelStore
+    from fastapi import HTTPException
+    from fastapi.responses import StreamingResponse
+
+    logger.info("Responses API stream request: model=%s", request.model)
+
+    # Validate before the response starts, so a bad request is a plain error response rather than a broken stream.
+    try:
+        model_name = ModelStore.validate_model(request.model)
+    except FileNotFoundError as exc:
+        logger.error("Model store unavailable: %s", exc)
+        raise HTTPException(
+            status_code=502,
+            detail="Model store unavailable. Server configuration error.",
+        ) from exc
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "type": "invalid_request_error",
+                "message": f"The model '{request.model}' does not exist.",
+                "param": "model",
+                "code": "model_not_found",
+            },
+        ) from exc
+
+    if not isinstance(request.input, str) and not request.input:
+        raise HTTPException(status_code=400, detail="input must contain at least one message.")
+
+    return StreamingResponse(
+        _sse_generator(request, model_name),
+        media_type="text/event-stream",
+        headers={"X-Accel-Buffering": "no", "Cache-Control": "no-cache"},
+    )
@@ -0,0 +1,254 @@
+"""
+Incremental token streams for the Anthropic- and OpenAI-compatible endpoints.
+
+Ollama models are streamed straight from the local Ollama's /api/chat
+(NDJSON), so every delta reaches the client as Ollama produces it. Models of
+other providers go through conduit's ModelAsync.query: the endpoint still
+speaks its streaming protocol, but the text arrives as one delta once the
+completion is ready.
+
+A TokenStream runs its source in a task and yields Delta items, then one Done
+item. While no token is due it yields None every `keepalive` seconds, which
+the endpoint turns into a ping or comment line. Closing the stream cancels the
+task. That happens when the client disconnects and Starlette closes the
+response generator, or when DeadlineMiddleware fires. Cancelling the task
+closes the Ollama connection (or the in-flight conduit call), which stops
+generation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+import httpx
+
+from headwater_server.server.governor import model_governor
+from headwater_server.server.metrics import conduit_metrics
+
+logger = logging.getLogger(__name__)
+
+OLLAMA_URL = "http://localhost:11434"
+KEEPALIVE_INTERVAL = 10.0  # seconds without a token before a keep-alive is sent
+TOKEN_COUNT_TIMEOUT = 1.0  # budget for counting prompt tokens before the first event
+
+
+@dataclass(frozen=True)
+class Delta:
+    text: str
+
+
+@dataclass(frozen=True)
+class Done:
+    input_tokens: int
+    output_tokens: int
+    stop_reason: str  # "stop", "length", "tool_calls", "content_filter" or "error"
+
+
+@dataclass(frozen=True)
+class ChatParams:
+    temperature: float | None = None
+    top_p: float | None = None
+    max_tokens: int | None = None
+    stop: list[str] | None = None
+
+
+def is_ollama_model(model_name: str) -> bool:
+    from conduit.core.model.models.modelstore import ModelStore
+
+    return model_name in ModelStore.models().get("ollama", [])
+
+
+async def ollama_chat(
+    model_name: str, messages: list[dict], params: ChatParams, client: httpx.AsyncClient | None = None
+) -> AsyncIterator[Delta | Done]:
+    """Stream an Ollama /api/chat completion; messages are {"role", "content"} dicts."""
+    options: dict = {}
+    if params.temperature is not None:
+        options["temperature"] = params.temperature
+    if params.top_p is not None:
+        options["top_p"] = params.top_p
+    if params.max_tokens is not None:
+        options["num_predict"] = params.max_tokens
+    if params.stop:
+        options["stop"] = params.stop
+    body = {"model": model_name, "messages": messages, "stream": True, "options": options}
+
+    owned = client is None
+    client = client or httpx.AsyncClient(base_url=OLLAMA_URL, timeout=httpx.Timeout(None, connect=5.0))
+    try:
+        async with client.stream("POST", "/api/chat", json=body) as response:
+            if response.status_code >= 400:
+                detail = (await response.aread()).decode(errors="replace")
+                raise RuntimeError(f"Ollama /api/chat returned {response.status_code}: {detail}")
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    raise RuntimeError(f"Ollama error: {chunk['error']}")
+                text = (chunk.get("message") or {}).get("content") or ""
+                if text:
+                    yield Delta(text)
+                if chunk.get("done"):
+                    yield Done(
+                        input_tokens=chunk.get("prompt_eval_count") or 0,
+                        output_tokens=chunk.get("eval_count") or 0,
+                        stop_reason="length" if chunk.get("done_reason") == "length" else "stop",
+                    )
+                    return
+    finally:
+        if owned:
+            await client.aclose()
+
+
+def _generation_request(model_name: str, messages: list[dict], params: ChatParams, use_cache: bool | None):
+    from conduit.domain.config.conduit_options import ConduitOptions
+    from conduit.domain.message.message import AssistantMessage, SystemMessage, ToolMessage, UserMessage
+    from conduit.domain.request.generation_params import GenerationParams
+    from conduit.domain.request.request import GenerationRequest
+    from conduit.utils.progress.verbosity import Verbosity
+
+    message_types = {
+        "system": SystemMessage,
+        "user": UserMessage,
+        "assistant": AssistantMessage,
+        "tool": ToolMessage,
+    }
+    conduit_messages = [
+        message_types[m["role"]](**{k: v for k, v in m.items() if k != "role"}) for m in messages
+    ]
+
+    params_kwargs: dict = {"model": model_name}
+    if params.temperature is not None:
+        params_kwargs["temperature"] = params.temperature
+    if params.top_p is not None:
+        params_kwargs["top_p"] = params.top_p
+    if params.max_tokens is not None:
+        params_kwargs["max_tokens"] = params.max_tokens
+    if params.stop:
+        params_kwargs["stop"] = params.stop
+
+    options_kwargs: dict = {"project_name": "headwater", "verbosity": Verbosity.SILENT, "include_history": False}
+    request_kwargs: dict = {"include_history": False}
+    if use_cache is not None:
+        options_kwargs["use_cache"] = use_cache
+        request_kwargs["use_cache"] = use_cache
+    return GenerationRequest(
+        messages=conduit_messages,
+        params=GenerationParams(**params_kwargs),
+        options=ConduitOptions(**options_kwargs),
+        **request_kwargs,
+    )
+
+
+def chat_source(
+    model_name: str, messages: list[dict], params: ChatParams, use_cache: bool | None = None
+) -> AsyncIterator[Delta | Done]:
+    """Delta/Done source for a chat: Ollama's own stream when it serves the model, else conduit.
+
+    messages are {"role", "content"} dicts; "name" and "tool_call_id" keys are passed on to
+    conduit's message types.
+    """
+    if is_ollama_model(model_name):
+        return ollama_chat(model_name, [{"role": m["role"], "content": m["content"]} for m in messages], params)
+    return conduit_chat(_generation_request(model_name, messages, params, use_cache), model_name)
+
+
+async def conduit_chat(gen_request, model_name: str) -> AsyncIterator[Delta | Done]:
+    """Whole completion through conduit, as a single delta."""
+    from conduit.core.model.model_async import ModelAsync
+    from conduit.domain.result.response_metadata import StopReason
+
+    result = await ModelAsync(model_name).query(gen_request)
+    stop_map = {
+        StopReason.STOP: "stop",
+        StopReason.LENGTH: "length",
+        StopReason.TOOL_CALLS: "tool_calls",
+        StopReason.CONTENT_FILTER: "content_filter",
+        StopReason.ERROR: "error",
+    }
+    stop_reason = stop_map.get(result.metadata.stop_reason)
+    if stop_reason is None:
+        logger.warning("Unknown StopReason '%s', defaulting to 'stop'", result.metadata.stop_reason)
+        stop_reason = "stop"
+    text = str(result.message)
+    if not text and stop_reason != "length":
+        raise RuntimeError("Model returned an empty response.")
+    if text:
+        yield Delta(text)
+    yield Done(result.metadata.input_tokens, result.metadata.output_tokens, stop_reason)
+
+
+async def count_tokens(model_name: str, text: str) -> int:
+    """Prompt token count for usage reported before generation; 0 if it cannot be had quickly."""
+    from conduit.core.model.model_async import ModelAsync
+
+    try:
+        return await asyncio.wait_for(ModelAsync(model_name).tokenize(text), TOKEN_COUNT_TIMEOUT)
+    except Exception as exc:
+        logger.debug("prompt_token_count_unavailable", extra={"model": model_name, "error": str(exc)})
+        return 0
+
+
+class TokenStream:
+    """Runs a Delta/Done source in a task; iterate for items, None meaning "send a keep-alive".
+
+    The source runs while holding one of the model's ModelGovernor slots, so
+    time queued for a slot counts toward ttft_ms. Time to the first Delta is
+    kept as ttft_ms and recorded in the headwater.llm.ttft histogram.
+    """
+
+    def __init__(
+        self,
+        source: AsyncIterator[Delta | Done],
+        model_name: str,
+        endpoint: str,
+        keepalive: float = KEEPALIVE_INTERVAL,
+    ):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._keepalive = keepalive
+        self._model_name = model_name
+        self._endpoint = endpoint
+        self._task = asyncio.ensure_future(self._pump(source))
+        self.started_at = time.monotonic()
+        self.ttft_ms: float | None = None
+
+    async def _pump(self, source: AsyncIterator[Delta | Done]) -> None:
+        try:
+            # Keep-alives keep flowing while this waits for a slot on the model.
+            async with model_governor().slot(self._model_name, self._endpoint):
+                async for item in source:
+                    await self._queue.put(item)
+        except Exception as exc:
+            await self._queue.put(exc)
+        finally:
+            await self._queue.put(StopAsyncIteration())
+
+    def __aiter__(self) -> TokenStream:
+        return self
+
+    async def __anext__(self) -> Delta | Done | None:
+        try:
+            item = await asyncio.wait_for(self._queue.get(), self._keepalive)
+        except asyncio.TimeoutError:
+            return None
+        if isinstance(item, BaseException):
+            raise item
+        if isinstance(item, Delta) and self.ttft_ms is None:
+            self.ttft_ms = (time.monotonic() - self.started_at) * 1000
+            conduit_metrics().record_ttft(self.ttft_ms, self._model_name, self._endpoint)
+        return item
+
+    async def aclose(self) -> None:
+        """Stop the source, e.g. because the client went away; safe to call more than once."""
+        if not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
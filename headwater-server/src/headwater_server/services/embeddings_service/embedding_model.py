@@ -9,6 +9,7 @@ import torch
 from sentence_transformers import SentenceTransformer
 
 from headwater_api.classes import ChromaBatch
+from headwater_server.server.deadline import Deadline
 from headwater_server.services.embeddings_service.embedding_model_store import EmbeddingModelStore
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,9 @@ _cache_lock = threading.Lock()
 HUGGINGFACE_API_TOKEN = os.getenv("HUGGINGFACEHUB_API_TOKEN")
 os.environ["HF_TOKEN"] = HUGGINGFACE_API_TOKEN
 
+# Documents per encode call when a Deadline is passed; it is checked between calls.
+DEADLINE_CHUNK_SIZE = 256
+
 _TRUST_REMOTE_CODE_MODELS = {
     "Alibaba-NLP/gte-large-en-v1.5",
     "nomic-ai/nomic-embed-text-v1.5",
@@ -163,9 +167,17 @@ class EmbeddingModel:
         return _model_cache[model_name]
 
     def generate_embeddings(
-        self, batch: ChromaBatch, prompt: str | None = None
+        self, batch: ChromaBatch, prompt: str | None = None, deadline: Deadline | None = None
     ) -> ChromaBatch:
-        embeddings = self.embedding_function(batch.documents, prompt=prompt)
+        if deadline is None:
+            embeddings = self.embedding_function(batch.documents, prompt=prompt)
+        else:
+            embeddings = []
+            for i in range(0, len(batch.documents), DEADLINE_CHUNK_SIZE):
+                deadline.check()
+                embeddings.extend(
+                    self.embedding_function(batch.documents[i : i + DEADLINE_CHUNK_SIZE], prompt=prompt)
+                )
         return ChromaBatch(
             ids=batch.ids,
             documents=batch.documents,
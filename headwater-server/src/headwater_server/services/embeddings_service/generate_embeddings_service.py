@@ -6,6 +6,8 @@ import time
 from headwater_api.classes import EmbeddingsRequest, EmbeddingsResponse
 from headwater_server.services.embeddings_service.embedding_model import EmbeddingModel
 from headwater_server.services.embeddings_service.embedding_model_store import EmbeddingModelStore
+from headwater_server.server.deadline import current as current_deadline
+from headwater_server.server.timing import phase, record
 
 logger = logging.getLogger(__name__)
 
@@ -34,14 +36,25 @@ async def generate_embeddings_service(request: EmbeddingsRequest) -> EmbeddingsR
         spec = EmbeddingModelStore.get_spec(model)
         prompt = spec.task_map[request.task.value]
 
-    embedding_model = EmbeddingModel.get(model)
+    deadline = current_deadline()
+    deadline.check()
+    with phase("model_load"):
+        embedding_model = EmbeddingModel.get(model)
+
+    # Thread-side timestamps split executor queueing from the inference itself.
+    started: list[float] = []
+
+    def _generate() -> ChromaBatch:
+        started.append(time.monotonic())
+        return embedding_model.generate_embeddings(batch, prompt=prompt, deadline=deadline)
 
     start = time.monotonic()
     loop = asyncio.get_running_loop()
-    new_batch: ChromaBatch = await loop.run_in_executor(
-        None, lambda: embedding_model.generate_embeddings(batch, prompt=prompt)
-    )
-    elapsed_ms = (time.monotonic() - start) * 1000
+    new_batch: ChromaBatch = await loop.run_in_executor(None, _generate)
+    finished = time.monotonic()
+    elapsed_ms = (finished - start) * 1000
+    record("executor_wait", (started[0] - start) * 1000)
+    record("embed", (finished - started[0]) * 1000)
     logger.info(
         "embeddings generated: model=%s batch_size=%d duration_ms=%.1f",
         model,
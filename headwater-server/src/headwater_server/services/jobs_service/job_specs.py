@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Any
+
+from headwater_api.classes import BatchExtractRequest
+from headwater_api.classes import BatchRequest
+from headwater_api.classes import EmbedBatchRequest
+from headwater_api.classes import JobKind
+from headwater_server.server.jobs import JobSpec
+
+# URIs per embed-batch chunk; the service itself encodes in sub-chunks of 128.
+_EMBED_URIS_PER_CHUNK = 512
+
+
+async def _run_conduit_batch(batch: BatchRequest) -> list[Any]:
+    from headwater_server.services.conduit_service.conduit_batch_service import (
+        conduit_batch_service,
+    )
+
+    response = await conduit_batch_service(batch)
+    return response.model_dump(mode="json")["results"]
+
+
+async def _run_siphon_extract_batch(request: BatchExtractRequest) -> list[Any]:
+    from headwater_server.services.siphon_service.batch_extract_siphon_service import (
+        batch_extract_siphon_service,
+    )
+
+    response = await batch_extract_siphon_service(request)
+    return response.model_dump(mode="json")["results"]
+
+
+async def _run_siphon_embed_batch(request: EmbedBatchRequest) -> list[Any]:
+    from headwater_server.services.siphon_service.embed_batch_siphon_service import (
+        embed_batch_siphon_service,
+    )
+
+    response = await embed_batch_siphon_service(request)
+    return [response.model_dump(mode="json")]
+
+
+def _sum_embed_counts(results: list[dict]) -> dict[str, int]:
+    return {
+        "embedded": sum(r["embedded"] for r in results),
+        "skipped": sum(r["skipped"] for r in results),
+    }
+
+
+# Chunks of a few times max_concurrent keep the service's semaphore busy while
+# still committing progress often enough that a restart loses little work.
+JOB_SPECS: dict[JobKind, JobSpec] = {
+    JobKind.CONDUIT_BATCH: JobSpec(
+        request_model=BatchRequest,
+        items_fields=("prompt_strings_list", "input_variables_list"),
+        chunk_size=lambda batch: (batch.max_concurrent or 8) * 4,
+        run=_run_conduit_batch,
+    ),
+    JobKind.SIPHON_EXTRACT_BATCH: JobSpec(
+        request_model=BatchExtractRequest,
+        items_fields=("sources",),
+        chunk_size=lambda request: request.max_concurrent * 4,
+        run=_run_siphon_extract_batch,
+    ),
+    JobKind.SIPHON_EMBED_BATCH: JobSpec(
+        request_model=EmbedBatchRequest,
+        items_fields=("uris",),
+        chunk_size=lambda request: _EMBED_URIS_PER_CHUNK,
+        run=_run_siphon_embed_batch,
+        summarize=_sum_embed_counts,
+    ),
+}
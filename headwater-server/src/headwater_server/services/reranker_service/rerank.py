@@ -10,6 +10,7 @@ from headwater_server.services.reranker_service.config import (
     get_model_config,
 )
 from headwater_server.services.reranker_service.model_cache import get_reranker
+from headwater_server.server.deadline import current as current_deadline
 
 logger = logging.getLogger(__name__)
 
@@ -44,10 +45,13 @@ async def run_rerank(request: RerankRequest) -> RerankResponse:
 
     docs_text = [d.text for d in documents]
 
+    deadline = current_deadline()
+    deadline.check()
     loop = asyncio.get_running_loop()
     ranker = await loop.run_in_executor(
         None, lambda: get_reranker(resolved_name, model_config)
     )
+    deadline.check()  # model load can be slow; don't start inference for a caller that gave up
     ranked = await loop.run_in_executor(
         None, lambda: ranker.rank(query=request.query, docs=docs_text)
     )
@@ -7,6 +7,7 @@ from headwater_api.classes import BatchExtractResponse
 from headwater_api.classes import ExtractResult
 from siphon_api.enums import ActionType
 from siphon_server.core.pipeline import SiphonPipeline
+from headwater_server.server.deadline import check_deadline
 
 
 async def batch_extract_siphon_service(request: BatchExtractRequest) -> BatchExtractResponse:
@@ -15,6 +16,7 @@ async def batch_extract_siphon_service(request: BatchExtractRequest) -> BatchExt
 
     async def extract_one(source: str) -> ExtractResult:
         async with semaphore:
+            check_deadline()
             try:
                 content_data = await pipeline.process(source, action=ActionType.EXTRACT)
                 text = content_data.text
@@ -5,6 +5,7 @@ import logging
 from functools import lru_cache
 
 from headwater_api.classes import EmbedBatchRequest, EmbedBatchResponse, SIPHON_EMBED_MODEL
+from headwater_server.server.deadline import check_deadline
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,9 @@ async def embed_batch_siphon_service(request: EmbedBatchRequest) -> EmbedBatchRe
     3. Encode non-empty texts in chunks of _CHUNK_SIZE using run_in_executor so
        the event loop stays free (encode is CPU/GPU-bound).
     4. Write vectors back to DB in the same chunk, one transaction per chunk.
+
+    Stops between chunks once the request deadline passes or the client leaves;
+    chunks already written stay written.
     """
     from siphon_server.database.postgres.repository import ContentRepository
 
@@ -59,6 +63,7 @@ async def embed_batch_siphon_service(request: EmbedBatchRequest) -> EmbedBatchRe
     embedded_count = 0
 
     for i in range(0, len(to_embed), _CHUNK_SIZE):
+        check_deadline()
         chunk = to_embed[i : i + _CHUNK_SIZE]
         chunk_uris = [uri for uri, _ in chunk]
         chunk_texts = [text for _, text in chunk]
@@ -138,6 +138,8 @@ def test_model_store_unavailable_returns_502(client):
 
 import json
 
+TOKEN_STREAM = "headwater_server.services.conduit_service.token_stream"
+
 
 def _parse_sse_events(body: str) -> list[dict]:
     """Parse raw SSE body into list of {event, data} dicts."""
@@ -163,6 +165,7 @@ def test_stream_true_returns_event_stream(client):
     mock_result = make_mock_result(content="Streaming response.", input_tokens=10, output_tokens=4)
     payload = {**VALID_ANTHROPIC_PAYLOAD, "stream": True}
     with patch("conduit.core.model.models.modelstore.ModelStore.validate_model", return_value="gpt-oss:latest"), \
+         patch(f"{TOKEN_STREAM}.is_ollama_model", return_value=False), \
          patch("conduit.core.model.model_async.ModelAsync") as MockModel:
         mock_instance = MagicMock()
         mock_instance.query = AsyncMock(return_value=mock_result)
@@ -177,6 +180,7 @@ def test_stream_sse_event_sequence(client):
     mock_result = make_mock_result(content="Hello!", input_tokens=8, output_tokens=3)
     payload = {**VALID_ANTHROPIC_PAYLOAD, "stream": True}
     with patch("conduit.core.model.models.modelstore.ModelStore.validate_model", return_value="gpt-oss:latest"), \
+         patch(f"{TOKEN_STREAM}.is_ollama_model", return_value=False), \
          patch("conduit.core.model.model_async.ModelAsync") as MockModel:
         mock_instance = MagicMock()
         mock_instance.query = AsyncMock(return_value=mock_result)
@@ -187,6 +191,7 @@ def test_stream_sse_event_sequence(client):
     assert event_types == [
         "message_start",
         "content_block_start",
+        "ping",
         "content_block_delta",
         "content_block_stop",
         "message_delta",
@@ -199,6 +204,7 @@ def test_stream_content_block_delta_has_text(client):
     mock_result = make_mock_result(content="Hello!", input_tokens=8, output_tokens=3)
     payload = {**VALID_ANTHROPIC_PAYLOAD, "stream": True}
     with patch("conduit.core.model.models.modelstore.ModelStore.validate_model", return_value="gpt-oss:latest"), \
+         patch(f"{TOKEN_STREAM}.is_ollama_model", return_value=False), \
          patch("conduit.core.model.model_async.ModelAsync") as MockModel:
         mock_instance = MagicMock()
         mock_instance.query = AsyncMock(return_value=mock_result)
@@ -214,6 +220,7 @@ def test_stream_message_delta_has_stop_reason(client):
     mock_result = make_mock_result(content="Done.", input_tokens=5, output_tokens=2)
     payload = {**VALID_ANTHROPIC_PAYLOAD, "stream": True}
     with patch("conduit.core.model.models.modelstore.ModelStore.validate_model", return_value="gpt-oss:latest"), \
+         patch(f"{TOKEN_STREAM}.is_ollama_model", return_value=False), \
          patch("conduit.core.model.model_async.ModelAsync") as MockModel:
         mock_instance = MagicMock()
         mock_instance.query = AsyncMock(return_value=mock_result)
@@ -223,3 +230,28 @@ def test_stream_message_delta_has_stop_reason(client):
     msg_delta = next(e for e in events if e["event"] == "message_delta")
     assert msg_delta["data"]["delta"]["stop_reason"] == "end_turn"
     assert msg_delta["data"]["usage"]["output_tokens"] == 2
+
+
+def test_stream_ollama_model_sends_each_delta_with_usage(client):
+    """AC-5: Ollama-served models stream one content_block_delta per chunk; final usage carries output_tokens"""
+    from headwater_server.services.conduit_service.token_stream import Delta, Done
+
+    async def fake_ollama_chat(model_name, messages, params):
+        assert messages == [{"role": "user", "content": "Hello"}]
+        yield Delta("Hel")
+        yield Delta("lo!")
+        yield Done(input_tokens=9, output_tokens=2, stop_reason="stop")
+
+    payload = {**VALID_ANTHROPIC_PAYLOAD, "stream": True}
+    with patch("conduit.core.model.models.modelstore.ModelStore.validate_model", return_value="gpt-oss:latest"), \
+         patch(f"{TOKEN_STREAM}.is_ollama_model", return_value=True), \
+         patch(f"{TOKEN_STREAM}.ollama_chat", fake_ollama_chat), \
+         patch(f"{TOKEN_STREAM}.count_tokens", AsyncMock(return_value=9)):
+        response = client.post("/v1/messages", json=payload)
+    events = _parse_sse_events(response.text)
+    deltas = [e["data"]["delta"]["text"] for e in events if e["event"] == "content_block_delta"]
+    assert deltas == ["Hel", "lo!"]
+    assert events[0]["data"]["message"]["usage"]["input_tokens"] == 9
+    msg_delta = next(e for e in events if e["event"] == "message_delta")
+    assert msg_delta["data"]["usage"] == {"input_tokens": 9, "output_tokens": 2}
+    assert events[-1]["event"] == "message_stop"
@@ -19,6 +19,7 @@ async def test_batch_started_and_completed_logged(caplog):
     mock_batch.params.model = "test-model"
     mock_batch.options = MagicMock()
     mock_batch.max_concurrent = 2
+    mock_batch.adaptive_concurrency = False
 
     mock_results = [MagicMock(), MagicMock(), MagicMock()]
 
@@ -60,6 +61,7 @@ async def test_batch_partial_failure_logs_item_failed_and_still_completes(caplog
     mock_batch.params.model = "test-model"
     mock_batch.options = MagicMock()
     mock_batch.max_concurrent = 2
+    mock_batch.adaptive_concurrency = False
 
     error = RuntimeError("item failed")
 
@@ -70,7 +72,10 @@ async def test_batch_partial_failure_logs_item_failed_and_still_completes(caplog
     ):
         mock_instance = AsyncMock()
         mock_batch_cls.return_value = mock_instance
-        mock_instance.run.return_value = [MagicMock(), error]
+        # Items run as one conduit call each; the second prompt fails.
+        mock_instance.run.side_effect = lambda prompt_strings_list, **kwargs: (
+            [error] if prompt_strings_list == ["p2"] else [MagicMock()]
+        )
 
         with caplog.at_level(logging.INFO):
             await conduit_batch_service(mock_batch)
@@ -87,3 +92,48 @@ async def test_batch_partial_failure_logs_item_failed_and_still_completes(caplog
     assert item_failed.levelno == logging.ERROR
     assert item_failed.index == 1
     assert item_failed.exc_info is not None
+
+
+@pytest.mark.asyncio
+async def test_expired_deadline_aborts_batch_without_item_failures(caplog):
+    """A deadline that passes mid-batch stops it with DeadlineExceeded; remaining items are not logged as failed."""
+    from headwater_server.server.context import deadline_var
+    from headwater_server.server.deadline import Deadline, DeadlineExceeded
+    from headwater_server.services.conduit_service.conduit_batch_service import (
+        conduit_batch_service,
+    )
+
+    mock_batch = MagicMock()
+    mock_batch.prompt_strings_list = ["p1", "p2", "p3", "p4"]
+    mock_batch.prompt_str = None
+    mock_batch.input_variables_list = None
+    mock_batch.params.model = "test-model"
+    mock_batch.options = MagicMock()
+    mock_batch.max_concurrent = 1
+    mock_batch.adaptive_concurrency = False
+
+    deadline = Deadline()
+
+    async def run(prompt_strings_list, **kwargs):
+        deadline.cancel("client_disconnected")  # the client goes away while the first item runs
+        return [MagicMock()]
+
+    token = deadline_var.set(deadline)
+    try:
+        with patch(
+            "conduit.core.conduit.batch.conduit_batch_async.ConduitBatchAsync"
+        ) as mock_batch_cls, patch(
+            "headwater_server.services.conduit_service.conduit_batch_service.BatchResponse"
+        ):
+            mock_instance = AsyncMock()
+            mock_batch_cls.return_value = mock_instance
+            mock_instance.run.side_effect = run
+
+            with caplog.at_level(logging.INFO), pytest.raises(DeadlineExceeded) as exc_info:
+                await conduit_batch_service(mock_batch)
+    finally:
+        deadline_var.reset(token)
+
+    assert exc_info.value.status_code == 499
+    assert mock_instance.run.await_count == 1
+    assert "batch_item_failed" not in [r.message for r in caplog.records]
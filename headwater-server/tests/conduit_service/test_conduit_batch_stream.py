@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+
+class _Item(BaseModel):
+    # Stand-in for BatchStreamItem that accepts mock results.
+    index: int
+    result: Any = None
+    error: str | None = None
+    error_type: str | None = None
+    duration_ms: float
+
+
+def _batch(prompts: list[str], max_concurrent: int, adaptive: bool = False, min_concurrent: int = 1) -> MagicMock:
+    batch = MagicMock()
+    batch.prompt_strings_list = prompts
+    batch.prompt_str = None
+    batch.input_variables_list = None
+    batch.params.model = "test-model"
+    batch.options = MagicMock()
+    batch.max_concurrent = max_concurrent
+    batch.adaptive_concurrency = adaptive
+    batch.min_concurrent = min_concurrent
+    return batch
+
+
+@pytest.mark.asyncio
+async def test_stream_batch_sends_each_item_as_it_finishes():
+    """Items come back in completion order with their index; a failed item carries its error."""
+    from headwater_server.services.conduit_service.conduit_batch_service import (
+        conduit_batch_stream_service,
+    )
+
+    delays = {"slow": 0.05, "fast": 0.0, "bad": 0.01}
+
+    async def run(prompt_strings_list, **kwargs):
+        prompt = prompt_strings_list[0]
+        await asyncio.sleep(delays[prompt])
+        if prompt == "bad":
+            return [RuntimeError("model exploded")]
+        return [{"text": prompt}]
+
+    with patch("conduit.core.conduit.batch.conduit_batch_async.ConduitBatchAsync") as mock_cls, \
+         patch("headwater_server.services.conduit_service.conduit_batch_service.BatchStreamItem", _Item):
+        mock_cls.return_value.run = run
+        response = await conduit_batch_stream_service(_batch(["slow", "fast", "bad"], max_concurrent=3))
+        lines = [json.loads(chunk) async for chunk in response.body_iterator]
+
+    assert response.media_type == "application/x-ndjson"
+    assert [line["index"] for line in lines] == [1, 2, 0]
+    assert lines[0]["result"] == {"text": "fast"}
+    assert lines[1]["error"] == "model exploded"
+    assert lines[1]["error_type"] == "RuntimeError"
+    assert all(line["duration_ms"] >= 0 for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_stream_batch_runs_at_most_max_concurrent_items():
+    """Only max_concurrent items are in flight at once."""
+    from headwater_server.services.conduit_service.conduit_batch_service import (
+        conduit_batch_stream_service,
+    )
+
+    in_flight = 0
+    peak = 0
+
+    async def run(prompt_strings_list, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [{"text": prompt_strings_list[0]}]
+
+    with patch("conduit.core.conduit.batch.conduit_batch_async.ConduitBatchAsync") as mock_cls, \
+         patch("headwater_server.services.conduit_service.conduit_batch_service.BatchStreamItem", _Item):
+        mock_cls.return_value.run = run
+        response = await conduit_batch_stream_service(_batch([f"p{i}" for i in range(10)], max_concurrent=3))
+        lines = [chunk async for chunk in response.body_iterator]
+
+    assert len(lines) == 10
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batch_grows_concurrency_and_logs_it(caplog):
+    """adaptive_concurrency starts at min_concurrent, grows while latency holds, and logs the chosen limit."""
+    import logging
+
+    from headwater_server.services.conduit_service.conduit_batch_service import (
+        conduit_batch_service,
+    )
+
+    in_flight = 0
+    peak = 0
+
+    async def run(prompt_strings_list, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [{"text": prompt_strings_list[0]}]
+
+    with patch("conduit.core.conduit.batch.conduit_batch_async.ConduitBatchAsync") as mock_cls, \
+         patch("headwater_server.services.conduit_service.conduit_batch_service.BatchStreamItem", _Item), \
+         patch("headwater_server.services.conduit_service.conduit_batch_service.BatchResponse") as mock_response, \
+         caplog.at_level(logging.INFO):
+        mock_cls.return_value.run = run
+        await conduit_batch_service(_batch([f"p{i}" for i in range(40)], max_concurrent=6, adaptive=True))
+
+    results = mock_response.call_args.kwargs["results"]
+    assert results == [{"text": f"p{i}"} for i in range(40)]
+    assert 1 < peak <= 6
+    completed = next(r for r in caplog.records if r.message == "batch_completed")
+    assert completed.peak_concurrency == peak
+    assert 1 <= completed.final_concurrency <= 6
@@ -156,3 +156,83 @@ def test_structured_output_parsed_none_returns_500(client):
 
     assert response.status_code == 500
     assert "Structured output failed" in response.json()["detail"]
+
+
+TOKEN_STREAM = "headwater_server.services.conduit_service.token_stream"
+AUTH = {"Authorization": "Bearer test-key"}
+
+
+async def _fake_ollama_chat(model_name, messages, params):
+    from headwater_server.services.conduit_service.token_stream import Delta, Done
+    yield Delta("Hel")
+    yield Delta("lo!")
+    yield Done(input_tokens=9, output_tokens=2, stop_reason="stop")
+
+
+def _sse_data(body: str) -> list[dict | str]:
+    out = []
+    for block in body.split("\n\n"):
+        for line in block.split("\n"):
+            if line.startswith("data: "):
+                data = line[len("data: "):]
+                out.append(data if data == "[DONE]" else json.loads(data))
+    return out
+
+
+def test_stream_chat_completion_sends_chunks_then_usage(client):
+    """stream_options.include_usage -> chat.completion.chunk deltas, a finish_reason chunk, a usage chunk, then [DONE]"""
+    payload = {**VALID_PAYLOAD, "stream": True, "stream_options": {"include_usage": True}}
+    with patch("conduit.core.model.models.modelstore.ModelStore.validate_model", return_value="llama3.1"), \
+         patch(f"{TOKEN_STREAM}.is_ollama_model", return_value=True), \
+         patch(f"{TOKEN_STREAM}.ollama_chat", _fake_ollama_chat):
+        response = client.post("/v1/chat/completions", json=payload, headers=AUTH)
+    assert response.status_code == 200
+    assert "text/event-stream" in response.headers["content-type"]
+    data = _sse_data(response.text)
+    assert data[-1] == "[DONE]"
+    chunks = data[:-1]
+    assert all(c["object"] == "chat.completion.chunk" for c in chunks)
+    assert [c["choices"][0]["delta"].get("content") for c in chunks[1:3]] == ["Hel", "lo!"]
+    assert chunks[3]["choices"][0]["finish_reason"] == "stop"
+    assert chunks[4]["choices"] == []
+    assert chunks[4]["usage"] == {"prompt_tokens": 9, "completion_tokens": 2, "total_tokens": 11}
+
+
+def test_stream_chat_completion_omits_usage_chunk_by_default(client):
+    """Without stream_options no `choices: []` usage chunk is sent; every chunk has choices[0]."""
+    payload = {**VALID_PAYLOAD, "stream": True}
+    with patch("conduit.core.model.models.modelstore.ModelStore.validate_model", return_value="llama3.1"), \
+         patch(f"{TOKEN_STREAM}.is_ollama_model", return_value=True), \
+         patch(f"{TOKEN_STREAM}.ollama_chat", _fake_ollama_chat):
+        response = client.post("/v1/chat/completions", json=payload, headers=AUTH)
+    data = _sse_data(response.text)
+    assert data[-1] == "[DONE]"
+    chunks = data[:-1]
+    assert all(c["choices"] and "usage" not in c for c in chunks)
+    assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+
+
+def test_stream_responses_sends_event_sequence(client):
+    """stream=true on /v1/responses -> Responses event sequence ending in response.completed with usage"""
+    payload = {"model": "llama3.1", "input": "Hello", "stream": True}
+    with patch("conduit.core.model.models.modelstore.ModelStore.validate_model", return_value="llama3.1"), \
+         patch(f"{TOKEN_STREAM}.is_ollama_model", return_value=True), \
+         patch(f"{TOKEN_STREAM}.ollama_chat", _fake_ollama_chat):
+        response = client.post("/v1/responses", json=payload, headers=AUTH)
+    events = _sse_data(response.text)
+    assert [e["type"] for e in events] == [
+        "response.created",
+        "response.in_progress",
+        "response.output_item.added",
+        "response.content_part.added",
+        "response.output_text.delta",
+        "response.output_text.delta",
+        "response.output_text.done",
+        "response.content_part.done",
+        "response.output_item.done",
+        "response.completed",
+    ]
+    assert [e["sequence_number"] for e in events] == list(range(len(events)))
+    completed = events[-1]["response"]
+    assert completed["output"][0]["content"][0]["text"] == "Hello!"
+    assert completed["usage"]["total_tokens"] == 11
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+
+from headwater_server.services.conduit_service.token_stream import (
+    ChatParams,
+    Delta,
+    Done,
+    TokenStream,
+    ollama_chat,
+)
+
+TOKEN_STREAM = "headwater_server.services.conduit_service.token_stream"
+
+
+def _ollama_client(lines: list[dict], seen: list[dict]) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(json.loads(request.content))
+        return httpx.Response(200, content="".join(json.dumps(line) + "\n" for line in lines))
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://ollama")
+
+
+def test_ollama_chat_yields_each_delta_then_usage():
+    """NDJSON chunks become Delta items; the done chunk carries token counts and stop reason."""
+    lines = [
+        {"message": {"role": "assistant", "content": "Hel"}, "done": False},
+        {"message": {"role": "assistant", "content": "lo"}, "done": False},
+        {"message": {"role": "assistant", "content": ""}, "done": True, "done_reason": "length",
+         "prompt_eval_count": 12, "eval_count": 2},
+    ]
+    seen: list[dict] = []
+
+    async def run():
+        client = _ollama_client(lines, seen)
+        params = ChatParams(temperature=0.2, max_tokens=2, stop=["\n"])
+        return [item async for item in ollama_chat("llama3.1", [{"role": "user", "content": "hi"}], params, client)]
+
+    items = asyncio.run(run())
+    assert items == [Delta("Hel"), Delta("lo"), Done(12, 2, "length")]
+    assert seen[0]["stream"] is True
+    assert seen[0]["options"] == {"temperature": 0.2, "num_predict": 2, "stop": ["\n"]}
+
+
+def test_token_stream_sends_keepalives_and_cancels_source_on_close():
+    """A quiet source produces None keep-alives; aclose() cancels the running source."""
+    cancelled = asyncio.Event()
+
+    async def slow_source():
+        yield Delta("a")
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        yield Done(1, 1, "stop")
+
+    async def run():
+        stream = TokenStream(slow_source(), "llama3.1", "test", keepalive=0.01)
+        first = await stream.__anext__()
+        second = await stream.__anext__()
+        await stream.aclose()
+        return first, second, stream.ttft_ms
+
+    first, second, ttft_ms = asyncio.run(run())
+    assert first == Delta("a")
+    assert second is None
+    assert ttft_ms is not None
+    assert cancelled.is_set()
+
+
+def test_closing_openai_stream_cancels_the_model_call():
+    """When the client goes away Starlette closes the SSE generator, which must cancel generation."""
+    from unittest.mock import patch
+
+    from headwater_api.classes import OpenAIChatRequest
+    from headwater_server.services.conduit_service.conduit_openai_stream_service import _sse_generator
+
+    cancelled = asyncio.Event()
+
+    async def slow_ollama_chat(model_name, messages, params):
+        yield Delta("Hel")
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        yield Done(1, 1, "stop")
+
+    request = OpenAIChatRequest(
+        model="headwater/llama3.1", messages=[{"role": "user", "content": "Hello"}], stream=True
+    )
+
+    async def run():
+        with patch(f"{TOKEN_STREAM}.is_ollama_model", return_value=True), \
+             patch(f"{TOKEN_STREAM}.ollama_chat", slow_ollama_chat):
+            gen = _sse_generator(request, "llama3.1")
+            chunks = [await gen.__anext__(), await gen.__anext__()]
+            await gen.aclose()
+        return chunks
+
+    chunks = asyncio.run(run())
+    assert json.loads(chunks[1][len("data: "):])["choices"][0]["delta"] == {"content": "Hel"}
+    assert cancelled.is_set()
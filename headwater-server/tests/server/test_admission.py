@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from headwater_server.server.admission import AdmissionController, AdmissionRejected
+from headwater_server.server.routing_config import AdmissionSettings, RouterConfig
+
+
+def _config(**admission) -> RouterConfig:
+    return RouterConfig(
+        backends={"deepwater": "http://deepwater:8080", "bywater": "http://bywater:8080"},
+        routes={"conduit": "bywater", "heavy_inference": "deepwater"},
+        heavy_models=[],
+        admission=AdmissionSettings(**admission),
+    )
+
+
+def test_interactive_waiters_are_admitted_before_bulk():
+    """With one slot busy, a later interactive request overtakes an earlier bulk one."""
+    controller = AdmissionController(_config(routes={"conduit": 1}))
+    order: list[str] = []
+
+    async def wait(priority: str) -> None:
+        ticket = await controller.acquire("conduit", "http://bywater:8080", priority)
+        order.append(priority)
+        ticket.release()
+
+    async def run() -> None:
+        held = await controller.acquire("conduit", "http://bywater:8080", "interactive")
+        bulk = asyncio.ensure_future(wait("bulk"))
+        await asyncio.sleep(0)
+        interactive = asyncio.ensure_future(wait("interactive"))
+        await asyncio.sleep(0)
+        assert controller.snapshot()["route:conduit"]["queued_bulk"] == 1
+        assert controller.snapshot()["route:conduit"]["queued_interactive"] == 1
+        held.release()
+        await asyncio.gather(bulk, interactive)
+
+    asyncio.run(run())
+    assert order == ["interactive", "bulk"]
+    assert controller.snapshot()["route:conduit"]["in_flight"] == 0
+
+
+def test_full_queue_and_queue_timeout_are_rejected_with_retry_after():
+    """Past queue_size waiters a request is refused at once; a waiter past queue_timeout gives up."""
+    controller = AdmissionController(
+        _config(backends={"deepwater": 1}, queue_size=1, queue_timeout=0.05, retry_after=7)
+    )
+
+    async def run() -> tuple[AdmissionRejected, AdmissionRejected]:
+        held = await controller.acquire("heavy_inference", "http://deepwater:8080", "bulk")
+        waiter = asyncio.ensure_future(controller.acquire("heavy_inference", "http://deepwater:8080", "bulk"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as full:
+            await controller.acquire("heavy_inference", "http://deepwater:8080", "interactive")
+        with pytest.raises(AdmissionRejected) as timed_out:
+            await waiter
+        held.release()
+        return full.value, timed_out.value
+
+    full, timed_out = asyncio.run(run())
+    assert (full.scope, full.reason, full.retry_after) == ("backend:deepwater", "queue_full", 7)
+    assert timed_out.reason == "queue_timeout"
+    assert controller.rejected == {("backend:deepwater", "queue_full"): 1, ("backend:deepwater", "queue_timeout"): 1}
+    assert controller.snapshot()["backend:deepwater"] == {
+        "limit": 1, "in_flight": 0, "queued_interactive": 0, "queued_bulk": 0,
+    }
+
+
+def test_cancelled_waiter_does_not_leak_its_slot():
+    """A client that disconnects while queued leaves no slot held once the queue drains."""
+    controller = AdmissionController(_config(routes={"conduit": 1}))
+
+    async def run() -> None:
+        held = await controller.acquire("conduit", "http://bywater:8080", "interactive")
+        gone = asyncio.ensure_future(controller.acquire("conduit", "http://bywater:8080", "interactive"))
+        await asyncio.sleep(0)
+        gone.cancel()
+        await asyncio.gather(gone, return_exceptions=True)
+        held.release()
+        held.release()  # idempotent
+        ticket = await controller.acquire("conduit", "http://bywater:8080", "interactive")
+        ticket.release()
+
+    asyncio.run(run())
+    assert controller.snapshot()["route:conduit"]["in_flight"] == 0
+
+
+def test_reconfigure_raising_limit_admits_waiters_and_keeps_counts():
+    """A reload that raises a cap wakes queued requests; slots already held are still counted."""
+    controller = AdmissionController(_config(routes={"conduit": 1}))
+
+    async def run() -> None:
+        held = await controller.acquire("conduit", "http://bywater:8080", "interactive")
+        waiter = asyncio.ensure_future(controller.acquire("conduit", "http://bywater:8080", "bulk"))
+        await asyncio.sleep(0)
+        controller.reconfigure(_config(routes={"conduit": 2}))
+        ticket = await asyncio.wait_for(waiter, 1.0)
+        assert controller.snapshot()["route:conduit"]["in_flight"] == 2
+        ticket.release()
+        held.release()
+
+    asyncio.run(run())
+    assert controller.snapshot()["route:conduit"]["in_flight"] == 0
+
+
+def test_priority_comes_from_header_then_bulk_prefixes():
+    """X-Headwater-Priority wins; otherwise `bulk` path prefixes mark bulk; everything else is interactive."""
+    controller = AdmissionController(_config(bulk=["conduit/batch"]))
+    assert controller.priority("conduit/batch", {}) == "bulk"
+    assert controller.priority("conduit/batch", {"x-headwater-priority": "Interactive"}) == "interactive"
+    assert controller.priority("conduit/generate", {}) == "interactive"
+    assert controller.priority("conduit/generate", {"x-headwater-priority": "bulk"}) == "bulk"
+    assert controller.priority("conduit/batchy", {}) == "interactive"
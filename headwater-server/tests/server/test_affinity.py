@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+
+from headwater_server.server.affinity import HashRing, PrefixAffinity, prefix_key
+from headwater_server.server.balancer import LeastOutstandingBalancer
+from headwater_server.server.routing_config import AffinitySettings
+
+URLS = ["http://a:8080", "http://b:8080", "http://c:8080"]
+
+
+def _chat(*contents: str, system: str = "be brief") -> bytes:
+    messages = [{"role": "system", "content": system}]
+    messages += [{"role": "user" if i % 2 == 0 else "assistant", "content": c} for i, c in enumerate(contents)]
+    return json.dumps({"model": "qwen3:4b", "messages": messages}).encode()
+
+
+class _Health:
+    def __init__(self, open_circuits: set[str] = frozenset()):
+        self.open = open_circuits
+
+    def is_closed(self, url: str) -> bool:
+        return url not in self.open
+
+
+def test_prefix_key_is_stable_across_turns_of_one_conversation():
+    """Later turns share the first-turn key; a different opener or system prompt does not."""
+    first = prefix_key(_chat("hello"), messages=1)
+    assert first is not None
+    assert prefix_key(_chat("hello", "hi!", "how are you?"), messages=1) == first
+    assert prefix_key(_chat("goodbye"), messages=1) != first
+    assert prefix_key(_chat("hello", system="be verbose"), messages=1) != first
+    anthropic = json.dumps({"model": "m", "system": "s", "messages": [{"role": "user", "content": "x"}]}).encode()
+    assert prefix_key(anthropic, messages=1) is not None
+    assert prefix_key(b'{"prompt": "no messages"}', messages=1) is None
+
+
+def test_prefix_key_ignores_params_that_is_not_an_object():
+    """A malformed `params` gives a key without a model rather than raising; the backend rejects the body."""
+    for params in ([1], "qwen3:4b", None):
+        body = json.dumps({"params": params, "messages": [{"role": "user", "content": "hello"}]}).encode()
+        assert prefix_key(body, messages=1) is not None
+
+
+def test_hash_ring_moves_only_keys_owned_by_removed_backend():
+    """Dropping a backend reassigns its keys and leaves every other key where it was."""
+    full = HashRing(URLS, {}, vnodes=100)
+    smaller = HashRing(URLS[:2], {}, vnodes=100)
+    keys = [f"conversation-{i}".encode() for i in range(300)]
+    owners = {k: full.candidates(k)[0] for k in keys}
+    assert len(set(owners.values())) == 3
+    for k in keys:
+        if owners[k] != URLS[2]:
+            assert smaller.candidates(k)[0] == owners[k]
+    assert sorted(full.candidates(keys[0])) == sorted(URLS)
+
+
+def test_choose_spills_past_unhealthy_or_overloaded_owner():
+    """The ring owner wins when idle; an open circuit or load over the bound moves to the next backend."""
+    affinity = PrefixAffinity(AffinitySettings(routes=["conduit"]))
+    balancer = LeastOutstandingBalancer()
+    key = prefix_key(_chat("hello"), messages=1)
+    ring_order = HashRing(URLS, {}, vnodes=100).candidates(key)
+
+    assert affinity.choose(key, URLS, {}, balancer, _Health()) == (ring_order[0], "affinity")
+    assert affinity.choose(key, URLS, {}, balancer, _Health({ring_order[0]})) == (ring_order[1], "affinity_spill")
+    for _ in range(3):
+        balancer.acquire(ring_order[0])
+    assert affinity.choose(key, URLS, {}, balancer, _Health()) == (ring_order[1], "affinity_spill")
+    assert affinity.choose(key, URLS, {}, balancer, _Health(set(URLS))) is None
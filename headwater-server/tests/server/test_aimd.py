@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from headwater_server.server import aimd
+from headwater_server.server.aimd import AIMDLimiter
+
+
+
+@pytest.mark.asyncio
+async def test_slow_start_then_one_backoff_per_congestion_episode(monkeypatch):
+    """Fast items double the limit up to maximum; several slow items in flight together cost one backoff."""
+    clock = [100.0]
+    monkeypatch.setattr(aimd.time, "monotonic", lambda: clock[0])
+    limiter = AIMDLimiter(minimum=1, maximum=8, model="llama3.1")
+
+    for _ in range(10):
+        started = await limiter.acquire()
+        clock[0] += 1.0
+        await limiter.release(started, ok=True, tokens=100)  # 10 ms per token
+    assert limiter.limit == 8
+
+    starts = [await limiter.acquire() for _ in range(3)]
+    clock[0] += 5.0  # 50 ms per token: 5x the baseline
+    for started in starts:
+        await limiter.release(started, ok=True, tokens=100)
+    assert limiter.limit == int(8 * aimd.BACKOFF)
+
+    started = await limiter.acquire()
+    clock[0] += 1.0
+    await limiter.release(started, ok=True, tokens=100)
+    assert limiter.limit == int(8 * aimd.BACKOFF)  # after a backoff the increase is additive: +1/limit
+    assert limiter.peak == 8
+
+
+@pytest.mark.asyncio
+async def test_error_rate_backs_off_but_never_below_minimum():
+    """A high error rate shrinks the limit, bounded by minimum; an isolated error does not."""
+    limiter = AIMDLimiter(minimum=2, maximum=8)
+    limiter._limit = 8.0
+    started = await limiter.acquire()
+    await limiter.release(started, ok=False)
+    assert limiter.limit == 8
+
+    for _ in range(10):
+        started = await limiter.acquire()
+        await limiter.release(started, ok=False)
+        limiter._last_decrease = 0.0  # treat every failure as a new episode
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_a_slot_under_the_limit():
+    """No more than limit items hold a slot; release() wakes a waiter."""
+    limiter = AIMDLimiter(minimum=1, maximum=1)
+    first = await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+    await limiter.release(first, ok=True)
+    await asyncio.wait_for(waiter, 1)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+
+from headwater_server.server.balancer import LeastOutstandingBalancer
+
+A = "http://172.16.0.4:8080"
+B = "http://172.16.0.9:8080"
+
+
+def test_idle_pool_prefers_primary():
+    """With nothing in flight, ties go to the first (primary) candidate."""
+    assert LeastOutstandingBalancer().pick([A, B]) == A
+
+
+def test_picks_backend_with_fewest_outstanding_requests():
+    """A busy primary sheds the next request to the idle replica."""
+    balancer = LeastOutstandingBalancer()
+    balancer.acquire(A)
+    assert balancer.pick([A, B]) == B
+    balancer.acquire(B)
+    balancer.acquire(B)
+    assert balancer.pick([A, B]) == A
+
+
+def test_weights_scale_outstanding_requests():
+    """A weight-3 backend absorbs three times the concurrency of a weight-1 backend."""
+    balancer = LeastOutstandingBalancer()
+    weights = {A: 1.0, B: 3.0}
+    picks = []
+    for _ in range(8):
+        url = balancer.pick([A, B], weights)
+        balancer.acquire(url)
+        picks.append(url)
+    assert picks.count(B) == 6
+    assert picks.count(A) == 2
+
+
+def test_release_decrements_and_never_goes_negative():
+    """release() undoes acquire() and clamps at zero."""
+    balancer = LeastOutstandingBalancer()
+    balancer.acquire(A)
+    balancer.release(A)
+    balancer.release(A)
+    assert balancer.in_flight(A) == 0
+    assert balancer.snapshot() == {A: 0}
+
+
+def test_pick_requires_candidates():
+    with pytest.raises(ValueError):
+        LeastOutstandingBalancer().pick([])
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from headwater_server.server.cache import ResponseCache, bypasses_cache
+from headwater_server.server.coalesce import SharedResponse
+from headwater_server.server.routing_config import CacheSettings
+
+
+def _response(body: bytes = b'{"ok": true}', status_code: int = 200) -> SharedResponse:
+    return SharedResponse(status_code, {"content-type": "application/json"}, body)
+
+
+def test_rule_matches_longest_path_prefix():
+    """A path is cached under the longest configured prefix; unlisted paths are not cached."""
+    cache = ResponseCache(CacheSettings(routes={"conduit": 10, "conduit/embeddings": 3600}))
+    assert cache.rule("conduit/embeddings/quick") == ("conduit/embeddings", 3600)
+    assert cache.rule("conduit/tokenize") == ("conduit", 10)
+    assert cache.rule("conduitx/tokenize") is None
+    assert cache.rule("reranker/rerank") is None
+
+
+def test_hit_miss_and_ttl_expiry():
+    """Stored 200s are returned until their TTL passes; non-200s are never stored."""
+    from unittest.mock import patch
+
+    cache = ResponseCache(CacheSettings(routes={"reranker": 60}))
+
+    async def run() -> None:
+        assert await cache.get(b"k", "reranker") is None
+        cache.put(b"k", "reranker", 60, _response())
+        cache.put(b"bad", "reranker", 60, _response(status_code=500))
+        assert await cache.get(b"k", "reranker") == (_response(), "memory")
+        assert await cache.get(b"bad", "reranker") is None
+        with patch("headwater_server.server.cache.time.time", return_value=10**12):
+            assert await cache.get(b"k", "reranker") is None
+
+    asyncio.run(run())
+    stats = cache.stats()
+    assert stats["hits"] == {("reranker", "memory"): 1}
+    assert stats["misses"] == {"reranker": 3}
+
+
+def test_lru_eviction_keeps_memory_within_budget():
+    """Least recently used entries are evicted once the memory budget is exceeded."""
+    cache = ResponseCache(CacheSettings(max_mb=0.01, routes={"conduit": 60}))  # ~10 KB, 1.3 KB max entry
+    body = b"x" * 1000
+
+    async def run() -> None:
+        for i in range(20):
+            cache.put(f"k{i}".encode(), "conduit", 60, _response(body))
+            await cache.get(b"k0", "conduit")  # keep k0 hot
+
+    asyncio.run(run())
+    stats = cache.stats()
+    assert stats["memory_bytes"] <= 0.01 * 1024 * 1024
+    assert stats["evictions"]["memory"] > 0
+    assert asyncio.run(cache.get(b"k0", "conduit")) is not None
+    assert asyncio.run(cache.get(b"k1", "conduit")) is None
+
+
+def test_oversized_entry_is_not_cached():
+    """A response larger than an eighth of the budget is passed through, not stored."""
+    cache = ResponseCache(CacheSettings(max_mb=0.01, routes={"conduit": 60}))
+    cache.put(b"big", "conduit", 60, _response(b"x" * 5000))
+    assert cache.stats()["memory_entries"] == 0
+
+
+def test_disk_tier_survives_restart(tmp_path: Path):
+    """With disk_path set, entries written by one cache are served by the next one."""
+    settings = CacheSettings(disk_path=tmp_path / "cache.sqlite", routes={"conduit": 60})
+
+    async def first() -> None:
+        cache = ResponseCache(settings)
+        cache.put(b"k", "conduit", 60, _response())
+        await cache.aclose()
+
+    async def second() -> tuple[SharedResponse, str] | None:
+        cache = ResponseCache(settings)
+        try:
+            return await cache.get(b"k", "conduit")
+        finally:
+            await cache.aclose()
+
+    asyncio.run(first())
+    assert asyncio.run(second()) == (_response(), "disk")
+
+
+def test_bypass_headers():
+    """Cache-Control no-cache/no-store and X-Headwater-Cache: bypass opt out."""
+    assert bypasses_cache({"cache-control": "no-cache"})
+    assert bypasses_cache({"cache-control": "max-age=0, no-store"})
+    assert bypasses_cache({"x-headwater-cache": "bypass"})
+    assert not bypasses_cache({"cache-control": "max-age=60"})
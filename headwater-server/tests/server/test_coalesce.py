@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+
+from headwater_server.server.coalesce import SharedResponse, SingleFlight, request_key
+
+
+def test_request_key_distinguishes_method_target_body_and_vary():
+    """Keys differ when any of method, target, body or a vary value differ, including boundary shifts."""
+    key = request_key
+    assert key("POST", "/a", b"x") == key("POST", "/a", b"x")
+    assert key("POST", "/a", b"x") != key("GET", "/a", b"x")
+    assert key("POST", "/a", b"x") != key("POST", "/a?q=1", b"x")
+    assert key("POST", "/a", b"bc") != key("POST", "/ab", b"c")
+    assert key("POST", "/a", b"x", "Bearer a") != key("POST", "/a", b"x", "Bearer b")
+
+
+def test_identical_concurrent_calls_share_one_upstream_call():
+    """Followers that arrive while the leader is in flight reuse its result."""
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch() -> SharedResponse:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return SharedResponse(200, {}, b"ok")
+
+    async def run() -> list[tuple[SharedResponse, bool]]:
+        return await asyncio.gather(*(flight.do(b"k", fetch) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert calls == 1
+    assert [shared for _, shared in results] == [False, True, True, True, True]
+    assert flight.coalesced == 4
+    assert flight.in_flight() == 0
+
+
+def test_leader_cancellation_does_not_cancel_followers():
+    """A leader whose client goes away leaves the shared call running for its followers."""
+    flight = SingleFlight()
+
+    async def fetch() -> SharedResponse:
+        await asyncio.sleep(0.02)
+        return SharedResponse(200, {}, b"ok")
+
+    async def run() -> SharedResponse:
+        leader = asyncio.ensure_future(flight.do(b"k", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do(b"k", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        response, shared = await follower
+        assert shared
+        return response
+
+    assert asyncio.run(run()).body == b"ok"
+
+
+def test_errors_are_shared_and_call_is_forgotten():
+    """An exception reaches every waiter, and the next call with the same key starts fresh."""
+    flight = SingleFlight()
+
+    async def boom() -> SharedResponse:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream exploded")
+
+    async def run() -> list:
+        return await asyncio.gather(flight.do(b"k", boom), flight.do(b"k", boom), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in asyncio.run(run()))
+    assert flight.in_flight() == 0
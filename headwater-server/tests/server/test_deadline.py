@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from headwater_server.server.context import deadline_var
+from headwater_server.server.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    DeadlineMiddleware,
+    current,
+    parse_budget,
+    with_deadline,
+)
+
+
+def _app(calls: list[str]) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware)
+
+    @app.post("/slow")
+    async def slow() -> dict:
+        calls.append("started")
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            calls.append("cancelled")
+            raise
+        return {"ok": True}
+
+    @app.post("/budget")
+    async def budget() -> dict:
+        return {"remaining": current().remaining()}
+
+    return app
+
+
+def test_budget_parsing_and_forwarded_header_counts_down():
+    """Malformed values are ignored, negatives clamp to 0, and the forwarded budget is what is left."""
+    assert parse_budget(None) is None
+    assert parse_budget("soon") is None
+    assert parse_budget("nan") is None
+    assert parse_budget("-3") == 0.0
+    assert parse_budget("2.5") == 2.5
+
+    assert with_deadline({"X-Headwater-Deadline": "9"}) == {}  # no deadline in this context: drop the stale value
+    token = deadline_var.set(Deadline(2.0))
+    try:
+        time.sleep(0.05)
+        forwarded = float(with_deadline({"x-request-id": "r"})["x-headwater-deadline"])
+    finally:
+        deadline_var.reset(token)
+    assert 1.8 < forwarded < 1.96
+
+
+def test_middleware_cancels_handler_at_deadline_and_504s_spent_budgets():
+    """The handler is cancelled when the budget runs out; a spent budget never reaches it."""
+    calls: list[str] = []
+    client = TestClient(_app(calls))
+
+    start = time.monotonic()
+    response = client.post("/slow", headers={"X-Headwater-Deadline": "0.1"})
+    assert response.status_code == 504
+    assert response.json()["error_type"] == "deadline_exceeded"
+    assert time.monotonic() - start < 2
+    assert calls == ["started", "cancelled"]
+
+    calls.clear()
+    assert client.post("/slow", headers={"X-Headwater-Deadline": "0"}).status_code == 504
+    assert calls == []
+
+    remaining = client.post("/budget", headers={"X-Headwater-Deadline": "30"}).json()["remaining"]
+    assert 29 < remaining <= 30
+    assert client.post("/budget").json()["remaining"] is None
+
+
+def test_middleware_cancels_handler_and_marks_deadline_when_client_disconnects():
+    """Once the body is read, a disconnect cancels the handler and flags the Deadline for worker threads."""
+    seen: list[Deadline] = []
+    cancelled = asyncio.Event()
+
+    async def app(scope, receive, send):
+        await receive()  # the request body
+        seen.append(current())
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def run() -> list[dict]:
+        client_gone = asyncio.Event()
+        messages = [{"type": "http.request", "body": b"{}", "more_body": False}]
+        sent: list[dict] = []
+
+        async def receive():
+            if messages:
+                return messages.pop(0)
+            await client_gone.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "path": "/x", "method": "POST", "headers": []}
+        task = asyncio.ensure_future(DeadlineMiddleware(app)(scope, receive, send))
+        await asyncio.sleep(0.05)
+        client_gone.set()
+        await asyncio.wait_for(task, 1)
+        return sent
+
+    sent = asyncio.run(run())
+    assert cancelled.is_set()
+    assert sent[0]["status"] == 499
+    with pytest.raises(DeadlineExceeded) as exc:
+        seen[0].check()
+    assert exc.value.reason == "client_disconnected"
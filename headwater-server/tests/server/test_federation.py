@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+from prometheus_client.parser import text_string_to_metric_families
+
+from headwater_server.server.federation import MetricsFederator, merge, relabel, render
+from headwater_server.server.routing_config import FederationSettings
+
+BYWATER = """\
+# HELP http_requests_total Requests
+# TYPE http_requests_total counter
+http_requests_total{path="/ping"} 3.0
+# HELP queue_depth Depth
+# TYPE queue_depth gauge
+queue_depth{backend="ollama"} 2.0
+"""
+
+DEEPWATER = """\
+# HELP http_requests_total Requests
+# TYPE http_requests_total counter
+http_requests_total{path="/ping"} 5.0
+# HELP queue_depth Depth
+# TYPE queue_depth counter
+queue_depth_total 9.0
+"""
+
+
+def _samples(text: str) -> dict[str, list[tuple[dict, float]]]:
+    return {
+        family.name: [(s.labels, s.value) for s in family.samples]
+        for family in text_string_to_metric_families(text)
+    }
+
+
+def test_merge_labels_each_backend_and_keeps_one_family_per_name():
+    """Samples gain backend=<name>; an existing backend label becomes exported_backend; type conflicts keep the first."""
+    text = render(merge([relabel(BYWATER, "bywater"), relabel(DEEPWATER, "deepwater")])).decode()
+    assert text.count("# TYPE http_requests_total counter") == 1
+    samples = _samples(text)
+    assert samples["http_requests"] == [
+        ({"path": "/ping", "backend": "bywater"}, 3.0),
+        ({"path": "/ping", "backend": "deepwater"}, 5.0),
+    ]
+    assert samples["queue_depth"] == [({"exported_backend": "ollama", "backend": "bywater"}, 2.0)]
+
+
+class _Client:
+    def __init__(self, text: str, delay: float, calls: list[str], name: str):
+        self._text, self._delay, self._calls, self._name = text, delay, calls, name
+
+    async def get(self, path: str, timeout: float) -> httpx.Response:
+        self._calls.append(self._name)
+        await asyncio.wait_for(asyncio.sleep(self._delay), timeout)
+        return httpx.Response(200, text=self._text, request=httpx.Request("GET", path))
+
+
+class _Pool:
+    def __init__(self, clients: dict[str, _Client]):
+        self._clients = clients
+
+    def client(self, url: str) -> _Client:
+        return self._clients[url]
+
+
+def test_slow_backend_is_dropped_at_timeout_and_rounds_are_cached_and_shared():
+    """A backend over the timeout is reported down without holding the scrape; repeats within the TTL reuse one round."""
+    calls: list[str] = []
+    pool = _Pool({
+        "http://b": _Client(BYWATER, 0.0, calls, "bywater"),
+        "http://d": _Client(DEEPWATER, 5.0, calls, "deepwater"),
+    })
+    federator = MetricsFederator(pool, FederationSettings(timeout=0.2, cache_ttl=60))
+    backends = {"bywater": "http://b", "deepwater": "http://d"}
+
+    async def run() -> list[bytes]:
+        return list(await asyncio.gather(*(federator.exposition(backends) for _ in range(3))))
+
+    start = time.monotonic()
+    bodies = asyncio.run(run())
+    assert time.monotonic() - start < 2
+    assert calls == ["bywater", "deepwater"]  # three concurrent scrapes, one round
+    assert len(set(bodies)) == 1
+
+    samples = _samples(bodies[0].decode())
+    assert samples["headwater_federate_up"] == [({"backend": "bywater"}, 1.0), ({"backend": "deepwater"}, 0.0)]
+    assert [labels["backend"] for labels, _ in samples["http_requests"]] == ["bywater"]
+
+    asyncio.run(run())
+    assert len(calls) == 2  # still within cache_ttl
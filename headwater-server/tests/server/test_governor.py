@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from headwater_server.server.governor import (
+    DEFAULT_OLLAMA_LIMIT,
+    GovernorConfig,
+    GovernorConfigError,
+    ModelGovernor,
+    load_governor_config,
+)
+
+
+def test_limits_come_from_models_then_ollama_default(tmp_path):
+    """Listed models use their limit, unlisted Ollama models the ollama default, others are unlimited."""
+    path = tmp_path / "concurrency.yaml"
+    path.write_text("ollama: 2\nmodels:\n  qwen3:30b: 1\n  gpt-4o: 32\n")
+    ollama = {"qwen3:30b", "llama3.1"}
+    governor = ModelGovernor(load_governor_config(path), is_ollama=lambda model: model in ollama)
+
+    assert governor.limit("qwen3:30b") == 1
+    assert governor.limit("llama3.1") == 2
+    assert governor.limit("gpt-4o") == 32
+    assert governor.limit("claude-sonnet-4") is None
+
+
+def test_missing_file_gives_defaults_and_bad_values_are_rejected(tmp_path):
+    """No concurrency.yaml means the default Ollama limit; a non-positive limit fails loading."""
+    assert load_governor_config(tmp_path / "absent.yaml") == GovernorConfig(ollama=DEFAULT_OLLAMA_LIMIT)
+    path = tmp_path / "concurrency.yaml"
+    path.write_text("models:\n  llama3.1: 0\n")
+    with pytest.raises(GovernorConfigError):
+        load_governor_config(path)
+
+
+@pytest.mark.asyncio
+async def test_slots_are_shared_across_callers_and_granted_fifo():
+    """Concurrent callers of one model never exceed its limit and are admitted in arrival order."""
+    governor = ModelGovernor(GovernorConfig(models={"llama3.1": 2}))
+    in_flight = 0
+    peak = 0
+    order: list[int] = []
+
+    async def call(i: int) -> None:
+        nonlocal in_flight, peak
+        async with governor.slot("llama3.1", "test"):
+            order.append(i)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    tasks = []
+    for i in range(6):
+        tasks.append(asyncio.ensure_future(call(i)))
+        await asyncio.sleep(0)  # arrive in index order
+    await asyncio.gather(*tasks)
+
+    assert peak == 2
+    assert order == list(range(6))
+    assert governor.snapshot()["llama3.1"] == {"limit": 2, "in_flight": 0, "queued": 0}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue_without_leaking_a_slot():
+    """A queued caller that is cancelled (client gone, deadline) frees its place; the next waiter gets the slot."""
+    governor = ModelGovernor(GovernorConfig(models={"llama3.1": 1}))
+    release = asyncio.Event()
+
+    async def holder() -> None:
+        async with governor.slot("llama3.1", "test"):
+            await release.wait()
+
+    async def waiter() -> float:
+        async with governor.slot("llama3.1", "test") as waited_ms:
+            return waited_ms
+
+    first = asyncio.ensure_future(holder())
+    await asyncio.sleep(0)
+    gone = asyncio.ensure_future(waiter())
+    next_in_line = asyncio.ensure_future(waiter())
+    await asyncio.sleep(0.01)
+    assert governor.snapshot()["llama3.1"]["queued"] == 2
+
+    gone.cancel()
+    release.set()
+    await first
+    waited_ms = await asyncio.wait_for(next_in_line, 1)
+
+    assert gone.cancelled()
+    assert waited_ms > 0
+    assert governor.snapshot()["llama3.1"] == {"limit": 1, "in_flight": 0, "queued": 0}
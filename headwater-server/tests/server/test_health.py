@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from headwater_server.server.health import CircuitState, HealthMonitor
+from headwater_server.server.routing_config import HealthSettings, RouterConfig
+
+BYWATER = "http://172.16.0.4:8080"
+DEEPWATER = "http://172.16.0.2:8080"
+
+
+def _monitor(**health) -> tuple[HealthMonitor, MagicMock]:
+    config = RouterConfig(
+        backends={"bywater": BYWATER, "deepwater": DEEPWATER},
+        routes={"conduit": "bywater"},
+        heavy_models=[],
+        health=HealthSettings(**health),
+    )
+    upstream = MagicMock()
+    return HealthMonitor(config, upstream), upstream
+
+
+def test_circuit_opens_after_failure_threshold():
+    """Consecutive failures below the threshold keep the circuit closed; reaching it opens it."""
+    monitor, _ = _monitor(failure_threshold=3)
+    monitor.record_failure(BYWATER)
+    monitor.record_failure(BYWATER)
+    assert monitor.allow(BYWATER)
+    monitor.record_failure(BYWATER)
+    assert monitor.snapshot()[BYWATER].state is CircuitState.OPEN
+    assert not monitor.allow(BYWATER)
+    assert monitor.allow(DEEPWATER)
+
+
+def test_success_resets_failure_count():
+    """A success between failures resets the consecutive-failure count."""
+    monitor, _ = _monitor(failure_threshold=2)
+    monitor.record_failure(BYWATER)
+    monitor.record_success(BYWATER)
+    monitor.record_failure(BYWATER)
+    assert monitor.snapshot()[BYWATER].state is CircuitState.CLOSED
+
+
+def test_half_open_allows_one_trial_after_cooldown():
+    """After cooldown one trial request is let through; its outcome closes or re-opens the circuit."""
+    monitor, _ = _monitor(failure_threshold=1, cooldown=10.0)
+    with patch("headwater_server.server.health.time.monotonic", return_value=100.0):
+        monitor.record_failure(BYWATER)
+    with patch("headwater_server.server.health.time.monotonic", return_value=105.0):
+        assert not monitor.allow(BYWATER)
+    with patch("headwater_server.server.health.time.monotonic", return_value=111.0):
+        assert monitor.allow(BYWATER)
+        assert monitor.snapshot()[BYWATER].state is CircuitState.HALF_OPEN
+        assert not monitor.allow(BYWATER)  # trial already in flight
+        monitor.record_failure(BYWATER)
+        assert monitor.snapshot()[BYWATER].state is CircuitState.OPEN
+    with patch("headwater_server.server.health.time.monotonic", return_value=122.0):
+        assert monitor.allow(BYWATER)
+        monitor.record_success(BYWATER)
+    assert monitor.snapshot()[BYWATER].state is CircuitState.CLOSED
+    assert monitor.allow(BYWATER)
+
+
+def test_probe_all_caches_up_and_latency_and_feeds_breaker():
+    """probe_all() pings every backend concurrently; results land in the snapshot and the breaker."""
+    monitor, upstream = _monitor(failure_threshold=1)
+
+    def client_for(url: str) -> MagicMock:
+        client = MagicMock()
+        if url == BYWATER:
+            client.get = AsyncMock(return_value=MagicMock(status_code=200))
+        else:
+            client.get = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        return client
+
+    upstream.client.side_effect = client_for
+    asyncio.run(monitor.probe_all())
+
+    snapshot = monitor.snapshot()
+    assert snapshot[BYWATER].up
+    assert snapshot[BYWATER].latency_ms is not None
+    assert not snapshot[DEEPWATER].up
+    assert snapshot[DEEPWATER].state is CircuitState.OPEN
+
+
+def test_successful_probe_closes_open_circuit():
+    """An open circuit closes as soon as the background probe sees the backend answer /ping."""
+    monitor, upstream = _monitor(failure_threshold=1, cooldown=3600.0)
+    monitor.record_failure(BYWATER)
+    assert not monitor.allow(BYWATER)
+
+    upstream.client.return_value.get = AsyncMock(return_value=MagicMock(status_code=200))
+    asyncio.run(monitor.probe(BYWATER))
+    assert monitor.allow(BYWATER)
+
+
+def test_start_and_stop_run_background_prober():
+    """start() launches the probe loop; stop() cancels it cleanly."""
+    monitor, upstream = _monitor(interval=0.01)
+    upstream.client.return_value.get = AsyncMock(return_value=MagicMock(status_code=200))
+
+    async def run() -> None:
+        monitor.start()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+    asyncio.run(run())
+    assert upstream.client.return_value.get.await_count >= 2
+    assert monitor._task is None
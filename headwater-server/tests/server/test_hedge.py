@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from headwater_server.server.hedge import Hedger, race
+from headwater_server.server.routing_config import HedgeSettings
+
+
+def test_delay_is_percentile_of_recent_latency_after_min_samples():
+    """No hedge delay until min_samples are seen; then the configured percentile of the window."""
+    hedger = Hedger(HedgeSettings(percentile=90, min_samples=10, window=100, routes=["embeddings"]))
+    for ms in range(1, 10):
+        hedger.observe("embeddings", ms)
+    assert hedger.delay("embeddings") is None
+    for ms in range(10, 101):
+        hedger.observe("embeddings", ms)
+    assert hedger.delay("embeddings") == pytest.approx(0.091)
+    assert hedger.enabled("embeddings")
+    assert not hedger.enabled("conduit")
+
+
+def test_budget_limits_hedges_to_fraction_of_requests():
+    """Each request deposits `budget` tokens and each hedge spends one."""
+    hedger = Hedger(HedgeSettings(budget=0.25, routes=["embeddings"]))
+    spent = 0
+    for _ in range(100):
+        hedger.deposit()
+        spent += hedger.try_spend()
+    assert spent == 25
+
+
+async def _after(delay: float, value: str) -> str:
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _fail_after(delay: float, exc: Exception) -> str:
+    await asyncio.sleep(delay)
+    raise exc
+
+
+def _discard(seen: list):
+    async def discard(value: str) -> None:
+        seen.append(value)
+    return discard
+
+
+def test_fast_primary_never_starts_hedge():
+    """A primary that answers within the delay is returned without a hedge."""
+    started = []
+
+    async def run() -> tuple[str, bool]:
+        return await race(_after(0.001, "primary"), lambda: started.append(1), 0.05, _discard([]))
+
+    assert asyncio.run(run()) == ("primary", False)
+    assert started == []
+
+
+def test_slow_primary_loses_to_hedge_and_is_cancelled():
+    """The hedge's reply wins; the primary is cancelled in the background."""
+    discarded: list[str] = []
+
+    async def run() -> tuple[str, bool]:
+        result = await race(_after(1.0, "primary"), lambda: _after(0.01, "hedge"), 0.01, _discard(discarded))
+        await asyncio.sleep(0.01)
+        return result
+
+    assert asyncio.run(run()) == ("hedge", True)
+    assert discarded == []  # the primary never produced a result to release
+
+
+def test_declined_hedge_waits_for_primary():
+    """When start_hedge declines (budget or no candidate), the primary's result is used."""
+    async def run() -> tuple[str, bool]:
+        return await race(_after(0.03, "primary"), lambda: None, 0.01, _discard([]))
+
+    assert asyncio.run(run()) == ("primary", False)
+
+
+def test_failed_primary_falls_back_to_hedge_and_both_failing_raises_primary_error():
+    """One failure waits for the other attempt; if both fail the primary's error is raised."""
+    async def one_fails() -> tuple[str, bool]:
+        return await race(
+            _fail_after(0.02, ConnectionError("primary")), lambda: _after(0.05, "hedge"), 0.01, _discard([])
+        )
+
+    async def both_fail() -> tuple[str, bool]:
+        return await race(
+            _fail_after(0.02, ConnectionError("primary")),
+            lambda: _fail_after(0.01, ConnectionError("hedge")),
+            0.01,
+            _discard([]),
+        )
+
+    assert asyncio.run(one_fails()) == ("hedge", True)
+    with pytest.raises(ConnectionError, match="primary"):
+        asyncio.run(both_fail())
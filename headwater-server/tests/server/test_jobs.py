@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from headwater_api.classes import JobKind, JobState
+from headwater_server.server.jobs import JobRunner, JobSpec, JobStore
+
+
+class _Numbers(BaseModel):
+    numbers: list[int]
+
+
+def _spec(calls: list[list[int]], fail_on: int | None = None, delay: float = 0.0) -> JobSpec:
+    async def run(request: _Numbers) -> list[int]:
+        calls.append(list(request.numbers))
+        await asyncio.sleep(delay)
+        if fail_on is not None and fail_on in request.numbers:
+            raise RuntimeError(f"bad item {fail_on}")
+        return [n * 2 for n in request.numbers]
+
+    return JobSpec(
+        request_model=_Numbers,
+        items_fields=("numbers",),
+        chunk_size=lambda request: 3,
+        run=run,
+        summarize=lambda results: {"sum": sum(results)},
+    )
+
+
+async def _wait_finished(runner: JobRunner, job_id: str) -> None:
+    for _ in range(200):
+        status = await runner.status(job_id)
+        if status.state.finished:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_job_runs_in_chunks_and_pages_results(tmp_path: Path):
+    """A submitted job returns at once, runs chunk by chunk, and its results page in order."""
+    calls: list[list[int]] = []
+    runner = JobRunner({JobKind.CONDUIT_BATCH: _spec(calls)}, path=tmp_path / "jobs.sqlite", workers=1)
+
+    async def run():
+        await runner.start()
+        try:
+            submitted = await runner.submit(JobKind.CONDUIT_BATCH, _Numbers(numbers=list(range(7))))
+            assert submitted.state in (JobState.QUEUED, JobState.RUNNING)
+            assert submitted.total == 7
+            await _wait_finished(runner, submitted.job_id)
+            status = await runner.status(submitted.job_id)
+            first = await runner.results(submitted.job_id, 0, 5)
+            rest = await runner.results(submitted.job_id, first.next_offset, 5)
+            return status, first, rest
+        finally:
+            await runner.stop()
+
+    status, first, rest = asyncio.run(run())
+    assert calls == [[0, 1, 2], [3, 4, 5], [6]]
+    assert (status.state, status.completed, status.results_available) == (JobState.SUCCEEDED, 7, 7)
+    assert status.summary == {"sum": 42}
+    assert first.results == [0, 2, 4, 6, 8] and first.next_offset == 5
+    assert rest.results == [10, 12] and rest.next_offset is None
+
+
+def test_failing_chunk_fails_job_but_keeps_committed_results(tmp_path: Path):
+    """An exception in one chunk marks the job failed; earlier chunks stay readable."""
+    runner = JobRunner({JobKind.CONDUIT_BATCH: _spec([], fail_on=4)}, path=tmp_path / "jobs.sqlite", workers=1)
+
+    async def run():
+        await runner.start()
+        try:
+            job = await runner.submit(JobKind.CONDUIT_BATCH, _Numbers(numbers=list(range(7))))
+            await _wait_finished(runner, job.job_id)
+            return await runner.status(job.job_id), await runner.results(job.job_id, 0, 100)
+        finally:
+            await runner.stop()
+
+    status, page = asyncio.run(run())
+    assert status.state == JobState.FAILED
+    assert "bad item 4" in status.error
+    assert status.completed == 3
+    assert page.results == [0, 2, 4]
+
+
+def test_cancel_stops_running_job(tmp_path: Path):
+    """DELETE-style cancel interrupts the running chunk and no further chunks run."""
+    calls: list[list[int]] = []
+    runner = JobRunner({JobKind.CONDUIT_BATCH: _spec(calls, delay=0.2)}, path=tmp_path / "jobs.sqlite", workers=1)
+
+    async def run():
+        await runner.start()
+        try:
+            job = await runner.submit(JobKind.CONDUIT_BATCH, _Numbers(numbers=list(range(9))))
+            while not calls:
+                await asyncio.sleep(0.01)
+            cancelled = await runner.cancel(job.job_id)
+            await asyncio.sleep(0.3)
+            return cancelled
+        finally:
+            await runner.stop()
+
+    cancelled = asyncio.run(run())
+    assert cancelled.state == JobState.CANCELLED
+    assert calls == [[0, 1, 2]]
+
+
+def test_interrupted_job_resumes_from_last_committed_chunk(tmp_path: Path):
+    """A job left running by a shutdown is requeued on start and skips chunks already stored."""
+    path = tmp_path / "jobs.sqlite"
+    store = JobStore(path)
+    job_id = store.create(JobKind.CONDUIT_BATCH, _Numbers(numbers=list(range(6))).model_dump_json(), 6)
+    store.claim()
+    store.append(job_id, 3, [0, 2, 4])
+    store.close()
+
+    calls: list[list[int]] = []
+    runner = JobRunner({JobKind.CONDUIT_BATCH: _spec(calls)}, path=path, workers=1)
+
+    async def run():
+        await runner.start()
+        try:
+            await _wait_finished(runner, job_id)
+            return await runner.status(job_id), await runner.results(job_id, 0, 100)
+        finally:
+            await runner.stop()
+
+    status, page = asyncio.run(run())
+    assert calls == [[3, 4, 5]]
+    assert status.state == JobState.SUCCEEDED
+    assert page.results == [0, 2, 4, 6, 8, 10]
@@ -214,3 +214,32 @@ def test_metrics_carry_service_name_label():
     assert "bywater" in service_names_found, (
         f"Expected service_name='bywater' to be present, but got: {service_names_found}"
     )
+
+
+def test_router_exports_backend_in_flight_gauge():
+    """headwater_router_backend_in_flight reports the balancer's open requests per backend."""
+    import yaml
+    from pathlib import Path
+    from fastapi.testclient import TestClient
+    from headwater_server.server.router import HeadwaterRouter
+    from headwater_server.server.metrics import register_router_metrics
+
+    config = {
+        "backends": {"bywater": "http://localhost:8080", "backwater": "http://localhost:8082"},
+        "routes": {"conduit": ["bywater", "backwater"]},
+        "heavy_models": [],
+    }
+    tmp = Path("/tmp/test_routes_in_flight.yaml")
+    tmp.write_text(yaml.dump(config))
+
+    router = HeadwaterRouter(config_path=tmp)
+    register_router_metrics(router.app, router._name, router._config, balancer=router._balancer)
+    router._balancer.acquire("http://localhost:8082")
+    client = TestClient(router.app)
+
+    text = client.get("/metrics").text
+    lines = [l for l in text.splitlines() if "headwater_router_backend_in_flight" in l and not l.startswith("#")]
+    backwater = next(l for l in lines if 'backend_name="backwater"' in l)
+    bywater = next(l for l in lines if 'backend_name="bywater"' in l)
+    assert backwater.strip().endswith("1.0")
+    assert bywater.strip().endswith("0.0")
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+
+from headwater_server.server.balancer import LeastOutstandingBalancer
+from headwater_server.server.residency import ResidencyMap
+from headwater_server.server.routing_config import RouterConfig, choose_backend
+
+BYWATER = "http://172.16.0.4:8080"
+DEEPWATER = "http://172.16.0.2:8080"
+STILLWATER = "http://172.16.0.3:8080"
+
+
+def _config() -> RouterConfig:
+    return RouterConfig(
+        backends={"bywater": BYWATER, "deepwater": DEEPWATER, "stillwater": STILLWATER},
+        routes={"conduit": "bywater", "siphon": "stillwater"},
+        heavy_models=[],
+        pools={"conduit": ["bywater", "deepwater"]},
+    )
+
+
+def _gpu(models: list[tuple[str, int]], vram_free_mb: int = 1000, error: str | None = None) -> dict:
+    return {
+        "server_name": "x",
+        "gpus": [{
+            "index": 0, "name": "RTX", "vram_total_mb": 24000, "vram_used_mb": 24000 - vram_free_mb,
+            "vram_free_mb": vram_free_mb, "utilization_pct": 0,
+        }],
+        "ollama_loaded_models": [
+            {"name": name, "size_mb": size, "vram_mb": size, "cpu_offload_mb": 0, "vram_pct": 100, "cpu_pct": 0}
+            for name, size in models
+        ],
+        "error": error,
+    }
+
+
+def _residency(payloads: dict[str, dict | Exception]) -> ResidencyMap:
+    upstream = MagicMock()
+
+    def client_for(url: str) -> MagicMock:
+        client = MagicMock()
+        payload = payloads[url]
+        if isinstance(payload, Exception):
+            client.get = AsyncMock(side_effect=payload)
+        else:
+            client.get = AsyncMock(return_value=httpx.Response(200, json=payload, request=httpx.Request("GET", url)))
+        return client
+
+    upstream.client.side_effect = client_for
+    residency = ResidencyMap(_config(), upstream)
+    asyncio.run(residency.refresh_all())
+    return residency
+
+
+def test_only_pooled_backends_are_polled():
+    """Backends outside any multi-backend pool are never asked for /gpu."""
+    residency = ResidencyMap(_config(), MagicMock())
+    assert residency._urls == [BYWATER, DEEPWATER]
+
+
+def test_refresh_records_resident_models_with_normalized_tags():
+    """Loaded models are read from /gpu; an untagged request name matches `:latest`."""
+    residency = _residency({BYWATER: _gpu([("llama3.2:latest", 2000)]), DEEPWATER: _gpu([])})
+    assert residency.is_resident(BYWATER, "llama3.2")
+    assert not residency.is_resident(DEEPWATER, "llama3.2")
+    assert residency.snapshot() == {BYWATER: ["llama3.2:latest"], DEEPWATER: []}
+
+
+def test_failed_refresh_or_ollama_error_reads_as_unknown():
+    """An unreachable backend or an Ollama error leaves the backend unknown, not idle."""
+    residency = _residency({
+        BYWATER: httpx.ConnectError("refused"),
+        DEEPWATER: _gpu([], error="ollama: connection refused"),
+    })
+    assert not residency.known(BYWATER)
+    assert not residency.known(DEEPWATER)
+
+
+def test_would_evict_uses_known_size_and_free_vram():
+    """A loaded node evicts unless the model's known size fits in its free VRAM; an idle node never evicts."""
+    residency = _residency({
+        BYWATER: _gpu([("qwen3:14b", 9000)], vram_free_mb=4000),
+        DEEPWATER: _gpu([("gemma3:4b", 3000)], vram_free_mb=12000),
+    })
+    assert not residency.would_evict(BYWATER, "gemma3:4b")    # 3000 MB fits in 4000 MB
+    assert residency.would_evict(BYWATER, "qwen3:32b")        # size unknown, node busy
+    assert not residency.would_evict(DEEPWATER, "qwen3:14b")  # 9000 MB fits in 12000 MB
+    assert residency.would_evict(DEEPWATER, "mistral:7b")
+
+
+def test_choose_backend_prefers_resident_model_over_less_loaded_backend():
+    """The backend holding the model wins even when another pool member is idle."""
+    residency = _residency({BYWATER: _gpu([("qwen3:14b", 9000)], vram_free_mb=0), DEEPWATER: _gpu([])})
+    balancer = LeastOutstandingBalancer()
+    balancer.acquire(BYWATER)
+    url, reason = choose_backend("conduit", "qwen3:14b", _config(), balancer, residency)
+    assert (url, reason) == (BYWATER, "model_resident")
+
+
+def test_choose_backend_sends_cold_model_where_nothing_is_evicted():
+    """A cold model avoids the node whose resident model it would push out."""
+    residency = _residency({BYWATER: _gpu([("qwen3:14b", 9000)], vram_free_mb=0), DEEPWATER: _gpu([])})
+    url, reason = choose_backend("conduit", "mistral:7b", _config(), LeastOutstandingBalancer(), residency)
+    assert (url, reason) == (DEEPWATER, "cold_no_evict")
+
+
+def test_choose_backend_reasons_without_residency_data():
+    """No model or no data falls back to least-outstanding; single-backend routes report primary."""
+    balancer = LeastOutstandingBalancer()
+    assert choose_backend("conduit", None, _config(), balancer)[1] == "least_outstanding"
+    assert choose_backend("siphon", "x", _config(), balancer) == (STILLWATER, "primary")
@@ -52,6 +52,20 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
 
+def _streaming_client(mock_response: MagicMock | None = None, side_effect: Exception | None = None) -> AsyncMock:
+    """AsyncClient stand-in for the proxy's build_request() + send(stream=True) path."""
+    if mock_response is not None:
+        async def aiter_raw():
+            yield mock_response.content
+
+        mock_response.aiter_raw = aiter_raw
+        mock_response.aclose = AsyncMock()
+    client = AsyncMock()
+    client.build_request = MagicMock(side_effect=lambda **kwargs: kwargs)
+    client.send = AsyncMock(return_value=mock_response, side_effect=side_effect)
+    return client
+
+
 def test_proxy_forwards_x_request_id_to_backend(router_client: TestClient):
     """AC-11: Every proxied request includes X-Request-ID on the upstream call."""
     mock_response = MagicMock(spec=httpx.Response)
@@ -59,19 +73,16 @@ def test_proxy_forwards_x_request_id_to_backend(router_client: TestClient):
     mock_response.content = b'{"result": "ok"}'
     mock_response.headers = {}
 
-    with patch("headwater_server.server.router.httpx") as mock_httpx:
-        mock_async_client = AsyncMock()
-        mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
-        mock_async_client.__aexit__ = AsyncMock(return_value=None)
-        mock_async_client.request = AsyncMock(return_value=mock_response)
-        mock_httpx.AsyncClient.return_value = mock_async_client
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(mock_response)
+        mock_client_cls.return_value = mock_async_client
 
         router_client.post(
             "/conduit/generate",
             json={"model": "llama3.2:3b", "prompt": "hello"},
         )
 
-    call_kwargs = mock_async_client.request.call_args.kwargs
+    call_kwargs = mock_async_client.build_request.call_args.kwargs
     assert "x-request-id" in {k.lower() for k in call_kwargs["headers"].keys()}
 
 
@@ -87,12 +98,9 @@ def test_proxy_propagates_422_status_and_body_verbatim(router_client: TestClient
         "x-custom-header": "keep-this",
     }
 
-    with patch("headwater_server.server.router.httpx") as mock_httpx:
-        mock_async_client = AsyncMock()
-        mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
-        mock_async_client.__aexit__ = AsyncMock(return_value=None)
-        mock_async_client.request = AsyncMock(return_value=mock_response)
-        mock_httpx.AsyncClient.return_value = mock_async_client
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(mock_response)
+        mock_client_cls.return_value = mock_async_client
 
         response = router_client.post(
             "/conduit/generate",
@@ -107,16 +115,11 @@ def test_proxy_propagates_422_status_and_body_verbatim(router_client: TestClient
 
 def test_proxy_returns_503_with_backend_unavailable_when_unreachable(router_client: TestClient):
     """AC-8: Backend ConnectError → HTTP 503 with error_type='backend_unavailable'."""
-    with patch("headwater_server.server.router.httpx") as mock_httpx:
-        mock_httpx.ConnectError = httpx.ConnectError
-        mock_httpx.TimeoutException = httpx.TimeoutException
-        mock_async_client = AsyncMock()
-        mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
-        mock_async_client.__aexit__ = AsyncMock(return_value=None)
-        mock_async_client.request = AsyncMock(
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(
             side_effect=httpx.ConnectError("Connection refused")
         )
-        mock_httpx.AsyncClient.return_value = mock_async_client
+        mock_client_cls.return_value = mock_async_client
 
         response = router_client.post(
             "/conduit/generate",
@@ -129,6 +132,615 @@ def test_proxy_returns_503_with_backend_unavailable_when_unreachable(router_clie
     assert "172.16.0.4" in body["message"] or "172.16.0.4" in str(body.get("context", ""))
 
 
+def test_proxy_reuses_one_pooled_client_per_backend(router_client: TestClient):
+    """Repeated requests to the same backend share one long-lived AsyncClient."""
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b'{}'
+    mock_response.headers = {}
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(mock_response)
+        mock_client_cls.return_value = mock_async_client
+
+        for _ in range(3):
+            router_client.post("/conduit/generate", json={"model": "llama3.2:3b"})
+
+    assert mock_client_cls.call_count == 1
+    assert mock_async_client.send.call_count == 3
+    assert mock_async_client.build_request.call_args.kwargs["url"] == "/conduit/generate"
+
+
+def test_proxy_streams_request_body_for_non_model_routes(router_client: TestClient):
+    """Services routed without the model (e.g. siphon) stream the request body upstream."""
+    from headwater_server.server.router import _StreamedBody
+
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b'{}'
+    mock_response.headers = {}
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(mock_response)
+        mock_client_cls.return_value = mock_async_client
+
+        router_client.post("/siphon/process", json={"source": "https://example.com"})
+        streamed = mock_async_client.build_request.call_args.kwargs["content"]
+
+        router_client.post("/conduit/generate", json={"model": "llama3.2:3b"})
+        buffered = mock_async_client.build_request.call_args.kwargs["content"]
+
+    assert isinstance(streamed, _StreamedBody)
+    assert isinstance(buffered, bytes)
+    assert mock_async_client.send.call_args.kwargs["stream"] is True
+
+
+def test_proxy_relays_response_chunks_in_order(router_client: TestClient):
+    """Upstream body chunks (e.g. SSE events) are relayed as they arrive and the upstream is closed."""
+    events = [b"event: message_start\ndata: {}\n\n", b"event: message_stop\ndata: {}\n\n"]
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b""
+    mock_response.headers = {"content-type": "text/event-stream"}
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(mock_response)
+
+        async def aiter_raw():
+            for event in events:
+                yield event
+
+        mock_response.aiter_raw = aiter_raw
+        mock_client_cls.return_value = mock_async_client
+
+        with router_client.stream("POST", "/conduit/generate", json={"stream": True}) as response:
+            received = list(response.iter_bytes())
+
+    assert b"".join(received) == b"".join(events)
+    assert response.headers["content-type"].startswith("text/event-stream")
+    mock_response.aclose.assert_awaited_once()
+
+
+def test_proxy_retries_pool_member_before_fallbacks_and_releases_in_flight(tmp_path: Path):
+    """A pooled route tries its other pool members on ConnectError; in-flight counts return to zero."""
+    from headwater_server.server.router import HeadwaterRouter
+
+    config = {**VALID_CONFIG, "routes": {**VALID_CONFIG["routes"], "siphon": ["deepwater", "bywater"]}}
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+    client = TestClient(router.app)
+
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b'{}'
+    mock_response.headers = {}
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(mock_response)
+        mock_async_client.send = AsyncMock(
+            side_effect=[httpx.ConnectError("Connection refused"), mock_response]
+        )
+        mock_client_cls.return_value = mock_async_client
+
+        response = client.post("/siphon/process", content=b"{}")
+
+    assert response.status_code == 200
+    assert response.headers["X-Headwater-Routed-Via"] == "bywater"
+    assert response.headers["X-Headwater-Primary-Backend"] == "deepwater"
+    assert all(n == 0 for n in router._balancer.snapshot().values())
+
+
+def test_proxy_skips_backend_with_open_circuit(tmp_path: Path):
+    """A backend whose circuit is open is skipped without a connect attempt; all-open → immediate 503."""
+    from headwater_server.server.router import HeadwaterRouter
+
+    config = {**VALID_CONFIG, "routes": {**VALID_CONFIG["routes"], "siphon": ["deepwater", "bywater"]}}
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+    client = TestClient(router.app)
+    for _ in range(router._config.health.failure_threshold):
+        router._health.record_failure("http://172.16.0.2:8080")
+
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b'{}'
+    mock_response.headers = {}
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(mock_response)
+        mock_client_cls.return_value = mock_async_client
+
+        response = client.post("/siphon/process", content=b"{}")
+        assert response.status_code == 200
+        assert response.headers["X-Headwater-Routed-Via"] == "bywater"
+        assert mock_async_client.send.await_count == 1
+
+        for _ in range(router._config.health.failure_threshold):
+            router._health.record_failure("http://172.16.0.4:8080")
+        response = client.post("/siphon/process", content=b"{}")
+
+    assert response.status_code == 503
+    assert response.json()["error_type"] == "backend_unavailable"
+    assert mock_async_client.send.await_count == 1
+
+
+@pytest.mark.parametrize(
+    "path,body",
+    [
+        ("/v1/chat/completions", {"model": "qwen3:14b", "messages": [{"role": "user", "content": "hi"}]}),
+        ("/v1/messages", {"model": "qwen3:14b", "max_tokens": 8, "messages": [{"role": "user", "content": "hi"}]}),
+        ("/v1/responses", {"model": "qwen3:14b", "input": "hi"}),
+    ],
+)
+def test_v1_generation_requests_prefer_backend_with_model_resident(tmp_path: Path, path: str, body: dict):
+    """OpenAI/Anthropic-compatible requests are routed by their model to the pool member that has it loaded."""
+    from headwater_server.server.residency import BackendResidency
+    from headwater_server.server.router import HeadwaterRouter
+    import time
+
+    config = {**VALID_CONFIG, "routes": {**VALID_CONFIG["routes"], "v1": ["bywater", "deepwater"]}}
+    config_file = tmp_path / "routes.yaml"
+    config_file.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=config_file)
+    router._residency._state["http://172.16.0.2:8080"] = BackendResidency(
+        models={"qwen3:14b": 9000}, vram_free_mb=0, refreshed_at=time.monotonic()
+    )
+    client = TestClient(router.app)
+
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b'{}'
+    mock_response.headers = {}
+    used: list[str] = []
+
+    def backend_client(base_url: str, **kwargs) -> AsyncMock:
+        used.append(base_url)
+        return _streaming_client(mock_response)
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient", side_effect=backend_client):
+        response = client.post(path, json=body)
+
+    assert response.headers["X-Headwater-Route-Reason"] == "model_resident"
+    assert used == ["http://172.16.0.2:8080"]
+
+
+def test_proxy_reports_route_reason_header(tmp_path: Path):
+    """X-Headwater-Route-Reason says why the backend was chosen: resident model, or failover."""
+    from headwater_server.server.residency import BackendResidency
+    from headwater_server.server.router import HeadwaterRouter
+    import time
+
+    config = {**VALID_CONFIG, "routes": {**VALID_CONFIG["routes"], "conduit": ["bywater", "deepwater"]}}
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+    router._residency._state["http://172.16.0.2:8080"] = BackendResidency(
+        models={"qwen3:14b": 9000}, vram_free_mb=0, refreshed_at=time.monotonic()
+    )
+    client = TestClient(router.app)
+
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b'{}'
+    mock_response.headers = {}
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(mock_response)
+        mock_client_cls.return_value = mock_async_client
+
+        response = client.post("/conduit/generate", json={"params": {"model": "qwen3:14b"}})
+        assert response.headers["X-Headwater-Route-Reason"] == "model_resident"
+        assert mock_async_client.build_request.call_args.kwargs["url"] == "/conduit/generate"
+
+        mock_async_client.send = AsyncMock(side_effect=[httpx.ConnectError("refused"), mock_response])
+        response = client.post("/conduit/generate", json={"params": {"model": "qwen3:14b"}})
+
+    assert response.headers["X-Headwater-Route-Reason"] == "failover"
+    assert response.headers["X-Headwater-Routed-Via"] == "bywater"
+
+
+def test_routes_reload_swaps_config_and_keeps_old_on_error(tmp_path: Path):
+    """POST /routes/reload applies a valid routes.yaml; an invalid one is rejected and the old config stays."""
+    from headwater_server.server.router import HeadwaterRouter
+
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(VALID_CONFIG))
+    router = HeadwaterRouter(config_path=path)
+    client = TestClient(router.app)
+
+    path.write_text(yaml.dump({**VALID_CONFIG, "routes": {**VALID_CONFIG["routes"], "siphon": "bywater"}}))
+    response = client.post("/routes/reload")
+    assert response.status_code == 200
+    assert response.json()["routes"]["siphon"] == "bywater"
+    assert client.get("/routes/").json()["routes"]["siphon"] == "bywater"
+
+    path.write_text(yaml.dump({**VALID_CONFIG, "routes": {"siphon": "nonexistent_backend"}}))
+    response = client.post("/routes/reload")
+    assert response.status_code == 400
+    assert response.json()["error_type"] == "routing_error"
+    assert router._config.routes["siphon"] == "bywater"
+
+    path.write_text("backends: [unclosed")
+    assert client.post("/routes/reload").status_code == 400
+    assert router._config.routes["siphon"] == "bywater"
+
+
+def test_routes_yaml_change_is_picked_up_by_file_watch(tmp_path: Path):
+    """The lifespan watcher reloads routes.yaml when its mtime changes."""
+    import os
+    import time
+    from headwater_server.server.router import HeadwaterRouter
+
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(VALID_CONFIG))
+    router = HeadwaterRouter(config_path=path)
+
+    path.write_text(yaml.dump({**VALID_CONFIG, "heavy_models": ["qwq:latest"]}))
+    os.utime(path, (router._config_mtime + 5, router._config_mtime + 5))
+    with patch("headwater_server.server.router.CONFIG_WATCH_INTERVAL", 0.01):
+        with TestClient(router.app):
+            deadline = time.monotonic() + 2.0
+            while router._config.heavy_models != ["qwq:latest"] and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+    assert router._config.heavy_models == ["qwq:latest"]
+
+
+def test_file_watch_survives_bad_reloads_and_keeps_old_config(tmp_path: Path):
+    """A mis-shaped routes.yaml, or any unexpected reload error, leaves the old config and the watcher running."""
+    import os
+    import time
+    from headwater_server.server import router as router_module
+    from headwater_server.server.router import HeadwaterRouter
+
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(VALID_CONFIG))
+    router = HeadwaterRouter(config_path=path)
+    real_load = router_module.load_router_config
+    calls: list[str] = []
+
+    def load(config_path: Path):
+        calls.append(path.read_text())
+        if len(calls) == 2:
+            raise TypeError("unexpected")
+        return real_load(config_path)
+
+    def save(config: dict, mtime: float) -> None:
+        path.write_text(yaml.dump(config))
+        os.utime(path, (mtime, mtime))
+
+    def wait_for(condition) -> None:
+        deadline = time.monotonic() + 2.0
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    start = router._config_mtime
+    with patch("headwater_server.server.router.CONFIG_WATCH_INTERVAL", 0.01), patch(
+        "headwater_server.server.router.load_router_config", side_effect=load
+    ):
+        with TestClient(router.app):
+            save({**VALID_CONFIG, "admission": 5}, start + 5)
+            wait_for(lambda: len(calls) == 1)
+            save({**VALID_CONFIG, "heavy_models": ["llama3.1"]}, start + 10)
+            wait_for(lambda: len(calls) == 2)
+            assert router._config.heavy_models == VALID_CONFIG["heavy_models"]
+
+            save({**VALID_CONFIG, "heavy_models": ["qwq:latest"]}, start + 15)
+            wait_for(lambda: router._config.heavy_models == ["qwq:latest"])
+
+    assert len(calls) == 3
+    assert router._config.heavy_models == ["qwq:latest"]
+
+
+def test_proxy_coalesces_identical_requests_on_opted_in_route(tmp_path: Path):
+    """Identical in-flight requests to a `coalesce` route share one upstream call; others do not."""
+    import asyncio
+    from headwater_server.server.router import HeadwaterRouter
+
+    config = {**VALID_CONFIG, "coalesce": ["embeddings"]}
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b'{"embeddings": [[0.1]]}'
+    mock_response.headers = {"content-type": "application/json"}
+
+    async def slow_send(request, stream=False):
+        await asyncio.sleep(0.05)
+        return mock_response
+
+    async def fire(path: str, n: int) -> tuple[list[httpx.Response], int]:
+        transport = httpx.ASGITransport(app=router.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://router") as client:
+            with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+                mock_async_client = _streaming_client(mock_response)
+                mock_async_client.send = AsyncMock(side_effect=slow_send)
+                mock_client_cls.return_value = mock_async_client
+                responses = await asyncio.gather(
+                    *(client.post(path, content=b'{"batch": ["a"]}') for _ in range(n))
+                )
+            router._upstream._clients.clear()
+        return responses, mock_async_client.send.await_count
+
+    responses, sends = asyncio.run(fire("/conduit/embeddings/quick", 4))
+    assert sends == 1
+    assert all(r.content == b'{"embeddings": [[0.1]]}' for r in responses)
+    assert sum(r.headers.get("X-Headwater-Coalesced") == "true" for r in responses) == 3
+    assert all(n == 0 for n in router._balancer.snapshot().values())
+
+    _, sends = asyncio.run(fire("/siphon/process", 3))
+    assert sends == 3
+
+
+def test_proxy_serves_repeat_from_cache_and_honours_bypass(tmp_path: Path):
+    """A repeat of a cached request never reaches the backend; an opt-out header goes upstream."""
+    from headwater_server.server.router import HeadwaterRouter
+
+    config = {**VALID_CONFIG, "cache": {"routes": {"conduit/embeddings": 3600}}}
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+    client = TestClient(router.app)
+
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b'{"embeddings": [[0.1]]}'
+    mock_response.headers = {"content-type": "application/json"}
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(mock_response)
+        mock_client_cls.return_value = mock_async_client
+
+        first = client.post("/conduit/embeddings/quick", content=b'{"batch": ["a"]}')
+        second = client.post("/conduit/embeddings/quick", content=b'{"batch": ["a"]}')
+        other = client.post("/conduit/embeddings/quick", content=b'{"batch": ["b"]}')
+        bypass = client.post(
+            "/conduit/embeddings/quick", content=b'{"batch": ["a"]}', headers={"Cache-Control": "no-cache"}
+        )
+
+    assert first.headers["X-Headwater-Cache"] == "miss"
+    assert second.headers["X-Headwater-Cache"] == "hit"
+    assert second.headers["X-Headwater-Route-Reason"] == "cache"
+    assert second.content == first.content
+    assert other.headers["X-Headwater-Cache"] == "miss"
+    assert bypass.headers["X-Headwater-Cache"] == "bypass"
+    assert mock_async_client.send.await_count == 3
+
+
+def test_proxy_hedges_slow_primary_to_second_pool_member(tmp_path: Path):
+    """On a hedged route, a primary slower than the latency percentile is raced against another pool member."""
+    import asyncio
+    from headwater_server.server.router import HeadwaterRouter
+
+    config = {
+        **VALID_CONFIG,
+        "routes": {**VALID_CONFIG["routes"], "embeddings": ["backwater", "bywater"]},
+        "hedge": {"routes": ["embeddings"], "budget": 1, "min_samples": 1},
+    }
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+    router._hedger.observe("embeddings", 5.0)
+    for _ in range(3):
+        router._hedger.deposit()
+    client = TestClient(router.app)
+
+    def backend_response(body: bytes) -> MagicMock:
+        response = MagicMock(spec=httpx.Response)
+        response.status_code = 200
+        response.headers = {}
+
+        async def aiter_raw():
+            yield body
+
+        response.aiter_raw = aiter_raw
+        response.aclose = AsyncMock()
+        return response
+
+    sent: list = []
+
+    async def send(request, stream=False):
+        sent.append(request)
+        if len(sent) == 1:
+            await asyncio.sleep(1.0)  # primary (backwater) is stuck
+            return backend_response(b"slow")
+        return backend_response(b"fast")
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client()
+        mock_async_client.send = AsyncMock(side_effect=send)
+        mock_client_cls.return_value = mock_async_client
+        response = client.post("/conduit/embeddings/quick", content=b'{"batch": ["a"]}')
+
+    assert response.content == b"fast"
+    assert response.headers["X-Headwater-Route-Reason"] == "hedge"
+    assert len(sent) == 2
+
+
+def test_proxy_queues_over_admission_limit_and_429s_when_queue_full(tmp_path: Path):
+    """Past a route's concurrency cap requests queue; past queue_size they get 429 with Retry-After."""
+    import asyncio
+    from headwater_server.server.router import HeadwaterRouter
+
+    config = {**VALID_CONFIG, "admission": {"routes": {"siphon": 1}, "queue_size": 1, "retry_after": 3}}
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b"ok"
+    mock_response.headers = {}
+
+    async def slow_send(request, stream=False):
+        await asyncio.sleep(0.05)
+        return mock_response
+
+    async def fire() -> tuple[list[httpx.Response], int]:
+        transport = httpx.ASGITransport(app=router.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://router") as client:
+            with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+                mock_async_client = _streaming_client(mock_response)
+                mock_async_client.send = AsyncMock(side_effect=slow_send)
+                mock_client_cls.return_value = mock_async_client
+                responses = await asyncio.gather(*(client.get("/siphon/status") for _ in range(3)))
+        return responses, mock_async_client.send.await_count
+
+    responses, sends = asyncio.run(fire())
+    statuses = sorted(r.status_code for r in responses)
+    assert statuses == [200, 200, 429]
+    rejected = next(r for r in responses if r.status_code == 429)
+    assert rejected.headers["Retry-After"] == "3"
+    assert rejected.json()["error_type"] == "overloaded"
+    assert sends == 2
+    assert router._admission.snapshot()["route:siphon"]["in_flight"] == 0
+
+
+def test_backend_cap_holds_for_requests_that_fail_over_to_it(tmp_path: Path):
+    """Admission slots are taken on the backend actually used: failover traffic respects the fallback's cap."""
+    import asyncio
+    from headwater_server.server.router import HeadwaterRouter
+
+    config = {
+        **VALID_CONFIG,
+        "routes": {**VALID_CONFIG["routes"], "siphon": ["deepwater", "bywater"]},
+        "admission": {"backends": {"bywater": 1}, "queue_size": 1, "retry_after": 3},
+    }
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b"ok"
+    mock_response.headers = {}
+    in_flight = 0
+    peak = 0
+
+    def backend_client(base_url: str, **kwargs) -> AsyncMock:
+        client = _streaming_client(mock_response)
+
+        async def send(request, stream=False):
+            nonlocal in_flight, peak
+            if base_url == VALID_CONFIG["backends"]["deepwater"]:
+                raise httpx.ConnectError("Connection refused")
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return mock_response
+
+        client.send = AsyncMock(side_effect=send)
+        return client
+
+    async def fire() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=router.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://router") as client:
+            with patch("headwater_server.server.upstream.httpx.AsyncClient", side_effect=backend_client):
+                return await asyncio.gather(*(client.get("/siphon/status") for _ in range(3)))
+
+    responses = asyncio.run(fire())
+    assert sorted(r.status_code for r in responses) == [200, 200, 429]
+    assert all(r.headers["X-Headwater-Routed-Via"] == "bywater" for r in responses if r.status_code == 200)
+    assert peak == 1
+    assert router._admission.snapshot()["backend:bywater"]["in_flight"] == 0
+    assert all(n == 0 for n in router._balancer.snapshot().values())
+
+
+def test_backend_admission_rejection_gives_back_half_open_trial(tmp_path: Path):
+    """A request 429'd in a recovering backend's queue returns its half-open trial instead of stranding it."""
+    import asyncio
+    import time
+    from headwater_server.server.router import HeadwaterRouter
+
+    config = {**VALID_CONFIG, "admission": {"backends": {"deepwater": 1}, "queue_size": 1, "queue_timeout": 0.01}}
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+    recovering = VALID_CONFIG["backends"]["deepwater"]
+    for _ in range(router._config.health.failure_threshold):
+        router._health.record_failure(recovering)
+    router._health._get(recovering).opened_at = time.monotonic() - router._config.health.cooldown - 1
+
+    async def fire() -> httpx.Response:
+        holder = await router._admission.acquire(None, recovering, "interactive")  # the backend's only slot
+        try:
+            transport = httpx.ASGITransport(app=router.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://router") as client:
+                return await client.get("/siphon/status")
+        finally:
+            holder.release()
+
+    response = asyncio.run(fire())
+
+    assert response.status_code == 429
+    assert not router._health._get(recovering).trial_in_flight
+    assert router._health.allow(recovering)
+
+
+def test_jobs_lookup_finds_owning_backend_and_remembers_it(router_client: TestClient):
+    """GET /jobs/{id} asks every backend, relays the owner's answer, then goes straight to the owner."""
+    owner = VALID_CONFIG["backends"]["deepwater"]
+    asked: list[str] = []
+
+    def make_client(base_url: str, **kwargs) -> AsyncMock:
+        async def request(method, url, **kw):
+            asked.append(base_url)
+            if base_url == owner and url.startswith("/jobs/abc"):
+                return httpx.Response(200, json={"job_id": "abc", "state": "running"})
+            return httpx.Response(404, json={"error_type": "job_not_found"})
+
+        client = AsyncMock()
+        client.request = AsyncMock(side_effect=request)
+        return client
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient", side_effect=make_client):
+        first = router_client.get("/jobs/abc")
+        asked_first = sorted(asked)
+        asked.clear()
+        second = router_client.get("/jobs/abc/results?offset=10")
+        missing = router_client.delete("/jobs/nope")
+
+    assert first.status_code == 200
+    assert first.json()["state"] == "running"
+    assert asked_first == sorted(VALID_CONFIG["backends"].values())
+    assert second.status_code == 200
+    assert asked[0] == owner
+    assert missing.status_code == 404
+    assert missing.json()["error_type"] == "job_not_found"
+
+
+def test_jobs_lookup_settles_half_open_trial(tmp_path: Path):
+    """A /jobs lookup that takes a backend's half-open trial records its outcome, so the circuit closes."""
+    import time
+    from headwater_server.server.router import HeadwaterRouter
+
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(VALID_CONFIG))
+    router = HeadwaterRouter(config_path=path)
+    client = TestClient(router.app)
+    recovering = VALID_CONFIG["backends"]["deepwater"]
+    for _ in range(router._config.health.failure_threshold):
+        router._health.record_failure(recovering)
+    router._health._get(recovering).opened_at = time.monotonic() - router._config.health.cooldown - 1
+
+    def make_client(base_url: str, **kwargs) -> AsyncMock:
+        client = AsyncMock()
+        client.request = AsyncMock(return_value=httpx.Response(404, json={"error_type": "job_not_found"}))
+        return client
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient", side_effect=make_client):
+        response = client.get("/jobs/abc")
+
+    assert response.status_code == 404
+    assert router._health.is_closed(recovering)
+    assert router._health.allow(recovering)
+
+
 def test_router_app_module_level_app_is_importable():
     """router.py exposes a module-level `app` for uvicorn."""
     from headwater_server.server import router as router_module
@@ -153,12 +765,9 @@ def test_proxy_request_log_includes_route_field(router_client: TestClient):
 
     before_count = len(list(ring_buffer._buffer))
 
-    with patch("headwater_server.server.router.httpx") as mock_httpx:
-        mock_async_client = AsyncMock()
-        mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
-        mock_async_client.__aexit__ = AsyncMock(return_value=None)
-        mock_async_client.request = AsyncMock(return_value=mock_response)
-        mock_httpx.AsyncClient.return_value = mock_async_client
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(mock_response)
+        mock_client_cls.return_value = mock_async_client
 
         router_client.post("/conduit/generate", json={"prompt": "hello"})
 
@@ -182,12 +791,9 @@ def test_proxy_request_log_route_is_heavy_inference_for_heavy_model(router_clien
 
     before_count = len(list(ring_buffer._buffer))
 
-    with patch("headwater_server.server.router.httpx") as mock_httpx:
-        mock_async_client = AsyncMock()
-        mock_async_client.__aenter__ = AsyncMock(return_value=mock_async_client)
-        mock_async_client.__aexit__ = AsyncMock(return_value=None)
-        mock_async_client.request = AsyncMock(return_value=mock_response)
-        mock_httpx.AsyncClient.return_value = mock_async_client
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(mock_response)
+        mock_client_cls.return_value = mock_async_client
 
         router_client.post("/conduit/generate", json={"model": "qwq:latest", "prompt": "think"})
 
@@ -197,3 +803,211 @@ def test_proxy_request_log_route_is_heavy_inference_for_heavy_model(router_clien
     assert proxy_req_records
     extra = proxy_req_records[-1].get("extra") or {}
     assert extra.get("route") == "heavy_inference"
+def test_proxy_scatters_large_embedding_batch_and_retries_failed_shard(tmp_path: Path):
+    """A big batch is split across the pool, order is kept, and a shard whose backend is down is resent."""
+    import json
+    from headwater_server.server.router import HeadwaterRouter
+
+    config = {
+        **VALID_CONFIG,
+        "routes": {**VALID_CONFIG["routes"], "embeddings": ["backwater", "bywater"]},
+        "scatter": {"routes": ["embeddings"], "min_items": 4, "min_shard": 1},
+    }
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+    client = TestClient(router.app)
+    down = {VALID_CONFIG["backends"]["bywater"]}
+    received: dict[str, list[list[str]]] = {}
+
+    def make_client(base_url: str, **kwargs) -> AsyncMock:
+        async def send(request, stream=False):
+            if base_url in down:
+                raise httpx.ConnectError("Connection refused")
+            ids = json.loads(request["content"])["batch"]["ids"]
+            received.setdefault(base_url, []).append(ids)
+            return httpx.Response(200, json={"embeddings": [[float(i)] for i in ids]})
+
+        mock = _streaming_client()
+        mock.send = AsyncMock(side_effect=send)
+        return mock
+
+    batch = {"model": "m", "batch": {"ids": [str(i) for i in range(6)], "documents": list("abcdef"), "metadatas": None}}
+    with patch("headwater_server.server.upstream.httpx.AsyncClient", side_effect=make_client):
+        response = client.post("/conduit/embeddings", json=batch)
+        down.clear()
+        second = client.post("/conduit/embeddings", json=batch)
+
+    assert response.status_code == 200
+    assert response.json() == {"embeddings": [[float(i)] for i in range(6)]}
+    assert response.headers["X-Headwater-Route-Reason"] == "scatter"
+    assert received[VALID_CONFIG["backends"]["backwater"]][:2] == [["0", "1", "2"], ["3", "4", "5"]]
+    assert second.headers["X-Headwater-Shards"] == "backwater=3,bywater=3"
+    assert second.json() == response.json()
+    assert all(n == 0 for n in router._balancer.snapshot().values())
+
+
+def test_proxy_scatters_conduit_batch_only_to_backends_with_model_loaded(tmp_path: Path):
+    """A /conduit/batch is split across pool members serving its model; None results keep their slots."""
+    import json
+    import time
+    from headwater_server.server.residency import BackendResidency
+    from headwater_server.server.router import HeadwaterRouter
+
+    backends = VALID_CONFIG["backends"]
+    config = {
+        **VALID_CONFIG,
+        "routes": {**VALID_CONFIG["routes"], "conduit": ["bywater", "deepwater", "stillwater"]},
+        "scatter": {"routes": ["conduit"], "min_items": 4, "min_shard": 1},
+    }
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+    for name, models in (("bywater", {"qwen3:4b": 3000}), ("deepwater", {"qwen3:4b": 3000}), ("stillwater", {"llama3:8b": 5000})):
+        router._residency._state[backends[name]] = BackendResidency(
+            models=models, vram_free_mb=0, refreshed_at=time.monotonic()
+        )
+    client = TestClient(router.app)
+    asked: list[str] = []
+
+    def make_client(base_url: str, **kwargs) -> AsyncMock:
+        async def send(request, stream=False):
+            asked.append(base_url)
+            prompts = json.loads(request["content"])["prompt_strings_list"]
+            return httpx.Response(200, json={"results": [None if p == "bad" else {"out": p} for p in prompts]})
+
+        mock = _streaming_client()
+        mock.send = AsyncMock(side_effect=send)
+        return mock
+
+    batch = {"prompt_strings_list": ["a", "bad", "c", "d"], "params": {"model": "qwen3:4b"}, "options": {}}
+    with patch("headwater_server.server.upstream.httpx.AsyncClient", side_effect=make_client):
+        response = client.post("/conduit/batch", json=batch)
+
+    assert response.status_code == 200
+    assert response.json() == {"results": [{"out": "a"}, None, {"out": "c"}, {"out": "d"}]}
+    assert sorted(asked) == sorted([backends["bywater"], backends["deepwater"]])
+    assert response.headers["X-Headwater-Shards"].count("=2") == 2
+
+
+def test_proxy_routes_conversation_turns_to_the_same_backend(tmp_path: Path):
+    """With affinity on, every turn of a conversation reaches the backend that owns its prefix."""
+    from headwater_server.server.router import HeadwaterRouter
+
+    config = {
+        **VALID_CONFIG,
+        "routes": {**VALID_CONFIG["routes"], "conduit": ["bywater", "deepwater", "stillwater"]},
+        "affinity": {"routes": ["conduit"]},
+    }
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+    client = TestClient(router.app)
+    asked: list[str] = []
+
+    def make_client(base_url: str, **kwargs) -> AsyncMock:
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.content = b"{}"
+        mock_response.headers = {}
+        mock = _streaming_client(mock_response)
+
+        async def send(request, stream=False):
+            asked.append(base_url)
+            return mock_response
+
+        mock.send = AsyncMock(side_effect=send)
+        return mock
+
+    opener = [{"role": "system", "content": "s"}, {"role": "user", "content": "hello"}]
+    turns = [opener, opener + [{"role": "assistant", "content": "hi"}, {"role": "user", "content": "more"}]]
+    with patch("headwater_server.server.upstream.httpx.AsyncClient", side_effect=make_client):
+        responses = [
+            client.post("/conduit/generate", json={"messages": m, "params": {"model": "qwen3:4b"}}) for m in turns
+        ]
+
+    assert [r.headers["X-Headwater-Route-Reason"] for r in responses] == ["affinity", "affinity"]
+    assert len(asked) == 2 and asked[0] == asked[1]
+
+
+def test_proxy_forwards_malformed_params_on_affinity_route(tmp_path: Path):
+    """A body whose `params` is not an object reaches a backend, which answers 422, instead of a router 500."""
+    from headwater_server.server.router import HeadwaterRouter
+
+    config = {
+        **VALID_CONFIG,
+        "routes": {**VALID_CONFIG["routes"], "conduit": ["bywater", "deepwater"]},
+        "affinity": {"routes": ["conduit"]},
+    }
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(config))
+    router = HeadwaterRouter(config_path=path)
+    client = TestClient(router.app)
+
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 422
+    mock_response.content = b'{"detail": "params must be an object"}'
+    mock_response.headers = {}
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient", return_value=_streaming_client(mock_response)):
+        response = client.post(
+            "/conduit/generate", json={"params": [1], "messages": [{"role": "user", "content": "hello"}]}
+        )
+
+    assert response.status_code == 422
+    assert response.headers["X-Headwater-Route-Reason"] == "affinity"
+
+
+
+
+def test_proxy_merges_backend_server_timing_after_router_phases(router_client: TestClient):
+    """The backend's Server-Timing entries come back prefixed with its name, between router phases and total."""
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b'{"embeddings": []}'
+    mock_response.headers = {"content-type": "application/json", "server-timing": "embed;dur=12.5, app;dur=14"}
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_client_cls.return_value = _streaming_client(mock_response)
+        response = router_client.post("/conduit/embeddings", json={"model": "m", "batch": {}})
+
+    names = [entry.split(";")[0].strip() for entry in response.headers["Server-Timing"].split(",")]
+    assert names == ["route", "upstream", "backwater.embed", "backwater.app", "total"]  # streamed body: no "body" phase
+    assert "backwater.embed;dur=12.5" in response.headers["Server-Timing"]
+    assert 'upstream;dur=' in response.headers["Server-Timing"] and 'desc="backwater"' in response.headers["Server-Timing"]
+
+
+def test_proxy_forwards_remaining_deadline_budget(router_client: TestClient):
+    """X-Headwater-Deadline is re-sent with what is left of the caller's budget, and only if one was given."""
+    mock_response = MagicMock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b'{}'
+    mock_response.headers = {}
+
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = _streaming_client(mock_response)
+        mock_client_cls.return_value = mock_async_client
+
+        router_client.post("/conduit/embeddings", json={}, headers={"X-Headwater-Deadline": "30"})
+        forwarded = mock_async_client.build_request.call_args.kwargs["headers"]
+        assert 29 < float(forwarded["x-headwater-deadline"]) < 30
+
+        router_client.post("/conduit/embeddings", json={})
+        assert "x-headwater-deadline" not in mock_async_client.build_request.call_args.kwargs["headers"]
+
+    assert router_client.post("/conduit/embeddings", json={}, headers={"X-Headwater-Deadline": "0"}).status_code == 504
+
+
+def test_metrics_federate_is_served_by_router_not_proxied(router_client: TestClient):
+    """GET /metrics/federate answers from the router and reports unreachable backends as down."""
+    with patch("headwater_server.server.upstream.httpx.AsyncClient") as mock_client_cls:
+        mock_async_client = AsyncMock()
+        mock_async_client.get = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        mock_client_cls.return_value = mock_async_client
+        response = router_client.get("/metrics/federate")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    for name in VALID_CONFIG["backends"]:
+        assert f'headwater_federate_up{{backend="{name}"}} 0.0' in response.text
+    mock_async_client.build_request.assert_not_called()
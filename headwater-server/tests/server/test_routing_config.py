@@ -151,3 +151,332 @@ def test_conduit_embeddings_path_ignores_heavy_model(config: RouterConfig):
     url, route_key = resolve_backend("conduit", "qwq:latest", config, path="conduit/embeddings")
     assert route_key == "embeddings"
     assert url == "http://172.16.0.9:8080"  # backwater
+
+
+def test_upstream_block_absent_uses_defaults(config: RouterConfig):
+    """No `upstream` block → fleet-wide UpstreamSettings defaults for every backend and route."""
+    from headwater_server.server.routing_config import (
+        UpstreamSettings,
+        get_backend_upstream,
+        get_route_upstream,
+    )
+    assert config.upstream == UpstreamSettings()
+    assert get_backend_upstream("bywater", config) == UpstreamSettings()
+    assert get_route_upstream("embeddings", config) == UpstreamSettings()
+
+
+def test_upstream_block_backend_and_route_overrides(tmp_path: Path):
+    """upstream.backends overrides pool limits; upstream.routes overrides timeouts; both inherit defaults."""
+    from headwater_server.server.routing_config import get_backend_upstream, get_route_upstream
+
+    raw = {
+        **VALID_CONFIG,
+        "upstream": {
+            "max_connections": 50,
+            "read_timeout": 120,
+            "backends": {"deepwater": {"max_connections": 8, "keepalive_expiry": 60}},
+            "routes": {"embeddings": {"read_timeout": 30}},
+        },
+    }
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump(raw))
+    config = load_router_config(path)
+
+    assert config.upstream.max_connections == 50
+    deepwater = get_backend_upstream("deepwater", config)
+    assert deepwater.max_connections == 8
+    assert deepwater.keepalive_expiry == 60
+    assert deepwater.read_timeout == 120  # inherited
+    assert get_backend_upstream("bywater", config).max_connections == 50
+    assert get_route_upstream("embeddings", config).read_timeout == 30
+    assert get_route_upstream("conduit", config).read_timeout == 120
+
+
+@pytest.mark.parametrize(
+    "upstream",
+    [
+        {"max_conections": 10},
+        {"read_timeout": 0},
+        {"backends": {"nonexistent": {"max_connections": 4}}},
+        {"routes": {"nonexistent": {"read_timeout": 4}}},
+    ],
+)
+def test_invalid_upstream_block_raises_routing_config_error(tmp_path: Path, upstream: dict):
+    """Unknown keys, non-positive values and undefined backend/route names are rejected at load time."""
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**VALID_CONFIG, "upstream": upstream}))
+    with pytest.raises(RoutingConfigError):
+        load_router_config(path)
+
+
+@pytest.mark.parametrize(
+    "service,path,expected",
+    [
+        ("conduit", "conduit/generate", True),
+        ("conduit", "conduit/batch", True),
+        ("conduit", "conduit/embeddings", False),
+        ("reranker", "reranker/rerank", True),
+        ("siphon", "siphon/process", False),
+        ("v1", "v1/messages", True),
+        ("v1", "v1/chat/completions", True),
+        ("v1", "v1/responses", True),
+        ("v1", "v1/models", False),
+    ],
+)
+def test_is_model_routed(service: str, path: str, expected: bool):
+    """Only requests whose backend (route or resident pool member) depends on the model need the body read first."""
+    from headwater_server.server.routing_config import is_model_routed
+    assert is_model_routed(service, path) is expected
+
+
+def _pooled_config(tmp_path: Path, routes: dict) -> RouterConfig:
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**VALID_CONFIG, "routes": {**VALID_CONFIG["routes"], **routes}}))
+    return load_router_config(path)
+
+
+def test_route_pool_parses_names_and_weights(tmp_path: Path):
+    """A route may list several backends, optionally weighted; the first is the primary."""
+    config = _pooled_config(tmp_path, {
+        "embeddings": ["backwater", {"backend": "bywater", "weight": 2}],
+    })
+    assert config.routes["embeddings"] == "backwater"
+    assert config.pools["embeddings"] == ["backwater", "bywater"]
+    assert config.weights["embeddings"] == {"backwater": 1.0, "bywater": 2.0}
+    assert "conduit" not in config.pools  # single-backend routes stay plain
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        [],
+        ["backwater", "nonexistent_backend"],
+        [{"backend": "bywater", "weight": 0}],
+        ["bywater", "bywater"],
+    ],
+)
+def test_invalid_route_pool_raises_routing_config_error(tmp_path: Path, entry: list):
+    """Empty pools, undefined backends, non-positive weights and duplicates are rejected."""
+    with pytest.raises(RoutingConfigError):
+        _pooled_config(tmp_path, {"embeddings": entry})
+
+
+def test_resolve_backend_without_balancer_returns_primary(tmp_path: Path):
+    """Without a balancer, a pooled route resolves to its primary backend."""
+    config = _pooled_config(tmp_path, {"embeddings": ["backwater", "bywater"]})
+    url, route_key = resolve_backend("conduit", None, config, path="conduit/embeddings")
+    assert (url, route_key) == ("http://172.16.0.9:8080", "embeddings")
+
+
+def test_resolve_backend_with_balancer_picks_least_outstanding(tmp_path: Path):
+    """With a balancer, a pooled route resolves to the backend with the fewest in-flight requests."""
+    from headwater_server.server.balancer import LeastOutstandingBalancer
+
+    config = _pooled_config(tmp_path, {"embeddings": ["backwater", "bywater"]})
+    balancer = LeastOutstandingBalancer()
+    balancer.acquire("http://172.16.0.9:8080")  # backwater busy
+    url, _ = resolve_backend("conduit", None, config, path="conduit/embeddings", balancer=balancer)
+    assert url == "http://172.16.0.4:8080"  # bywater
+
+
+def test_health_block_overrides_defaults(tmp_path: Path):
+    """`health` overlays probe interval and breaker thresholds onto HealthSettings defaults."""
+    from headwater_server.server.routing_config import HealthSettings
+
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**VALID_CONFIG, "health": {"interval": 2, "failure_threshold": 5}}))
+    config = load_router_config(path)
+    assert config.health == HealthSettings(interval=2, failure_threshold=5)
+
+
+@pytest.mark.parametrize("health", [{"intervall": 2}, {"cooldown": 0}])
+def test_invalid_health_block_raises_routing_config_error(tmp_path: Path, health: dict):
+    """Unknown keys and non-positive values in `health` are rejected at load time."""
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**VALID_CONFIG, "health": health}))
+    with pytest.raises(RoutingConfigError):
+        load_router_config(path)
+
+
+def test_residency_block_overrides_defaults(tmp_path: Path):
+    """`residency` sets the /gpu refresh interval and timeout."""
+    from headwater_server.server.routing_config import ResidencySettings
+
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**VALID_CONFIG, "residency": {"interval": 30}}))
+    assert load_router_config(path).residency == ResidencySettings(interval=30)
+
+
+def test_federation_block_overrides_defaults_and_rejects_non_positive(tmp_path: Path):
+    """`federation` sets the per-backend scrape timeout and the merged-scrape cache TTL."""
+    from headwater_server.server.routing_config import FederationSettings
+
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**VALID_CONFIG, "federation": {"timeout": 0.5}}))
+    assert load_router_config(path).federation == FederationSettings(timeout=0.5)
+
+    path.write_text(yaml.dump({**VALID_CONFIG, "federation": {"cache_ttl": 0}}))
+    with pytest.raises(RoutingConfigError):
+        load_router_config(path)
+
+
+def test_coalesce_must_name_defined_routes(tmp_path: Path):
+    """`coalesce` lists route keys; an undefined one is rejected at load time."""
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**VALID_CONFIG, "coalesce": ["embeddings", "reranker_light"]}))
+    assert load_router_config(path).coalesce == ["embeddings", "reranker_light"]
+
+    path.write_text(yaml.dump({**VALID_CONFIG, "coalesce": ["nonexistent"]}))
+    with pytest.raises(RoutingConfigError):
+        load_router_config(path)
+
+
+def test_cache_block_parses_routes_and_disk_path(tmp_path: Path):
+    """`cache` sets budgets, an optional disk tier and TTL per path prefix."""
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({
+        **VALID_CONFIG,
+        "cache": {"max_mb": 64, "disk_path": "~/hw-cache.sqlite", "routes": {"/conduit/tokenize": 600}},
+    }))
+    cache = load_router_config(path).cache
+    assert cache.max_mb == 64
+    assert cache.disk_path == Path("~/hw-cache.sqlite").expanduser()
+    assert cache.routes == {"conduit/tokenize": 600.0}
+
+
+@pytest.mark.parametrize("cache", [{"max_mbs": 1}, {"routes": {"reranker": 0}}, {"routes": ["reranker"]}])
+def test_invalid_cache_block_raises_routing_config_error(tmp_path: Path, cache: dict):
+    """Unknown keys, non-positive TTLs and a non-mapping routes entry are rejected at load time."""
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**VALID_CONFIG, "cache": cache}))
+    with pytest.raises(RoutingConfigError):
+        load_router_config(path)
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"routes": ["bywater"]},
+        {"backends": None},
+        {"heavy_models": "qwq:latest"},
+        {"fallbacks": {"conduit": "deepwater"}},
+        {"coalesce": "conduit"},
+        {"upstream": [1]},
+        {"upstream": {"routes": {"conduit": [1]}}},
+        {"health": [1]},
+        {"cache": ["x"]},
+        {"admission": 5},
+        {"hedge": {"routes": 3}},
+        {"scatter": {"routes": {"conduit": 1}}},
+        {"affinity": "conduit"},
+    ],
+)
+def test_wrongly_shaped_block_raises_routing_config_error(tmp_path: Path, overrides: dict):
+    """A block that is not the mapping or list of names it should be is a RoutingConfigError, not a crash."""
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**VALID_CONFIG, **overrides}))
+    with pytest.raises(RoutingConfigError):
+        load_router_config(path)
+
+
+@pytest.mark.parametrize(
+    "hedge",
+    [{"percentile": 101}, {"budget": 1.5}, {"routes": ["nonexistent"]}, {"percentile": 0}],
+)
+def test_invalid_hedge_block_raises_routing_config_error(tmp_path: Path, hedge: dict):
+    """Percentile above 100, budget above 1, unknown routes and non-positive values are rejected."""
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**VALID_CONFIG, "hedge": hedge}))
+    with pytest.raises(RoutingConfigError):
+        load_router_config(path)
+
+
+def test_admission_block_parses_limits_and_bulk_prefixes(tmp_path: Path):
+    """`admission` caps named routes/backends and lists bulk path prefixes."""
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({
+        **VALID_CONFIG,
+        "admission": {
+            "queue_size": 16,
+            "routes": {"heavy_inference": 2},
+            "backends": {"deepwater": 4},
+            "bulk": ["/conduit/batch"],
+        },
+    }))
+    admission = load_router_config(path).admission
+    assert admission.queue_size == 16
+    assert admission.routes == {"heavy_inference": 2}
+    assert admission.backends == {"deepwater": 4}
+    assert admission.bulk == ["conduit/batch"]
+
+
+@pytest.mark.parametrize(
+    "admission",
+    [
+        {"routes": {"nonexistent": 1}},
+        {"backends": {"nonexistent": 1}},
+        {"backends": {"deepwater": 1.5}},
+        {"routes": {"conduit": 0}},
+        {"queue_timeout": -1},
+        {"bulk": "conduit/batch"},
+    ],
+)
+def test_invalid_admission_block_raises_routing_config_error(tmp_path: Path, admission: dict):
+    """Unknown names, non-integer or non-positive limits and a non-list `bulk` are rejected."""
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**VALID_CONFIG, "admission": admission}))
+    with pytest.raises(RoutingConfigError):
+        load_router_config(path)
+
+
+def test_scatter_block_requires_pooled_routes(tmp_path: Path):
+    """`scatter.routes` must name routes with a backend pool; thresholds default sensibly."""
+    pooled = {**VALID_CONFIG, "routes": {**VALID_CONFIG["routes"], "embeddings": ["backwater", "bywater"]}}
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**pooled, "scatter": {"routes": ["embeddings"], "min_items": 100}}))
+    scatter = load_router_config(path).scatter
+    assert (scatter.routes, scatter.min_items, scatter.min_shard) == (["embeddings"], 100, 32)
+
+    path.write_text(yaml.dump({**pooled, "scatter": {"routes": ["siphon"]}}))
+    with pytest.raises(RoutingConfigError):
+        load_router_config(path)
+
+
+def test_affinity_block_requires_pooled_routes_and_load_factor_of_at_least_one(tmp_path: Path):
+    """`affinity.routes` must name pooled routes; a load_factor below 1 would reject every owner."""
+    pooled = {**VALID_CONFIG, "routes": {**VALID_CONFIG["routes"], "conduit": ["bywater", "deepwater"]}}
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**pooled, "affinity": {"routes": ["conduit"], "messages": 2}}))
+    affinity = load_router_config(path).affinity
+    assert (affinity.routes, affinity.messages, affinity.load_factor) == (["conduit"], 2, 1.25)
+
+    for bad in ({"routes": ["siphon"]}, {"routes": ["conduit"], "load_factor": 0.5}):
+        path.write_text(yaml.dump({**pooled, "affinity": bad}))
+        with pytest.raises(RoutingConfigError):
+            load_router_config(path)
+
+
+def test_unix_socket_backend_url_needs_absolute_path(tmp_path: Path):
+    """`unix:///abs/path.sock` backends load; a relative socket path is rejected."""
+    path = tmp_path / "routes.yaml"
+    backends = {**VALID_CONFIG["backends"], "bywater": "unix:///run/headwater/bywater.sock"}
+    path.write_text(yaml.dump({**VALID_CONFIG, "backends": backends}))
+    assert load_router_config(path).backends["bywater"] == "unix:///run/headwater/bywater.sock"
+
+    path.write_text(yaml.dump({**VALID_CONFIG, "backends": {**backends, "bywater": "unix://bywater.sock"}}))
+    with pytest.raises(RoutingConfigError):
+        load_router_config(path)
+
+
+def test_upstream_http2_is_a_per_backend_boolean(tmp_path: Path):
+    """`http2` is set fleet-wide or per backend, must be a boolean, and is rejected under routes."""
+    path = tmp_path / "routes.yaml"
+    path.write_text(yaml.dump({**VALID_CONFIG, "upstream": {"backends": {"bywater": {"http2": True}}}}))
+    config = load_router_config(path)
+    assert config.upstream_backends["bywater"].http2 is True
+    assert config.upstream.http2 is False
+
+    for bad in ({"http2": "yes"}, {"routes": {"conduit": {"http2": True}}}):
+        path.write_text(yaml.dump({**VALID_CONFIG, "upstream": bad}))
+        with pytest.raises(RoutingConfigError):
+            load_router_config(path)
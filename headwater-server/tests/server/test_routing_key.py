@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from headwater_server.server import routing_key
+from headwater_server.server.routing_key import extract_model
+
+
+def _reference(body: bytes) -> str | None:
+    """The proxy's previous full-parse lookup."""
+    try:
+        parsed = json.loads(body)
+        return parsed.get("model") or (parsed.get("params") or {}).get("model")
+    except Exception:
+        return None
+
+
+def _batch_body(n: int) -> bytes:
+    prompts = [f'Summarise document {i}: "quoted" text with {{braces}} and [brackets]' for i in range(n)]
+    return json.dumps({
+        "prompt_strings_list": prompts,
+        "input_variables_list": [],
+        "prompt_str": None,
+        "max_concurrent": 8,
+        "params": {"model": "llama3.2:3b", "temperature": 0.1},
+        "options": {"project_name": "headwater"},
+    }).encode()
+
+
+def _embeddings_body(n: int) -> bytes:
+    return json.dumps({
+        "model": "BAAI/bge-m3",
+        "batch": {
+            "ids": [str(i) for i in range(n)],
+            "documents": [f"document {i} " * 20 for i in range(n)],
+            "metadatas": [{"model": "not-this-one", "i": i} for i in range(n)],
+        },
+    }).encode()
+
+
+@pytest.mark.parametrize(
+    "payload,expected",
+    [
+        ({"model": "gpt-4o", "messages": []}, "gpt-4o"),
+        ({"messages": [{"role": "user", "content": "hi"}], "model": "gpt-4o"}, "gpt-4o"),
+        ({"messages": [], "params": {"model": "qwq:latest"}, "options": {}}, "qwq:latest"),
+        ({"model": "", "params": {"model": "qwq:latest"}}, "qwq:latest"),
+        ({"input_variables_list": [{"model": "decoy"}], "params": {"model": "llama3.2:3b"}}, "llama3.2:3b"),
+        ({"k": {"params": {"model": "decoy"}}, "params": {"temperature": 0.1}}, None),
+        ({"text": '{"model": "decoy"}', "x\"params": {"model": "decoy"}}, None),
+        ({"model": "café:latest"}, "café:latest"),
+        ({"query": "no model here"}, None),
+    ],
+)
+def test_extract_model_matches_full_parse(payload: dict, expected: str | None):
+    """Top-level `model` wins, then `params.model`; nested decoys and strings are ignored."""
+    body = json.dumps(payload).encode()
+    assert extract_model(body) == expected
+    assert extract_model(body) == _reference(body)
+
+
+@pytest.mark.parametrize("body", [b"", b"[]", b"not json", b'{"model": ]', b'{"params": {"model": "x"}'])
+def test_extract_model_non_object_or_malformed_returns_reference(body: bytes):
+    """Non-object and malformed bodies behave like the full parse (no model)."""
+    assert extract_model(body) == _reference(body)
+
+
+def test_extract_model_large_bodies_use_bounded_windows(monkeypatch: pytest.MonkeyPatch):
+    """Model at the head (embeddings) or tail (batch params) is found without a full parse."""
+    def _fail(body: bytes) -> None:
+        raise AssertionError("full parse fallback used")
+
+    monkeypatch.setattr(routing_key, "_full_parse", _fail)
+    assert extract_model(_embeddings_body(5_000)) == "BAAI/bge-m3"
+    assert extract_model(_batch_body(5_000)) == "llama3.2:3b"
+
+
+def test_extract_model_falls_back_when_model_is_mid_body(monkeypatch: pytest.MonkeyPatch):
+    """A top-level model outside both windows is still found via the full parse."""
+    monkeypatch.setattr(routing_key, "PREFIX_BYTES", 256)
+    monkeypatch.setattr(routing_key, "SUFFIX_BYTES", 256)
+    body = json.dumps({
+        "head": ["x" * 50] * 20,
+        "model": "mid-body-model",
+        "tail": ["y" * 50] * 20,
+    }).encode()
+    assert extract_model(body) == "mid-body-model"
+
+
+def test_extract_model_large_bodies_match_full_parse():
+    """Multi-thousand-item embeddings and batch bodies give the same model as json.loads."""
+    for body in (_embeddings_body(20_000), _batch_body(20_000)):
+        assert extract_model(body) == _reference(body)
+
+
+@pytest.mark.benchmark
+def test_benchmark_extract_model_vs_full_parse():
+    """Benchmark (pytest -m benchmark): routing-key extraction beats json.loads on 100k-item bodies."""
+    def best_of(fn, body: bytes, runs: int = 3) -> float:
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            fn(body)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    for body in (_embeddings_body(100_000), _batch_body(100_000)):
+        assert best_of(extract_model, body) < best_of(_reference, body)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from headwater_server.server.scatter import EMBEDDINGS, Shard, ShardFailed, ThroughputTracker, gather_shards, plan_shards
+
+
+def test_plan_shards_splits_by_weight_and_drops_tiny_shares():
+    """Shards are contiguous, sized by weight, and backends below min_shard sit out."""
+    shards = plan_shards(100, {"a": 3.0, "b": 1.0, "c": 0.05}, min_shard=10)
+    assert shards == [Shard("a", 0, 75), Shard("b", 75, 100)]
+    assert [s.size for s in plan_shards(10, {"a": 1.0, "b": 1.0, "c": 1.0}, min_shard=1)] == [4, 3, 3]
+    assert plan_shards(20, {"a": 1.0, "b": 1.0}, min_shard=32) == [Shard("a", 0, 20)]
+
+
+def test_throughput_tracker_defaults_unmeasured_backends_to_mean():
+    """Measured rates are EWMA-smoothed; a new backend is assumed as fast as the average."""
+    tracker = ThroughputTracker()
+    assert tracker.weights("r", ["a", "b"]) == {"a": 1.0, "b": 1.0}
+    tracker.observe("r", "a", 100, 1.0)
+    tracker.observe("r", "a", 200, 1.0)
+    assert tracker.rate("r", "a") == pytest.approx(130.0)
+    assert tracker.weights("r", ["a", "b"]) == {"a": pytest.approx(130.0), "b": pytest.approx(130.0)}
+
+
+def test_embeddings_adapter_slices_every_list_field_and_merges_in_order():
+    """Slicing keeps ids/documents/metadatas aligned; merge concatenates embeddings."""
+    payload = {"model": "m", "batch": {"ids": ["1", "2", "3"], "documents": ["x", "y", "z"], "embeddings": None}}
+    assert EMBEDDINGS.count(payload) == 3
+    part = EMBEDDINGS.slice(payload, 1, 3)
+    assert part == {"model": "m", "batch": {"ids": ["2", "3"], "documents": ["y", "z"], "embeddings": None}}
+    assert EMBEDDINGS.merge([{"embeddings": [[1.0]]}, {"embeddings": [[2.0], [3.0]]}]) == {
+        "embeddings": [[1.0], [2.0], [3.0]]
+    }
+
+
+def test_gather_retries_retryable_failures_and_raises_client_errors():
+    """A 5xx/unreachable shard moves to an untried backend; a 4xx fails the whole request."""
+    shards = [Shard("a", 0, 2), Shard("b", 2, 4)]
+
+    async def flaky(url: str, shard: Shard) -> dict:
+        if url == "b":
+            raise ShardFailed(url, 503)
+        return {"url": url, "start": shard.start}
+
+    parts, retries = asyncio.run(gather_shards(shards, ["a", "b"], flaky, lambda urls: urls[0]))
+    assert parts == [{"url": "a", "start": 0}, {"url": "a", "start": 2}]
+    assert retries == 1
+
+    async def rejecting(url: str, shard: Shard) -> dict:
+        if url == "b":
+            raise ShardFailed(url, 422, b"bad")
+        await asyncio.sleep(0.01)
+        return {}
+
+    with pytest.raises(ShardFailed) as excinfo:
+        asyncio.run(gather_shards(shards, ["a", "b"], rejecting, lambda urls: urls[0]))
+    assert excinfo.value.status_code == 422
+
+
+def test_batch_adapter_measures_tokens_and_keeps_failed_items():
+    """Batch shards slice whichever list is set; work is generated tokens, falling back to item count."""
+    from headwater_server.server.scatter import BATCH
+
+    payload = {"input_variables_list": [{"x": "1"}, {"x": "2"}, {"x": "3"}], "prompt_str": "{{x}}", "params": {}}
+    assert BATCH.count(payload) == 3
+    assert BATCH.slice(payload, 2, 3)["input_variables_list"] == [{"x": "3"}]
+    assert BATCH.merge([{"results": [1, None]}, {"results": [3]}]) == {"results": [1, None, 3]}
+    with_usage = {"results": [{"messages": [{"metadata": {"output_tokens": 40}}]}, None]}
+    assert BATCH.work(payload, with_usage) == 40
+    assert BATCH.work(payload, {"results": [{"text": "hi"}, None, {"text": "yo"}]}) == 2
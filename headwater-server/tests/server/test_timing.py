@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from headwater_server.server.context import server_timing_var
+from headwater_server.server.timing import Phase, ServerTiming, TimedJSONResponse, parse, phase, record
+
+
+def test_parse_reads_dur_and_quoted_desc_and_round_trips():
+    """Entries without dur are 0 ms; quoted descriptions may contain commas and semicolons."""
+    phases = parse('db;dur=53, cache;desc="hit, disk; warm";dur=23.2 ,miss, app;dur=bad')
+    assert phases == [
+        Phase("db", 53.0),
+        Phase("cache", 23.2, "hit, disk; warm"),
+        Phase("miss", 0.0),
+        Phase("app", 0.0),
+    ]
+    assert parse("") == []
+
+    timing = ServerTiming()
+    timing.extend(phases[:2], prefix="bywater.")
+    assert parse(timing.header()) == [Phase("bywater.db", 53.0), Phase("bywater.cache", 23.2, "hit, disk; warm")]
+
+
+def test_record_is_noop_outside_a_request_and_log_extra_sums_repeats():
+    """record()/phase() only collect while a ServerTiming is set; log extras are flat scalars."""
+    record("queue", 5.0)  # no collector: nothing to do, nothing raised
+
+    timing = ServerTiming()
+    token = server_timing_var.set(timing)
+    try:
+        record("upstream", 10.0, "bywater")
+        record("upstream", 2.5, "deepwater")
+        with phase("route"):
+            pass
+    finally:
+        server_timing_var.reset(token)
+
+    assert [p.name for p in timing.phases] == ["upstream", "upstream", "route"]
+    assert timing.header().startswith('upstream;dur=10;desc="bywater", upstream;dur=2.5;desc="deepwater", route;dur=')
+    extra = timing.log_extra()
+    assert extra["timing_upstream_ms"] == 12.5
+    assert set(extra) == {"timing_upstream_ms", "timing_route_ms"}
+
+
+def test_timed_json_response_records_encode_phase():
+    """The subserver's default response class times body rendering as `encode`."""
+    timing = ServerTiming()
+    token = server_timing_var.set(timing)
+    try:
+        response = TimedJSONResponse({"embeddings": [[0.1, 0.2]]})
+    finally:
+        server_timing_var.reset(token)
+    assert response.body == b'{"embeddings":[[0.1,0.2]]}'
+    assert [p.name for p in timing.phases] == ["encode"]
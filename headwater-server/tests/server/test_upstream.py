@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from headwater_server.server.routing_config import RouterConfig, UpstreamSettings
+from headwater_server.server.upstream import UpstreamPool
+
+
+def _config() -> RouterConfig:
+    return RouterConfig(
+        backends={"bywater": "http://172.16.0.4:8080", "deepwater": "http://172.16.0.2:8080"},
+        routes={"conduit": "bywater", "embeddings": "deepwater"},
+        heavy_models=[],
+        upstream=UpstreamSettings(read_timeout=300.0),
+        upstream_backends={"deepwater": UpstreamSettings(max_connections=4)},
+        upstream_routes={"embeddings": UpstreamSettings(read_timeout=30.0, connect_timeout=2.0)},
+    )
+
+
+def test_client_is_reused_per_backend():
+    """The same AsyncClient is returned for every request to a backend."""
+    pool = UpstreamPool(_config())
+    first = pool.client("http://172.16.0.4:8080")
+    assert pool.client("http://172.16.0.4:8080") is first
+    assert pool.client("http://172.16.0.2:8080") is not first
+    asyncio.run(pool.aclose())
+
+
+def test_client_base_url_and_limits_come_from_backend_settings():
+    """Pool limits are resolved per backend name from upstream.backends."""
+    pool = UpstreamPool(_config())
+    client = pool.client("http://172.16.0.2:8080")
+    assert str(client.base_url).rstrip("/") == "http://172.16.0.2:8080"
+    assert client._transport._pool._max_connections == 4
+    asyncio.run(pool.aclose())
+
+
+def test_timeout_comes_from_route_settings():
+    """Per-request timeouts are resolved per route key, falling back to fleet defaults."""
+    pool = UpstreamPool(_config())
+    embeddings = pool.timeout("embeddings")
+    assert embeddings.read == 30.0
+    assert embeddings.connect == 2.0
+    assert pool.timeout("conduit").read == 300.0
+
+
+def test_start_opens_all_backends_and_aclose_closes_them():
+    """start() opens one client per backend; aclose() closes them and is idempotent."""
+    async def run() -> list[httpx.AsyncClient]:
+        pool = UpstreamPool(_config())
+        await pool.start()
+        clients = list(pool._clients.values())
+        await pool.aclose()
+        await pool.aclose()
+        return clients
+
+    clients = asyncio.run(run())
+    assert len(clients) == 2
+    assert all(c.is_closed for c in clients)
+
+
+def test_unix_socket_backend_is_reached_over_the_socket(tmp_path):
+    """A `unix:///path.sock` backend URL sends requests through that socket with the backend's pool limits."""
+    sock = str(tmp_path / "bywater.sock")
+    config = RouterConfig(
+        backends={"bywater": f"unix://{sock}"},
+        routes={"conduit": "bywater"},
+        heavy_models=[],
+        upstream_backends={"bywater": UpstreamSettings(max_connections=4)},
+    )
+    seen: list[bytes] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        seen.append(await reader.readuntil(b"\r\n\r\n"))
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 4\r\n\r\npong")
+        await writer.drain()
+        writer.close()
+
+    async def run() -> httpx.Response:
+        server = await asyncio.start_unix_server(handle, path=sock)
+        pool = UpstreamPool(config)
+        try:
+            client = pool.client(f"unix://{sock}")
+            assert client._transport._pool._max_connections == 4
+            return await client.get("/ping")
+        finally:
+            await pool.aclose()
+            server.close()
+
+    response = asyncio.run(run())
+    assert response.text == "pong"
+    assert seen[0].startswith(b"GET /ping HTTP/1.1")
+
+
+def test_http2_backend_falls_back_to_http1_without_h2(monkeypatch):
+    """`http2: true` asks for an h2c transport; if `h2` is missing the backend still gets an HTTP/1.1 client."""
+    from headwater_server.server import upstream as upstream_module
+
+    real_transport = httpx.AsyncHTTPTransport
+    requested: list[bool] = []
+
+    def transport(**kwargs):
+        requested.append(kwargs["http2"])
+        if kwargs["http2"]:
+            raise ImportError("Using http2=True, but the 'h2' package is not installed.")
+        return real_transport(**kwargs)
+
+    monkeypatch.setattr(upstream_module.httpx, "AsyncHTTPTransport", transport)
+    config = RouterConfig(
+        backends={"bywater": "http://172.16.0.4:8080"},
+        routes={"conduit": "bywater"},
+        heavy_models=[],
+        upstream_backends={"bywater": UpstreamSettings(http2=True)},
+    )
+    pool = UpstreamPool(config)
+    client = pool.client("http://172.16.0.4:8080")
+    assert requested == [True, False]
+    assert str(client.base_url).rstrip("/") == "http://172.16.0.4:8080"
+    assert pool.connections() == {"http://172.16.0.4:8080": []}
+    asyncio.run(pool.aclose())
+
+
+def test_connection_stats_count_http2_streams():
+    """HTTP/2 connections report their open streams; a busy HTTP/1.1 connection carries one request."""
+    from headwater_server.server.upstream import ConnectionStats, _connection_stats
+
+    class _Conn:
+        def __init__(self, info: str, idle: bool):
+            self._info, self._idle = info, idle
+
+        def info(self) -> str:
+            return self._info
+
+        def is_idle(self) -> bool:
+            return self._idle
+
+    assert _connection_stats(_Conn("'http://a:8080', HTTP/2, ACTIVE, Request Count: 7", False)) == ConnectionStats(
+        "HTTP/2", False, 7
+    )
+    assert _connection_stats(_Conn("'http://a:8080', HTTP/1.1, ACTIVE, Request Count: 40", False)).streams == 1
+    assert _connection_stats(_Conn("'http://a:8080', HTTP/1.1, IDLE, Request Count: 40", True)).streams == 0
+    assert _connection_stats(_Conn("CONNECTING", False)) == ConnectionStats("CONNECTING", False, 0)
+
+
+def test_connection_stats_tolerate_unexpected_info():
+    """An info() format we can't parse, or no info() at all, reports zero streams instead of raising."""
+    from headwater_server.server.upstream import ConnectionStats, _connection_stats
+
+    class _Conn:
+        def __init__(self, info: str):
+            self._info = info
+
+        def info(self) -> str:
+            return self._info
+
+        def is_idle(self) -> bool:
+            return False
+
+    class _NoInfo:
+        def is_idle(self) -> bool:
+            return True
+
+    assert _connection_stats(_Conn("'http://a:8080', HTTP/2, ACTIVE, Streams: seven")) == ConnectionStats(
+        "HTTP/2", False, 0
+    )
+    assert _connection_stats(_Conn("'http://a:8080', HTTP/2, ACTIVE, 7 open streams")).streams == 0
+    assert _connection_stats(_NoInfo()).streams == 0